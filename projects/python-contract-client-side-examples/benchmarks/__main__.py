@@ -0,0 +1,131 @@
+import argparse
+import json
+import logging
+import platform
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+
+from algokit_utils.config import config
+
+from benchmarks.network import Network, connect
+from benchmarks.runner import COMPOSED, CONCURRENT, MODES, compare, run
+from benchmarks.scenarios import SCENARIOS
+
+logger = logging.getLogger(__name__)
+root_path = Path(__file__).parent
+
+# results only compare with a baseline measured the same way on the same kind of host
+COMPARABLE_META = ("network", "calls", "workers", "machine")
+
+
+def measure(
+    network: Network, names: Sequence[str], calls: int, workers: int
+) -> dict[str, dict[str, object]]:
+    """Measures the scenarios in every mode they support, setting up new streams for
+    each mode
+
+    :param Network network: Network to measure on
+    :param Sequence[str] names: Names of the scenarios in `SCENARIOS`
+    :param int calls: Calls made in each mode, split between workers when concurrent
+    :param int workers: Threads calling at the same time in the concurrent mode
+    :returns dict: Results by "<scenario>/<mode>", as of `Result.as_dict`"""
+    results = {}
+    for name in names:
+        scenario = SCENARIOS[name]
+        for mode in MODES:
+            if mode == CONCURRENT:
+                streams = scenario(network, max(calls // workers, 1), workers)
+            else:
+                streams = scenario(network, calls, 1)
+            if mode == COMPOSED and not streams[0].composable:
+                logger.info(f"Skipping {name}/{mode}, its calls can't be batched")
+                continue
+            logger.info(f"Measuring {name}/{mode}")
+            results[f"{name}/{mode}"] = run(mode, streams).as_dict()
+    return results
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Measure throughput and latency of typed client calls",
+    )
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=list(SCENARIOS),
+        help="scenario to measure, can be repeated, defaults to all of them",
+    )
+    parser.add_argument("--calls", type=int, default=200, help="calls per mode")
+    parser.add_argument("--workers", type=int, default=4, help="concurrent callers")
+    parser.add_argument("--output", type=Path, help="file to write results to")
+    parser.add_argument("--baseline", type=Path, default=root_path / "baseline.json")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.35,
+        help="fraction results may be worse than the baseline by",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="write results to the baseline instead of comparing with it",
+    )
+    parser.add_argument(
+        "--localnet",
+        action="store_true",
+        help="run against a running AlgoKit LocalNet instead of the in-process stand-in",
+    )
+    args = parser.parse_args(argv)
+
+    # confirmations go through the shared waiter, as they do in production
+    config.configure(debug=False)
+    with connect(localnet=args.localnet) as network:
+        results = measure(
+            network, args.scenario or list(SCENARIOS), args.calls, args.workers
+        )
+    report = {
+        "meta": {
+            "network": "localnet" if args.localnet else "stand-in",
+            "calls": args.calls,
+            "workers": args.workers,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+        },
+        "results": results,
+    }
+    output = json.dumps(report, indent=2) + "\n"
+    if args.output:
+        args.output.write_text(output)
+    if args.update_baseline:
+        args.baseline.write_text(output)
+        logger.info(f"Wrote baseline to {args.baseline}")
+        return 0
+    if not args.output:
+        print(output, end="")
+
+    baseline = json.loads(args.baseline.read_text())
+    baseline_meta = baseline.get("meta", {})
+    differences = [
+        f"{key} {baseline_meta.get(key)} rather than {report['meta'][key]}"
+        for key in COMPARABLE_META
+        if baseline_meta.get(key) != report["meta"][key]
+    ]
+    if differences:
+        logger.error(
+            f"Baseline was measured with {', '.join(differences)}, measure with the "
+            "same options or record it again with --update-baseline"
+        )
+        return 1
+    regressions = compare(results, baseline["results"], args.tolerance)
+    for regression in regressions:
+        logger.error(f"Regression in {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)-10s: %(message)s"
+    )
+    sys.exit(main())
@@ -0,0 +1,71 @@
+import base64
+import contextlib
+from collections.abc import Iterator
+from pathlib import Path
+
+from algokit_utils.beta.account_manager import AddressAndSigner
+from algosdk import encoding, transaction
+from algosdk.v2client.algod import AlgodClient
+from filelock import FileLock
+
+from smart_contracts._helpers.submission import SubmissionPipeline
+
+
+class LocalnetClock:
+    """Moves the timestamps of LocalNet's blocks, for flows that depend on time
+
+    The timestamp offset is network wide, so while one flow holds the clock no other
+    flow, in this process or another one sharing `lock_path`, can hold it. Flows
+    start at the current time and the offset is reset when they let go.
+
+    :param AlgodClient algod_client: AlgodClient of the network
+    :param AddressAndSigner account: Account sending the transactions that make new
+    blocks
+    :param Path lock_path: (optional) File locked while the clock is held, when other
+    processes share the network"""
+
+    def __init__(
+        self,
+        algod_client: AlgodClient,
+        account: AddressAndSigner,
+        lock_path: Path | None = None,
+    ):
+        self.algod_client = algod_client
+        self.account = account
+        self.pipeline = SubmissionPipeline(algod_client)
+        self._lock_path = lock_path
+
+    @contextlib.contextmanager
+    def hold(self) -> Iterator["LocalnetClock"]:
+        """Holds the clock for the duration of a `with` block"""
+        with self._lock():
+            self.advance(0)
+            try:
+                yield self
+            finally:
+                self.algod_client.set_timestamp_offset(0)
+
+    def advance(self, seconds: int) -> None:
+        """Makes the timestamp of the next block, and the blocks after it, `seconds`
+        past the current time, and waits for the next block
+
+        :param int seconds: Seconds to move blocks past the current time"""
+        self.algod_client.set_timestamp_offset(seconds)
+        # the offset only shows in blocks made after it's set
+        sp = self.algod_client.suggested_params()
+        txn = transaction.PaymentTxn(
+            self.account.address,
+            sp,
+            self.account.address,
+            0,
+            note=f"clock:{seconds}".encode(),
+        )
+        signed = self.account.signer.sign_transactions([txn], [0])[0]
+        self.pipeline.submit(
+            [base64.b64decode(encoding.msgpack_encode(signed))]
+        ).result()
+
+    def _lock(self) -> contextlib.AbstractContextManager[object]:
+        if self._lock_path is None:
+            return contextlib.nullcontext()
+        return FileLock(self._lock_path)
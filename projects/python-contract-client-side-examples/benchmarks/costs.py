@@ -0,0 +1,774 @@
+import argparse
+import base64
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import sys
+import typing
+from collections.abc import Callable, Collection, Iterator, Mapping, Sequence
+from pathlib import Path
+
+import algokit_utils
+from algokit_utils.beta.algorand_client import (
+    AssetCreateParams,
+    AssetOptInParams,
+    AssetTransferParams,
+)
+from algokit_utils.config import config
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionResponse,
+    TransactionWithSigner,
+)
+from algosdk.v2client import models
+
+from benchmarks.clock import LocalnetClock
+from benchmarks.network import Network, connect, params
+from smart_contracts._helpers.fees import count_inner_transactions
+from smart_contracts._helpers.simulate_cache import Composer
+from smart_contracts.artifacts.auction import auction_client
+from smart_contracts.artifacts.box_voting import box_voting_client
+from smart_contracts.artifacts.hello_world import hello_world_client
+from smart_contracts.artifacts.multi_auction import multi_auction_client
+from smart_contracts.artifacts.refund_auction import refund_auction_client
+from smart_contracts.artifacts.tictactoe import tic_tac_toe_client
+from smart_contracts.artifacts.tictactoe_bitboard import tic_tac_toe_bitboard_client
+from smart_contracts.artifacts.tictactoe_stats import tic_tac_toe_stats_client
+from smart_contracts.artifacts.voting import voting_client
+from smart_contracts.auction.client import AuctionClient
+from smart_contracts.box_voting.client import BALLOT_MBR, BoxVotingClient, topic_mbr
+from smart_contracts.hello_world.client import MAX_NAMES_PER_CALL, HelloWorldClient
+from smart_contracts.multi_auction.client import (
+    ASSET_OPT_IN_MBR,
+    AUCTION_BOX_MBR,
+    CLAIM_BOX_MBR,
+    MultiAuctionClient,
+)
+from smart_contracts.refund_auction.client import RefundAuctionClient
+from smart_contracts.tictactoe.client import NEW_GAME_MBR, TicTacToeClient
+from smart_contracts.tictactoe_bitboard import client as bitboard
+from smart_contracts.tictactoe_stats.client import TicTacToeStatsClient
+from smart_contracts.voting.client import VOTE_PAYMENT, VotingClient
+
+logger = logging.getLogger(__name__)
+root_path = Path(__file__).parent
+
+# Version of the format of the baseline, bumped whenever what's recorded changes
+VERSION = 1
+# Seconds the tracked auction runs for
+AUCTION_LENGTH = 1_000
+# How algod reports state changes, see `_state_bytes`
+_SET_BYTES, _SET_UINT = 1, 2
+
+
+class ExecutableComposer(Composer, typing.Protocol):
+    """Any of the generated `Composer` classes"""
+
+    def execute(self) -> AtomicTransactionResponse: ...
+
+
+@dataclasses.dataclass(frozen=True)
+class Costs:
+    """What a method call costs, as simulate reports it
+
+    :param int | None app_budget: Opcode budget consumed by the call, None if the
+    network doesn't report it
+    :param int inner_txns: Inner transactions sent, including nested ones
+    :param int state_bytes: Bytes of global and local state keys and values written
+    :param int | None box_bytes: Bytes of box names and contents written, None if the
+    network doesn't trace state changes
+    :param int min_fee: MicroAlgos the call has to pay, covering its inner transactions
+    """
+
+    app_budget: int | None
+    inner_txns: int
+    state_bytes: int
+    box_bytes: int | None
+    min_fee: int
+
+    @classmethod
+    def of(cls, txn_result: Mapping[str, typing.Any], min_fee: int) -> "Costs":
+        """Reads the costs of an app call from its result in a simulate response
+
+        :param Mapping txn_result: Result of the call, an entry of "txn-results"
+        :param int min_fee: Minimum fee of a transaction on the network"""
+        result = txn_result["txn-result"]
+        inner_txns = count_inner_transactions(result)
+        exec_trace = txn_result.get("exec-trace")
+        return cls(
+            app_budget=txn_result.get("app-budget-consumed"),
+            inner_txns=inner_txns,
+            state_bytes=_state_bytes(result.get("global-state-delta", []))
+            + sum(
+                _state_bytes(local["delta"])
+                for local in result.get("local-state-delta", [])
+            ),
+            box_bytes=None if exec_trace is None else _box_bytes(exec_trace),
+            min_fee=min_fee * (1 + inner_txns),
+        )
+
+
+class Tracker:
+    """Simulates method calls before sending them, recording their costs
+
+    Calls are recorded by contract, method and, if it isn't NoOp, on completion, e.g.
+    f"{contract}.join[opt_in]".
+
+    :param Network network: Network the calls are made on"""
+
+    def __init__(self, network: Network):
+        self.network = network
+        self.costs: dict[str, Costs] = {}
+        # execution traces of the calls, if the network traces them
+        self.traces: dict[str, Mapping[str, typing.Any]] = {}
+        self._min_fee = network.algorand.client.algod.suggested_params().min_fee
+
+    def call(
+        self, name: str, composer: ExecutableComposer
+    ) -> AtomicTransactionResponse:
+        """Records the costs of the last call in `composer`, then sends the group
+
+        :param str name: Name to record the costs by
+        :param ExecutableComposer composer: Generated `Composer` holding the group
+        :returns AtomicTransactionResponse: The response of `composer.execute()`"""
+        response = composer.atc.simulate(
+            composer.app_client.algod_client,
+            models.SimulateRequest(
+                txn_groups=[],
+                allow_unnamed_resources=True,
+                exec_trace_config=models.SimulateTraceConfig(
+                    enable=True, state_change=True
+                ),
+            ),
+        )
+        if response.failure_message:
+            raise RuntimeError(f"{name} failed: {response.failure_message}")
+        txn_results = response.simulate_response["txn-groups"][0]["txn-results"]
+        self.costs[name] = Costs.of(txn_results[-1], self._min_fee)
+        if "exec-trace" in txn_results[-1]:
+            self.traces[name] = txn_results[-1]["exec-trace"]
+        return composer.execute()
+
+
+def _state_bytes(delta: Sequence[Mapping[str, typing.Any]]) -> int:
+    written = 0
+    for change in delta:
+        value = change["value"]
+        if value["action"] == _SET_BYTES:
+            written += len(base64.b64decode(change["key"]))
+            written += len(base64.b64decode(value.get("bytes", "")))
+        elif value["action"] == _SET_UINT:
+            written += len(base64.b64decode(change["key"])) + 8
+    return written
+
+
+def _box_bytes(exec_trace: Mapping[str, typing.Any]) -> int:
+    # a box written several times counts once, at its final size
+    boxes: dict[str, int] = {}
+    for trace in _traces(exec_trace):
+        for unit in trace.get("approval-program-trace", []):
+            for change in unit.get("state-changes", []):
+                if change["app-state-type"] != "b":
+                    continue
+                key = change["key"]
+                value = change.get("new-value", {}).get("bytes", "")
+                boxes[key] = len(base64.b64decode(key)) + len(base64.b64decode(value))
+    return sum(boxes.values())
+
+
+def _traces(exec_trace: Mapping[str, typing.Any]) -> Iterator[Mapping[str, typing.Any]]:
+    yield exec_trace
+    for inner in exec_trace.get("inner-trace", []):
+        yield from _traces(inner)
+
+
+def hello_world(tracker: Tracker) -> None:
+    creator = tracker.network.take_account()
+    client = HelloWorldClient(
+        tracker.network.algorand.client.algod,
+        sender=creator.address,
+        signer=creator.signer,
+    )
+    client.create_bare()
+
+    tracker.call("HelloWorld.hello", client.compose().hello(name="World"))
+    tracker.call(
+        "HelloWorld.hello_many",
+        client.compose().hello_many(
+            names=[f"World {i}" for i in range(MAX_NAMES_PER_CALL)]
+        ),
+    )
+
+
+def voting(tracker: Tracker) -> None:
+    creator, voter = tracker.network.take_account(), tracker.network.take_account()
+    client = VotingClient(
+        tracker.network.algorand.client.algod,
+        sender=creator.address,
+        signer=creator.signer,
+    )
+    client.create_bare()
+    tracker.network.fund(client.app_address)
+
+    tracker.call("Voting.set_topic", client.compose().set_topic(topic="Hello, World"))
+    tracker.call(
+        "Voting.opt_in[opt_in]",
+        client.compose().opt_in_opt_in(transaction_parameters=params(voter)),
+    )
+    tracker.call(
+        "Voting.vote",
+        client.compose().vote(
+            pay=tracker.network.payment(voter, client.app_address, VOTE_PAYMENT),
+            transaction_parameters=params(voter),
+        ),
+    )
+    tracker.call("Voting.get_votes", client.compose().get_votes())
+
+
+def box_voting(tracker: Tracker) -> None:
+    creator, voter = tracker.network.take_account(), tracker.network.take_account()
+    client = BoxVotingClient(
+        tracker.network.algorand.client.algod,
+        sender=creator.address,
+        signer=creator.signer,
+    )
+    client.create_bare()
+    tracker.network.fund(client.app_address)
+
+    topic = "Hello, World"
+    response = tracker.call(
+        "BoxVoting.add_topic",
+        client.compose().add_topic(
+            topic=topic,
+            options=2,
+            mbr=tracker.network.payment(
+                creator, client.app_address, topic_mbr(topic, 2)
+            ),
+        ),
+    )
+    topic_id = response.abi_results[-1].return_value
+    # no opt in, the vote's payment funds the voter's ballot box
+    tracker.call(
+        "BoxVoting.vote",
+        client.compose().vote(
+            topic_id=topic_id,
+            option=1,
+            pay=tracker.network.payment(voter, client.app_address, BALLOT_MBR),
+            transaction_parameters=params(voter),
+        ),
+    )
+    tracker.call("BoxVoting.get_votes", client.compose().get_votes(topic_id=topic_id))
+
+
+def auction(tracker: Tracker) -> None:
+    network = tracker.network
+    creator = network.take_account()
+    alice, bob = network.take_account(), network.take_account()
+    client = AuctionClient(
+        network.algorand.client.algod, sender=creator.address, signer=creator.signer
+    )
+    client.create_bare()
+    network.fund(client.app_address)
+    asset_id = network.algorand.send.asset_create(
+        AssetCreateParams(sender=creator.address, total=1, decimals=0)
+    )["confirmation"]["asset-index"]
+
+    tracker.call(
+        "Auction.opt_into_asset", client.compose().opt_into_asset(asset=asset_id)
+    )
+    axfer = network.algorand.transactions.asset_transfer(
+        AssetTransferParams(
+            sender=creator.address,
+            receiver=client.app_address,
+            asset_id=asset_id,
+            amount=1,
+        )
+    )
+    clock = LocalnetClock(network.algorand.client.algod, network.take_account())
+    with clock.hold():
+        tracker.call(
+            "Auction.start_auction",
+            client.compose().start_auction(
+                starting_price=1_000,
+                length=AUCTION_LENGTH,
+                axfer=TransactionWithSigner(axfer, creator.signer),
+            ),
+        )
+        for amount, bidder in ((200_000, alice), (300_000, bob)):
+            tracker.call(
+                "Auction.opt_in[opt_in]",
+                client.compose().opt_in_opt_in(transaction_parameters=params(bidder)),
+            )
+            tracker.call(
+                "Auction.bid",
+                client.compose().bid(
+                    pay=network.payment(bidder, client.app_address, amount),
+                    transaction_parameters=params(bidder),
+                ),
+            )
+
+        clock.advance(AUCTION_LENGTH + 1)
+        network.algorand.send.asset_opt_in(
+            AssetOptInParams(sender=bob.address, asset_id=asset_id)
+        )
+        tracker.call(
+            "Auction.claim_asset",
+            client.compose().claim_asset(
+                asset=asset_id, transaction_parameters=params(bob)
+            ),
+        )
+        # alice was outbid, so gets her whole bid back
+        tracker.call(
+            "Auction.claim_bids",
+            client.compose().claim_bids(transaction_parameters=params(alice)),
+        )
+        tracker.call(
+            "Auction.delete_application[delete_application]",
+            client.compose().delete_delete_application(),
+        )
+
+
+def multi_auction(tracker: Tracker) -> None:
+    network = tracker.network
+    seller = network.take_account()
+    alice, bob = network.take_account(), network.take_account()
+    client = MultiAuctionClient(
+        network.algorand.client.algod, sender=seller.address, signer=seller.signer
+    )
+    client.create_bare()
+    network.fund(client.app_address)
+    asset_id = network.algorand.send.asset_create(
+        AssetCreateParams(sender=seller.address, total=1, decimals=0)
+    )["confirmation"]["asset-index"]
+
+    tracker.call(
+        "MultiAuction.opt_into_asset",
+        client.compose().opt_into_asset(
+            asset=asset_id,
+            mbr=network.payment(seller, client.app_address, ASSET_OPT_IN_MBR),
+        ),
+    )
+    axfer = network.algorand.transactions.asset_transfer(
+        AssetTransferParams(
+            sender=seller.address,
+            receiver=client.app_address,
+            asset_id=asset_id,
+            amount=1,
+        )
+    )
+    clock = LocalnetClock(network.algorand.client.algod, network.take_account())
+    with clock.hold():
+        auction_id = (
+            tracker.call(
+                "MultiAuction.start_auction",
+                client.compose().start_auction(
+                    starting_price=100_000,
+                    length=AUCTION_LENGTH,
+                    axfer=TransactionWithSigner(axfer, seller.signer),
+                    mbr=network.payment(
+                        seller,
+                        client.app_address,
+                        AUCTION_BOX_MBR,
+                    ),
+                ),
+            )
+            .abi_results[-1]
+            .return_value
+        )
+        # each bidder's first bid also pays for their claim box
+        for amount, bidder in ((200_000, alice), (300_000, bob)):
+            tracker.call(
+                "MultiAuction.bid",
+                client.compose().bid(
+                    auction_id=auction_id,
+                    pay=network.payment(
+                        bidder,
+                        client.app_address,
+                        amount + CLAIM_BOX_MBR,
+                    ),
+                    transaction_parameters=params(bidder),
+                ),
+            )
+
+        clock.advance(AUCTION_LENGTH + 1)
+        network.algorand.send.asset_opt_in(
+            AssetOptInParams(sender=bob.address, asset_id=asset_id)
+        )
+        tracker.call(
+            "MultiAuction.settle", client.compose().settle(auction_id=auction_id)
+        )
+        tracker.call(
+            "MultiAuction.claim_asset",
+            client.compose().claim_asset(
+                auction_id=auction_id, transaction_parameters=params(bob)
+            ),
+        )
+        tracker.call(
+            "MultiAuction.claim_bids",
+            client.compose().claim_bids(
+                auction_id=auction_id, transaction_parameters=params(alice)
+            ),
+        )
+
+
+def refund_auction(tracker: Tracker) -> None:
+    network = tracker.network
+    creator = network.take_account()
+    alice, bob = network.take_account(), network.take_account()
+    client = RefundAuctionClient(
+        network.algorand.client.algod, sender=creator.address, signer=creator.signer
+    )
+    client.create_bare()
+    network.fund(client.app_address)
+    asset_id = network.algorand.send.asset_create(
+        AssetCreateParams(sender=creator.address, total=1, decimals=0)
+    )["confirmation"]["asset-index"]
+
+    tracker.call(
+        "RefundAuction.opt_into_asset",
+        client.compose().opt_into_asset(asset=asset_id),
+    )
+    axfer = network.algorand.transactions.asset_transfer(
+        AssetTransferParams(
+            sender=creator.address,
+            receiver=client.app_address,
+            asset_id=asset_id,
+            amount=1,
+        )
+    )
+    clock = LocalnetClock(network.algorand.client.algod, network.take_account())
+    with clock.hold():
+        tracker.call(
+            "RefundAuction.start_auction",
+            client.compose().start_auction(
+                starting_price=100_000,
+                length=AUCTION_LENGTH,
+                axfer=TransactionWithSigner(axfer, creator.signer),
+            ),
+        )
+        # bob's bid pays alice back, tracking the path with a refund
+        client.compose().bid(
+            pay=network.payment(alice, client.app_address, 200_000),
+            transaction_parameters=params(alice),
+        ).execute()
+        tracker.call(
+            "RefundAuction.bid",
+            client.compose().bid(
+                pay=network.payment(bob, client.app_address, 300_000),
+                transaction_parameters=params(bob),
+            ),
+        )
+
+        clock.advance(AUCTION_LENGTH + 1)
+        network.algorand.send.asset_opt_in(
+            AssetOptInParams(sender=bob.address, asset_id=asset_id)
+        )
+        tracker.call(
+            "RefundAuction.claim_asset",
+            client.compose().claim_asset(
+                asset=asset_id, transaction_parameters=params(bob)
+            ),
+        )
+        tracker.call(
+            "RefundAuction.delete_application[delete_application]",
+            client.compose().delete_delete_application(),
+        )
+
+
+def tictactoe(tracker: Tracker) -> None:
+    _play_tictactoe(tracker, TicTacToeClient, NEW_GAME_MBR)
+
+
+def tictactoe_bitboard(tracker: Tracker) -> None:
+    # the same game as `tictactoe`, so the costs of the two contracts compare
+    _play_tictactoe(tracker, bitboard.TicTacToeBitboardClient, bitboard.NEW_GAME_MBR)
+
+
+def tictactoe_stats(tracker: Tracker) -> None:
+    network = tracker.network
+    creator = network.take_account()
+    host, guest = network.take_account(), network.take_account()
+    client = TicTacToeStatsClient(
+        network.algorand.client.algod, sender=creator.address, signer=creator.signer
+    )
+    client.create_bare()
+    network.fund(client.app_address)
+
+    # the first game of each player also pays for their stats box, in place of the
+    # opt in of `tictactoe`
+    game_id = (
+        tracker.call(
+            "TicTacToeStats.new_game",
+            client.compose().new_game(
+                mbr=network.payment(
+                    host, client.app_address, client.new_game_mbr(host.address)
+                ),
+                transaction_parameters=params(host),
+            ),
+        )
+        .abi_results[-1]
+        .return_value
+    )
+    tracker.call(
+        "TicTacToeStats.join",
+        client.compose().join(
+            game_id=game_id,
+            mbr=network.payment(
+                guest, client.app_address, client.join_mbr(guest.address)
+            ),
+            transaction_parameters=params(guest),
+        ),
+    )
+    # the host's third move wins, updating both players' stats boxes
+    moves = [(host, 0, 0), (guest, 0, 1), (host, 1, 0), (guest, 1, 1)]
+    for player, x, y in moves:
+        client.move(game_id=game_id, x=x, y=y, transaction_parameters=params(player))
+    tracker.call(
+        "TicTacToeStats.move",
+        client.compose().move(
+            game_id=game_id, x=2, y=0, transaction_parameters=params(host)
+        ),
+    )
+    tracker.call(
+        "TicTacToeStats.get_stats",
+        client.compose().get_stats(player=host.address),
+    )
+    tracker.call(
+        "TicTacToeStats.delete_game",
+        client.compose().delete_game(
+            game_id=game_id, transaction_parameters=params(host)
+        ),
+    )
+
+
+def _play_tictactoe(
+    tracker: Tracker,
+    client_type: type[TicTacToeClient] | type[bitboard.TicTacToeBitboardClient],
+    game_mbr: int,
+) -> None:
+    network = tracker.network
+    creator = network.take_account()
+    host, guest = network.take_account(), network.take_account()
+    client = client_type(
+        network.algorand.client.algod, sender=creator.address, signer=creator.signer
+    )
+    client.create_bare()
+    network.fund(client.app_address)
+    contract = client.app_spec.contract.name
+
+    def new_game(name: str, add_call: Callable[..., ExecutableComposer]) -> int:
+        return (
+            tracker.call(
+                name,
+                add_call(
+                    mbr=network.payment(host, client.app_address, game_mbr),
+                    transaction_parameters=params(host),
+                ),
+            )
+            .abi_results[-1]
+            .return_value
+        )
+
+    game_id = new_game(f"{contract}.new_game[opt_in]", client.compose().opt_in_new_game)
+    other_game_id = new_game(f"{contract}.new_game", client.compose().new_game)
+    tracker.call(
+        f"{contract}.join[opt_in]",
+        client.compose().opt_in_join(
+            game_id=game_id, transaction_parameters=params(guest)
+        ),
+    )
+    tracker.call(
+        f"{contract}.join",
+        client.compose().join(
+            game_id=other_game_id, transaction_parameters=params(guest)
+        ),
+    )
+    # the host's third move wins, tracking the costliest path of `move`
+    moves = [(host, 0, 0), (guest, 0, 1), (host, 1, 0), (guest, 1, 1)]
+    for player, x, y in moves:
+        client.move(game_id=game_id, x=x, y=y, transaction_parameters=params(player))
+    tracker.call(
+        f"{contract}.move",
+        client.compose().move(
+            game_id=game_id, x=2, y=0, transaction_parameters=params(host)
+        ),
+    )
+    tracker.call(
+        f"{contract}.delete_game",
+        client.compose().delete_game(
+            game_id=game_id, transaction_parameters=params(host)
+        ),
+    )
+
+
+# Flows calling every ABI method of a contract, with the spec of the contract
+FLOWS: list[tuple[algokit_utils.ApplicationSpecification, Callable[[Tracker], None]]]
+FLOWS = [
+    (hello_world_client.APP_SPEC, hello_world),
+    (voting_client.APP_SPEC, voting),
+    (box_voting_client.APP_SPEC, box_voting),
+    (auction_client.APP_SPEC, auction),
+    (multi_auction_client.APP_SPEC, multi_auction),
+    (refund_auction_client.APP_SPEC, refund_auction),
+    (tic_tac_toe_client.APP_SPEC, tictactoe),
+    (tic_tac_toe_bitboard_client.APP_SPEC, tictactoe_bitboard),
+    (tic_tac_toe_stats_client.APP_SPEC, tictactoe_stats),
+]
+
+
+def method_names(app_spec: algokit_utils.ApplicationSpecification) -> set[str]:
+    """Returns the names `Tracker` records calls to the ABI methods of an app by
+
+    :param ApplicationSpecification app_spec: Spec of the app
+    :returns set[str]: A name for each ABI method and on completion it can be called
+    with"""
+    names = set()
+    for method in app_spec.contract.methods:
+        call_config = app_spec.hints[method.get_signature()].call_config
+        for action, config_value in call_config.items():
+            if not config_value & algokit_utils.CallConfig.CALL:
+                continue
+            suffix = "" if action == "no_op" else f"[{action}]"
+            names.add(f"{app_spec.contract.name}.{method.name}{suffix}")
+    return names
+
+
+def track(network: Network, contracts: Collection[str] | None = None) -> Tracker:
+    """Runs the flows of `FLOWS`, checking every ABI method was called
+
+    :param Network network: Network to call the methods on
+    :param Collection[str] contracts: (optional) Names of the contracts to run the
+    flows of, defaults to all of them
+    :returns Tracker: The tracker holding what the calls cost"""
+    tracker = Tracker(network)
+    for app_spec, flow in FLOWS:
+        if contracts is not None and app_spec.contract.name not in contracts:
+            continue
+        logger.info(f"Tracking {app_spec.contract.name}")
+        flow(tracker)
+        missing = method_names(app_spec) - tracker.costs.keys()
+        if missing:
+            raise RuntimeError(f"{flow.__name__} doesn't call {sorted(missing)}")
+    return tracker
+
+
+def compare(
+    costs: Mapping[str, Mapping[str, int | None]],
+    baseline: Mapping[str, Mapping[str, int | None]],
+    threshold: float,
+) -> list[str]:
+    """Compares costs, as in a report, with a baseline of the same
+
+    :param Mapping costs: Costs by method to check
+    :param Mapping baseline: Costs by method to check against. Costs None in
+    `costs`, e.g. opcode budgets on the stand-in, are skipped, while costs the
+    baseline has no value for count as regressions, as they would otherwise pass
+    unchecked
+    :param float threshold: Fraction a cost may grow by before it counts as a
+    regression
+    :returns list[str]: A description of each regression"""
+    regressions = []
+    for name, method_costs in costs.items():
+        for cost, value in method_costs.items():
+            base = baseline.get(name, {}).get(cost)
+            if value is None:
+                continue
+            if base is None:
+                regressions.append(f"{name}: {cost} {value}, missing from baseline")
+            elif value > base * (1 + threshold):
+                regressions.append(f"{name}: {cost} {value}, up from {base}")
+    return regressions
+
+
+def _programs() -> dict[str, str]:
+    # hashes of the approval programs, to tell which contracts changed
+    return {
+        path.parent.name: hashlib.sha256(path.read_bytes()).hexdigest()
+        for path in sorted(
+            (root_path.parent / "smart_contracts").glob("**/*.approval.teal")
+        )
+    }
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.costs",
+        description="Track opcode budget, inner transactions, state and fees of ABI methods",
+    )
+    parser.add_argument("--output", type=Path, help="file to write costs to")
+    parser.add_argument("--baseline", type=Path, default=root_path / "costs.json")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="fraction costs may exceed the baseline by",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="write costs to the baseline instead of comparing with it",
+    )
+    parser.add_argument(
+        "--localnet",
+        action="store_true",
+        help="run against a running AlgoKit LocalNet instead of the in-process stand-in",
+    )
+    args = parser.parse_args(argv)
+
+    config.configure(debug=False)
+    with connect(localnet=args.localnet) as network:
+        costs = dict(sorted(track(network).costs.items()))
+    report = {
+        "version": VERSION,
+        "network": "localnet" if args.localnet else "stand-in",
+        "programs": _programs(),
+        "costs": {name: dataclasses.asdict(c) for name, c in costs.items()},
+    }
+    output = json.dumps(report, indent=2) + "\n"
+    if args.output:
+        args.output.write_text(output)
+    if args.update_baseline:
+        args.baseline.write_text(output)
+        logger.info(f"Wrote baseline to {args.baseline}")
+        if not args.localnet:
+            logger.warning(
+                "The stand-in reports no opcode budgets or box bytes, so a LocalNet "
+                "run fails against this baseline, record it with --localnet"
+            )
+        return 0
+    if not args.output:
+        print(output, end="")
+
+    if not args.baseline.exists():
+        message = f"No baseline at {args.baseline}, record one with --update-baseline"
+        # a gate without a baseline would pass whatever the costs
+        if os.environ.get("CI"):
+            logger.error(message)
+            return 1
+        logger.warning(message)
+        return 0
+    baseline = json.loads(args.baseline.read_text())
+    if baseline.get("version") != VERSION:
+        logger.error(
+            f"Baseline is version {baseline.get('version')} rather than {VERSION}, "
+            "record it again with --update-baseline"
+        )
+        return 1
+    if baseline.get("network") != report["network"]:
+        logger.warning(
+            f"Baseline was recorded on the {baseline.get('network')} rather than the "
+            f"{report['network']}, record it again with --update-baseline on the "
+            "network that gates it"
+        )
+    regressions = compare(report["costs"], baseline["costs"], args.threshold)
+    for regression in regressions:
+        logger.error(f"Regression in {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)-10s: %(message)s"
+    )
+    sys.exit(main())
@@ -0,0 +1,102 @@
+import contextlib
+import dataclasses
+import itertools
+from collections.abc import Iterator
+
+from algokit_utils import (
+    TransactionParameters,
+    get_algod_client,
+    get_default_localnet_config,
+    get_indexer_client,
+    get_localnet_default_account,
+)
+from algokit_utils.beta.account_manager import AddressAndSigner
+from algokit_utils.beta.algorand_client import AlgorandClient, PayParams
+from algokit_utils.beta.client_manager import AlgoSdkClients
+from algosdk.atomic_transaction_composer import (
+    AccountTransactionSigner,
+    TransactionWithSigner,
+)
+
+from benchmarks.stand_in import LocalnetStandIn
+from smart_contracts._helpers.account_pool import AccountPool
+
+# Notes keeping otherwise identical calls, e.g. from concurrent streams sending in the
+# same round, from having the same transaction ID
+_notes = itertools.count()
+
+
+@dataclasses.dataclass(frozen=True)
+class Network:
+    """What benchmarks set up their apps and accounts with
+
+    :param AlgorandClient algorand: AlgorandClient of the network, signing for every
+    account taken from `account_pool`
+    :param AccountPool account_pool: Pool of funded accounts"""
+
+    algorand: AlgorandClient
+    account_pool: AccountPool
+
+    def take_account(self) -> AddressAndSigner:
+        acct = self.account_pool.take()
+        self.algorand.account.set_signer(acct.address, acct.signer)
+        return acct
+
+    def fund(self, app_address: str, amount: int = 1_000_000) -> None:
+        funder = self.account_pool.funder
+        self.algorand.send.payment(
+            PayParams(
+                sender=funder.address,
+                signer=funder.signer,
+                receiver=app_address,
+                amount=amount,
+            )
+        )
+
+    def payment(
+        self, sender: AddressAndSigner, receiver: str, amount: int
+    ) -> TransactionWithSigner:
+        """Returns a payment from `sender`, e.g. for an argument of a method call"""
+        txn = self.algorand.transactions.payment(
+            PayParams(sender=sender.address, receiver=receiver, amount=amount)
+        )
+        return TransactionWithSigner(txn, sender.signer)
+
+
+def params(acct: AddressAndSigner) -> TransactionParameters:
+    """Returns the parameters of a call sent and signed by `acct`"""
+    return TransactionParameters(
+        sender=acct.address, signer=acct.signer, note=f"bench:{next(_notes)}"
+    )
+
+
+@contextlib.contextmanager
+def connect(*, localnet: bool) -> Iterator[Network]:
+    """Connects to a running AlgoKit LocalNet, or to an in-process stand-in for the
+    duration of a `with` block
+
+    :param bool localnet: Whether to connect to LocalNet rather than the stand-in"""
+    if localnet:
+        algod_client = get_algod_client(get_default_localnet_config("algod"))
+        indexer_client = get_indexer_client(get_default_localnet_config("indexer"))
+        funder = get_localnet_default_account(algod_client)
+        yield _connect(AlgoSdkClients(algod_client, indexer_client), funder)
+        return
+    with LocalnetStandIn(algod_port=0, kmd_port=0, indexer_port=0) as stand_in:
+        clients = AlgoSdkClients(
+            get_algod_client(stand_in.config("algod")),
+            get_indexer_client(stand_in.config("indexer")),
+        )
+        ledger = stand_in.ledger
+        dispenser = AddressAndSigner(
+            ledger.dispenser_address,
+            AccountTransactionSigner(ledger.dispenser_private_key),
+        )
+        yield _connect(clients, dispenser)
+
+
+def _connect(clients: AlgoSdkClients, funder: AddressAndSigner) -> Network:
+    algorand = AlgorandClient.from_clients(clients)
+    algorand.set_suggested_params_timeout(0)
+    algorand.set_signer(funder.address, funder.signer)
+    return Network(algorand, AccountPool(clients.algod, funder))
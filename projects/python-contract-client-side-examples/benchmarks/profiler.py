@@ -0,0 +1,332 @@
+import argparse
+import ast
+import collections
+import dataclasses
+import importlib.util
+import json
+import logging
+import subprocess
+import sys
+import tempfile
+import typing
+from collections.abc import Iterable, Mapping, Sequence
+from pathlib import Path
+
+from algokit_utils.config import config
+from algosdk.v2client.algod import AlgodClient
+
+from benchmarks.costs import FLOWS, method_names, track
+from benchmarks.network import connect
+
+logger = logging.getLogger(__name__)
+
+# Characters of the base64 VLQ encoding of source map mappings
+_BASE64 = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+# Name profiles give the code of the approval program outside subroutines
+APPROVAL_PROGRAM = "approval_program"
+
+
+@dataclasses.dataclass(frozen=True)
+class SourceMap:
+    """Where in its sources each pc of a program comes from
+
+    :param Sequence[str] sources: Paths of the sources
+    :param Mapping[int, tuple[int, int]] lines: Index of the source and the line in
+    it, from 0, by pc"""
+
+    sources: Sequence[str]
+    lines: Mapping[int, tuple[int, int]]
+
+    @classmethod
+    def from_json(cls, source_map: Mapping[str, typing.Any]) -> "SourceMap":
+        """Reads a source map of version 3 in which each generated line is a pc, as
+        algod's compile and puya's `--output-source-map` write them"""
+        lines = {}
+        source, line = 0, 0
+        for pc, segments in enumerate(source_map["mappings"].split(";")):
+            for segment in filter(None, segments.split(",")):
+                fields = _decode_vlq(segment)
+                if len(fields) >= 3:
+                    source += fields[1]
+                    line += fields[2]
+                    lines.setdefault(pc, (source, line))
+        return cls(source_map.get("sources", []), lines)
+
+
+def _decode_vlq(segment: str) -> list[int]:
+    values, value, shift = [], 0, 0
+    for char in segment:
+        digit = _BASE64.index(char)
+        value += (digit & 0b11111) << shift
+        if digit & 0b100000:
+            shift += 5
+            continue
+        values.append(-(value >> 1) if value & 1 else value >> 1)
+        value, shift = 0, 0
+    return values
+
+
+@dataclasses.dataclass(frozen=True, order=True)
+class Line:
+    """A line of source code, numbered from 1"""
+
+    path: str
+    number: int
+
+    def __str__(self) -> str:
+        return f"{self.path}:{self.number}"
+
+
+class Program:
+    """Locates the pcs of an approval program in the contract it's compiled from
+
+    :param str teal: TEAL of the program, as written by puya
+    :param SourceMap teal_map: Source map from pcs to lines of `teal`
+    :param Path contract_path: Path of the contract's source
+    :param SourceMap source_map: (optional) Source map from pcs to lines of the
+    contract, without one each pc is located at the `def` of its subroutine"""
+
+    def __init__(
+        self,
+        teal: str,
+        teal_map: SourceMap,
+        contract_path: Path,
+        source_map: SourceMap | None = None,
+    ):
+        self.teal_lines = teal.splitlines()
+        self.teal_map = teal_map
+        self.contract_path = contract_path
+        self.source_map = source_map
+        self._defs = _definitions(contract_path, _approval_label(teal)[-2])
+        subroutines = {
+            op[1] for op in map(str.split, self.teal_lines) if op[:1] == ["callsub"]
+        }
+        # the subroutine each line of TEAL belongs to
+        self._functions: list[str] = []
+        function = APPROVAL_PROGRAM
+        for teal_line in self.teal_lines:
+            if (label := teal_line.strip().removesuffix(":")) in subroutines:
+                function = label
+            self._functions.append(function)
+
+    def op(self, pc: int) -> list[str]:
+        """Returns the opcode at `pc` and its immediate arguments"""
+        code = self.teal_lines[self.teal_map.lines[pc][1]]
+        return code.split("//")[0].split()
+
+    def function(self, pc: int) -> str:
+        """Returns the name of the subroutine `pc` is in"""
+        return self._functions[self.teal_map.lines[pc][1]]
+
+    def line(self, pc: int) -> Line:
+        """Returns the line of the contract `pc` was compiled from"""
+        if self.source_map is not None and pc in self.source_map.lines:
+            source, line = self.source_map.lines[pc]
+            return Line(_relative(self.source_map.sources[source]), line + 1)
+        return Line(_relative(str(self.contract_path)), self._defs[self.function(pc)])
+
+    def source(self, line: Line) -> str:
+        """Returns the code of a line of the contract"""
+        try:
+            return Path(line.path).read_text().splitlines()[line.number - 1].strip()
+        except (OSError, IndexError):
+            return ""
+
+
+def _approval_label(teal: str) -> list[str]:
+    # puya labels the approval program "<module>.<contract class>.approval_program"
+    label = next(line for line in teal.splitlines() if line.endswith(":"))
+    return label.removesuffix(":").split(".")
+
+
+def _definitions(contract_path: Path, class_name: str) -> dict[str, int]:
+    # lines of each function, the approval program being the contract class
+    defs = {}
+    for node in ast.parse(contract_path.read_text()).body:
+        if isinstance(node, ast.FunctionDef):
+            defs[node.name] = node.lineno
+        elif isinstance(node, ast.ClassDef) and node.name == class_name:
+            defs[APPROVAL_PROGRAM] = node.lineno
+            for member in node.body:
+                if isinstance(member, ast.FunctionDef):
+                    defs[member.name] = member.lineno
+    return defs
+
+
+def _relative(path: str) -> str:
+    try:
+        return str(Path(path).resolve().relative_to(Path.cwd()))
+    except ValueError:
+        return path
+
+
+@dataclasses.dataclass
+class Profile:
+    """Opcodes a call executed, by the line of the contract they were compiled from
+
+    Each opcode counts once, so opcodes with a higher budget cost than 1 are
+    undercounted. Cumulative counts include the subroutines a line calls."""
+
+    own: collections.Counter[Line] = dataclasses.field(
+        default_factory=collections.Counter
+    )
+    cumulative: collections.Counter[Line] = dataclasses.field(
+        default_factory=collections.Counter
+    )
+    # opcodes by stack of "<function> (<line>)" frames, outermost first
+    stacks: collections.Counter[tuple[str, ...]] = dataclasses.field(
+        default_factory=collections.Counter
+    )
+
+    @classmethod
+    def of(cls, program: Program, pcs: Iterable[int]) -> "Profile":
+        """Profiles the opcodes executed at `pcs`, in the order they ran"""
+        profile = cls()
+        # call sites of the subroutines being run
+        calls: list[tuple[Line, str]] = []
+        for pc in pcs:
+            line, function = program.line(pc), program.function(pc)
+            profile.own[line] += 1
+            for counted in {line, *(call_line for call_line, _ in calls)}:
+                profile.cumulative[counted] += 1
+            frames = [f"{f} ({call_line})" for call_line, f in calls]
+            profile.stacks[(*frames, f"{function} ({line})")] += 1
+            match program.op(pc):
+                case ["callsub", *_]:
+                    calls.append((line, function))
+                case ["retsub"] if calls:
+                    calls.pop()
+        return profile
+
+    @property
+    def total(self) -> int:
+        return sum(self.own.values())
+
+    def report(self, program: Program, limit: int = 20) -> str:
+        """Returns a table of the lines with the most cumulative opcodes"""
+        rows = [f"{'cumulative':>12} {'own':>8}  line", ""]
+        for line, cumulative in self.cumulative.most_common(limit):
+            share = f"{cumulative / self.total:.0%}"
+            rows.append(
+                f"{cumulative:>6} {share:>5} {self.own[line]:>8}  "
+                f"{line}  {program.source(line)}"
+            )
+        rows.append(f"\n{self.total} opcodes executed")
+        return "\n".join(rows)
+
+    def folded(self) -> str:
+        """Returns the stacks in the folded format of flamegraph.pl, speedscope and
+        other flame graph tools"""
+        return "".join(
+            f"{';'.join(stack)} {count}\n"
+            for stack, count in sorted(self.stacks.items())
+        )
+
+
+def compile_source_map(contract_path: Path, contract_name: str) -> SourceMap | None:
+    """Compiles a contract with puya as `build` does, returning the source map of its
+    approval program, or None if it can't be compiled"""
+    with tempfile.TemporaryDirectory() as out_dir:
+        result = subprocess.run(
+            [
+                "algokit",
+                "--no-color",
+                "compile",
+                "python",
+                contract_path.absolute(),
+                f"--out-dir={out_dir}",
+                "--output-source-map",
+                "--debug-level=0",
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            check=False,
+        )
+        map_path = Path(out_dir) / f"{contract_name}.approval.puya.map"
+        if result.returncode or not map_path.exists():
+            logger.warning(
+                f"Could not compile a source map of {contract_path}, locating opcodes "
+                f"by subroutine:\n{result.stdout}"
+            )
+            return None
+        return SourceMap.from_json(json.loads(map_path.read_text()))
+
+
+def teal_source_map(algod_client: AlgodClient, teal: str) -> SourceMap:
+    """Compiles TEAL with algod, returning the source map from pcs to its lines"""
+    compiled = algod_client.compile(teal, source_map=True)
+    return SourceMap.from_json(compiled["sourcemap"])  # type: ignore[call-overload]
+
+
+def contract_path(teal: str) -> Path:
+    """Returns the path of the contract puya compiled TEAL from, which puya names in
+    the label of the approval program"""
+    module = ".".join(_approval_label(teal)[:-2])
+    spec = importlib.util.find_spec(module)
+    if spec is None or spec.origin is None:
+        raise LookupError(f"Could not find module {module}")
+    return Path(spec.origin)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    names = sorted(name for app_spec, _ in FLOWS for name in method_names(app_spec))
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.profiler",
+        description="Profile the opcodes an ABI method executes by line of its contract, "
+        "on a running AlgoKit LocalNet",
+    )
+    parser.add_argument("method", help=f"method to profile, one of {', '.join(names)}")
+    parser.add_argument("--limit", type=int, default=20, help="lines to report")
+    parser.add_argument(
+        "--flamegraph", type=Path, help="file to write folded stacks to"
+    )
+    parser.add_argument(
+        "--source-map",
+        type=Path,
+        help="puya source map of the approval program, compiled when not given",
+    )
+    args = parser.parse_args(argv)
+    contract_name = args.method.split(".")[0]
+    app_spec = next(
+        (spec for spec, _ in FLOWS if spec.contract.name == contract_name), None
+    )
+    if app_spec is None:
+        parser.error(f"Unknown contract {contract_name}")
+
+    # the stand-in doesn't run the AVM, so can't trace it
+    config.configure(debug=False)
+    with connect(localnet=True) as network:
+        tracker = track(network, contracts=[contract_name])
+        trace = tracker.traces.get(args.method)
+        if trace is None:
+            parser.error(
+                f"No trace of {args.method}, pick one of {sorted(tracker.traces)}"
+            )
+        teal_map = teal_source_map(
+            network.algorand.client.algod, app_spec.approval_program
+        )
+
+    path = contract_path(app_spec.approval_program)
+    source_map = (
+        SourceMap.from_json(json.loads(args.source_map.read_text()))
+        if args.source_map
+        else compile_source_map(path, contract_name)
+    )
+    program = Program(app_spec.approval_program, teal_map, path, source_map)
+    profile = Profile.of(
+        program, (unit["pc"] for unit in trace["approval-program-trace"])
+    )
+    print(f"{args.method}, {tracker.costs[args.method].app_budget} budget consumed\n")
+    print(profile.report(program, args.limit))
+    if args.flamegraph:
+        args.flamegraph.write_text(profile.folded())
+        logger.info(f"Wrote folded stacks to {args.flamegraph}")
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)-10s: %(message)s"
+    )
+    sys.exit(main())
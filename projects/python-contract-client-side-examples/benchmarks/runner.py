@@ -0,0 +1,190 @@
+import dataclasses
+import statistics
+import threading
+import time
+import typing
+from collections.abc import Callable, Sequence
+
+from algosdk.atomic_transaction_composer import AtomicTransactionComposer
+
+# Modes every scenario is measured in
+SYNC = "sync"
+COMPOSED = "composed"
+CONCURRENT = "concurrent"
+MODES = (SYNC, COMPOSED, CONCURRENT)
+
+
+@dataclasses.dataclass(frozen=True)
+class Step:
+    """One typed client call of a scenario
+
+    :param Callable call: Makes the call through the typed client, on its own
+    :param Callable add_to: (optional) Adds the same call to a generated `Composer`
+    of the client, if the call can be batched
+    :param int txn_count: (optional) Transactions the call takes, with its
+    transaction arguments
+    :param int calls: (optional) Calls the step counts as, e.g. the names one
+    `hello_many` call greets, so its throughput compares with that of single calls"""
+
+    call: Callable[[], object]
+    add_to: Callable[[typing.Any], object] | None = None
+    txn_count: int = 1
+    calls: int = 1
+
+
+@dataclasses.dataclass(frozen=True)
+class Stream:
+    """Steps that have to run in order, and a composer to batch them in
+
+    :param Sequence[Step] steps: The steps, in order
+    :param Callable compose: (optional) Returns a new generated `Composer` of the
+    client the steps call, if they can be batched"""
+
+    steps: Sequence[Step]
+    compose: Callable[[], typing.Any] | None = None
+
+    @property
+    def composable(self) -> bool:
+        return self.compose is not None and all(s.add_to for s in self.steps)
+
+    @property
+    def calls(self) -> int:
+        return sum(step.calls for step in self.steps)
+
+
+@dataclasses.dataclass(frozen=True)
+class Result:
+    """Throughput and latency of a scenario in one mode
+
+    Latencies are of each operation, a single call or, when composed, a group."""
+
+    calls: int
+    seconds: float
+    latencies: Sequence[float] = dataclasses.field(repr=False)
+
+    @property
+    def calls_per_second(self) -> float:
+        return self.calls / self.seconds
+
+    def percentile(self, percent: int) -> float:
+        if len(self.latencies) == 1:
+            return self.latencies[0]
+        return statistics.quantiles(self.latencies, n=100, method="inclusive")[
+            percent - 1
+        ]
+
+    def as_dict(self) -> dict[str, object]:
+        return {
+            "calls": self.calls,
+            "operations": len(self.latencies),
+            "seconds": round(self.seconds, 4),
+            "calls_per_second": round(self.calls_per_second, 2),
+            "latency_ms": {
+                f"p{percent}": round(self.percentile(percent) * 1000, 3)
+                for percent in (50, 90, 99)
+            },
+        }
+
+
+def run(mode: str, streams: Sequence[Stream]) -> Result:
+    """Runs the steps of `streams` in `mode`
+
+    `SYNC` and `COMPOSED` run the first stream only, `CONCURRENT` runs each stream on
+    a thread of its own."""
+    match mode:
+        case "sync":
+            return _timed(lambda latencies: _run_calls(streams[0], latencies))
+        case "composed":
+            return _timed(lambda latencies: _run_composed(streams[0], latencies))
+        case "concurrent":
+            return _timed(lambda latencies: _run_concurrently(streams, latencies))
+    raise ValueError(f"Unknown mode {mode}")
+
+
+def _timed(run_steps: Callable[[list[float]], int]) -> Result:
+    latencies: list[float] = []
+    start = time.perf_counter()
+    calls = run_steps(latencies)
+    return Result(calls, time.perf_counter() - start, latencies)
+
+
+def _run_calls(stream: Stream, latencies: list[float]) -> int:
+    for step in stream.steps:
+        start = time.perf_counter()
+        step.call()
+        latencies.append(time.perf_counter() - start)
+    return stream.calls
+
+
+def _run_composed(stream: Stream, latencies: list[float]) -> int:
+    if not stream.composable:
+        raise ValueError("Steps can't be batched")
+    assert stream.compose
+    for group in _pack(stream.steps):
+        start = time.perf_counter()
+        composer = stream.compose()
+        for step in group:
+            assert step.add_to
+            step.add_to(composer)
+        composer.execute()
+        latencies.append(time.perf_counter() - start)
+    return stream.calls
+
+
+def _run_concurrently(streams: Sequence[Stream], latencies: list[float]) -> int:
+    errors: list[BaseException] = []
+
+    def run_stream(stream: Stream) -> None:
+        try:
+            _run_calls(stream, latencies)
+        except BaseException as ex:
+            errors.append(ex)
+
+    threads = [threading.Thread(target=run_stream, args=(s,)) for s in streams]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+    return sum(stream.calls for stream in streams)
+
+
+def _pack(steps: Sequence[Step]) -> list[list[Step]]:
+    groups: list[list[Step]] = [[]]
+    txn_count = 0
+    for step in steps:
+        if txn_count + step.txn_count > AtomicTransactionComposer.MAX_GROUP_SIZE:
+            groups.append([])
+            txn_count = 0
+        groups[-1].append(step)
+        txn_count += step.txn_count
+    return [group for group in groups if group]
+
+
+def compare(
+    results: dict[str, dict[str, typing.Any]],
+    baseline: dict[str, dict[str, typing.Any]],
+    tolerance: float,
+) -> list[str]:
+    """Compares results of `Result.as_dict`, by scenario and mode, with a baseline of
+    the same
+
+    :param dict results: Results to check
+    :param dict baseline: Results to check against, those missing from either are
+    skipped
+    :param float tolerance: Fraction throughput may drop by, or p90 latency may grow
+    by, before it counts as a regression, p99 being too noisy to compare over a few
+    hundred calls
+    :returns list[str]: A description of each regression"""
+    regressions = []
+    for name, result in results.items():
+        if (base := baseline.get(name)) is None:
+            continue
+        rate, base_rate = result["calls_per_second"], base["calls_per_second"]
+        if rate < base_rate * (1 - tolerance):
+            regressions.append(f"{name}: {rate} calls/s, down from {base_rate} calls/s")
+        p90, base_p90 = result["latency_ms"]["p90"], base["latency_ms"]["p90"]
+        if p90 > base_p90 * (1 + tolerance):
+            regressions.append(f"{name}: p90 latency {p90} ms, up from {base_p90} ms")
+    return regressions
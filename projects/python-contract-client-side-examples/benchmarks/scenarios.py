@@ -0,0 +1,260 @@
+import typing
+from collections.abc import Callable
+
+from algokit_utils.beta.account_manager import AddressAndSigner
+from algokit_utils.beta.algorand_client import (
+    AssetCreateParams,
+    AssetTransferParams,
+)
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    TransactionWithSigner,
+)
+
+from benchmarks.network import Network, params
+from benchmarks.runner import Step, Stream
+from smart_contracts.artifacts.auction import auction_client
+from smart_contracts.artifacts.hello_world import hello_world_client
+from smart_contracts.artifacts.tictactoe import tic_tac_toe_client
+from smart_contracts.auction.client import AuctionClient
+from smart_contracts.hello_world.client import HelloWorldClient, pack_names
+from smart_contracts.tictactoe.client import NEW_GAME_MBR, TicTacToeClient
+from smart_contracts.voting.client import VOTE_PAYMENT, VotingClient
+
+# Moves of a game the host wins in, as (x, y) taking turns from the host
+GAME_MOVES = ((0, 0), (0, 1), (1, 0), (1, 1), (2, 0))
+
+
+# Builds `count` streams of `calls` steps each, on apps and accounts it sets up
+Scenario = Callable[[Network, int, int], list[Stream]]
+
+
+def _execute_in_groups(
+    compose: Callable[[], typing.Any],
+    add_calls: list[Callable[[typing.Any], object]],
+    per_group: int = AtomicTransactionComposer.MAX_GROUP_SIZE,
+) -> None:
+    for start in range(0, len(add_calls), per_group):
+        composer = compose()
+        for add_call in add_calls[start : start + per_group]:
+            add_call(composer)
+        composer.execute()
+
+
+def hello(network: Network, calls: int, count: int) -> list[Stream]:
+    """`HelloWorldClient.hello`, from an account per stream"""
+    creator = network.take_account()
+    client = HelloWorldClient(
+        network.algorand.client.algod, sender=creator.address, signer=creator.signer
+    )
+    client.create_bare()
+
+    def stream() -> Stream:
+        caller = network.take_account()
+
+        def call() -> object:
+            return client.hello(name="World", transaction_parameters=params(caller))
+
+        def add_to(composer: hello_world_client.Composer) -> object:
+            return composer.hello(name="World", transaction_parameters=params(caller))
+
+        return Stream([Step(call, add_to)] * calls, client.compose)
+
+    return [stream() for _ in range(count)]
+
+
+def hello_many(network: Network, calls: int, count: int) -> list[Stream]:
+    """`HelloWorldClient.hello_many`, from an account per stream, each call greeting
+    as many of the stream's names as fit and counting as a call per name"""
+    creator = network.take_account()
+    client = HelloWorldClient(
+        network.algorand.client.algod, sender=creator.address, signer=creator.signer
+    )
+    client.create_bare()
+
+    def stream() -> Stream:
+        caller = network.take_account()
+
+        def step(names: list[str]) -> Step:
+            def call() -> object:
+                return client.hello_many(
+                    names=names, transaction_parameters=params(caller)
+                )
+
+            def add_to(composer: hello_world_client.Composer) -> object:
+                return composer.hello_many(
+                    names=names, transaction_parameters=params(caller)
+                )
+
+            return Step(call, add_to, calls=len(names))
+
+        names = [f"World {i}" for i in range(calls)]
+        return Stream([step(chunk) for chunk in pack_names(names)], client.compose)
+
+    return [stream() for _ in range(count)]
+
+
+def vote(network: Network, calls: int, count: int) -> list[Stream]:
+    """`VotingClient.vote`, each call from a voter opted in beforehand
+
+    `vote` has to be in a group of its own with its payment, so it can't be batched."""
+    creator = network.take_account()
+    client = VotingClient(
+        network.algorand.client.algod, sender=creator.address, signer=creator.signer
+    )
+    client.create_bare()
+    network.fund(client.app_address)
+
+    def step(voter: AddressAndSigner) -> Step:
+        def call() -> object:
+            return client.vote(
+                pay=network.payment(voter, client.app_address, VOTE_PAYMENT),
+                transaction_parameters=params(voter),
+            )
+
+        return Step(call, txn_count=2)
+
+    voters = [network.take_account() for _ in range(calls * count)]
+    _execute_in_groups(
+        client.compose,
+        [
+            lambda composer, voter=voter: composer.opt_in_opt_in(
+                transaction_parameters=params(voter)
+            )
+            for voter in voters
+        ],
+    )
+    return [
+        Stream([step(voter) for voter in voters[start : start + calls]])
+        for start in range(0, len(voters), calls)
+    ]
+
+
+def bid(network: Network, calls: int, count: int) -> list[Stream]:
+    """`AuctionClient.bid`, each stream outbidding itself in an auction of its own"""
+
+    def stream() -> Stream:
+        creator = network.take_account()
+        bidder = network.take_account()
+        client = AuctionClient(
+            network.algorand.client.algod,
+            sender=creator.address,
+            signer=creator.signer,
+        )
+        client.create_bare()
+        network.fund(client.app_address)
+        asset_id = network.algorand.send.asset_create(
+            AssetCreateParams(sender=creator.address, total=1, decimals=0)
+        )["confirmation"]["asset-index"]
+        client.opt_into_asset(asset=asset_id)
+        axfer = network.algorand.transactions.asset_transfer(
+            AssetTransferParams(
+                sender=creator.address,
+                receiver=client.app_address,
+                asset_id=asset_id,
+                amount=1,
+            )
+        )
+        client.start_auction(
+            starting_price=1_000,
+            length=3_600,
+            axfer=TransactionWithSigner(axfer, creator.signer),
+        )
+        bidder_client = client.as_account(bidder.address, bidder.signer)
+        bidder_client.opt_in_opt_in()
+
+        def step(amount: int) -> Step:
+            def call() -> object:
+                return bidder_client.bid(
+                    pay=network.payment(bidder, client.app_address, amount),
+                    transaction_parameters=params(bidder),
+                )
+
+            def add_to(composer: auction_client.Composer) -> object:
+                return composer.bid(
+                    pay=network.payment(bidder, client.app_address, amount),
+                    transaction_parameters=params(bidder),
+                )
+
+            return Step(call, add_to, txn_count=2)
+
+        return Stream([step(1_001 + i) for i in range(calls)], bidder_client.compose)
+
+    return [stream() for _ in range(count)]
+
+
+def move(network: Network, calls: int, count: int) -> list[Stream]:
+    """`TicTacToeClient.move`, each stream playing games of its own that the host wins
+    in five moves"""
+    creator = network.take_account()
+    client = TicTacToeClient(
+        network.algorand.client.algod, sender=creator.address, signer=creator.signer
+    )
+    client.create_bare()
+    network.fund(client.app_address)
+
+    def new_games(host: AddressAndSigner, guest: AddressAndSigner) -> list[int]:
+        games = -(-calls // len(GAME_MOVES))
+        game_ids = [
+            client.opt_in_new_game(
+                mbr=network.payment(host, client.app_address, NEW_GAME_MBR),
+                transaction_parameters=params(host),
+            ).return_value
+        ]
+        game_ids += [
+            client.new_game(
+                mbr=network.payment(host, client.app_address, NEW_GAME_MBR),
+                transaction_parameters=params(host),
+            ).return_value
+            for _ in range(games - 1)
+        ]
+        client.opt_in_join(game_id=game_ids[0], transaction_parameters=params(guest))
+        _execute_in_groups(
+            client.compose,
+            [
+                lambda composer, game_id=game_id: composer.join(
+                    game_id=game_id, transaction_parameters=params(guest)
+                )
+                for game_id in game_ids[1:]
+            ],
+        )
+        return game_ids
+
+    def stream() -> Stream:
+        host, guest = network.take_account(), network.take_account()
+        players = (host, guest)
+
+        def step(game_id: int, turn: int) -> Step:
+            x, y = GAME_MOVES[turn]
+            player = players[turn % 2]
+
+            def call() -> object:
+                return client.move(
+                    game_id=game_id, x=x, y=y, transaction_parameters=params(player)
+                )
+
+            def add_to(composer: tic_tac_toe_client.Composer) -> object:
+                return composer.move(
+                    game_id=game_id, x=x, y=y, transaction_parameters=params(player)
+                )
+
+            return Step(call, add_to)
+
+        steps = [
+            step(game_id, turn)
+            for game_id in new_games(host, guest)
+            for turn in range(len(GAME_MOVES))
+        ]
+        return Stream(steps[:calls], client.compose)
+
+    return [stream() for _ in range(count)]
+
+
+# Scenarios by name, each measuring one typed client method
+SCENARIOS: dict[str, Scenario] = {
+    "hello": hello,
+    "hello_many": hello_many,
+    "vote": vote,
+    "bid": bid,
+    "move": move,
+}
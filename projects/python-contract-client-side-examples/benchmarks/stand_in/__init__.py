@@ -0,0 +1,4 @@
+from benchmarks.stand_in.ledger import Ledger, RejectedError
+from benchmarks.stand_in.server import LocalnetStandIn
+
+__all__ = ["Ledger", "LocalnetStandIn", "RejectedError"]
@@ -0,0 +1,454 @@
+import contextlib
+import dataclasses
+import inspect
+import typing
+from collections.abc import Callable, Iterator, Sequence
+from unittest import mock
+
+import algopy
+
+# the test context keeps app state and the min balance in internals only, which is
+# why pyproject.toml pins algorand-python-testing to one release
+from _algopy_testing import arc4 as testing_arc4
+from _algopy_testing.context_helpers import lazy_context
+from algopy import Account, Application, Asset, BigUInt, Bytes, String, UInt64, arc4
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+from algosdk import constants, transaction
+from algosdk.abi import Method
+from algosdk.logic import get_application_address
+
+from benchmarks.stand_in.state import (
+    ASSET_MIN_BALANCE,
+    BOX_BYTE_MIN_BALANCE,
+    BOX_FLAT_MIN_BALANCE,
+    State,
+    StateValue,
+)
+
+# Method metadata `algopy_testing` attaches to ARC-4 methods
+_ARC4_METADATA = "arc4_metadata"
+
+
+def _struct_from_bytes(cls: type[arc4.Struct], value: Bytes | bytes, /) -> arc4.Struct:
+    # `algopy_testing` passes the decoded fields positionally, which `kw_only`
+    # structs like TicTacToe's `GameState` refuse
+    fields = testing_arc4._tuple_type_from_struct(cls).from_bytes(value).native
+    return cls(**dict(zip(cls._type_info.field_names, fields, strict=True)))
+
+
+def _kw_only_structs() -> contextlib.AbstractContextManager[object]:
+    # patched only while a contract runs, rather than for everything else using
+    # `algopy_testing` in the process, such as unit tests; the ledger runs one
+    # contract at a time
+    return mock.patch.object(
+        testing_arc4.Struct, "from_bytes", classmethod(_struct_from_bytes)
+    )
+
+
+class ContractRejectedError(Exception):
+    """The contract failed the call, with a message in the style of the AVM's"""
+
+
+@dataclasses.dataclass
+class AppCallOutcome:
+    global_state: dict[bytes, StateValue]
+    # local state of every account holding some for the app, by address
+    local_state: dict[str, dict[bytes, StateValue]]
+    boxes: dict[bytes, bytes]
+    logs: list[bytes]
+    inner_txns: list[transaction.Transaction]
+
+
+def call_contract(
+    state: State,
+    group: Sequence[transaction.Transaction],
+    index: int,
+    app_id: int,
+    *,
+    round_num: int,
+    latest_timestamp: int,
+) -> AppCallOutcome:
+    """Runs the app call at `index` of `group` through the app's contract class
+
+    The call sees `state` as it is when the call is reached, with any opt in of the
+    call already applied, and leaves it untouched. Inner transactions are returned
+    rather than applied."""
+    txn = typing.cast(transaction.ApplicationCallTxn, group[index])
+    app = state.apps[app_id]
+    with _kw_only_structs(), algopy_testing_context() as context:
+        _load_assets(context, state)
+        _load_accounts(context, state, group, app_id)
+        context.ledger.patch_global_fields(
+            round=UInt64(round_num),
+            latest_timestamp=UInt64(latest_timestamp),
+            asset_opt_in_min_balance=UInt64(ASSET_MIN_BALANCE),
+        )
+        # the contract gets the next app id of the context when it's instantiated
+        context.ledger._app_id = iter([app_id])
+        gtxns = [_group_txn(context, t, app_id) for t in group]
+        with context.txn.create_group(gtxns, active_txn_index=index):
+            contract = app.contract()
+            app_data = lazy_context.get_app_data(app_id)
+            context.ledger.update_app(app_id, creator=Account(app.creator))
+            if txn.index != 0:
+                # only a create runs `__init__` on chain, so restore what it replaced
+                app_data.global_state.clear()
+                app_data.global_state.update(app.global_state)
+            app_data.boxes.update(app.boxes)
+            for address, account in state.accounts.items():
+                if app_id in account.local_state:
+                    lazy_context.get_account_data(address).opted_apps[app_id] = (
+                        Application(app_id)
+                    )
+                    for key, value in account.local_state[app_id].items():
+                        app_data.local_state[(address, key)] = value
+            _track_box_min_balance(state, app_id, app_data.boxes)
+            app_data.is_creating = txn.index == 0
+            try:
+                _route(contract, txn, gtxns, index)
+            except Exception as ex:
+                raise ContractRejectedError(_avm_message(ex)) from ex
+
+        local_state: dict[str, dict[bytes, StateValue]] = {}
+        for (address, key), value in app_data.local_state.items():
+            local_state.setdefault(address, {})[key] = value
+        active_fields = context.txn.last_group.active_txn.fields
+        return AppCallOutcome(
+            global_state=dict(app_data.global_state),
+            local_state=local_state,
+            boxes=dict(app_data.boxes),
+            logs=[_as_bytes(log) for log in active_fields.get("logs", [])],
+            inner_txns=[
+                _inner_txn(inner.fields, txn)
+                for itxn_group in context.txn.last_group.itxn_groups
+                for inner in itxn_group
+            ],
+        )
+
+
+def _load_assets(context: AlgopyTestContext, state: State) -> None:
+    for asset_id, asset in state.assets.items():
+        context.any.asset(
+            asset_id=asset_id,
+            creator=Account(asset.creator),
+            total=UInt64(asset.total),
+            decimals=UInt64(asset.decimals),
+            default_frozen=asset.default_frozen,
+            unit_name=Bytes(asset.unit_name.encode()),
+            name=Bytes(asset.name.encode()),
+            url=Bytes(asset.url.encode()),
+            metadata_hash=Bytes(asset.metadata_hash),
+            manager=Account(asset.manager),
+            reserve=Account(asset.reserve),
+            freeze=Account(asset.freeze),
+            clawback=Account(asset.clawback),
+        )
+
+
+def _load_accounts(
+    context: AlgopyTestContext,
+    state: State,
+    group: Sequence[transaction.Transaction],
+    app_id: int,
+) -> None:
+    addresses = {get_application_address(app_id), state.apps[app_id].creator}
+    for txn in group:
+        addresses.update(_addresses(txn))
+    addresses.update(
+        address
+        for address, account in state.accounts.items()
+        if app_id in account.local_state
+    )
+    addresses.discard(constants.ZERO_ADDRESS)
+    for address in addresses:
+        account = state.accounts.get(address)
+        if account is None:
+            continue
+        context.any.account(
+            address,
+            balance=UInt64(account.balance),
+            opted_asset_balances=dict(account.assets),
+        )
+
+
+def _addresses(txn: transaction.Transaction) -> Iterator[str]:
+    yield txn.sender
+    match txn:
+        case transaction.PaymentTxn():
+            yield txn.receiver
+            if txn.close_remainder_to:
+                yield txn.close_remainder_to
+        case transaction.AssetTransferTxn():
+            yield txn.receiver
+            if txn.close_assets_to:
+                yield txn.close_assets_to
+        case transaction.ApplicationCallTxn():
+            yield from txn.accounts or []
+            for app_id in txn.foreign_apps or []:
+                yield get_application_address(app_id)
+
+
+def _track_box_min_balance(
+    state: State, app_id: int, boxes: dict[bytes, bytes]
+) -> None:
+    # creating or deleting a box changes the app account's min balance mid call
+    address = get_application_address(app_id)
+    base = state.min_balance(address, with_boxes=False)
+
+    def min_balance() -> int:
+        return base + sum(
+            BOX_FLAT_MIN_BALANCE + BOX_BYTE_MIN_BALANCE * (len(name) + len(value))
+            for name, value in boxes.items()
+        )
+
+    account_data = lazy_context.get_account_data(address)
+    account_data.fields = _LiveMinBalance(account_data.fields, min_balance)  # type: ignore[assignment]
+
+
+class _LiveMinBalance(dict[str, object]):
+    def __init__(
+        self, fields: typing.Mapping[str, object], min_balance: Callable[[], int]
+    ):
+        super().__init__(fields)
+        self._min_balance = min_balance
+
+    def __getitem__(self, key: str) -> object:
+        if key == "min_balance":
+            return UInt64(self._min_balance())
+        return super().__getitem__(key)
+
+
+def _group_txn(
+    context: AlgopyTestContext, txn: transaction.Transaction, app_id: int
+) -> algopy.gtxn.TransactionBase:
+    base = {
+        "sender": Account(txn.sender),
+        "fee": UInt64(txn.fee),
+        "first_valid": UInt64(txn.first_valid_round),
+        "last_valid": UInt64(txn.last_valid_round),
+        "note": Bytes(txn.note or b""),
+        "lease": Bytes(txn.lease or b""),
+        "rekey_to": _account(txn.rekey_to),
+    }
+    match txn:
+        case transaction.PaymentTxn():
+            return context.any.txn.payment(
+                **base,
+                receiver=Account(txn.receiver),
+                amount=UInt64(txn.amt),
+                close_remainder_to=_account(txn.close_remainder_to),
+            )
+        case transaction.AssetTransferTxn():
+            return context.any.txn.asset_transfer(
+                **base,
+                xfer_asset=Asset(txn.index),
+                asset_amount=UInt64(txn.amount),
+                asset_receiver=Account(txn.receiver),
+                asset_close_to=_account(txn.close_assets_to),
+                asset_sender=_account(txn.revocation_target),
+            )
+        case transaction.ApplicationCallTxn():
+            called_app_id = txn.index or app_id
+            return context.any.txn.application_call(
+                **base,
+                app_id=Application(called_app_id),
+                on_completion=algopy.OnCompleteAction(txn.on_complete),
+                app_args=[Bytes(arg) for arg in txn.app_args or []],
+                accounts=[Account(a) for a in [txn.sender, *(txn.accounts or [])]],
+                assets=[Asset(a) for a in txn.foreign_assets or []],
+                apps=[
+                    Application(a) for a in [called_app_id, *(txn.foreign_apps or [])]
+                ],
+            )
+        case transaction.AssetConfigTxn():
+            return context.any.txn.asset_config(
+                **base, config_asset=Asset(txn.index or 0)
+            )
+    return context.any.txn.transaction(**base)
+
+
+def _account(address: str | None) -> Account:
+    return Account(address or constants.ZERO_ADDRESS)
+
+
+def _route(
+    contract: algopy.ARC4Contract,
+    txn: transaction.ApplicationCallTxn,
+    gtxns: Sequence[algopy.gtxn.TransactionBase],
+    index: int,
+) -> None:
+    if txn.on_complete == transaction.OnComplete.ClearStateOC:
+        contract.clear_state_program()
+        return
+
+    contract_cls = type(contract)
+    if txn.app_args:
+        selector = bytes(txn.app_args[0])
+        method = _abi_methods(contract_cls).get(selector)
+        if method is None:
+            raise ContractRejectedError(
+                f"no ARC-4 method with selector {selector.hex()}"
+            )
+        args = _decode_args(method, txn, gtxns, index)
+        getattr(contract, method.__name__)(*args)
+        return
+
+    on_completion = algopy.OnCompleteAction(txn.on_complete).name
+    for method in _bare_methods(contract_cls):
+        if on_completion in _allowed_actions(method):
+            getattr(contract, method.__name__)()
+            return
+    # without create methods of its own, an ARC-4 contract is created by a bare call
+    creating = txn.index == 0
+    if not (
+        creating and on_completion == "NoOp" and not _has_create_methods(contract_cls)
+    ):
+        raise ContractRejectedError(f"no bare method for {on_completion}")
+
+
+def _arc4_methods(contract_cls: type) -> Iterator[Callable[..., object]]:
+    seen = set[str]()
+    for cls in contract_cls.__mro__:
+        for name, member in vars(cls).items():
+            if name not in seen and hasattr(member, _ARC4_METADATA):
+                seen.add(name)
+                yield member
+
+
+def _abi_methods(contract_cls: type) -> dict[bytes, Callable[..., object]]:
+    return {
+        Method.from_signature(signature).get_selector(): method
+        for method in _arc4_methods(contract_cls)
+        if (signature := getattr(method, _ARC4_METADATA).arc4_signature)
+    }
+
+
+def _bare_methods(contract_cls: type) -> list[Callable[..., object]]:
+    return [
+        method
+        for method in _arc4_methods(contract_cls)
+        if not getattr(method, _ARC4_METADATA).arc4_signature
+    ]
+
+
+def _allowed_actions(method: Callable[..., object]) -> list[str]:
+    return [
+        action if isinstance(action, str) else action.name
+        for action in getattr(method, _ARC4_METADATA).allow_actions
+    ]
+
+
+def _has_create_methods(contract_cls: type) -> bool:
+    return any(
+        getattr(method, _ARC4_METADATA).is_create
+        for method in _arc4_methods(contract_cls)
+    )
+
+
+def _decode_args(
+    method: Callable[..., object],
+    txn: transaction.ApplicationCallTxn,
+    gtxns: Sequence[algopy.gtxn.TransactionBase],
+    index: int,
+) -> list[object]:
+    annotations = inspect.get_annotations(method, eval_str=True)
+    annotations.pop("return", None)
+    arg_types = list(annotations.values())
+    if len(arg_types) > 15:
+        raise ContractRejectedError(
+            "methods with more than 15 arguments aren't supported"
+        )
+
+    # transaction arguments are the transactions just before the call, in order
+    txn_index = index - sum(_is_txn_type(arg_type) for arg_type in arg_types)
+    raw_args = iter(txn.app_args[1:])
+    accounts = [txn.sender, *(txn.accounts or [])]
+    apps = [txn.index, *(txn.foreign_apps or [])]
+    args: list[object] = []
+    for arg_type in arg_types:
+        if _is_txn_type(arg_type):
+            args.append(gtxns[txn_index])
+            txn_index += 1
+            continue
+        raw = bytes(next(raw_args))
+        if arg_type is Account:
+            args.append(Account(accounts[raw[0]]))
+        elif arg_type is Asset:
+            args.append(Asset((txn.foreign_assets or [])[raw[0]]))
+        elif arg_type is Application:
+            args.append(Application(apps[raw[0]]))
+        elif arg_type is UInt64:
+            args.append(UInt64(int.from_bytes(raw)))
+        elif arg_type is BigUInt:
+            args.append(BigUInt(int.from_bytes(raw)))
+        elif arg_type is bool:
+            args.append(arc4.Bool.from_bytes(raw).native)
+        elif arg_type is String:
+            args.append(arc4.String.from_bytes(raw).native)
+        elif arg_type is Bytes:
+            args.append(arc4.DynamicBytes.from_bytes(raw).native)
+        else:
+            args.append(arg_type.from_bytes(raw))
+    return args
+
+
+def _is_txn_type(arg_type: object) -> bool:
+    return isinstance(arg_type, type) and issubclass(
+        arg_type, algopy.gtxn.TransactionBase
+    )
+
+
+def _inner_txn(
+    fields: typing.Mapping[str, typing.Any], outer: transaction.Transaction
+) -> transaction.Transaction:
+    sp = transaction.SuggestedParams(
+        fee=int(fields["fee"]),
+        first=outer.first_valid_round,
+        last=outer.last_valid_round,
+        gh=outer.genesis_hash,
+        flat_fee=True,
+    )
+    sender = str(fields["sender"])
+    note = _as_bytes(fields["note"]) or None
+    txn_type = fields["type"]
+    if txn_type == algopy.TransactionType.Payment:
+        return transaction.PaymentTxn(
+            sender,
+            sp,
+            str(fields["receiver"]),
+            int(fields["amount"]),
+            close_remainder_to=_address(fields["close_remainder_to"]),
+            note=note,
+        )
+    if txn_type == algopy.TransactionType.AssetTransfer:
+        asset_sender = _address(fields["asset_sender"])
+        return transaction.AssetTransferTxn(
+            sender,
+            sp,
+            str(fields["asset_receiver"]),
+            int(fields["asset_amount"]),
+            int(fields["xfer_asset"].id),
+            close_assets_to=_address(fields["asset_close_to"]),
+            revocation_target=None if asset_sender == sender else asset_sender,
+            note=note,
+        )
+    raise ContractRejectedError(
+        f"inner transactions of type {fields['type']} aren't supported"
+    )
+
+
+def _address(account: object) -> str | None:
+    address = str(account)
+    return None if address == constants.ZERO_ADDRESS else address
+
+
+def _as_bytes(value: object) -> bytes:
+    return value if isinstance(value, bytes) else typing.cast(Bytes, value).value
+
+
+def _avm_message(ex: Exception) -> str:
+    if isinstance(ex, ContractRejectedError):
+        return str(ex)
+    if isinstance(ex, AssertionError):
+        return f"assert failed: {ex}" if str(ex) else "assert failed"
+    return f"{type(ex).__name__}: {ex}"
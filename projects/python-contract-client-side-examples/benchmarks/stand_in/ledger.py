@@ -0,0 +1,534 @@
+import base64
+import copy
+import dataclasses
+import hashlib
+import importlib
+import re
+import threading
+import time
+import typing
+from collections.abc import Sequence
+
+from algopy import ARC4Contract
+from algosdk import account, constants, encoding, transaction
+
+from benchmarks.stand_in.contracts import ContractRejectedError, call_contract
+from benchmarks.stand_in.state import App, Asset, Schema, State, StateValue
+
+MIN_FEE = 1_000
+GENESIS_ID = "dockernet-v1"
+GENESIS_HASH = base64.b64encode(hashlib.sha256(GENESIS_ID.encode()).digest()).decode()
+# Balance of the dispenser account, which funds everything else
+DISPENSER_BALANCE = 10**16
+# Maximum rounds a transaction can be valid for
+MAX_TXN_LIFE = 1_000
+
+# Label puya puts at the start of a contract's programs, naming the contract class
+_PROGRAM_LABEL = re.compile(
+    r"^(?P<module>[\w.]+)\.(?P<cls>\w+)\.(?:approval|clear_state)_program:$",
+    re.MULTILINE,
+)
+_PRAGMA_VERSION = re.compile(r"^#pragma version (\d+)", re.MULTILINE)
+
+# msgpack keys of transaction fields holding addresses
+_ADDRESS_KEYS = frozenset(
+    (
+        "snd",
+        "rcv",
+        "close",
+        "asnd",
+        "arcv",
+        "aclose",
+        "rekey",
+        "fadd",
+        "m",
+        "r",
+        "f",
+        "c",
+    )
+)
+
+
+class RejectedError(Exception):
+    """The ledger refused a group of transactions, with a message like algod's
+
+    :param str message: What was wrong
+    :param int index: (optional) Index in the group of the transaction at fault"""
+
+    def __init__(self, message: str, index: int | None = None):
+        super().__init__(message)
+        self.index = index
+
+
+@dataclasses.dataclass
+class Block:
+    timestamp: int
+    tx_ids: list[str] = dataclasses.field(default_factory=list)
+
+
+@dataclasses.dataclass
+class Committed:
+    round_num: int
+    intra_round_offset: int
+    signed_txn: transaction.GenericSignedTransaction
+    # what algod reports about the transaction besides the transaction itself
+    result: dict[str, object]
+
+
+class Ledger:
+    """A single node chain held in memory, which confirms each group in a block of its
+    own as soon as it's sent
+
+    Payments, asset creation, opt ins and transfers, and app calls are applied.
+    App calls run the algopy contract class named by the compiled program, through
+    `algopy_testing`, so only programs compiled by `compile` can be called. Signatures
+    aren't checked and no opcode budget is modelled.
+
+    :param int dispenser_balance: (optional) MicroAlgos of the dispenser account"""
+
+    def __init__(self, dispenser_balance: int = DISPENSER_BALANCE):
+        self.dispenser_private_key, self.dispenser_address = account.generate_account()
+        self.state = State()
+        dispenser = self.state.account(self.dispenser_address)
+        dispenser.balance = dispenser_balance
+        dispenser.online = True
+        self.timestamp_offset = 0
+        now = int(time.time())
+        self.blocks = [Block(now), Block(now)]
+        self.committed: dict[str, Committed] = {}
+        self._programs: dict[bytes, type[ARC4Contract] | None] = {}
+        self._new_block = threading.Condition()
+
+    @property
+    def last_round(self) -> int:
+        return len(self.blocks) - 1
+
+    def wait_for_block_after(self, round_num: int, timeout: float) -> int:
+        """Blocks until a round after `round_num` or `timeout` seconds, returning the
+        last round"""
+        with self._new_block:
+            self._new_block.wait_for(lambda: self.last_round > round_num, timeout)
+            return self.last_round
+
+    def compile(self, source: str) -> bytes:
+        """Returns a stand-in program for the TEAL `source`, which app calls run through
+        the contract class its label names"""
+        version = _PRAGMA_VERSION.search(source)
+        program = bytes([int(version.group(1)) if version else 1])
+        program += hashlib.sha256(source.encode()).digest()
+        with self._new_block:
+            self._programs[program] = _contract_class(source)
+        return program
+
+    def send(self, signed_txns: Sequence[transaction.GenericSignedTransaction]) -> str:
+        """Applies a group of transactions and confirms it in a new block, returning
+        the ID of the first transaction"""
+        with self._new_block:
+            state = self.state.copy()
+            round_num = self.last_round + 1
+            results = self._apply_group(state, signed_txns, round_num)
+            # as in dev mode, an offset can move timestamps back as well as forward
+            block = Block(int(time.time()) + self.timestamp_offset)
+            for offset, (signed_txn, result) in enumerate(
+                zip(signed_txns, results, strict=True)
+            ):
+                tx_id = signed_txn.get_txid()
+                block.tx_ids.append(tx_id)
+                self.committed[tx_id] = Committed(round_num, offset, signed_txn, result)
+            self.state = state
+            self.blocks.append(block)
+            self._new_block.notify_all()
+        return block.tx_ids[0]
+
+    def simulate(
+        self, signed_txns: Sequence[transaction.GenericSignedTransaction]
+    ) -> dict[str, object]:
+        """Applies a group of transactions to a copy of the ledger, returning the
+        simulate response of the group"""
+        with self._new_block:
+            state = self.state.copy()
+            round_num = self.last_round + 1
+            results: list[dict[str, object]] = []
+            group: dict[str, object] = {}
+            try:
+                results = self._apply_group(state, signed_txns, round_num, results)
+            except RejectedError as ex:
+                group["failure-message"] = str(ex)
+                group["failed-at"] = [ex.index or 0]
+        # transactions after a failure get empty results, as with algod
+        results += [{}] * (len(signed_txns) - len(results))
+        group["txn-results"] = [
+            {"txn-result": {"txn": signed_json(signed_txn), "pool-error": "", **result}}
+            for signed_txn, result in zip(signed_txns, results, strict=True)
+        ]
+        return {"version": 2, "last-round": round_num - 1, "txn-groups": [group]}
+
+    def pending_info(self, tx_id: str) -> dict[str, object]:
+        committed = self.committed.get(tx_id)
+        if committed is None:
+            raise LookupError("txn does not exist")
+        return {
+            "confirmed-round": committed.round_num,
+            "pool-error": "",
+            "txn": signed_json(committed.signed_txn),
+            **committed.result,
+        }
+
+    def _apply_group(
+        self,
+        state: State,
+        signed_txns: Sequence[transaction.GenericSignedTransaction],
+        round_num: int,
+        results: list[dict[str, object]] | None = None,
+    ) -> list[dict[str, object]]:
+        txns = [signed_txn.transaction for signed_txn in signed_txns]
+        if not 0 < len(txns) <= constants.TX_GROUP_LIMIT:
+            raise RejectedError(
+                f"group size {len(txns)} is outside 1 to {constants.TX_GROUP_LIMIT}"
+            )
+        _check_group_id(txns)
+        fee_credit = sum(txn.fee for txn in txns) - MIN_FEE * len(txns)
+        if fee_credit < 0:
+            raise RejectedError(
+                f"txgroup had {sum(txn.fee for txn in txns)} in fees, which is less than "
+                f"the minimum {len(txns)} * {MIN_FEE}"
+            )
+        credit = [fee_credit]
+        results = [] if results is None else results
+        for index, txn in enumerate(txns):
+            tx_id = txn.get_txid()
+            try:
+                self._check_txn(txn, tx_id, round_num)
+                _debit(state, txn.sender, txn.fee)
+                results.append(self._apply(state, txns, index, round_num, credit))
+            except ContractRejectedError as ex:
+                app_id = getattr(txn, "index", 0)
+                raise RejectedError(
+                    f"transaction {tx_id}: logic eval error: {ex}. "
+                    f"Details: app={app_id}, pc=0, opcodes=",
+                    index,
+                ) from ex
+            except (ValueError, LookupError) as ex:
+                raise RejectedError(f"transaction {tx_id}: {ex}", index) from ex
+        for address in {txn.sender for txn in txns} | _receivers(txns):
+            holder = state.accounts.get(address)
+            if holder is None or (holder.balance == 0 and not holder.assets):
+                continue
+            if holder.balance < (min_balance := state.min_balance(address)):
+                raise RejectedError(
+                    f"account {address} balance {holder.balance} below min {min_balance}"
+                )
+        return results
+
+    def _check_txn(
+        self, txn: transaction.Transaction, tx_id: str, round_num: int
+    ) -> None:
+        if not txn.first_valid_round <= round_num <= txn.last_valid_round:
+            raise ValueError(
+                f"txn dead: round {round_num} outside of "
+                f"{txn.first_valid_round}--{txn.last_valid_round}"
+            )
+        if txn.last_valid_round - txn.first_valid_round > MAX_TXN_LIFE:
+            raise ValueError(f"validity period exceeds {MAX_TXN_LIFE} rounds")
+        if txn.genesis_hash != GENESIS_HASH:
+            raise ValueError("genesis hash mismatch")
+        if tx_id in self.committed:
+            raise ValueError(f"transaction already in ledger: {tx_id}")
+
+    def _apply(
+        self,
+        state: State,
+        group: Sequence[transaction.Transaction],
+        index: int,
+        round_num: int,
+        credit: list[int],
+    ) -> dict[str, object]:
+        txn = group[index]
+        match txn:
+            case transaction.PaymentTxn():
+                _pay(state, txn)
+            case transaction.AssetTransferTxn():
+                _transfer_asset(state, txn)
+            case transaction.AssetConfigTxn():
+                return {"asset-index": _configure_asset(state, txn)}
+            case transaction.ApplicationCallTxn():
+                return self._call_app(state, group, index, round_num, credit)
+            case _:
+                raise ValueError(f"{txn.type} transactions aren't supported")
+        return {}
+
+    def _call_app(
+        self,
+        state: State,
+        group: Sequence[transaction.Transaction],
+        index: int,
+        round_num: int,
+        credit: list[int],
+    ) -> dict[str, object]:
+        txn = typing.cast(transaction.ApplicationCallTxn, group[index])
+        result: dict[str, object] = {}
+        if txn.index == 0:
+            app_id = self._create_app(state, txn, round_num)
+            result["application-index"] = app_id
+        else:
+            app_id = txn.index
+        app = state.live_app(app_id)
+        caller = state.account(txn.sender)
+        if txn.on_complete == transaction.OnComplete.OptInOC:
+            if app_id in caller.local_state:
+                raise ValueError(
+                    f"account {txn.sender} has already opted in to app {app_id}"
+                )
+            caller.local_state[app_id] = {}
+        elif app_id not in caller.local_state and txn.on_complete in (
+            transaction.OnComplete.CloseOutOC,
+            transaction.OnComplete.ClearStateOC,
+        ):
+            raise ValueError(f"account {txn.sender} is not opted in to app {app_id}")
+
+        try:
+            outcome = call_contract(
+                state,
+                group,
+                index,
+                app_id,
+                round_num=round_num,
+                latest_timestamp=self.blocks[-1].timestamp,
+            )
+        except ContractRejectedError:
+            # clearing state can't fail, the app just doesn't get a say in it
+            if txn.on_complete != transaction.OnComplete.ClearStateOC:
+                raise
+            del caller.local_state[app_id]
+            return result
+
+        app.global_schema.check(outcome.global_state, "global state")
+        if global_delta := _state_delta(app.global_state, outcome.global_state):
+            result["global-state-delta"] = global_delta
+        app.global_state = outcome.global_state
+        app.boxes = outcome.boxes
+        local_deltas = []
+        for address, holder in state.accounts.items():
+            if app_id in holder.local_state:
+                local_state = outcome.local_state.pop(address, {})
+                if delta := _state_delta(holder.local_state[app_id], local_state):
+                    local_deltas.append({"address": address, "delta": delta})
+                holder.local_state[app_id] = local_state
+                app.local_schema.check(holder.local_state[app_id], "local state")
+        if local_deltas:
+            result["local-state-delta"] = local_deltas
+        for address in outcome.local_state:
+            raise ContractRejectedError(
+                f"account {address} is not opted in to app {app_id}"
+            )
+
+        match txn.on_complete:
+            case (
+                transaction.OnComplete.CloseOutOC | transaction.OnComplete.ClearStateOC
+            ):
+                del caller.local_state[app_id]
+            case transaction.OnComplete.DeleteApplicationOC:
+                app.deleted = True
+            case transaction.OnComplete.UpdateApplicationOC:
+                app.contract = self._contract(txn.approval_program)
+                app.approval_program = txn.approval_program
+                app.clear_program = txn.clear_program
+
+        inner_txns = []
+        for inner_txn in outcome.inner_txns:
+            credit[0] += inner_txn.fee - MIN_FEE
+            if credit[0] < 0:
+                raise ContractRejectedError("fee too small")
+            _debit(state, inner_txn.sender, inner_txn.fee)
+            inner_result = self._apply(state, [inner_txn], 0, round_num, credit)
+            inner_txns.append(
+                {"txn": {"txn": _json(inner_txn.dictify())}, **inner_result}
+            )
+        result["logs"] = [base64.b64encode(log).decode() for log in outcome.logs]
+        if inner_txns:
+            result["inner-txns"] = inner_txns
+        return result
+
+    def _create_app(
+        self, state: State, txn: transaction.ApplicationCallTxn, round_num: int
+    ) -> int:
+        app_id = state.new_index()
+        global_schema = txn.global_schema or transaction.StateSchema(0, 0)
+        local_schema = txn.local_schema or transaction.StateSchema(0, 0)
+        state.add_app(
+            app_id,
+            App(
+                creator=txn.sender,
+                created_at_round=round_num,
+                contract=self._contract(txn.approval_program),
+                approval_program=txn.approval_program,
+                clear_program=txn.clear_program,
+                global_schema=Schema(
+                    global_schema.num_uints, global_schema.num_byte_slices
+                ),
+                local_schema=Schema(
+                    local_schema.num_uints, local_schema.num_byte_slices
+                ),
+                extra_pages=txn.extra_pages,
+            ),
+        )
+        return app_id
+
+    def _contract(self, program: bytes) -> type[ARC4Contract]:
+        contract = self._programs.get(program)
+        if contract is None:
+            raise ValueError(
+                "the approval program doesn't name an algopy contract, "
+                "compile it through the stand-in"
+            )
+        return contract
+
+
+def _contract_class(source: str) -> type[ARC4Contract] | None:
+    label = _PROGRAM_LABEL.search(source)
+    if label is None:
+        return None
+    try:
+        module = importlib.import_module(label.group("module"))
+    except ImportError:
+        return None
+    contract = getattr(module, label.group("cls"), None)
+    return (
+        contract
+        if isinstance(contract, type) and issubclass(contract, ARC4Contract)
+        else None
+    )
+
+
+def _check_group_id(txns: Sequence[transaction.Transaction]) -> None:
+    if len(txns) == 1 and not txns[0].group:
+        return
+    ungrouped = [copy.copy(txn) for txn in txns]
+    for txn in ungrouped:
+        txn.group = None
+    group_id = transaction.calculate_group_id(ungrouped)
+    if any(txn.group != group_id for txn in txns):
+        raise RejectedError("transaction group is incomplete or has the wrong group id")
+
+
+def _state_delta(
+    before: dict[bytes, StateValue], after: dict[bytes, StateValue]
+) -> list[dict[str, object]]:
+    # as algod reports it, action 1 sets bytes, 2 sets a uint and 3 deletes
+    delta: list[dict[str, object]] = []
+    for key in sorted(before.keys() | after.keys()):
+        if key not in after:
+            value: dict[str, object] = {"action": 3}
+        elif before.get(key) == (new_value := after[key]):
+            continue
+        elif isinstance(new_value, int):
+            value = {"action": 2, "uint": new_value}
+        else:
+            value = {"action": 1, "bytes": base64.b64encode(new_value).decode()}
+        delta.append({"key": base64.b64encode(key).decode(), "value": value})
+    return delta
+
+
+def _receivers(txns: Sequence[transaction.Transaction]) -> set[str]:
+    receivers = set[str]()
+    for txn in txns:
+        if isinstance(txn, transaction.PaymentTxn | transaction.AssetTransferTxn):
+            receivers.add(txn.receiver)
+    return receivers
+
+
+def _debit(state: State, address: str, amount: int) -> None:
+    holder = state.account(address)
+    if holder.balance < amount:
+        raise ValueError(
+            f"overspend (account {address}, data {{balance: {holder.balance}}}, "
+            f"tried to spend {amount})"
+        )
+    holder.balance -= amount
+
+
+def _pay(state: State, txn: transaction.PaymentTxn) -> None:
+    _debit(state, txn.sender, txn.amt)
+    state.account(txn.receiver).balance += txn.amt
+    if txn.close_remainder_to:
+        sender = state.account(txn.sender)
+        state.account(txn.close_remainder_to).balance += sender.balance
+        sender.balance = 0
+
+
+def _transfer_asset(state: State, txn: transaction.AssetTransferTxn) -> None:
+    asset_id = txn.index
+    if asset_id not in state.assets:
+        raise LookupError(f"asset {asset_id} does not exist")
+    asset = state.assets[asset_id]
+    source = txn.sender
+    if txn.revocation_target:
+        if txn.sender != asset.clawback:
+            raise ValueError(f"{txn.sender} is not the clawback of asset {asset_id}")
+        source = txn.revocation_target
+    holdings = state.account(source).assets
+    receiver = state.account(txn.receiver)
+
+    if source == txn.receiver and txn.amount == 0 and asset_id not in holdings:
+        holdings[asset_id] = 0  # opt in
+        return
+    if asset_id not in holdings:
+        raise ValueError(f"asset {asset_id} missing from {source}")
+    if asset_id not in receiver.assets:
+        raise ValueError(
+            f"receiver error: must optin, asset {asset_id} missing from {txn.receiver}"
+        )
+    if holdings[asset_id] < txn.amount:
+        raise ValueError(
+            f"underflow on subtracting {txn.amount} from sender amount {holdings[asset_id]}"
+        )
+    holdings[asset_id] -= txn.amount
+    receiver.assets[asset_id] += txn.amount
+
+    if txn.close_assets_to:
+        close_to = state.account(txn.close_assets_to)
+        if asset_id not in close_to.assets:
+            raise ValueError(
+                f"receiver error: must optin, asset {asset_id} missing from {txn.close_assets_to}"
+            )
+        close_to.assets[asset_id] += holdings.pop(asset_id)
+
+
+def _configure_asset(state: State, txn: transaction.AssetConfigTxn) -> int:
+    if txn.index:
+        raise ValueError("only creating assets is supported")
+    asset_id = state.new_index()
+    state.assets[asset_id] = Asset(
+        creator=txn.sender,
+        total=txn.total,
+        decimals=txn.decimals,
+        default_frozen=bool(txn.default_frozen),
+        unit_name=txn.unit_name or "",
+        name=txn.asset_name or "",
+        url=txn.url or "",
+        metadata_hash=txn.metadata_hash or bytes(32),
+        manager=txn.manager or constants.ZERO_ADDRESS,
+        reserve=txn.reserve or constants.ZERO_ADDRESS,
+        freeze=txn.freeze or constants.ZERO_ADDRESS,
+        clawback=txn.clawback or constants.ZERO_ADDRESS,
+    )
+    state.account(txn.sender).assets[asset_id] = txn.total
+    return asset_id
+
+
+def signed_json(signed_txn: transaction.GenericSignedTransaction) -> dict[str, object]:
+    """Renders a signed transaction the way algod's JSON responses do"""
+    return typing.cast(dict[str, object], _json(signed_txn.dictify()))
+
+
+def _json(value: object, key: str = "") -> object:
+    match value:
+        case dict():
+            return {k: _json(v, k) for k, v in value.items()}
+        case list():
+            return [_json(v, key) for v in value]
+        case bytes() if key in _ADDRESS_KEYS or key == "apat":
+            return encoding.encode_address(value)
+        case bytes():
+            return base64.b64encode(value).decode()
+    return value
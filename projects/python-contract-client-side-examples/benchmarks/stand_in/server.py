@@ -0,0 +1,681 @@
+import base64
+import json
+import re
+import threading
+import typing
+import urllib.parse
+from collections.abc import Callable, Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import TracebackType
+
+import msgpack  # type: ignore[import-untyped]
+from algokit_utils import AlgoClientConfig
+from algosdk import encoding, transaction
+
+from benchmarks.stand_in.ledger import (
+    GENESIS_HASH,
+    GENESIS_ID,
+    MIN_FEE,
+    Ledger,
+    RejectedError,
+    signed_json,
+)
+from benchmarks.stand_in.state import Account, App, Asset, Schema, StateValue
+
+# Name of the kmd wallet holding the dispenser, which algokit looks for on LocalNet
+DEFAULT_WALLET = "unencrypted-default-wallet"
+# API token of LocalNet, which the stand-in accepts without checking
+TOKEN = "a" * 64
+# Seconds `wait-for-block-after` waits for a block before answering with the last one
+WAIT_TIMEOUT = 1.0
+
+Query = dict[str, str]
+Handler = Callable[[re.Match[str], Query, bytes], object]
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class _Service:
+    """Routes requests of one of the servers to methods, by HTTP method and path"""
+
+    def __init__(self, ledger: Ledger):
+        self.ledger = ledger
+        self.routes: list[tuple[str, re.Pattern[str], Handler]] = []
+
+    def route(self, method: str, path: str, handler: Handler) -> None:
+        self.routes.append((method, re.compile(f"^{path}$"), handler))
+
+    def dispatch(self, method: str, path: str, query: Query, body: bytes) -> object:
+        for route_method, pattern, handler in self.routes:
+            if route_method == method and (match := pattern.match(path)):
+                return handler(match, query, body)
+        raise HTTPError(404, f"no route for {method} {path}")
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    server: "_Server"
+
+    def do_GET(self) -> None:  # noqa: N802
+        self._handle("GET")
+
+    def do_POST(self) -> None:  # noqa: N802
+        self._handle("POST")
+
+    def do_DELETE(self) -> None:  # noqa: N802
+        self._handle("DELETE")
+
+    def _handle(self, method: str) -> None:
+        url = urllib.parse.urlsplit(self.path)
+        query = dict(urllib.parse.parse_qsl(url.query))
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        try:
+            status, payload = 200, self.server.service.dispatch(
+                method, url.path, query, body
+            )
+        except HTTPError as ex:
+            status, payload = ex.status, {"message": str(ex)}
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], service: _Service):
+        super().__init__(address, _RequestHandler)
+        self.service = service
+
+
+class LocalnetStandIn:
+    """Serves algod, kmd and indexer APIs from an in memory `Ledger`, on the ports of
+    AlgoKit LocalNet, so code written against LocalNet runs without it
+
+    Use it as a context manager, the servers run on background threads until it exits.
+    Pass port 0 to listen on any free port, e.g. for a stand-in per pytest-xdist
+    worker, and connect through `config`.
+
+    :param Ledger ledger: (optional) Ledger to serve, a new one by default
+    :param str host: (optional) Host to listen on
+    :param int algod_port: (optional) Port for algod
+    :param int kmd_port: (optional) Port for kmd
+    :param int indexer_port: (optional) Port for indexer"""
+
+    def __init__(
+        self,
+        ledger: Ledger | None = None,
+        *,
+        host: str = "localhost",
+        algod_port: int = 4001,
+        kmd_port: int = 4002,
+        indexer_port: int = 8980,
+    ):
+        self.ledger = ledger or Ledger()
+        self._addresses = {
+            "algod": (host, algod_port),
+            "kmd": (host, kmd_port),
+            "indexer": (host, indexer_port),
+        }
+        self._servers: dict[str, _Server] = {}
+
+    def port(self, name: str) -> int:
+        """Returns the port "algod", "kmd" or "indexer" listens on"""
+        return int(self._servers[name].server_address[1])
+
+    def config(self, name: str) -> AlgoClientConfig:
+        """Returns the config to connect to "algod" or "indexer" with"""
+        host = self._addresses[name][0]
+        return AlgoClientConfig(f"http://{host}:{self.port(name)}", TOKEN)
+
+    def __enter__(self) -> "LocalnetStandIn":
+        services = {
+            "algod": _Algod(self.ledger),
+            "kmd": _Kmd(self.ledger),
+            "indexer": _Indexer(self.ledger),
+        }
+        try:
+            for name, service in services.items():
+                self._servers[name] = _Server(self._addresses[name], service)
+        except OSError:
+            self._close()
+            raise
+        for server in self._servers.values():
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        for server in self._servers.values():
+            server.shutdown()
+        self._close()
+
+    def _close(self) -> None:
+        for server in self._servers.values():
+            server.server_close()
+        self._servers.clear()
+
+
+class _Algod(_Service):
+    def __init__(self, ledger: Ledger):
+        super().__init__(ledger)
+        self.route("GET", "/health", lambda *_: {})
+        self.route("GET", "/v2/status", lambda *_: self._status())
+        self.route(
+            "GET", r"/v2/status/wait-for-block-after/(\d+)", self._wait_for_block_after
+        )
+        self.route("GET", "/v2/transactions/params", lambda *_: self._params())
+        self.route("POST", "/v2/transactions", self._send)
+        self.route("POST", "/v2/transactions/simulate", self._simulate)
+        self.route("GET", r"/v2/transactions/pending/(\w+)", self._pending)
+        self.route("POST", "/v2/teal/compile", self._compile)
+        self.route("GET", r"/v2/blocks/(\d+)", self._block)
+        self.route("GET", r"/v2/blocks/(\d+)/txids", self._block_txids)
+        self.route("GET", r"/v2/accounts/(\w+)", self._account)
+        self.route("GET", r"/v2/accounts/(\w+)/assets/(\d+)", self._account_asset)
+        self.route("GET", r"/v2/accounts/(\w+)/applications/(\d+)", self._account_app)
+        self.route("GET", r"/v2/assets/(\d+)", self._asset)
+        self.route("GET", r"/v2/applications/(\d+)", self._app)
+        self.route("GET", r"/v2/applications/(\d+)/boxes", self._boxes)
+        self.route("GET", r"/v2/applications/(\d+)/box", self._box)
+        self.route("GET", "/v2/devmode/blocks/offset", self._get_offset)
+        self.route("POST", r"/v2/devmode/blocks/offset/(\d+)", self._set_offset)
+
+    def _status(self) -> dict[str, object]:
+        return {
+            "last-round": self.ledger.last_round,
+            "last-version": "future",
+            "next-version": "future",
+            "next-version-round": self.ledger.last_round + 1,
+            "next-version-supported": True,
+            "time-since-last-round": 0,
+            "catchup-time": 0,
+            "stopped-at-unsupported-round": False,
+        }
+
+    def _wait_for_block_after(
+        self, match: re.Match[str], *_: object
+    ) -> dict[str, object]:
+        self.ledger.wait_for_block_after(int(match[1]), WAIT_TIMEOUT)
+        return self._status()
+
+    def _params(self) -> dict[str, object]:
+        return {
+            "consensus-version": "future",
+            "fee": 0,
+            "genesis-hash": GENESIS_HASH,
+            "genesis-id": GENESIS_ID,
+            "last-round": self.ledger.last_round,
+            "min-fee": MIN_FEE,
+        }
+
+    def _send(self, _: re.Match[str], __: Query, body: bytes) -> dict[str, object]:
+        unpacker = msgpack.Unpacker(raw=False)
+        unpacker.feed(body)
+        try:
+            tx_id = self.ledger.send([_signed_txn(signed) for signed in unpacker])
+        except RejectedError as ex:
+            raise HTTPError(400, f"TransactionPool.Remember: {ex}") from ex
+        return {"txId": tx_id}
+
+    def _simulate(self, _: re.Match[str], __: Query, body: bytes) -> dict[str, object]:
+        request = msgpack.unpackb(body, raw=False)
+        groups = request.get("txn-groups", [])
+        if len(groups) != 1:
+            raise HTTPError(400, "simulating exactly one group is supported")
+        return self.ledger.simulate(
+            [_signed_txn(signed) for signed in groups[0]["txns"]]
+        )
+
+    def _pending(self, match: re.Match[str], *_: object) -> dict[str, object]:
+        try:
+            return self.ledger.pending_info(match[1])
+        except LookupError as ex:
+            raise HTTPError(404, str(ex)) from ex
+
+    def _compile(
+        self, _: re.Match[str], query: Query, body: bytes
+    ) -> dict[str, object]:
+        program = self.ledger.compile(body.decode())
+        response: dict[str, object] = {
+            "hash": encoding.encode_address(encoding.checksum(b"Program" + program)),
+            "result": base64.b64encode(program).decode(),
+        }
+        if query.get("sourcemap", "").lower() == "true":
+            response["sourcemap"] = {
+                "version": 3,
+                "sources": [],
+                "names": [],
+                "mappings": "",
+            }
+        return response
+
+    def _block(self, match: re.Match[str], *_: object) -> dict[str, object]:
+        round_num = self._round(match)
+        return {
+            "block": {"rnd": round_num, "ts": self.ledger.blocks[round_num].timestamp}
+        }
+
+    def _block_txids(self, match: re.Match[str], *_: object) -> dict[str, object]:
+        return {"blockTxids": self.ledger.blocks[self._round(match)].tx_ids}
+
+    def _round(self, match: re.Match[str]) -> int:
+        round_num = int(match[1])
+        if round_num > self.ledger.last_round:
+            raise HTTPError(
+                404,
+                f"failed to retrieve information from the ledger: round {round_num}",
+            )
+        return round_num
+
+    def _account(self, match: re.Match[str], *_: object) -> dict[str, object]:
+        return account_json(self.ledger, match[1])
+
+    def _account_asset(self, match: re.Match[str], *_: object) -> dict[str, object]:
+        holder = self.ledger.state.accounts.get(match[1], Account())
+        asset_id = int(match[2])
+        if asset_id not in holder.assets:
+            raise HTTPError(404, "account asset info not found")
+        return {
+            "round": self.ledger.last_round,
+            "asset-holding": _holding_json(asset_id, holder.assets[asset_id]),
+        }
+
+    def _account_app(self, match: re.Match[str], *_: object) -> dict[str, object]:
+        state = self.ledger.state
+        holder = state.accounts.get(match[1], Account())
+        app_id = int(match[2])
+        response: dict[str, object] = {"round": self.ledger.last_round}
+        if app_id in holder.local_state:
+            response["app-local-state"] = _local_state_json(
+                app_id, state.apps[app_id], holder.local_state[app_id]
+            )
+        if app_id in state.created_apps(match[1]):
+            response["created-app"] = _app_params_json(state.apps[app_id])
+        if len(response) == 1:
+            raise HTTPError(404, "account application info not found")
+        return response
+
+    def _asset(self, match: re.Match[str], *_: object) -> dict[str, object]:
+        asset_id = int(match[1])
+        asset = self.ledger.state.assets.get(asset_id)
+        if asset is None:
+            raise HTTPError(404, "asset does not exist")
+        return {"index": asset_id, "params": _asset_params_json(asset)}
+
+    def _app(self, match: re.Match[str], *_: object) -> dict[str, object]:
+        app_id, app = self._live_app(match)
+        return {"id": app_id, "params": _app_params_json(app)}
+
+    def _boxes(self, match: re.Match[str], *_: object) -> dict[str, object]:
+        _, app = self._live_app(match)
+        return {"boxes": [{"name": _b64(name)} for name in app.boxes]}
+
+    def _box(self, match: re.Match[str], query: Query, _: bytes) -> dict[str, object]:
+        _, app = self._live_app(match)
+        name = _box_name(query)
+        if name not in app.boxes:
+            raise HTTPError(404, "box not found")
+        return {
+            "name": _b64(name),
+            "value": _b64(app.boxes[name]),
+            "round": self.ledger.last_round,
+        }
+
+    def _live_app(self, match: re.Match[str]) -> tuple[int, App]:
+        app_id = int(match[1])
+        try:
+            return app_id, self.ledger.state.live_app(app_id)
+        except LookupError as ex:
+            raise HTTPError(404, str(ex)) from ex
+
+    def _get_offset(self, *_: object) -> dict[str, object]:
+        return {"offset": self.ledger.timestamp_offset}
+
+    def _set_offset(self, match: re.Match[str], *_: object) -> dict[str, object]:
+        self.ledger.timestamp_offset = int(match[1])
+        return {}
+
+
+class _Kmd(_Service):
+    """Just enough of kmd for algokit to find the dispenser in the default wallet"""
+
+    WALLET_ID = "stand-in-default-wallet"
+    HANDLE = "stand-in-wallet-handle"
+
+    def __init__(self, ledger: Ledger):
+        super().__init__(ledger)
+        wallet = {"id": self.WALLET_ID, "name": DEFAULT_WALLET, "driver_name": "sqlite"}
+        self.route("GET", "/versions", lambda *_: {"versions": ["v1"]})
+        self.route("GET", "/v1/wallets", lambda *_: {"wallets": [wallet]})
+        self.route(
+            "POST", "/v1/wallet/init", lambda *_: {"wallet_handle_token": self.HANDLE}
+        )
+        self.route("POST", "/v1/wallet/release", lambda *_: {})
+        self.route(
+            "POST", "/v1/wallet/renew", lambda *_: {"wallet_handle": {"wallet": wallet}}
+        )
+        self.route(
+            "GET", "/v1/wallet/info", lambda *_: {"wallet_handle": {"wallet": wallet}}
+        )
+        self.route(
+            "POST", "/v1/key/list", lambda *_: {"addresses": [ledger.dispenser_address]}
+        )
+        self.route("POST", "/v1/key/export", self._export_key)
+
+    def _export_key(
+        self, _: re.Match[str], __: Query, body: bytes
+    ) -> dict[str, object]:
+        if json.loads(body or b"{}").get("address") != self.ledger.dispenser_address:
+            raise HTTPError(404, "key does not exist in this wallet")
+        return {"private_key": self.ledger.dispenser_private_key}
+
+
+class _Indexer(_Service):
+    def __init__(self, ledger: Ledger):
+        super().__init__(ledger)
+        self.route("GET", "/health", lambda *_: {"round": ledger.last_round})
+        self.route("GET", r"/v2/accounts/(\w+)", self._account)
+        self.route(
+            "GET", r"/v2/accounts/(\w+)/created-applications", self._created_apps
+        )
+        self.route("GET", r"/v2/applications/(\d+)", self._app)
+        self.route("GET", r"/v2/applications/(\d+)/boxes", self._boxes)
+        self.route("GET", r"/v2/applications/(\d+)/box", self._box)
+        self.route("GET", "/v2/transactions", self._search_transactions)
+
+    def _account(self, match: re.Match[str], *_: object) -> dict[str, object]:
+        return {
+            "account": account_json(self.ledger, match[1]),
+            "current-round": self.ledger.last_round,
+        }
+
+    def _created_apps(self, match: re.Match[str], *_: object) -> dict[str, object]:
+        return {
+            "applications": [
+                _indexer_app_json(app_id, app)
+                for app_id, app in self.ledger.state.apps.items()
+                if app.creator == match[1]
+            ],
+            "current-round": self.ledger.last_round,
+        }
+
+    def _app(self, match: re.Match[str], *_: object) -> dict[str, object]:
+        app = self._app_of(match)
+        return {
+            "application": _indexer_app_json(int(match[1]), app),
+            "current-round": self.ledger.last_round,
+        }
+
+    def _boxes(self, match: re.Match[str], query: Query, _: bytes) -> dict[str, object]:
+        app = self._app_of(match)
+        names = sorted(name for name in app.boxes if _b64(name) > query.get("next", ""))
+        limit = int(query.get("limit", 0)) or len(names)
+        response: dict[str, object] = {
+            "application-id": int(match[1]),
+            "boxes": [{"name": _b64(name)} for name in names[:limit]],
+        }
+        if len(names) > limit:
+            response["next-token"] = _b64(names[limit - 1])
+        return response
+
+    def _box(self, match: re.Match[str], query: Query, _: bytes) -> dict[str, object]:
+        app = self._app_of(match)
+        name = _box_name(query)
+        if name not in app.boxes:
+            raise HTTPError(404, "box not found")
+        return {
+            "name": _b64(name),
+            "value": _b64(app.boxes[name]),
+            "round": self.ledger.last_round,
+        }
+
+    def _app_of(self, match: re.Match[str]) -> App:
+        app = self.ledger.state.apps.get(int(match[1]))
+        if app is None:
+            raise HTTPError(404, "no application found for application-id")
+        return app
+
+    def _search_transactions(
+        self, _: re.Match[str], query: Query, __: bytes
+    ) -> dict[str, object]:
+        note_prefix = base64.b64decode(query.get("note-prefix", ""))
+        records = [
+            record
+            for record in self._transactions()
+            if record["confirmed-round"] >= int(query.get("min-round", 0))
+            and record["confirmed-round"]
+            <= int(query.get("max-round", self.ledger.last_round))
+            and (_matches(record, "tx-type", query.get("tx-type")))
+            and base64.b64decode(typing.cast(str, record.get("note", ""))).startswith(
+                note_prefix
+            )
+            and _matches_app(record, query.get("application-id"))
+            and _matches_address(
+                record, query.get("address"), query.get("address-role")
+            )
+        ]
+        return {"transactions": records, "current-round": self.ledger.last_round}
+
+    def _transactions(self) -> Iterator[dict[str, typing.Any]]:
+        for tx_id, committed in list(self.ledger.committed.items()):
+            txn = signed_json(committed.signed_txn)["txn"]
+            txn = typing.cast(dict[str, typing.Any], txn)
+            record: dict[str, typing.Any] = {
+                "id": tx_id,
+                "confirmed-round": committed.round_num,
+                "intra-round-offset": committed.intra_round_offset,
+                "round-time": self.ledger.blocks[committed.round_num].timestamp,
+                "tx-type": txn["type"],
+                "sender": txn["snd"],
+                "fee": txn.get("fee", 0),
+                "first-valid": txn.get("fv", 0),
+                "last-valid": txn["lv"],
+            }
+            if "note" in txn:
+                record["note"] = txn["note"]
+            if "rcv" in txn:
+                record["receiver"] = txn["rcv"]
+            if txn["type"] == "appl":
+                record["application-transaction"] = {
+                    "application-id": txn.get("apid", 0),
+                    "on-completion": _ON_COMPLETION_NAMES[txn.get("apan", 0)],
+                    "application-args": txn.get("apaa", []),
+                    "accounts": txn.get("apat", []),
+                    "foreign-apps": txn.get("apfa", []),
+                    "foreign-assets": txn.get("apas", []),
+                }
+                if "application-index" in committed.result:
+                    record["created-application-index"] = committed.result[
+                        "application-index"
+                    ]
+            yield record
+
+
+_ON_COMPLETION_NAMES = ["noop", "optin", "closeout", "clear", "update", "delete"]
+
+
+def _matches(record: dict[str, typing.Any], key: str, value: str | None) -> bool:
+    return value is None or record[key] == value
+
+
+def _matches_app(record: dict[str, typing.Any], app_id: str | None) -> bool:
+    if app_id is None:
+        return True
+    app_call = record.get("application-transaction")
+    if app_call is None:
+        return False
+    return int(app_id) in (
+        app_call["application-id"],
+        record.get("created-application-index"),
+    )
+
+
+def _matches_address(
+    record: dict[str, typing.Any], address: str | None, role: str | None
+) -> bool:
+    if address is None:
+        return True
+    if role == "sender":
+        return bool(record["sender"] == address)
+    if role == "receiver":
+        return bool(record.get("receiver") == address)
+    return address in (record["sender"], record.get("receiver"))
+
+
+def account_json(ledger: Ledger, address: str) -> dict[str, object]:
+    """Renders an account the way algod's account information does"""
+    state = ledger.state
+    holder = state.accounts.get(address, Account())
+    created_apps = state.created_apps(address)
+    created_assets = state.created_assets(address)
+    app_id = state.app_ids_by_address.get(address)
+    boxes = state.apps[app_id].boxes if app_id is not None else {}
+    opted_in = [state.apps[app_id] for app_id in holder.local_state]
+    return {
+        "address": address,
+        "amount": holder.balance,
+        "amount-without-pending-rewards": holder.balance,
+        "min-balance": state.min_balance(address),
+        "pending-rewards": 0,
+        "rewards": 0,
+        "reward-base": 0,
+        "round": ledger.last_round,
+        "status": "Online" if holder.online else "Offline",
+        "sig-type": "sig",
+        "total-apps-opted-in": len(holder.local_state),
+        "total-assets-opted-in": len(holder.assets),
+        "total-created-apps": len(created_apps),
+        "total-created-assets": len(created_assets),
+        "total-boxes": len(boxes),
+        "total-box-bytes": sum(len(name) + len(value) for name, value in boxes.items()),
+        "apps-total-extra-pages": sum(app.extra_pages for app in created_apps.values()),
+        "apps-total-schema": _schema_json(
+            Schema(
+                sum(app.local_schema.num_uints for app in opted_in)
+                + sum(app.global_schema.num_uints for app in created_apps.values()),
+                sum(app.local_schema.num_byte_slices for app in opted_in)
+                + sum(
+                    app.global_schema.num_byte_slices for app in created_apps.values()
+                ),
+            )
+        ),
+        "assets": [
+            _holding_json(asset_id, amount)
+            for asset_id, amount in holder.assets.items()
+        ],
+        "created-assets": [
+            {"index": asset_id, "params": _asset_params_json(asset)}
+            for asset_id, asset in created_assets.items()
+        ],
+        "created-apps": [
+            {"id": app_id, "params": _app_params_json(app)}
+            for app_id, app in created_apps.items()
+        ],
+        "apps-local-state": [
+            _local_state_json(app_id, state.apps[app_id], values)
+            for app_id, values in holder.local_state.items()
+        ],
+    }
+
+
+def _holding_json(asset_id: int, amount: int) -> dict[str, object]:
+    return {"asset-id": asset_id, "amount": amount, "is-frozen": False}
+
+
+def _asset_params_json(asset: Asset) -> dict[str, object]:
+    return {
+        "creator": asset.creator,
+        "total": asset.total,
+        "decimals": asset.decimals,
+        "default-frozen": asset.default_frozen,
+        "unit-name": asset.unit_name,
+        "name": asset.name,
+        "url": asset.url,
+        "metadata-hash": _b64(asset.metadata_hash),
+        "manager": asset.manager,
+        "reserve": asset.reserve,
+        "freeze": asset.freeze,
+        "clawback": asset.clawback,
+    }
+
+
+def _app_params_json(app: App) -> dict[str, object]:
+    return {
+        "creator": app.creator,
+        "approval-program": _b64(app.approval_program),
+        "clear-state-program": _b64(app.clear_program),
+        "extra-program-pages": app.extra_pages,
+        "global-state-schema": _schema_json(app.global_schema),
+        "local-state-schema": _schema_json(app.local_schema),
+        "global-state": _key_values_json(app.global_state),
+    }
+
+
+def _indexer_app_json(app_id: int, app: App) -> dict[str, object]:
+    return {
+        "id": app_id,
+        "created-at-round": app.created_at_round,
+        "deleted": app.deleted,
+        "params": _app_params_json(app),
+    }
+
+
+def _local_state_json(
+    app_id: int, app: App, values: dict[bytes, StateValue]
+) -> dict[str, object]:
+    return {
+        "id": app_id,
+        "schema": _schema_json(app.local_schema),
+        "key-value": _key_values_json(values),
+    }
+
+
+def _schema_json(schema: Schema) -> dict[str, int]:
+    return {"num-uint": schema.num_uints, "num-byte-slice": schema.num_byte_slices}
+
+
+def _key_values_json(values: dict[bytes, StateValue]) -> list[dict[str, object]]:
+    return [
+        {
+            "key": _b64(key),
+            "value": (
+                {"type": 2, "uint": value, "bytes": ""}
+                if isinstance(value, int)
+                else {"type": 1, "uint": 0, "bytes": _b64(value)}
+            ),
+        }
+        for key, value in values.items()
+    ]
+
+
+def _box_name(query: Query) -> bytes:
+    encoding_name, _, value = query.get("name", "").partition(":")
+    if encoding_name != "b64":
+        raise HTTPError(400, "box names must be given as b64:<name>")
+    return base64.b64decode(value)
+
+
+def _b64(value: bytes) -> str:
+    return base64.b64encode(value).decode()
+
+
+def _signed_txn(signed: dict[str, typing.Any]) -> transaction.GenericSignedTransaction:
+    decoded = encoding.msgpack_decode(signed)
+    if isinstance(decoded, transaction.Transaction):
+        # an unsigned transaction, as simulate allows
+        return transaction.SignedTransaction(decoded, None)
+    return typing.cast(transaction.GenericSignedTransaction, decoded)
@@ -0,0 +1,161 @@
+import copy
+import dataclasses
+
+from algopy import ARC4Contract
+from algosdk.logic import get_application_address
+
+# Minimum balance requirements, in microAlgos, as set by the consensus protocol
+ACCOUNT_MIN_BALANCE = 100_000
+ASSET_MIN_BALANCE = 100_000
+APP_PAGE_MIN_BALANCE = 100_000
+UINT_MIN_BALANCE = 28_500
+BYTES_MIN_BALANCE = 50_000
+BOX_FLAT_MIN_BALANCE = 2_500
+BOX_BYTE_MIN_BALANCE = 400
+
+StateValue = int | bytes
+
+
+@dataclasses.dataclass
+class Schema:
+    num_uints: int = 0
+    num_byte_slices: int = 0
+
+    @property
+    def min_balance(self) -> int:
+        return (
+            UINT_MIN_BALANCE * self.num_uints + BYTES_MIN_BALANCE * self.num_byte_slices
+        )
+
+    def check(self, values: dict[bytes, StateValue], what: str) -> None:
+        uints = sum(isinstance(value, int) for value in values.values())
+        if uints > self.num_uints or len(values) - uints > self.num_byte_slices:
+            raise ValueError(f"store {what} exceeds schema")
+
+
+@dataclasses.dataclass
+class Account:
+    balance: int = 0
+    # asset holdings by asset id
+    assets: dict[int, int] = dataclasses.field(default_factory=dict)
+    # local state by the id of each app the account opted in to
+    local_state: dict[int, dict[bytes, StateValue]] = dataclasses.field(
+        default_factory=dict
+    )
+    online: bool = False
+
+
+@dataclasses.dataclass
+class Asset:
+    creator: str
+    total: int
+    decimals: int
+    default_frozen: bool
+    unit_name: str
+    name: str
+    url: str
+    metadata_hash: bytes
+    manager: str
+    reserve: str
+    freeze: str
+    clawback: str
+
+
+@dataclasses.dataclass
+class App:
+    creator: str
+    created_at_round: int
+    contract: type[ARC4Contract]
+    approval_program: bytes
+    clear_program: bytes
+    global_schema: Schema
+    local_schema: Schema
+    extra_pages: int = 0
+    global_state: dict[bytes, StateValue] = dataclasses.field(default_factory=dict)
+    boxes: dict[bytes, bytes] = dataclasses.field(default_factory=dict)
+    deleted: bool = False
+
+    @property
+    def boxes_min_balance(self) -> int:
+        return sum(
+            BOX_FLAT_MIN_BALANCE + BOX_BYTE_MIN_BALANCE * (len(name) + len(value))
+            for name, value in self.boxes.items()
+        )
+
+
+@dataclasses.dataclass
+class State:
+    """Everything a group of transactions can change, copied to apply a group atomically"""
+
+    accounts: dict[str, Account] = dataclasses.field(default_factory=dict)
+    assets: dict[int, Asset] = dataclasses.field(default_factory=dict)
+    apps: dict[int, App] = dataclasses.field(default_factory=dict)
+    app_ids_by_address: dict[str, int] = dataclasses.field(default_factory=dict)
+    # assets and apps share one sequence of ids, as on a real network
+    next_index: int = 1001
+
+    def copy(self) -> "State":
+        # contract classes are shared, everything else is plain data
+        return State(
+            accounts=copy.deepcopy(self.accounts),
+            assets=dict(self.assets),
+            apps={
+                app_id: dataclasses.replace(
+                    app,
+                    global_state=dict(app.global_state),
+                    boxes=dict(app.boxes),
+                )
+                for app_id, app in self.apps.items()
+            },
+            app_ids_by_address=dict(self.app_ids_by_address),
+            next_index=self.next_index,
+        )
+
+    def account(self, address: str) -> Account:
+        if address not in self.accounts:
+            self.accounts[address] = Account()
+        return self.accounts[address]
+
+    def new_index(self) -> int:
+        index = self.next_index
+        self.next_index += 1
+        return index
+
+    def add_app(self, app_id: int, app: App) -> None:
+        self.apps[app_id] = app
+        self.app_ids_by_address[get_application_address(app_id)] = app_id
+
+    def live_app(self, app_id: int) -> App:
+        app = self.apps.get(app_id)
+        if app is None or app.deleted:
+            raise LookupError(f"application does not exist: {app_id}")
+        return app
+
+    def min_balance(self, address: str, *, with_boxes: bool = True) -> int:
+        account = self.accounts.get(address, Account())
+        total = ACCOUNT_MIN_BALANCE + ASSET_MIN_BALANCE * len(account.assets)
+        for app_id in account.local_state:
+            total += APP_PAGE_MIN_BALANCE + self.apps[app_id].local_schema.min_balance
+        for app in self.created_apps(address).values():
+            total += (
+                APP_PAGE_MIN_BALANCE * (1 + app.extra_pages)
+                + app.global_schema.min_balance
+            )
+        app_id = self.app_ids_by_address.get(address)
+        if with_boxes and app_id is not None:
+            total += self.apps[app_id].boxes_min_balance
+        return total
+
+    def created_apps(self, address: str) -> dict[int, App]:
+        return {
+            app_id: app
+            for app_id, app in self.apps.items()
+            if app.creator == address and not app.deleted
+        }
+
+    def created_assets(self, address: str) -> dict[int, Asset]:
+        return {
+            asset_id: asset
+            for asset_id, asset in self.assets.items()
+            if asset.creator == address
+        }
@@ -0,0 +1,126 @@
+# mypy: disable-error-code="no-untyped-call, misc"
+import base64
+import collections
+import threading
+import typing
+from concurrent.futures import Future
+
+from algokit_utils.beta.account_manager import AddressAndSigner
+from algosdk import account, encoding, transaction
+from algosdk.atomic_transaction_composer import (
+    AccountTransactionSigner,
+    AtomicTransactionComposer,
+    TransactionSigner,
+)
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts._helpers.submission import SubmissionPipeline
+
+# MicroAlgos each new account is funded with, enough to spend 10 Algos past its
+# minimum balance
+DEFAULT_FUNDING = 10_100_000
+
+
+class Funder(typing.Protocol):
+    """An account paying for new accounts, e.g. an `AddressAndSigner` or an
+    `algokit_utils.Account`"""
+
+    @property
+    def address(self) -> str: ...
+
+    @property
+    def signer(self) -> TransactionSigner: ...
+
+
+class AccountPool:
+    """Hands out funded accounts, creating them in bulk
+
+    Accounts are created `size` at a time when the pool runs out. Their funding
+    payments go out in full groups, all sent before waiting once for every group to
+    be confirmed. Accounts given back are handed out again before new ones, so only
+    give back accounts whose state and balance leave them as good as new to whoever
+    takes them next.
+
+    :param AlgodClient algod_client: AlgodClient to fund accounts through
+    :param Funder funder: Account paying for new accounts
+    :param int size: (optional) Number of accounts created whenever the pool runs out
+    :param int funding: (optional) MicroAlgos each new account is funded with
+    :param SubmissionPipeline pipeline: (optional) Pipeline to send payments through,
+    defaults to a new one for `algod_client`"""
+
+    def __init__(
+        self,
+        algod_client: AlgodClient,
+        funder: Funder,
+        *,
+        size: int = AtomicTransactionComposer.MAX_GROUP_SIZE,
+        funding: int = DEFAULT_FUNDING,
+        pipeline: SubmissionPipeline | None = None,
+    ):
+        self.algod_client = algod_client
+        self.funder = funder
+        self.size = size
+        self.funding = funding
+        self.pipeline = pipeline or SubmissionPipeline(algod_client)
+        self._lock = threading.Lock()
+        self._free: collections.deque[AddressAndSigner] = collections.deque()
+
+    def __len__(self) -> int:
+        """Number of accounts ready to be handed out"""
+        return len(self._free)
+
+    def take(self) -> AddressAndSigner:
+        """Returns an account nobody else holds, creating more first if none is left
+
+        :returns AddressAndSigner: A funded account"""
+        with self._lock:
+            if not self._free:
+                self._free.extend(self._create(self.size))
+            return self._free.popleft()
+
+    def give_back(self, *accounts: AddressAndSigner) -> None:
+        """Makes accounts taken from the pool available to the next `take`
+
+        :param AddressAndSigner accounts: Accounts done with"""
+        with self._lock:
+            self._free.extendleft(reversed(accounts))
+
+    def fill(self, count: int) -> None:
+        """Creates accounts until at least `count` are ready to be handed out
+
+        :param int count: Number of accounts to have ready"""
+        with self._lock:
+            if len(self._free) < count:
+                self._free.extend(self._create(count - len(self._free)))
+
+    def _create(self, count: int) -> list[AddressAndSigner]:
+        accounts = []
+        for _ in range(count):
+            private_key, address = account.generate_account()
+            accounts.append(
+                AddressAndSigner(address, AccountTransactionSigner(private_key))
+            )
+
+        sp = self.algod_client.suggested_params()
+        group_size = AtomicTransactionComposer.MAX_GROUP_SIZE
+        confirmations: list[Future[int]] = []
+        for start in range(0, count, group_size):
+            payments: list[transaction.Transaction] = [
+                transaction.PaymentTxn(
+                    self.funder.address, sp, new_account.address, self.funding
+                )
+                for new_account in accounts[start : start + group_size]
+            ]
+            if len(payments) > 1:
+                transaction.assign_group_id(payments)
+            signed = self.funder.signer.sign_transactions(
+                payments, list(range(len(payments)))
+            )
+            confirmations.append(
+                self.pipeline.submit(
+                    [base64.b64decode(encoding.msgpack_encode(txn)) for txn in signed]
+                )
+            )
+        for confirmation in confirmations:
+            confirmation.result()
+        return accounts
@@ -0,0 +1,183 @@
+# mypy: disable-error-code="no-untyped-call, misc"
+import dataclasses
+import threading
+import typing
+
+import algokit_utils
+from algokit_utils.config import config
+from algokit_utils.logic_error import LogicError, parse_logic_error
+from algosdk import transaction
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    AtomicTransactionResponse,
+)
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts._helpers.confirmations import ConfirmationWaiter
+from smart_contracts._helpers.fees import FeePooler
+from smart_contracts._helpers.readonly import ReadonlyCall, ReadonlyCaller
+from smart_contracts._helpers.references import ReferenceResolver
+
+# Programs compiled by any client, by algod client, programs and template values, so
+# clients and their account views compile each app once
+_compiled_programs: dict[
+    tuple[AlgodClient, str, str, str],
+    tuple[algokit_utils.Program, algokit_utils.Program],
+] = {}
+_compiled_programs_lock = threading.Lock()
+
+
+class ApplicationClient(algokit_utils.ApplicationClient):
+    """ApplicationClient used underneath the typed clients in this project
+
+    Every typed call and `Composer` method goes through `add_method_call`, so
+    behaviour shared by all clients hooks in there.
+
+    :param ReferenceResolver reference_resolver: (optional) Fills in the references of
+    ABI method calls that the caller left unset
+    :param FeePooler fee_pooler: (optional) Raises the fee of ABI method calls to cover
+    the inner transactions they send
+    :param ReadonlyCaller readonly_caller: (optional) Runs `call`s of readonly ABI
+    methods through simulate alone, so they need no signer
+    :param ConfirmationWaiter confirmation_waiter: (optional) Waits for executed groups
+    to be confirmed instead of each polling on its own"""
+
+    def __init__(
+        self,
+        *args: typing.Any,
+        reference_resolver: ReferenceResolver | None = None,
+        fee_pooler: FeePooler | None = None,
+        readonly_caller: ReadonlyCaller | None = None,
+        confirmation_waiter: ConfirmationWaiter | None = None,
+        **kwargs: typing.Any,
+    ):
+        super().__init__(*args, **kwargs)
+        self.reference_resolver = reference_resolver
+        self.fee_pooler = fee_pooler
+        self.readonly_caller = readonly_caller
+        self.confirmation_waiter = confirmation_waiter
+
+    def _check_is_compiled(self) -> tuple[algokit_utils.Program, algokit_utils.Program]:
+        key = (
+            self.algod_client,
+            self.app_spec.approval_program,
+            self.app_spec.clear_program,
+            repr(sorted(self.template_values.items())),
+        )
+        with _compiled_programs_lock:
+            if key in _compiled_programs:
+                self._approval_program, self._clear_program = _compiled_programs[key]
+        programs = super()._check_is_compiled()
+        with _compiled_programs_lock:
+            _compiled_programs.setdefault(key, programs)
+        return programs
+
+    def execute_atc(self, atc: AtomicTransactionComposer) -> AtomicTransactionResponse:
+        # debug mode keeps algokit_utils' execution, which adds simulate traces to
+        # logic errors
+        if self.confirmation_waiter is None or config.debug:
+            return super().execute_atc(atc)
+        try:
+            return self.confirmation_waiter.execute(atc)
+        except Exception as ex:
+            logic_error_data = parse_logic_error(str(ex))
+            if logic_error_data is None:
+                raise
+            raise LogicError(
+                logic_error_str=str(ex),
+                logic_error=ex,
+                program=self.app_spec.approval_program,
+                source_map=self._get_approval_source_map(),
+                **logic_error_data,
+            ) from ex
+
+    def call(  # type: ignore[override]
+        self,
+        call_abi_method: algokit_utils.ABIMethod | bool | None = None,
+        transaction_parameters: (
+            algokit_utils.OnCompleteCallParameters
+            | algokit_utils.OnCompleteCallParametersDict
+            | None
+        ) = None,
+        **abi_kwargs: typing.Any,
+    ) -> (
+        algokit_utils.TransactionResponse
+        | algokit_utils.ABITransactionResponse[typing.Any]
+    ):
+        if self.readonly_caller is not None:
+            parameters = as_parameters_dict(transaction_parameters)
+            on_complete = (
+                typing.cast(dict[str, typing.Any], parameters).get("on_complete")
+                or transaction.OnComplete.NoOpOC
+            )
+            method = self._resolve_method(call_abi_method, abi_kwargs, on_complete)
+            hints = self._method_hints(method) if method is not None else None
+            if method is not None and hints is not None and hints.read_only:
+                return self.readonly_caller.call(
+                    ReadonlyCall(self, method, abi_kwargs, parameters.get("sender"))
+                )
+
+        return super().call(call_abi_method, transaction_parameters, **abi_kwargs)
+
+    def add_method_call(
+        self,
+        atc: AtomicTransactionComposer,
+        abi_method: algokit_utils.ABIMethod | bool | None = None,
+        *,
+        abi_args: algokit_utils.ABIArgsDict | None = None,
+        app_id: int | None = None,
+        parameters: (
+            algokit_utils.TransactionParameters
+            | algokit_utils.TransactionParametersDict
+            | None
+        ) = None,
+        on_complete: transaction.OnComplete = transaction.OnComplete.NoOpOC,
+        **kwargs: typing.Any,
+    ) -> None:
+        parameters = as_parameters_dict(parameters)
+        # creates pass an explicit app_id of 0 and have nothing to reference yet
+        if app_id is None and (self.reference_resolver or self.fee_pooler):
+            self._load_reference_and_check_app_id()
+            method = self._resolve_method(
+                abi_method,
+                abi_args,
+                on_complete,
+                kwargs.get("call_config", algokit_utils.CallConfig.CALL),
+            )
+            if method is not None and self.reference_resolver is not None:
+                parameters = self.reference_resolver.resolve_parameters(
+                    self, method, abi_args or {}, parameters, on_complete, atc
+                )
+            if method is not None and self.fee_pooler is not None:
+                parameters = self.fee_pooler.pool_fees(
+                    self, method, abi_args or {}, parameters, on_complete
+                )
+
+        super().add_method_call(
+            atc,
+            abi_method,
+            abi_args=abi_args,
+            app_id=app_id,
+            parameters=parameters,
+            on_complete=on_complete,
+            **kwargs,
+        )
+
+
+def as_parameters_dict(
+    parameters: (
+        algokit_utils.TransactionParameters
+        | algokit_utils.TransactionParametersDict
+        | None
+    ),
+) -> algokit_utils.TransactionParametersDict:
+    """Returns `parameters` as a dict, which is what `add_method_call` works with"""
+    if isinstance(parameters, algokit_utils.TransactionParameters):
+        return typing.cast(
+            algokit_utils.TransactionParametersDict,
+            {
+                field.name: getattr(parameters, field.name)
+                for field in dataclasses.fields(parameters)
+            },
+        )
+    return typing.cast(algokit_utils.TransactionParametersDict, dict(parameters or {}))
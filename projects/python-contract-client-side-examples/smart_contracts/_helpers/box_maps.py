@@ -0,0 +1,161 @@
+# mypy: disable-error-code="no-untyped-call, misc"
+import base64
+import dataclasses
+import typing
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+from algosdk.error import AlgodHTTPError
+from algosdk.v2client.algod import AlgodClient
+from algosdk.v2client.indexer import IndexerClient
+
+from smart_contracts._helpers.references import ReferenceRule, References
+
+_K = typing.TypeVar("_K")
+_V = typing.TypeVar("_V")
+
+
+@dataclasses.dataclass(frozen=True)
+class BoxMap(typing.Generic[_K, _V]):
+    """Typed access to the boxes of one `BoxMap` of a contract, from off chain
+
+    :param bytes prefix: Key prefix of the box map
+    :param int key_size: Bytes of each encoded key
+    :param Callable encode_key: Encodes a key, without the prefix
+    :param Callable decode_key: Decodes a key encoded by `encode_key`
+    :param Callable decode_value: Decodes the raw value of a box"""
+
+    prefix: bytes
+    key_size: int
+    encode_key: Callable[[_K], bytes]
+    decode_key: Callable[[bytes], _K]
+    decode_value: Callable[[bytes], _V]
+
+    def box_name(self, key: _K) -> bytes:
+        """Returns the name of the box holding the value of `key`"""
+        return self.prefix + self.encode_key(key)
+
+    def key_from_box_name(self, box_name: bytes) -> _K | None:
+        """Returns the key stored in a box name, or None if it isn't a box of this
+        map"""
+        if len(box_name) != len(self.prefix) + self.key_size or not box_name.startswith(
+            self.prefix
+        ):
+            return None
+        return self.decode_key(box_name[len(self.prefix) :])
+
+    def references(self, *keys: _K) -> References:
+        """Returns references to the boxes of `keys`, in the called app"""
+        return References(boxes=tuple((0, self.box_name(key)) for key in keys))
+
+    def references_to(self, arg: str) -> ReferenceRule:
+        """Returns a rule referencing the box whose key is the method argument `arg`"""
+
+        def rule(abi_args: Mapping[str, object]) -> References:
+            return self.references(typing.cast(_K, abi_args[arg]))
+
+        return rule
+
+    def get(self, algod_client: AlgodClient, app_id: int, key: _K) -> _V:
+        """Returns the value of `key`
+
+        :raises AlgodHTTPError: With code 404 if there's no box for `key`"""
+        box = typing.cast(
+            dict[str, str],
+            algod_client.application_box_by_name(app_id, self.box_name(key)),
+        )
+        return self.decode_value(base64.b64decode(box["value"]))
+
+    def get_or_none(self, algod_client: AlgodClient, app_id: int, key: _K) -> _V | None:
+        """Returns the value of `key`, or None if there's no box for it"""
+        try:
+            return self.get(algod_client, app_id, key)
+        except AlgodHTTPError as ex:
+            if ex.code == 404:
+                return None
+            raise
+
+    def iter_keys(
+        self,
+        algod_client: AlgodClient,
+        app_id: int,
+        indexer_client: IndexerClient | None = None,
+        page_size: int = 1000,
+    ) -> Iterator[_K]:
+        """Streams the key of every box of this map
+
+        :param IndexerClient indexer_client: (optional) Page box names through the
+        indexer rather than listing them all from algod in one response
+        :param int page_size: Number of box names requested per indexer page"""
+        if indexer_client is None:
+            response = typing.cast(
+                dict[str, object], algod_client.application_boxes(app_id)
+            )
+            yield from self._keys(typing.cast(list[dict[str, str]], response["boxes"]))
+            return
+
+        next_page: str | None = None
+        while True:
+            response = typing.cast(
+                dict[str, object],
+                indexer_client.application_boxes(
+                    app_id, limit=page_size, next_page=next_page
+                ),
+            )
+            boxes = typing.cast(list[dict[str, str]], response["boxes"])
+            yield from self._keys(boxes)
+            next_page = typing.cast(str | None, response.get("next-token"))
+            if not next_page or not boxes:
+                return
+
+    def iter_items(
+        self,
+        algod_client: AlgodClient,
+        app_id: int,
+        keys: Iterable[_K],
+        max_in_flight: int = 16,
+    ) -> Iterator[tuple[_K, _V]]:
+        """Streams `(key, value)` for each of `keys`, fetching values concurrently and
+        yielding them in the order they arrive
+
+        Keys whose box was deleted after they were listed are skipped.
+
+        :param Iterable keys: Keys to fetch, e.g. from `iter_keys`
+        :param int max_in_flight: Maximum number of box values fetched concurrently"""
+
+        def fetch(key: _K) -> tuple[_K, _V] | None:
+            value = self.get_or_none(algod_client, app_id, key)
+            return None if value is None else (key, value)
+
+        for entry in fetch_concurrently(keys, fetch, max_in_flight):
+            if entry is not None:
+                yield entry
+
+    def _keys(self, boxes: Iterable[dict[str, str]]) -> Iterator[_K]:
+        for box in boxes:
+            key = self.key_from_box_name(base64.b64decode(box["name"]))
+            if key is not None:
+                yield key
+
+
+def fetch_concurrently(
+    keys: Iterable[_K], fetch: Callable[[_K], _V], max_in_flight: int
+) -> Iterator[_V]:
+    """Calls `fetch` for each of `keys` on a thread pool, yielding results in the
+    order they arrive
+
+    `keys` is consumed lazily, no further ahead than `max_in_flight` pending calls,
+    and calls still pending when the caller stops iterating are cancelled."""
+    executor = ThreadPoolExecutor(max_workers=max_in_flight)
+    pending: set[Future[_V]] = set()
+    try:
+        for key in keys:
+            if len(pending) >= max_in_flight:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                yield from (future.result() for future in done)
+            pending.add(executor.submit(fetch, key))
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            yield from (future.result() for future in done)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,204 @@
+# mypy: disable-error-code="no-untyped-call, misc"
+import collections
+import dataclasses
+import typing
+from collections.abc import Hashable, Iterable, Iterator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+
+import algokit_utils
+from algosdk.abi import Method
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    TransactionWithSigner,
+)
+
+
+class MethodArgs(typing.Protocol):
+    """One of the generated `*Args` dataclasses, e.g. `HelloArgs(name="World")`"""
+
+    @staticmethod
+    def method() -> str: ...
+
+
+@dataclasses.dataclass(frozen=True)
+class BulkCall:
+    """A single ABI method call to add to a `BulkComposer`
+
+    :param Method | str method: The method to call, or its signature
+    :param Mapping abi_args: The method's arguments, by name
+    :param algokit_utils.TransactionParametersDict parameters: (optional) Parameters
+    of the call
+    :param Hashable lane: (optional) Calls in the same lane are sent in order, each
+    group only once the groups before it in its lanes are done"""
+
+    method: Method | str
+    abi_args: Mapping[str, typing.Any] = dataclasses.field(default_factory=dict)
+    parameters: algokit_utils.TransactionParametersDict = dataclasses.field(
+        default_factory=lambda: algokit_utils.TransactionParametersDict()
+    )
+    lane: Hashable | None = None
+
+    @classmethod
+    def from_args(
+        cls,
+        args: MethodArgs,
+        parameters: algokit_utils.TransactionParametersDict | None = None,
+    ) -> "BulkCall":
+        """Returns the call described by generated `*Args`"""
+        return cls(
+            args.method(),
+            {
+                field.name: getattr(args, field.name)
+                for field in dataclasses.fields(args)  # type: ignore[arg-type]
+            },
+            parameters or {},
+        )
+
+    @property
+    def transaction_count(self) -> int:
+        return 1 + sum(
+            isinstance(value, TransactionWithSigner) for value in self.abi_args.values()
+        )
+
+
+class BulkGroupError(Exception):
+    """Raised in place of the result of every call in a group that failed"""
+
+    def __init__(self, group_index: int, cause: Exception):
+        super().__init__(f"Group {group_index} failed: {cause}")
+        self.group_index = group_index
+        self.cause = cause
+
+
+BulkResult = algokit_utils.ABITransactionResponse[typing.Any] | BulkGroupError
+
+
+class BulkComposer:
+    """Executes any number of ABI method calls to one app, packing as many calls as
+    fit into each group
+
+    Calls are never split across groups and each keeps its own references, so every
+    group stays within the per transaction reference limits. Groups are executed
+    concurrently, at most `max_in_flight` at a time, except that a group waits for
+    the earlier groups sharing a lane with any of its calls, and a failing group only
+    fails its own calls. Signing runs on the same threads, or on the worker processes of a
+    `BatchSigner` when the client's signer comes from one.
+
+    :param algokit_utils.ApplicationClient app_client: Client of the app to call,
+    e.g. `typed_client.app_client`
+    :param int max_in_flight: (optional) Number of groups signed and submitted at once
+    """
+
+    def __init__(
+        self, app_client: algokit_utils.ApplicationClient, *, max_in_flight: int = 8
+    ):
+        self.app_client = app_client
+        self.max_in_flight = max_in_flight
+
+    def execute(self, calls: Iterable[BulkCall | MethodArgs]) -> Iterator[BulkResult]:
+        """Yields the result of each call, in the order of `calls`
+
+        `calls` may be `BulkCall`s or generated `*Args` dataclasses and is consumed
+        lazily, no further ahead than the groups in flight."""
+        groups = _pack(_as_bulk_calls(calls, self._suggested_params()))
+        in_flight: collections.deque[Future[list[BulkResult]]] = collections.deque()
+        # the last group submitted in each lane
+        lane_tails: dict[Hashable, Future[list[BulkResult]]] = {}
+        with ThreadPoolExecutor(self.max_in_flight) as executor:
+            for group_index, group in enumerate(groups):
+                if len(in_flight) == self.max_in_flight:
+                    yield from in_flight.popleft().result()
+                lanes = {call.lane for call in group if call.lane is not None}
+                future = executor.submit(
+                    self._execute_group,
+                    group_index,
+                    group,
+                    [lane_tails[lane] for lane in lanes if lane in lane_tails],
+                )
+                lane_tails.update((lane, future) for lane in lanes)
+                in_flight.append(future)
+            while in_flight:
+                yield from in_flight.popleft().result()
+
+    def _suggested_params(self) -> algokit_utils.TransactionParametersDict:
+        # fetched once up front rather than once per call
+        return {
+            "suggested_params": self.app_client.suggested_params
+            or self.app_client.algod_client.suggested_params()
+        }
+
+    def _execute_group(
+        self,
+        group_index: int,
+        group: list[BulkCall],
+        after: list[Future[list[BulkResult]]],
+    ) -> list[BulkResult]:
+        # earlier groups were submitted first, so they already hold a worker
+        wait(after)
+        try:
+            atc = AtomicTransactionComposer()
+            app_call_indexes = []
+            for call in group:
+                self.app_client.add_method_call(
+                    atc,
+                    call.method,
+                    abi_args=dict(call.abi_args),
+                    parameters=call.parameters,
+                )
+                app_call_indexes.append(atc.get_tx_count() - 1)
+            response = self.app_client.execute_atc(atc)
+        except Exception as ex:
+            return [BulkGroupError(group_index, ex)] * len(group)
+        return [
+            typing.cast(
+                algokit_utils.ABITransactionResponse[typing.Any],
+                algokit_utils.TransactionResponse.from_atr(response, index),
+            )
+            for index in app_call_indexes
+        ]
+
+
+def _as_bulk_calls(
+    calls: Iterable[BulkCall | MethodArgs],
+    default_parameters: algokit_utils.TransactionParametersDict,
+) -> Iterator[BulkCall]:
+    occurrences: collections.Counter[tuple[object, ...]] = collections.Counter()
+    for call in calls:
+        if not isinstance(call, BulkCall):
+            call = BulkCall.from_args(call)
+        parameters = typing.cast(
+            algokit_utils.TransactionParametersDict,
+            {**default_parameters, **_without_none(call.parameters)},
+        )
+        # identical calls would be identical transactions, which can only be sent
+        # once, so repeats get a note telling them apart
+        key = (_signature(call.method), repr(sorted(call.abi_args.items())))
+        if not parameters.get("note") and not parameters.get("lease"):
+            if occurrences[key]:
+                parameters["note"] = f"bulk:{occurrences[key]}".encode()
+            occurrences[key] += 1
+        yield dataclasses.replace(call, parameters=parameters)
+
+
+def _pack(calls: Iterator[BulkCall]) -> Iterator[list[BulkCall]]:
+    group: list[BulkCall] = []
+    transaction_count = 0
+    for call in calls:
+        if (
+            transaction_count + call.transaction_count
+            > AtomicTransactionComposer.MAX_GROUP_SIZE
+        ):
+            yield group
+            group, transaction_count = [], 0
+        group.append(call)
+        transaction_count += call.transaction_count
+    if group:
+        yield group
+
+
+def _signature(method: Method | str) -> str:
+    return method if isinstance(method, str) else method.get_signature()
+
+
+def _without_none(parameters: Mapping[str, object]) -> dict[str, object]:
+    return {name: value for name, value in parameters.items() if value is not None}
@@ -0,0 +1,206 @@
+# mypy: disable-error-code="no-untyped-call, misc"
+import logging
+import threading
+import time
+import typing
+from concurrent.futures import Future
+
+from algosdk.atomic_transaction_composer import (
+    ABIResult,
+    AtomicTransactionComposer,
+    AtomicTransactionComposerStatus,
+    AtomicTransactionResponse,
+)
+from algosdk.v2client.algod import AlgodClient
+
+logger = logging.getLogger(__name__)
+
+_shared: "dict[AlgodClient, ConfirmationWaiter]" = {}
+_shared_lock = threading.Lock()
+
+
+class _Watch(typing.NamedTuple):
+    future: "Future[int]"
+    last_round: int
+
+
+class ConfirmationWaiter:
+    """Confirms any number of transactions by following blocks from one thread
+
+    After each new block the waiter fetches the block's transaction IDs once and
+    resolves every watched transaction in it, so the load on algod doesn't grow with
+    the number of transactions waited on. A transaction is only looked up on its own
+    when it may have been confirmed before it was watched, when it isn't seen by its
+    last round, or when algod can't list a block's transactions.
+
+    The thread starts on first use.
+
+    :param AlgodClient algod_client: AlgodClient to follow"""
+
+    def __init__(self, algod_client: AlgodClient):
+        self.algod_client = algod_client
+        self._new_round = threading.Condition()
+        self._watches: dict[str, _Watch] = {}
+        self._round = 0
+        # the round whose transactions are being resolved, ahead of `_round` meanwhile
+        self._listed_round = 0
+        self._closed = False
+        self._loop: threading.Thread | None = None
+
+    @classmethod
+    def shared(cls, algod_client: AlgodClient) -> "ConfirmationWaiter":
+        """Returns the waiter every client of `algod_client` shares"""
+        with _shared_lock:
+            if algod_client not in _shared:
+                _shared[algod_client] = cls(algod_client)
+            return _shared[algod_client]
+
+    @property
+    def last_round(self) -> int:
+        """The latest round the waiter has seen"""
+        self._start()
+        return self._round
+
+    def _start(self) -> None:
+        with self._new_round:
+            if self._loop is not None:
+                return
+            self._round = self._listed_round = _last_round(self.algod_client.status())
+            self._loop = threading.Thread(target=self._follow_blocks, daemon=True)
+            self._loop.start()
+
+    def close(self) -> None:
+        """Stops following blocks, failing every transaction still watched"""
+        with self._new_round:
+            self._closed = True
+            self._new_round.notify_all()
+            watches, self._watches = self._watches, {}
+        for watch in watches.values():
+            watch.future.set_exception(Exception("Confirmation waiter closed"))
+
+    def watch(
+        self, tx_id: str, *, sent_after_round: int, wait_rounds: int
+    ) -> "Future[int]":
+        """Returns a future for the round `tx_id` is confirmed in
+
+        :param str tx_id: ID of a top level transaction
+        :param int sent_after_round: A round from before the transaction was sent,
+        such as `last_round` read just before sending it
+        :param int wait_rounds: Rounds after `sent_after_round` to wait before giving
+        up on the transaction"""
+        self._start()
+        future: Future[int] = Future()
+        with self._new_round:
+            if self._closed:
+                raise Exception("Confirmation waiter closed")
+            self._watches[tx_id] = _Watch(future, sent_after_round + wait_rounds)
+            missed_rounds = self._listed_round > sent_after_round
+        if missed_rounds:
+            self._look_up(tx_id, give_up=False)
+        return future
+
+    def wait_for_round(self, round_num: int) -> None:
+        """Blocks until the waiter has seen `round_num`, or is closed"""
+        self._start()
+        with self._new_round:
+            self._new_round.wait_for(lambda: self._round >= round_num or self._closed)
+
+    def execute(
+        self, atc: AtomicTransactionComposer, wait_rounds: int = 4
+    ) -> AtomicTransactionResponse:
+        """Does what `atc.execute` does, waiting on this waiter rather than polling"""
+        sent_after_round = self.last_round
+        tx_ids = atc.submit(self.algod_client)
+        confirmed_round = self.watch(
+            tx_ids[0], sent_after_round=sent_after_round, wait_rounds=wait_rounds
+        ).result()
+        atc.status = AtomicTransactionComposerStatus.COMMITTED
+
+        method_results = []
+        for method_index, method in atc.method_dict.items():
+            tx_id = tx_ids[method_index]
+            try:
+                tx_info = typing.cast(
+                    dict[str, typing.Any],
+                    self.algod_client.pending_transaction_info(tx_id),
+                )
+                result = atc.parse_result(method, tx_id, tx_info)
+            except Exception as ex:
+                result = ABIResult(tx_id, b"", None, ex, {}, method)
+            method_results.append(result)
+        return AtomicTransactionResponse(confirmed_round, tx_ids, method_results)
+
+    def _follow_blocks(self) -> None:
+        while not self._closed:
+            try:
+                last_round = _last_round(
+                    self.algod_client.status_after_block(self._round)
+                )
+                for round_num in range(self._round + 1, last_round + 1):
+                    self._confirm_round(round_num)
+            except Exception as ex:
+                logger.warning(f"Following round {self._round + 1} failed: {ex}")
+                time.sleep(1)
+
+    def _confirm_round(self, round_num: int) -> None:
+        with self._new_round:
+            self._listed_round = round_num
+        if self._watches:
+            try:
+                response = self.algod_client.get_block_txids(round_num)
+                tx_ids = typing.cast(dict[str, list[str]], response)["blockTxids"]
+            except Exception as ex:
+                logger.debug(f"Listing round {round_num} failed, looking up: {ex}")
+                for tx_id in list(self._watches):
+                    self._look_up(tx_id, give_up=False)
+            else:
+                for tx_id in tx_ids:
+                    self._resolve(tx_id, confirmed_round=round_num)
+
+        with self._new_round:
+            self._round = round_num
+            expired = [
+                tx_id
+                for tx_id, watch in self._watches.items()
+                if watch.last_round < round_num
+            ]
+            self._new_round.notify_all()
+        for tx_id in expired:
+            self._look_up(tx_id, give_up=True)
+
+    def _look_up(self, tx_id: str, *, give_up: bool) -> None:
+        try:
+            info = typing.cast(
+                dict[str, typing.Any], self.algod_client.pending_transaction_info(tx_id)
+            )
+        except Exception as ex:
+            self._resolve(tx_id, exception=ex)
+            return
+        if info.get("confirmed-round", 0) > 0:
+            self._resolve(tx_id, confirmed_round=info["confirmed-round"])
+        elif info.get("pool-error"):
+            self._resolve(
+                tx_id, exception=Exception(f"Pool error: {info['pool-error']}")
+            )
+        elif give_up:
+            self._resolve(tx_id, exception=Exception(f"{tx_id} not confirmed in time"))
+
+    def _resolve(
+        self,
+        tx_id: str,
+        *,
+        confirmed_round: int | None = None,
+        exception: Exception | None = None,
+    ) -> None:
+        with self._new_round:
+            watch = self._watches.pop(tx_id, None)
+        if watch is None:  # not watched, or already resolved
+            return
+        if exception is not None:
+            watch.future.set_exception(exception)
+        else:
+            watch.future.set_result(typing.cast(int, confirmed_round))
+
+
+def _last_round(status: object) -> int:
+    return typing.cast(int, typing.cast(dict[str, object], status)["last-round"])
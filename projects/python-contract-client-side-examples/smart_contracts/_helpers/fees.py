@@ -0,0 +1,142 @@
+# mypy: disable-error-code="no-untyped-call, misc"
+import copy
+import logging
+import typing
+from collections.abc import Callable, Hashable, Mapping
+
+import algokit_utils
+from algosdk import constants, transaction
+from algosdk.abi import Method
+
+from smart_contracts._helpers.probes import simulate_probe
+
+logger = logging.getLogger(__name__)
+
+# Number of inner transactions a probe pays for up front, a method sending more is
+# probed again with the next budget
+_PROBE_INNER_BUDGETS = (16, 256)
+
+# Tells apart calls of one method that send different inner transactions, given the
+# call's ABI args and its transaction parameters, references included
+Variant = Callable[
+    [Mapping[str, object], algokit_utils.TransactionParametersDict], Hashable
+]
+
+
+class FeePooler:
+    """Raises the outer fee of ABI method calls to cover their inner transactions
+
+    Each method's inner transaction count is learnt from a single simulate probe and
+    cached per method signature and on completion, so a pooler shared by every client
+    of the same contract only ever probes each method once. Calls whose suggested
+    params already use a flat fee are left untouched.
+
+    :param Mapping variants: (optional) Maps method signatures to a `Variant`, for
+    methods whose inner transactions depend on the call. Each variant is probed and
+    cached on its own"""
+
+    def __init__(self, variants: Mapping[str, Variant] | None = None) -> None:
+        self._variants = dict(variants or {})
+        self._inner_counts: dict[tuple[str, transaction.OnComplete, Hashable], int] = {}
+
+    def pool_fees(
+        self,
+        app_client: algokit_utils.ApplicationClient,
+        method: Method,
+        abi_args: Mapping[str, object],
+        parameters: algokit_utils.TransactionParametersDict,
+        on_complete: transaction.OnComplete,
+    ) -> algokit_utils.TransactionParametersDict:
+        """Returns `parameters` with a flat fee covering the call and its inner
+        transactions"""
+        suggested_params = (
+            parameters.get("suggested_params") or app_client.suggested_params
+        )
+        if suggested_params is not None and suggested_params.flat_fee:
+            return parameters
+
+        inner_count = self.inner_transaction_count(
+            app_client, method, abi_args, parameters, on_complete
+        )
+        if not inner_count:
+            return parameters
+
+        suggested_params = copy.copy(
+            suggested_params or app_client.algod_client.suggested_params()
+        )
+        suggested_params.flat_fee = True
+        suggested_params.fee = _min_fee(suggested_params) * (1 + inner_count)
+        return {**parameters, "suggested_params": suggested_params}
+
+    def inner_transaction_count(
+        self,
+        app_client: algokit_utils.ApplicationClient,
+        method: Method,
+        abi_args: Mapping[str, object],
+        parameters: algokit_utils.TransactionParametersDict,
+        on_complete: transaction.OnComplete,
+    ) -> int | None:
+        """Returns the number of inner transactions the method sends, including nested
+        ones, or None if it couldn't be simulated"""
+        signature = method.get_signature()
+        variant = self._variants.get(signature)
+        key = (
+            signature,
+            on_complete,
+            None if variant is None else variant(abi_args, parameters),
+        )
+        if key not in self._inner_counts:
+            inner_count = _probe_inner_count(
+                app_client, method, abi_args, parameters, on_complete
+            )
+            if inner_count is None:
+                return None
+            self._inner_counts[key] = inner_count
+        return self._inner_counts[key]
+
+
+def _probe_inner_count(
+    app_client: algokit_utils.ApplicationClient,
+    method: Method,
+    abi_args: Mapping[str, object],
+    parameters: algokit_utils.TransactionParametersDict,
+    on_complete: transaction.OnComplete,
+) -> int | None:
+    suggested_params = copy.copy(
+        parameters.get("suggested_params")
+        or app_client.suggested_params
+        or app_client.algod_client.suggested_params()
+    )
+    suggested_params.flat_fee = True
+    for budget in _PROBE_INNER_BUDGETS:
+        suggested_params.fee = _min_fee(suggested_params) * (1 + budget)
+        response = simulate_probe(
+            app_client,
+            method,
+            abi_args,
+            {**parameters, "suggested_params": suggested_params},
+            on_complete,
+        )
+        if not response.failure_message:
+            app_call = response.simulate_response["txn-groups"][0]["txn-results"][-1]
+            return count_inner_transactions(app_call["txn-result"])
+        if "fee too small" not in response.failure_message:
+            break
+
+    # let the real call surface the failure rather than caching a guess
+    logger.debug(
+        f"Could not learn the inner transactions of {method.get_signature()}: "
+        f"{response.failure_message}"
+    )
+    return None
+
+
+def count_inner_transactions(txn_result: Mapping[str, typing.Any]) -> int:
+    """Returns the number of inner transactions of a transaction result, as algod
+    reports it, including nested ones"""
+    inner_txns = txn_result.get("inner-txns", [])
+    return len(inner_txns) + sum(count_inner_transactions(t) for t in inner_txns)
+
+
+def _min_fee(suggested_params: transaction.SuggestedParams) -> int:
+    return suggested_params.min_fee or constants.MIN_TXN_FEE
@@ -0,0 +1,84 @@
+# mypy: disable-error-code="no-untyped-call, misc"
+import typing
+from collections.abc import Callable, Mapping
+from functools import lru_cache
+
+from algosdk import encoding
+from algosdk.constants import ZERO_ADDRESS
+from algosdk.error import AlgodHTTPError
+
+from smart_contracts._helpers.references import References
+
+
+@lru_cache(maxsize=4096)
+def encode_address(public_key: bytes) -> str:
+    """Returns the address of a public key, as `algosdk.encoding.encode_address`
+
+    Players repeat across many boxes, so their checksums are only computed once."""
+    return typing.cast(str, encoding.encode_address(public_key))
+
+
+class Game(typing.Protocol):
+    """The state of a game of any of the TicTacToe contracts"""
+
+    @property
+    def host(self) -> str: ...
+
+    @property
+    def guest(self) -> str: ...
+
+    @property
+    def has_guest(self) -> bool: ...
+
+
+class GamePlayers:
+    """Players of each game, for the references of the move that ends it, which
+    updates the state of both players
+
+    Players never change once the guest has joined, so those games are only read
+    once.
+
+    :param Callable get_game: Returns the state of the game with the given id"""
+
+    def __init__(self, get_game: Callable[[int], Game]):
+        self.get_game = get_game
+        self._players: dict[int, tuple[str, ...]] = {}
+
+    def get(self, game_id: int) -> tuple[str, ...] | None:
+        """Returns the host and guest of a game, without a guest yet to join, or None
+        if the game can't be read"""
+        players = self._players.get(game_id)
+        if players is None:
+            try:
+                game = self.get_game(game_id)
+            except AlgodHTTPError:
+                return None
+            players = tuple(p for p in (game.host, game.guest) if p != ZERO_ADDRESS)
+            if game.has_guest:
+                self._players[game_id] = players
+        return players
+
+
+class PlayersRule:
+    """Rule for a method taking a `game_id` whose references depend on the players
+    of the game, e.g. `move`, falling back to simulating the call when the game can't
+    be read
+
+    :param Callable get_game: Returns the state of the game with the given id
+    :param Callable references: Returns the references of a call, given its game id
+    and the players of the game"""
+
+    def __init__(
+        self,
+        get_game: Callable[[int], Game],
+        references: Callable[[int, tuple[str, ...]], References],
+    ):
+        self.players = GamePlayers(get_game)
+        self.references = references
+
+    def __call__(self, abi_args: Mapping[str, object]) -> References | None:
+        game_id = typing.cast(int, abi_args["game_id"])
+        players = self.players.get(game_id)
+        if players is None:
+            return None
+        return self.references(game_id, players)
@@ -0,0 +1,63 @@
+# mypy: disable-error-code="no-untyped-call, misc"
+import copy
+from collections.abc import Mapping
+
+import algokit_utils
+from algosdk import transaction
+from algosdk.abi import Method
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    EmptySigner,
+    SimulateAtomicTransactionResponse,
+    TransactionWithSigner,
+)
+from algosdk.v2client import models
+
+
+def simulate_probe(
+    app_client: algokit_utils.ApplicationClient,
+    method: Method,
+    abi_args: Mapping[str, object],
+    parameters: algokit_utils.TransactionParametersDict,
+    on_complete: transaction.OnComplete,
+) -> SimulateAtomicTransactionResponse:
+    """Simulates an unsigned copy of an ABI method call, without touching the caller's
+    transactions, allowing unnamed resources so references don't need to be known
+
+    The method call is the last transaction of the simulated group."""
+    _, sender = app_client.get_signer_sender(
+        parameters.get("signer"), parameters.get("sender")
+    )
+    probe_parameters: algokit_utils.TransactionParametersDict = {
+        **parameters,
+        "signer": EmptySigner(),
+    }
+    if sender:
+        probe_parameters["sender"] = sender
+
+    atc = AtomicTransactionComposer()
+    # bypass any subclass hook so the probe doesn't try to resolve itself
+    algokit_utils.ApplicationClient.add_method_call(
+        app_client,
+        atc,
+        method,
+        abi_args={name: _unsigned(value) for name, value in abi_args.items()},
+        parameters=probe_parameters,
+        on_complete=on_complete,
+    )
+    return atc.simulate(
+        app_client.algod_client,
+        models.SimulateRequest(
+            txn_groups=[],
+            allow_empty_signatures=True,
+            allow_unnamed_resources=True,
+        ),
+    )
+
+
+def _unsigned(value: object) -> object:
+    # the probe group gets its own group id, which must not leak into the caller's
+    # transaction, so simulate a copy of it
+    if isinstance(value, TransactionWithSigner):
+        return TransactionWithSigner(copy.copy(value.txn), EmptySigner())
+    return value
@@ -0,0 +1,138 @@
+# mypy: disable-error-code="no-untyped-call, misc"
+import dataclasses
+import threading
+import typing
+from collections.abc import Mapping, Sequence
+
+import algokit_utils
+from algosdk import transaction
+from algosdk.abi import Method
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    EmptySigner,
+    SimulateAtomicTransactionResponse,
+)
+from algosdk.v2client import models
+
+from smart_contracts._helpers.confirmations import ConfirmationWaiter
+
+
+@dataclasses.dataclass(frozen=True)
+class ReadonlyCall:
+    app_client: algokit_utils.ApplicationClient
+    method: Method
+    abi_args: Mapping[str, object] = dataclasses.field(default_factory=dict)
+    sender: str | None = None
+
+
+class ReadonlyCaller:
+    """Runs readonly ABI methods through simulate, never signing or submitting them
+
+    Calls are packed up to 16 per simulate request and results are cached until the
+    shared `ConfirmationWaiter` sees a later round. Transactions use the suggested
+    params of the first call's client when it has them, otherwise params fetched once
+    per round, and are sent from the caller's sender when there is one, otherwise
+    from the app account, since simulate doesn't check signatures."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._round = 0
+        self._suggested_params: transaction.SuggestedParams | None = None
+        self._results: dict[
+            tuple[object, ...], algokit_utils.ABITransactionResponse[typing.Any]
+        ] = {}
+
+    def call(
+        self, call: ReadonlyCall
+    ) -> algokit_utils.ABITransactionResponse[typing.Any]:
+        [result] = self.call_many([call])
+        return result
+
+    def call_many(
+        self, calls: Sequence[ReadonlyCall]
+    ) -> list[algokit_utils.ABITransactionResponse[typing.Any]]:
+        """Returns the result of every call, in order"""
+        if not calls:
+            return []
+        app_client = calls[0].app_client
+        round_num = ConfirmationWaiter.shared(app_client.algod_client).last_round
+        keys = [_cache_key(call) for call in calls]
+        with self._lock:
+            if round_num != self._round:
+                self._round = round_num
+                self._suggested_params = None
+                self._results.clear()
+            results = {key: self._results[key] for key in keys if key in self._results}
+            suggested_params = app_client.suggested_params or self._suggested_params
+
+        # identical calls would be identical transactions, so each is simulated once
+        calls_by_key = dict(zip(keys, calls, strict=True))
+        missing_keys = [key for key in calls_by_key if key not in results]
+        if missing_keys and suggested_params is None:
+            suggested_params = app_client.algod_client.suggested_params()
+            with self._lock:
+                if self._round == round_num:
+                    self._suggested_params = suggested_params
+        for start in range(
+            0, len(missing_keys), AtomicTransactionComposer.MAX_GROUP_SIZE
+        ):
+            batch = missing_keys[
+                start : start + AtomicTransactionComposer.MAX_GROUP_SIZE
+            ]
+            response = _simulate(
+                [calls_by_key[key] for key in batch],
+                typing.cast(transaction.SuggestedParams, suggested_params),
+            )
+            for index, key in enumerate(batch):
+                results[key] = typing.cast(
+                    algokit_utils.ABITransactionResponse[typing.Any],
+                    algokit_utils.TransactionResponse.from_atr(response, index),
+                )
+            with self._lock:
+                if self._round == round_num:
+                    self._results.update((key, results[key]) for key in batch)
+
+        return [results[key] for key in keys]
+
+
+def _cache_key(call: ReadonlyCall) -> tuple[object, ...]:
+    return (
+        call.app_client.app_id,
+        call.method.get_signature(),
+        call.sender,
+        *sorted((name, repr(value)) for name, value in call.abi_args.items()),
+    )
+
+
+def _simulate(
+    calls: Sequence[ReadonlyCall], suggested_params: transaction.SuggestedParams
+) -> SimulateAtomicTransactionResponse:
+    atc = AtomicTransactionComposer()
+    for call in calls:
+        _, sender = call.app_client.get_signer_sender(sender=call.sender)
+        algokit_utils.ApplicationClient.add_method_call(
+            call.app_client,
+            atc,
+            call.method,
+            abi_args=dict(call.abi_args),
+            parameters={
+                "sender": sender or call.app_client.app_address,
+                "signer": EmptySigner(),
+                "suggested_params": suggested_params,
+            },
+        )
+    response = atc.simulate(
+        calls[0].app_client.algod_client,
+        models.SimulateRequest(
+            txn_groups=[],
+            allow_empty_signatures=True,
+            allow_unnamed_resources=True,
+        ),
+    )
+    if response.failure_message:
+        signatures = ", ".join(call.method.get_signature() for call in calls)
+        raise Exception(
+            f"Simulate failed for readonly methods {signatures}: "
+            f"{response.failure_message}"
+        )
+    return response
@@ -0,0 +1,210 @@
+# mypy: disable-error-code="no-untyped-call, misc"
+import base64
+import collections
+import dataclasses
+import logging
+import threading
+import typing
+import weakref
+from collections.abc import Callable, Mapping
+
+import algokit_utils
+from algosdk import transaction
+from algosdk.abi import Method
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    TransactionWithSigner,
+)
+
+from smart_contracts._helpers.probes import simulate_probe
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass(frozen=True)
+class References:
+    boxes: tuple[tuple[int, bytes], ...] = ()
+    accounts: tuple[str, ...] = ()
+    foreign_apps: tuple[int, ...] = ()
+    foreign_assets: tuple[int, ...] = ()
+
+
+# A rule derives the references of one ABI method from its arguments, returning None
+# when it can't decide, in which case the call is simulated instead
+ReferenceRule = Callable[[Mapping[str, object]], References | None]
+
+
+class NextIdRule:
+    """Rule for a method storing boxes under the next value of a global id counter,
+    e.g. `new_game`, which can't be derived from its arguments alone
+
+    The counter is read once per group, by its first call of the method, and each
+    call after it in the same group takes the id after the one before. Groups
+    composed before an earlier one is confirmed read the same counter, so send
+    groups of these calls one after the other, as `MultiAuctionClient.start_auctions`
+    does.
+
+    :param Callable read_counter: Returns the current value of the counter
+    :param Callable references: Returns the references of a call, given the id it
+    stores its boxes under and its arguments"""
+
+    def __init__(
+        self,
+        read_counter: Callable[[], int],
+        references: Callable[[int, Mapping[str, object]], References],
+    ):
+        self.read_counter = read_counter
+        self.references = references
+        self._lock = threading.Lock()
+        self._next_ids: weakref.WeakKeyDictionary[AtomicTransactionComposer, int]
+        self._next_ids = weakref.WeakKeyDictionary()
+
+    def resolve(
+        self, abi_args: Mapping[str, object], atc: AtomicTransactionComposer | None
+    ) -> References:
+        with self._lock:
+            next_id = self._next_ids.get(atc) if atc is not None else None
+        if next_id is None:
+            next_id = self.read_counter() + 1
+        if atc is not None:
+            with self._lock:
+                self._next_ids[atc] = next_id + 1
+        return self.references(next_id, abi_args)
+
+
+class ReferenceResolver:
+    """Populates the box, account, app and asset references of ABI method calls
+
+    References come from the rule registered for the method's signature, falling back
+    to a single simulate call that reports the resources the call touched. Simulated
+    references are cached per method, on completion, sender and non-transaction
+    arguments, dropping the least recently used beyond `max_entries`.
+
+    :param Mapping rules: (optional) Rules by method signature
+    :param int max_entries: (optional) Number of simulated references to keep"""
+
+    def __init__(
+        self,
+        rules: Mapping[str, ReferenceRule | NextIdRule] | None = None,
+        max_entries: int = 1024,
+    ):
+        self.rules = dict(rules or {})
+        self.max_entries = max_entries
+        # shared by every thread composing calls through the same client
+        self._lock = threading.Lock()
+        self._simulated: collections.OrderedDict[tuple[object, ...], References]
+        self._simulated = collections.OrderedDict()
+
+    def resolve_parameters(
+        self,
+        app_client: algokit_utils.ApplicationClient,
+        method: Method,
+        abi_args: Mapping[str, object],
+        parameters: algokit_utils.TransactionParametersDict,
+        on_complete: transaction.OnComplete,
+        atc: AtomicTransactionComposer | None = None,
+    ) -> algokit_utils.TransactionParametersDict:
+        """Returns `parameters` with references filled in, unless the caller already
+        set any of them
+
+        `atc` is the group the call is added to, which `NextIdRule`s count ids in"""
+        fields = ("boxes", "accounts", "foreign_apps", "foreign_assets")
+        if any(parameters.get(field) is not None for field in fields):
+            return parameters
+
+        rule = self.rules.get(method.get_signature())
+        if isinstance(rule, NextIdRule):
+            references: References | None = rule.resolve(abi_args, atc)
+        else:
+            references = rule(abi_args) if rule else None
+        if references is None:
+            references = self._simulate(
+                app_client, method, abi_args, parameters, on_complete
+            )
+
+        resolved = typing.cast(dict[str, object], dict(parameters))
+        for field in fields:
+            if getattr(references, field):
+                resolved[field] = list(getattr(references, field))
+        return typing.cast(algokit_utils.TransactionParametersDict, resolved)
+
+    def _simulate(
+        self,
+        app_client: algokit_utils.ApplicationClient,
+        method: Method,
+        abi_args: Mapping[str, object],
+        parameters: algokit_utils.TransactionParametersDict,
+        on_complete: transaction.OnComplete,
+    ) -> References:
+        _, sender = app_client.get_signer_sender(
+            parameters.get("signer"), parameters.get("sender")
+        )
+        key = (
+            method.get_signature(),
+            on_complete,
+            sender,
+            *sorted(
+                (name, repr(value))
+                for name, value in abi_args.items()
+                if not isinstance(value, TransactionWithSigner)
+            ),
+        )
+        with self._lock:
+            if key in self._simulated:
+                self._simulated.move_to_end(key)
+                return self._simulated[key]
+
+        response = simulate_probe(app_client, method, abi_args, parameters, on_complete)
+        if response.failure_message:
+            # let the real call surface the failure rather than caching a guess
+            logger.debug(
+                f"Could not resolve references for {method.get_signature()}: "
+                f"{response.failure_message}"
+            )
+            return References()
+
+        references = _unnamed_resources(response.simulate_response, app_client.app_id)
+        with self._lock:
+            self._simulated[key] = references
+            while len(self._simulated) > self.max_entries:
+                self._simulated.popitem(last=False)
+        return references
+
+
+def _unnamed_resources(
+    simulate_response: dict[str, typing.Any], app_id: int
+) -> References:
+    group = simulate_response["txn-groups"][0]
+    accessed = [
+        group.get("unnamed-resources-accessed", {}),
+        *(
+            result.get("unnamed-resources-accessed", {})
+            for result in group["txn-results"]
+        ),
+    ]
+
+    boxes: dict[tuple[int, bytes], None] = {}
+    accounts: dict[str, None] = {}
+    apps: dict[int, None] = {}
+    assets: dict[int, None] = {}
+    for resources in accessed:
+        for box in resources.get("boxes", []):
+            box_app = 0 if box["app"] == app_id else box["app"]
+            boxes[(box_app, base64.b64decode(box.get("name", "")))] = None
+        accounts.update(dict.fromkeys(resources.get("accounts", [])))
+        apps.update(dict.fromkeys(resources.get("apps", [])))
+        assets.update(dict.fromkeys(resources.get("assets", [])))
+        for local in resources.get("app-locals", []):
+            accounts[local["account"]] = None
+            if local["app"] != app_id:
+                apps[local["app"]] = None
+        for holding in resources.get("asset-holdings", []):
+            accounts[holding["account"]] = None
+            assets[holding["asset"]] = None
+
+    return References(
+        boxes=tuple(boxes),
+        accounts=tuple(accounts),
+        foreign_apps=tuple(apps),
+        foreign_assets=tuple(assets),
+    )
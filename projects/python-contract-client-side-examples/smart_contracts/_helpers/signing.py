@@ -0,0 +1,120 @@
+# mypy: disable-error-code="no-untyped-call, misc"
+import base64
+import multiprocessing
+import typing
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+
+from algosdk import encoding, transaction
+from algosdk.atomic_transaction_composer import TransactionSigner
+
+# Private keys of the worker process, by signing address, set once when it starts
+_worker_keys: dict[str, str] = {}
+
+
+class BatchSigner:
+    """Signs groups of transactions across a pool of worker processes
+
+    Private keys are handed to each worker once, when it starts, and never travel with
+    the transactions to sign or the signatures coming back. Use as a context manager,
+    or `close` it, to stop the workers.
+
+    :param Mapping[str, str] private_keys: Private keys by the address they sign for,
+    which is the auth address of rekeyed accounts
+    :param int max_workers: (optional) Number of worker processes, defaults to the
+    number of CPUs"""
+
+    def __init__(
+        self, private_keys: Mapping[str, str], *, max_workers: int | None = None
+    ):
+        self._addresses = frozenset(private_keys)
+        # workers are started from whichever thread signs first, often a
+        # BulkComposer one, where forking could copy a lock some other thread holds
+        self._executor = ProcessPoolExecutor(
+            max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(dict(private_keys),),
+        )
+
+    def __enter__(self) -> "BatchSigner":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._executor.shutdown(cancel_futures=True)
+
+    def sign_groups(
+        self,
+        groups: Sequence[Sequence[transaction.Transaction]],
+        auth_addresses: Mapping[str, str] | None = None,
+    ) -> list[list[bytes]]:
+        """Signs every transaction of every group, each with the key of its sender
+
+        :param Sequence groups: Groups of unsigned transactions, with their group IDs
+        already assigned
+        :param Mapping[str, str] auth_addresses: (optional) Addresses that sign for
+        rekeyed senders, by sender
+        :returns list[list[bytes]]: The msgpack encoded signed transactions of each
+        group, ready to be sent as is"""
+        auth_addresses = auth_addresses or {}
+        tasks = [
+            [
+                (
+                    auth_addresses.get(txn.sender, txn.sender),
+                    encoding.msgpack_encode(txn),
+                )
+                for txn in group
+            ]
+            for group in groups
+        ]
+        for task in tasks:
+            for address, _ in task:
+                if address not in self._addresses:
+                    raise ValueError(f"No private key to sign for {address}")
+        return list(self._executor.map(_sign_group, tasks))
+
+    def signer(self, address: str) -> TransactionSigner:
+        """Returns a signer for `address`, which signs on the pool, to use wherever a
+        `TransactionSigner` goes, such as the `signer` of a typed client"""
+        if address not in self._addresses:
+            raise ValueError(f"No private key to sign for {address}")
+        return _PooledSigner(self, address)
+
+
+class _PooledSigner(TransactionSigner):
+    def __init__(self, batch_signer: BatchSigner, address: str):
+        self.batch_signer = batch_signer
+        self.address = address
+
+    def sign_transactions(
+        self, txn_group: list[transaction.Transaction], indexes: list[int]
+    ) -> list[transaction.GenericSignedTransaction]:
+        txns = [txn_group[i] for i in indexes]
+        [blobs] = self.batch_signer.sign_groups(
+            [txns], {txn.sender: self.address for txn in txns}
+        )
+        return [
+            typing.cast(
+                transaction.GenericSignedTransaction,
+                encoding.msgpack_decode(base64.b64encode(blob).decode()),
+            )
+            for blob in blobs
+        ]
+
+
+def _init_worker(private_keys: dict[str, str]) -> None:
+    _worker_keys.update(private_keys)
+
+
+def _sign_group(task: list[tuple[str, str]]) -> list[bytes]:
+    return [
+        base64.b64decode(
+            encoding.msgpack_encode(
+                encoding.msgpack_decode(encoded_txn).sign(_worker_keys[address])
+            )
+        )
+        for address, encoded_txn in task
+    ]
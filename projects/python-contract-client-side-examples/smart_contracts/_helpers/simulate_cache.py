@@ -0,0 +1,103 @@
+# mypy: disable-error-code="no-untyped-call, misc"
+import base64
+import collections
+import hashlib
+import json
+import threading
+import typing
+
+import algokit_utils
+from algosdk import encoding
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    SimulateAtomicTransactionResponse,
+)
+from algosdk.v2client import models
+
+from smart_contracts._helpers.confirmations import ConfirmationWaiter
+
+
+class Composer(typing.Protocol):
+    """Any of the generated `Composer` classes"""
+
+    app_client: algokit_utils.ApplicationClient
+    atc: AtomicTransactionComposer
+
+
+class SimulateOptions(typing.Protocol):
+    """Any of the generated `SimulateOptions` classes"""
+
+    allow_more_logs: bool
+    allow_empty_signatures: bool
+    extra_opcode_budget: int
+    exec_trace_config: models.SimulateTraceConfig
+
+
+class SimulateCache:
+    """Simulates `Composer` groups, reusing results for an identical group within the
+    same round
+
+    Results are keyed by a hash of the group's encoded transactions, the simulate
+    options and the latest round, which comes from the shared `ConfirmationWaiter`
+    rather than another request. The least recently used results are dropped beyond
+    `max_entries`. Cached responses are shared, so treat them as read only.
+
+    :param int max_entries: (optional) Number of results to keep"""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._results: collections.OrderedDict[bytes, SimulateAtomicTransactionResponse]
+        self._results = collections.OrderedDict()
+
+    def simulate(
+        self, composer: Composer, options: SimulateOptions | None = None
+    ) -> SimulateAtomicTransactionResponse:
+        """Does what `composer.simulate(options)` does, unless the same group was
+        simulated with the same options in the current round
+
+        :param Composer composer: The composer to simulate
+        :param SimulateOptions options: (optional) The generated `SimulateOptions` of
+        the composer's client
+        :returns SimulateAtomicTransactionResponse: The simulate response"""
+        algod_client = composer.app_client.algod_client
+        request = (
+            models.SimulateRequest(
+                txn_groups=[],
+                allow_more_logs=options.allow_more_logs,
+                allow_empty_signatures=options.allow_empty_signatures,
+                extra_opcode_budget=options.extra_opcode_budget,
+                exec_trace_config=options.exec_trace_config,
+            )
+            if options
+            else None
+        )
+        key = _cache_key(
+            composer.atc,
+            request,
+            ConfirmationWaiter.shared(algod_client).last_round,
+        )
+        with self._lock:
+            if key in self._results:
+                self._results.move_to_end(key)
+                return self._results[key]
+
+        response = composer.atc.simulate(algod_client, request)
+        with self._lock:
+            self._results[key] = response
+            while len(self._results) > self.max_entries:
+                self._results.popitem(last=False)
+        return response
+
+
+def _cache_key(
+    atc: AtomicTransactionComposer,
+    request: models.SimulateRequest | None,
+    round_num: int,
+) -> bytes:
+    digest = hashlib.sha256(round_num.to_bytes(8, "big"))
+    for txn_with_signer in atc.build_group():
+        digest.update(base64.b64decode(encoding.msgpack_encode(txn_with_signer.txn)))
+    if request is not None:
+        digest.update(json.dumps(request.dictify(), sort_keys=True).encode())
+    return digest.digest()
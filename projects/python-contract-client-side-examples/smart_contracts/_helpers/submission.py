@@ -0,0 +1,82 @@
+# mypy: disable-error-code="no-untyped-call, misc"
+import threading
+import typing
+from collections.abc import Sequence
+from concurrent.futures import Future
+
+from algosdk.error import AlgodHTTPError
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts._helpers.confirmations import ConfirmationWaiter
+
+# Errors algod answers with while its transaction pool can't take any more
+_POOL_FULL_ERRORS = ("txpool is full", "reached capacity")
+
+
+class SubmissionPipeline:
+    """Sends signed groups as raw bytes, leaving confirmation to a `ConfirmationWaiter`
+
+    At most `max_pending` groups are sent and not yet confirmed, `submit` blocks once
+    that many are, and while algod reports its transaction pool full it waits for the
+    next block before trying again.
+
+    :param AlgodClient algod_client: AlgodClient to send with
+    :param int max_pending: (optional) Number of groups waiting on confirmation at once
+    :param int wait_rounds: (optional) Rounds after sending before a group that isn't
+    confirmed is given up on
+    :param ConfirmationWaiter confirmation_waiter: (optional) Waiter to confirm with,
+    defaults to the one shared by every client of `algod_client`"""
+
+    def __init__(
+        self,
+        algod_client: AlgodClient,
+        *,
+        max_pending: int = 64,
+        wait_rounds: int = 10,
+        confirmation_waiter: ConfirmationWaiter | None = None,
+    ):
+        self.algod_client = algod_client
+        self.wait_rounds = wait_rounds
+        self.confirmation_waiter = confirmation_waiter or ConfirmationWaiter.shared(
+            algod_client
+        )
+        self._slots = threading.BoundedSemaphore(max_pending)
+
+    def submit(self, signed_group: Sequence[bytes]) -> "Future[int]":
+        """Sends a group of msgpack encoded signed transactions, as they are
+
+        :param Sequence[bytes] signed_group: The group's signed transactions, in order
+        :returns Future[int]: Resolves to the round the group is confirmed in"""
+        body = b"".join(signed_group)
+        self._slots.acquire()
+        try:
+            sent_after_round = self.confirmation_waiter.last_round
+            tx_id = self._send(body)
+            future = self.confirmation_waiter.watch(
+                tx_id, sent_after_round=sent_after_round, wait_rounds=self.wait_rounds
+            )
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def _send(self, body: bytes) -> str:
+        while True:
+            try:
+                response = self.algod_client.algod_request(
+                    "POST",
+                    "/transactions",
+                    data=body,
+                    headers={"Content-Type": "application/x-binary"},
+                )
+                return typing.cast(
+                    str, typing.cast(dict[str, object], response)["txId"]
+                )
+            except AlgodHTTPError as ex:
+                if not any(error in str(ex) for error in _POOL_FULL_ERRORS):
+                    raise
+            # back off until a block has made room in the pool
+            self.confirmation_waiter.wait_for_round(
+                self.confirmation_waiter.last_round + 1
+            )
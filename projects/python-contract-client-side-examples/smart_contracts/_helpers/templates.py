@@ -0,0 +1,76 @@
+# mypy: disable-error-code="no-untyped-call, misc"
+import copy
+from collections.abc import Mapping, Sequence
+
+import algokit_utils
+from algosdk import constants, transaction
+from algosdk.abi import Method
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    EmptySigner,
+)
+
+# Sender the template is composed with, replaced by the sender of each instance
+TEMPLATE_SENDER = constants.ZERO_ADDRESS
+
+
+class GroupTemplate:
+    """The group of an ABI method call, composed once and stamped out for many senders
+
+    Every transaction sent by `TEMPLATE_SENDER` when composing gets the sender of the
+    instance, and every transaction gets its validity rounds moved to start at the
+    instance's first valid round. Nothing else changes, so the method's arguments,
+    references and fees must be the same for every sender."""
+
+    def __init__(self, txns: Sequence[transaction.Transaction], method: Method):
+        self.method = method
+        self._txns = [copy.copy(txn) for txn in txns]
+        for txn in self._txns:
+            txn.group = None
+        self._sender_indexes = [
+            index
+            for index, txn in enumerate(self._txns)
+            if txn.sender == TEMPLATE_SENDER
+        ]
+        self._validity = [
+            txn.last_valid_round - txn.first_valid_round for txn in self._txns
+        ]
+
+    @classmethod
+    def compose(
+        cls,
+        app_client: algokit_utils.ApplicationClient,
+        method: Method,
+        abi_args: Mapping[str, object],
+        parameters: algokit_utils.TransactionParametersDict | None = None,
+    ) -> "GroupTemplate":
+        """Composes a call of `method` from `TEMPLATE_SENDER`, transaction arguments
+        included, which should also be sent from `TEMPLATE_SENDER`"""
+        atc = AtomicTransactionComposer()
+        app_client.add_method_call(
+            atc,
+            method,
+            abi_args=dict(abi_args),
+            parameters={
+                **(parameters or {}),
+                "sender": TEMPLATE_SENDER,
+                "signer": EmptySigner(),
+            },
+        )
+        return cls([txn_with_signer.txn for txn_with_signer in atc.txn_list], method)
+
+    def instantiate(
+        self, sender: str, first_valid_round: int
+    ) -> list[transaction.Transaction]:
+        """Returns the group for `sender`, valid from `first_valid_round` and with its
+        group ID assigned, ready to sign"""
+        txns = [copy.copy(txn) for txn in self._txns]
+        for index in self._sender_indexes:
+            txns[index].sender = sender
+        for txn, validity in zip(txns, self._validity, strict=True):
+            txn.first_valid_round = first_valid_round
+            txn.last_valid_round = first_valid_round + validity
+        group_id = transaction.calculate_group_id(txns)
+        for txn in txns:
+            txn.group = group_id
+        return txns
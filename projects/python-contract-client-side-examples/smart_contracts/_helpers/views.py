@@ -0,0 +1,27 @@
+# mypy: disable-error-code="no-untyped-call, misc"
+import copy
+import typing
+
+import algokit_utils
+from algosdk.atomic_transaction_composer import TransactionSigner
+
+
+class AccountViews:
+    """Lets a typed client hand out views of itself bound to other accounts
+
+    A view is a shallow copy with its own sender and signer, sharing the parsed app
+    spec, the algod client, compiled programs and every cache of the client it came
+    from, so one view per user account costs next to nothing."""
+
+    app_client: algokit_utils.ApplicationClient
+
+    def as_account(self, sender: str, signer: TransactionSigner) -> typing.Self:
+        """Returns a view of this client that sends from `sender` and signs with
+        `signer`
+
+        :param str sender: Address to send transactions from
+        :param TransactionSigner signer: Signer for `sender`
+        :returns: The view, of the same type as this client"""
+        view = copy.copy(self)
+        view.app_client = self.app_client.prepare(signer=signer, sender=sender)
+        return view
@@ -0,0 +1,695 @@
+# flake8: noqa
+# fmt: off
+# mypy: disable-error-code="no-any-return, no-untyped-call, misc, type-arg"
+# This file was automatically generated by algokit-client-generator.
+# DO NOT MODIFY IT BY HAND.
+# requires: algokit-utils@^1.2.0
+import base64
+import dataclasses
+import decimal
+import typing
+from abc import ABC, abstractmethod
+
+import algokit_utils
+import algosdk
+from algosdk.v2client import models
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    AtomicTransactionResponse,
+    SimulateAtomicTransactionResponse,
+    TransactionSigner,
+    TransactionWithSigner
+)
+
+_APP_SPEC_JSON = r"""{
+    "hints": {
+        "add_topic(string,uint64,pay)uint64": {
+            "call_config": {
+                "no_op": "CALL"
+            }
+        },
+        "vote(uint64,uint64,pay)bool": {
+            "call_config": {
+                "no_op": "CALL"
+            }
+        },
+        "get_votes(uint64)uint64[]": {
+            "read_only": true,
+            "call_config": {
+                "no_op": "CALL"
+            }
+        }
+    },
+    "source": {
+        "approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzbWFydF9jb250cmFjdHMuYm94X3ZvdGluZy5jb250cmFjdC5Cb3hWb3RpbmcuYXBwcm92YWxfcHJvZ3JhbToKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBibnogbWFpbl9lbnRyeXBvaW50QDIKICAgIGNhbGxzdWIgX19pbml0X18KCm1haW5fZW50cnlwb2ludEAyOgogICAgdHhuIE51bUFwcEFyZ3MKICAgIGJ6IG1haW5fYmFyZV9yb3V0aW5nQDkKICAgIG1ldGhvZCAiYWRkX3RvcGljKHN0cmluZyx1aW50NjQscGF5KXVpbnQ2NCIKICAgIG1ldGhvZCAidm90ZSh1aW50NjQsdWludDY0LHBheSlib29sIgogICAgbWV0aG9kICJnZXRfdm90ZXModWludDY0KXVpbnQ2NFtdIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggbWFpbl9hZGRfdG9waWNfcm91dGVANCBtYWluX3ZvdGVfcm91dGVANSBtYWluX2dldF92b3Rlc19yb3V0ZUA2CiAgICBlcnIgLy8gcmVqZWN0IHRyYW5zYWN0aW9uCgptYWluX2FkZF90b3BpY19yb3V0ZUA0OgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgYnRvaQogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludCAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnQgcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICBjYWxsc3ViIGFkZF90b3BpYwogICAgaXRvYgogICAgYnl0ZSAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl92b3RlX3JvdXRlQDU6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBidG9pCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50IDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludCBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIGNhbGxzdWIgdm90ZQogICAgYnl0ZSAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9nZXRfdm90ZXNfcm91dGVANjoKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIGNhbGxzdWIgZ2V0X3ZvdGVzCiAgICBieXRlIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX2JhcmVfcm91dGluZ0A5OgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIHJlamVjdCB0cmFuc2FjdGlvbgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgICEKICAgIGFzc2VydCAvLyBpcyBjcmVhdGluZwogICAgaW50IDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5ib3hfdm90aW5nLmNvbnRyYWN0LkJveFZvdGluZy5hZGRfdG9waWModG9waWM6IGJ5dGVzLCBvcHRpb25zOiB1aW50NjQsIG1icjogdWludDY0KSAtPiB1aW50NjQ6CmFkZF90b3BpYzoKICAgIHByb3RvIDMgMQogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIE9ubHkgY3JlYXRvciBjYW4gYWRkIHRvcGljcwogICAgZnJhbWVfZGlnIC0yCiAgICBieiBhZGRfdG9waWNfYm9vbF9mYWxzZUAzCiAgICBmcmFtZV9kaWcgLTIKICAgIGludCAyNTUKICAgIDw9CiAgICBieiBhZGRfdG9waWNfYm9vbF9mYWxzZUAzCiAgICBpbnQgMQogICAgYiBhZGRfdG9waWNfYm9vbF9tZXJnZUA0CgphZGRfdG9waWNfYm9vbF9mYWxzZUAzOgogICAgaW50IDAKCmFkZF90b3BpY19ib29sX21lcmdlQDQ6CiAgICBhc3NlcnQgLy8gVG9waWNzIGhhdmUgMSB0byAyNTUgb3B0aW9ucwogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gbWJyIG11c3QgcGF5IHRoaXMgYXBwCiAgICBpbnQgMAogICAgYnl0ZSAidG9waWNfY291bnRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3BpY19jb3VudGVyIGV4aXN0cwogICAgaW50IDEKICAgICsKICAgIGJ5dGUgInRvcGljX2NvdW50ZXIiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0TWluQmFsYW5jZQogICAgYXNzZXJ0CiAgICBpbnQgMAogICAgYnl0ZSAidG9waWNfY291bnRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3BpY19jb3VudGVyIGV4aXN0cwogICAgaXRvYgogICAgYnl0ZSAweDc0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2RlbAogICAgcG9wCiAgICBmcmFtZV9kaWcgLTMKICAgIGJveF9wdXQKICAgIGludCAwCiAgICBieXRlICJ0b3BpY19jb3VudGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvcGljX2NvdW50ZXIgZXhpc3RzCiAgICBjYWxsc3ViIHRhbGxpZXNfa2V5CiAgICBmcmFtZV9kaWcgLTIKICAgIGludCA4CiAgICAqCiAgICBib3hfY3JlYXRlCiAgICBhc3NlcnQKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIGFzc2VydAogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBBbW91bnQKICAgIHN3YXAKICAgIHVuY292ZXIgMgogICAgLQogICAgPT0KICAgIGFzc2VydCAvLyBtYnIgbXVzdCBjb3ZlciB0aGUgdG9waWMgYm94ZXMKICAgIGludCAwCiAgICBieXRlICJ0b3BpY19jb3VudGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvcGljX2NvdW50ZXIgZXhpc3RzCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYm94X3ZvdGluZy5jb250cmFjdC5Cb3hWb3RpbmcudGFsbGllc19rZXkodG9waWNfaWQ6IHVpbnQ2NCkgLT4gYnl0ZXM6CnRhbGxpZXNfa2V5OgogICAgcHJvdG8gMSAxCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIGJ5dGUgMHg3NgogICAgc3dhcAogICAgY29uY2F0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYm94X3ZvdGluZy5jb250cmFjdC5Cb3hWb3Rpbmcudm90ZSh0b3BpY19pZDogdWludDY0LCBvcHRpb246IHVpbnQ2NCwgcGF5OiB1aW50NjQpIC0+IGJ5dGVzOgp2b3RlOgogICAgcHJvdG8gMyAxCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIFNlbmRlcgogICAgdHhuIFNlbmRlcgogICAgPT0KICAgIGFzc2VydCAvLyBQYXltZW50IHNlbmRlciBtdXN0IG1hdGNoIHRyYW5zYWN0aW9uIHNlbmRlcgogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gUGF5bWVudCBtdXN0IHBheSB0aGlzIGFwcAogICAgZnJhbWVfZGlnIC0zCiAgICBjYWxsc3ViIHRhbGxpZXNfa2V5CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGFzc2VydCAvLyBVbmtub3duIHRvcGljCiAgICBpbnQgOAogICAgLwogICAgZnJhbWVfZGlnIC0yCiAgICA+CiAgICBhc3NlcnQgLy8gVW5rbm93biBvcHRpb24KICAgIGZyYW1lX2RpZyAtMwogICAgaXRvYgogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICBieXRlIDB4NjIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGJ6IHZvdGVfYWZ0ZXJfaWZfZWxzZUAyCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIEFtb3VudAogICAgIQogICAgYXNzZXJ0IC8vIEFscmVhZHkgdm90ZWQsIHNvIHBheSBub3RoaW5nCiAgICBieXRlIDB4MDAKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgp2b3RlX2FmdGVyX2lmX2Vsc2VAMjoKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIGFzc2VydAogICAgZnJhbWVfZGlnIC0yCiAgICBpdG9iCiAgICBleHRyYWN0IDcgMQogICAgZnJhbWVfZGlnIDEKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIGFzc2VydAogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBBbW91bnQKICAgIHN3YXAKICAgIHVuY292ZXIgMgogICAgLQogICAgPT0KICAgIGFzc2VydCAvLyBJbmNvcnJlY3QgcGF5bWVudCBhbW91bnQKICAgIGZyYW1lX2RpZyAtMgogICAgaW50IDgKICAgICoKICAgIGZyYW1lX2RpZyAwCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGRpZyAxCiAgICBpbnQgOAogICAgYm94X2V4dHJhY3QKICAgIGJ0b2kKICAgIGludCAxCiAgICArCiAgICBpdG9iCiAgICBib3hfcmVwbGFjZQogICAgYnl0ZSAweDgwCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5ib3hfdm90aW5nLmNvbnRyYWN0LkJveFZvdGluZy5nZXRfdm90ZXModG9waWNfaWQ6IHVpbnQ2NCkgLT4gYnl0ZXM6CmdldF92b3RlczoKICAgIHByb3RvIDEgMQogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIHRhbGxpZXNfa2V5CiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gVW5rbm93biB0b3BpYwogICAgZHVwCiAgICBsZW4KICAgIGludCA4CiAgICAvCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYm94X3ZvdGluZy5jb250cmFjdC5Cb3hWb3RpbmcuX19pbml0X18oKSAtPiB2b2lkOgpfX2luaXRfXzoKICAgIHByb3RvIDAgMAogICAgYnl0ZSAidG9waWNfY291bnRlciIKICAgIGludCAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCg==",
+        "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzbWFydF9jb250cmFjdHMuYm94X3ZvdGluZy5jb250cmFjdC5Cb3hWb3RpbmcuY2xlYXJfc3RhdGVfcHJvZ3JhbToKICAgIGludCAxCiAgICByZXR1cm4K"
+    },
+    "state": {
+        "global": {
+            "num_byte_slices": 0,
+            "num_uints": 1
+        },
+        "local": {
+            "num_byte_slices": 0,
+            "num_uints": 0
+        }
+    },
+    "schema": {
+        "global": {
+            "declared": {
+                "topic_counter": {
+                    "type": "uint64",
+                    "key": "topic_counter"
+                }
+            },
+            "reserved": {}
+        },
+        "local": {
+            "declared": {},
+            "reserved": {}
+        }
+    },
+    "contract": {
+        "name": "BoxVoting",
+        "methods": [
+            {
+                "name": "add_topic",
+                "args": [
+                    {
+                        "type": "string",
+                        "name": "topic"
+                    },
+                    {
+                        "type": "uint64",
+                        "name": "options"
+                    },
+                    {
+                        "type": "pay",
+                        "name": "mbr"
+                    }
+                ],
+                "returns": {
+                    "type": "uint64"
+                }
+            },
+            {
+                "name": "vote",
+                "args": [
+                    {
+                        "type": "uint64",
+                        "name": "topic_id"
+                    },
+                    {
+                        "type": "uint64",
+                        "name": "option"
+                    },
+                    {
+                        "type": "pay",
+                        "name": "pay"
+                    }
+                ],
+                "returns": {
+                    "type": "bool"
+                }
+            },
+            {
+                "name": "get_votes",
+                "args": [
+                    {
+                        "type": "uint64",
+                        "name": "topic_id"
+                    }
+                ],
+                "returns": {
+                    "type": "uint64[]"
+                }
+            }
+        ],
+        "networks": {}
+    },
+    "bare_call_config": {
+        "no_op": "CREATE"
+    }
+}"""
+APP_SPEC = algokit_utils.ApplicationSpecification.from_json(_APP_SPEC_JSON)
+_TReturn = typing.TypeVar("_TReturn")
+
+
+class _ArgsBase(ABC, typing.Generic[_TReturn]):
+    @staticmethod
+    @abstractmethod
+    def method() -> str:
+        ...
+
+
+_TArgs = typing.TypeVar("_TArgs", bound=_ArgsBase[typing.Any])
+
+
+@dataclasses.dataclass(kw_only=True)
+class _TArgsHolder(typing.Generic[_TArgs]):
+    args: _TArgs
+
+
+def _filter_none(value: dict | typing.Any) -> dict | typing.Any:
+    if isinstance(value, dict):
+        return {k: _filter_none(v) for k, v in value.items() if v is not None}
+    return value
+
+
+def _as_dict(data: typing.Any, *, convert_all: bool = True) -> dict[str, typing.Any]:
+    if data is None:
+        return {}
+    if not dataclasses.is_dataclass(data):
+        raise TypeError(f"{data} must be a dataclass")
+    if convert_all:
+        result = dataclasses.asdict(data) # type: ignore[call-overload]
+    else:
+        result = {f.name: getattr(data, f.name) for f in dataclasses.fields(data)}
+    return _filter_none(result)
+
+
+def _convert_transaction_parameters(
+    transaction_parameters: algokit_utils.TransactionParameters | None,
+) -> algokit_utils.TransactionParametersDict:
+    return typing.cast(algokit_utils.TransactionParametersDict, _as_dict(transaction_parameters))
+
+
+def _convert_call_transaction_parameters(
+    transaction_parameters: algokit_utils.TransactionParameters | None,
+) -> algokit_utils.OnCompleteCallParametersDict:
+    return typing.cast(algokit_utils.OnCompleteCallParametersDict, _as_dict(transaction_parameters))
+
+
+def _convert_create_transaction_parameters(
+    transaction_parameters: algokit_utils.TransactionParameters | None,
+    on_complete: algokit_utils.OnCompleteActionName,
+) -> algokit_utils.CreateCallParametersDict:
+    result = typing.cast(algokit_utils.CreateCallParametersDict, _as_dict(transaction_parameters))
+    on_complete_enum = on_complete.replace("_", " ").title().replace(" ", "") + "OC"
+    result["on_complete"] = getattr(algosdk.transaction.OnComplete, on_complete_enum)
+    return result
+
+
+def _convert_deploy_args(
+    deploy_args: algokit_utils.DeployCallArgs | None,
+) -> algokit_utils.ABICreateCallArgsDict | None:
+    if deploy_args is None:
+        return None
+
+    deploy_args_dict = typing.cast(algokit_utils.ABICreateCallArgsDict, _as_dict(deploy_args))
+    if isinstance(deploy_args, _TArgsHolder):
+        deploy_args_dict["args"] = _as_dict(deploy_args.args)
+        deploy_args_dict["method"] = deploy_args.args.method()
+
+    return deploy_args_dict
+
+
+@dataclasses.dataclass(kw_only=True)
+class AddTopicArgs(_ArgsBase[int]):
+    topic: str
+    options: int
+    mbr: TransactionWithSigner
+
+    @staticmethod
+    def method() -> str:
+        return "add_topic(string,uint64,pay)uint64"
+
+
+@dataclasses.dataclass(kw_only=True)
+class VoteArgs(_ArgsBase[bool]):
+    topic_id: int
+    option: int
+    pay: TransactionWithSigner
+
+    @staticmethod
+    def method() -> str:
+        return "vote(uint64,uint64,pay)bool"
+
+
+@dataclasses.dataclass(kw_only=True)
+class GetVotesArgs(_ArgsBase[list[int]]):
+    topic_id: int
+
+    @staticmethod
+    def method() -> str:
+        return "get_votes(uint64)uint64[]"
+
+
+class GlobalState:
+    def __init__(self, data: dict[bytes, bytes | int]):
+        self.topic_counter = typing.cast(int, data.get(b"topic_counter"))
+
+
+@dataclasses.dataclass(kw_only=True)
+class SimulateOptions:
+    allow_more_logs: bool = dataclasses.field(default=False)
+    allow_empty_signatures: bool = dataclasses.field(default=False)
+    extra_opcode_budget: int = dataclasses.field(default=0)
+    exec_trace_config: models.SimulateTraceConfig | None         = dataclasses.field(default=None)
+
+
+class Composer:
+
+    def __init__(self, app_client: algokit_utils.ApplicationClient, atc: AtomicTransactionComposer):
+        self.app_client = app_client
+        self.atc = atc
+
+    def build(self) -> AtomicTransactionComposer:
+        return self.atc
+
+    def simulate(self, options: SimulateOptions | None = None) -> SimulateAtomicTransactionResponse:
+        request = models.SimulateRequest(
+            allow_more_logs=options.allow_more_logs,
+            allow_empty_signatures=options.allow_empty_signatures,
+            extra_opcode_budget=options.extra_opcode_budget,
+            exec_trace_config=options.exec_trace_config,
+            txn_groups=[]
+        ) if options else None
+        result = self.atc.simulate(self.app_client.algod_client, request)
+        return result
+
+    def execute(self) -> AtomicTransactionResponse:
+        return self.app_client.execute_atc(self.atc)
+
+    def add_topic(
+        self,
+        *,
+        topic: str,
+        options: int,
+        mbr: TransactionWithSigner,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `add_topic(string,uint64,pay)uint64` ABI method
+        
+        :param str topic: The `topic` ABI parameter
+        :param int options: The `options` ABI parameter
+        :param TransactionWithSigner mbr: The `mbr` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = AddTopicArgs(
+            topic=topic,
+            options=options,
+            mbr=mbr,
+        )
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def vote(
+        self,
+        *,
+        topic_id: int,
+        option: int,
+        pay: TransactionWithSigner,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `vote(uint64,uint64,pay)bool` ABI method
+        
+        :param int topic_id: The `topic_id` ABI parameter
+        :param int option: The `option` ABI parameter
+        :param TransactionWithSigner pay: The `pay` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = VoteArgs(
+            topic_id=topic_id,
+            option=option,
+            pay=pay,
+        )
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def get_votes(
+        self,
+        *,
+        topic_id: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `get_votes(uint64)uint64[]` ABI method
+        
+        :param int topic_id: The `topic_id` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = GetVotesArgs(
+            topic_id=topic_id,
+        )
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def create_bare(
+        self,
+        *,
+        on_complete: typing.Literal["no_op"] = "no_op",
+        transaction_parameters: algokit_utils.CreateTransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to create an application using the no_op bare method
+        
+        :param typing.Literal[no_op] on_complete: On completion type to use
+        :param algokit_utils.CreateTransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        self.app_client.compose_create(
+            self.atc,
+            call_abi_method=False,
+            transaction_parameters=_convert_create_transaction_parameters(transaction_parameters, on_complete),
+        )
+        return self
+
+    def clear_state(
+        self,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+        app_args: list[bytes] | None = None,
+    ) -> "Composer":
+        """Adds a call to the application with on completion set to ClearState
+    
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :param list[bytes] | None app_args: (optional) Application args to pass"""
+    
+        self.app_client.compose_clear_state(self.atc, _convert_transaction_parameters(transaction_parameters), app_args)
+        return self
+
+
+class BoxVotingClient:
+    """A class for interacting with the BoxVoting app providing high productivity and
+    strongly typed methods to deploy and call the app"""
+
+    @typing.overload
+    def __init__(
+        self,
+        algod_client: algosdk.v2client.algod.AlgodClient,
+        *,
+        app_id: int = 0,
+        signer: TransactionSigner | algokit_utils.Account | None = None,
+        sender: str | None = None,
+        suggested_params: algosdk.transaction.SuggestedParams | None = None,
+        template_values: algokit_utils.TemplateValueMapping | None = None,
+        app_name: str | None = None,
+    ) -> None:
+        ...
+
+    @typing.overload
+    def __init__(
+        self,
+        algod_client: algosdk.v2client.algod.AlgodClient,
+        *,
+        creator: str | algokit_utils.Account,
+        indexer_client: algosdk.v2client.indexer.IndexerClient | None = None,
+        existing_deployments: algokit_utils.AppLookup | None = None,
+        signer: TransactionSigner | algokit_utils.Account | None = None,
+        sender: str | None = None,
+        suggested_params: algosdk.transaction.SuggestedParams | None = None,
+        template_values: algokit_utils.TemplateValueMapping | None = None,
+        app_name: str | None = None,
+    ) -> None:
+        ...
+
+    def __init__(
+        self,
+        algod_client: algosdk.v2client.algod.AlgodClient,
+        *,
+        creator: str | algokit_utils.Account | None = None,
+        indexer_client: algosdk.v2client.indexer.IndexerClient | None = None,
+        existing_deployments: algokit_utils.AppLookup | None = None,
+        app_id: int = 0,
+        signer: TransactionSigner | algokit_utils.Account | None = None,
+        sender: str | None = None,
+        suggested_params: algosdk.transaction.SuggestedParams | None = None,
+        template_values: algokit_utils.TemplateValueMapping | None = None,
+        app_name: str | None = None,
+    ) -> None:
+        """
+        BoxVotingClient can be created with an app_id to interact with an existing application, alternatively
+        it can be created with a creator and indexer_client specified to find existing applications by name and creator.
+        
+        :param AlgodClient algod_client: AlgoSDK algod client
+        :param int app_id: The app_id of an existing application, to instead find the application by creator and name
+        use the creator and indexer_client parameters
+        :param str | Account creator: The address or Account of the app creator to resolve the app_id
+        :param IndexerClient indexer_client: AlgoSDK indexer client, only required if deploying or finding app_id by
+        creator and app name
+        :param AppLookup existing_deployments:
+        :param TransactionSigner | Account signer: Account or signer to use to sign transactions, if not specified and
+        creator was passed as an Account will use that.
+        :param str sender: Address to use as the sender for all transactions, will use the address associated with the
+        signer if not specified.
+        :param TemplateValueMapping template_values: Values to use for TMPL_* template variables, dictionary keys should
+        *NOT* include the TMPL_ prefix
+        :param str | None app_name: Name of application to use when deploying, defaults to name defined on the
+        Application Specification
+            """
+
+        self.app_spec = APP_SPEC
+        
+        # calling full __init__ signature, so ignoring mypy warning about overloads
+        self.app_client = algokit_utils.ApplicationClient(  # type: ignore[call-overload, misc]
+            algod_client=algod_client,
+            app_spec=self.app_spec,
+            app_id=app_id,
+            creator=creator,
+            indexer_client=indexer_client,
+            existing_deployments=existing_deployments,
+            signer=signer,
+            sender=sender,
+            suggested_params=suggested_params,
+            template_values=template_values,
+            app_name=app_name,
+        )
+
+    @property
+    def algod_client(self) -> algosdk.v2client.algod.AlgodClient:
+        return self.app_client.algod_client
+
+    @property
+    def app_id(self) -> int:
+        return self.app_client.app_id
+
+    @app_id.setter
+    def app_id(self, value: int) -> None:
+        self.app_client.app_id = value
+
+    @property
+    def app_address(self) -> str:
+        return self.app_client.app_address
+
+    @property
+    def sender(self) -> str | None:
+        return self.app_client.sender
+
+    @sender.setter
+    def sender(self, value: str) -> None:
+        self.app_client.sender = value
+
+    @property
+    def signer(self) -> TransactionSigner | None:
+        return self.app_client.signer
+
+    @signer.setter
+    def signer(self, value: TransactionSigner) -> None:
+        self.app_client.signer = value
+
+    @property
+    def suggested_params(self) -> algosdk.transaction.SuggestedParams | None:
+        return self.app_client.suggested_params
+
+    @suggested_params.setter
+    def suggested_params(self, value: algosdk.transaction.SuggestedParams | None) -> None:
+        self.app_client.suggested_params = value
+
+    def get_global_state(self) -> GlobalState:
+        """Returns the application's global state wrapped in a strongly typed class with options to format the stored value"""
+
+        state = typing.cast(dict[bytes, bytes | int], self.app_client.get_global_state(raw=True))
+        return GlobalState(state)
+
+    def add_topic(
+        self,
+        *,
+        topic: str,
+        options: int,
+        mbr: TransactionWithSigner,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[int]:
+        """Calls `add_topic(string,uint64,pay)uint64` ABI method
+        
+        :param str topic: The `topic` ABI parameter
+        :param int options: The `options` ABI parameter
+        :param TransactionWithSigner mbr: The `mbr` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[int]: The result of the transaction"""
+
+        args = AddTopicArgs(
+            topic=topic,
+            options=options,
+            mbr=mbr,
+        )
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
+    def vote(
+        self,
+        *,
+        topic_id: int,
+        option: int,
+        pay: TransactionWithSigner,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[bool]:
+        """Calls `vote(uint64,uint64,pay)bool` ABI method
+        
+        :param int topic_id: The `topic_id` ABI parameter
+        :param int option: The `option` ABI parameter
+        :param TransactionWithSigner pay: The `pay` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[bool]: The result of the transaction"""
+
+        args = VoteArgs(
+            topic_id=topic_id,
+            option=option,
+            pay=pay,
+        )
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
+    def get_votes(
+        self,
+        *,
+        topic_id: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[list[int]]:
+        """Calls `get_votes(uint64)uint64[]` ABI method
+        
+        :param int topic_id: The `topic_id` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[list[int]]: The result of the transaction"""
+
+        args = GetVotesArgs(
+            topic_id=topic_id,
+        )
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
+    def create_bare(
+        self,
+        *,
+        on_complete: typing.Literal["no_op"] = "no_op",
+        transaction_parameters: algokit_utils.CreateTransactionParameters | None = None,
+    ) -> algokit_utils.TransactionResponse:
+        """Creates an application using the no_op bare method
+        
+        :param typing.Literal[no_op] on_complete: On completion type to use
+        :param algokit_utils.CreateTransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.TransactionResponse: The result of the transaction"""
+
+        result = self.app_client.create(
+            call_abi_method=False,
+            transaction_parameters=_convert_create_transaction_parameters(transaction_parameters, on_complete),
+        )
+        return result
+
+    def clear_state(
+        self,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+        app_args: list[bytes] | None = None,
+    ) -> algokit_utils.TransactionResponse:
+        """Calls the application with on completion set to ClearState
+    
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :param list[bytes] | None app_args: (optional) Application args to pass
+        :returns algokit_utils.TransactionResponse: The result of the transaction"""
+    
+        return self.app_client.clear_state(_convert_transaction_parameters(transaction_parameters), app_args)
+
+    def deploy(
+        self,
+        version: str | None = None,
+        *,
+        signer: TransactionSigner | None = None,
+        sender: str | None = None,
+        allow_update: bool | None = None,
+        allow_delete: bool | None = None,
+        on_update: algokit_utils.OnUpdate = algokit_utils.OnUpdate.Fail,
+        on_schema_break: algokit_utils.OnSchemaBreak = algokit_utils.OnSchemaBreak.Fail,
+        template_values: algokit_utils.TemplateValueMapping | None = None,
+        create_args: algokit_utils.DeployCallArgs | None = None,
+        update_args: algokit_utils.DeployCallArgs | None = None,
+        delete_args: algokit_utils.DeployCallArgs | None = None,
+    ) -> algokit_utils.DeployResponse:
+        """Deploy an application and update client to reference it.
+        
+        Idempotently deploy (create, update/delete if changed) an app against the given name via the given creator
+        account, including deploy-time template placeholder substitutions.
+        To understand the architecture decisions behind this functionality please see
+        <https://github.com/algorandfoundation/algokit-cli/blob/main/docs/architecture-decisions/2023-01-12_smart-contract-deployment.md>
+        
+        ```{note}
+        If there is a breaking state schema change to an existing app (and `on_schema_break` is set to
+        'ReplaceApp' the existing app will be deleted and re-created.
+        ```
+        
+        ```{note}
+        If there is an update (different TEAL code) to an existing app (and `on_update` is set to 'ReplaceApp')
+        the existing app will be deleted and re-created.
+        ```
+        
+        :param str version: version to use when creating or updating app, if None version will be auto incremented
+        :param algosdk.atomic_transaction_composer.TransactionSigner signer: signer to use when deploying app
+        , if None uses self.signer
+        :param str sender: sender address to use when deploying app, if None uses self.sender
+        :param bool allow_delete: Used to set the `TMPL_DELETABLE` template variable to conditionally control if an app
+        can be deleted
+        :param bool allow_update: Used to set the `TMPL_UPDATABLE` template variable to conditionally control if an app
+        can be updated
+        :param OnUpdate on_update: Determines what action to take if an application update is required
+        :param OnSchemaBreak on_schema_break: Determines what action to take if an application schema requirements
+        has increased beyond the current allocation
+        :param dict[str, int|str|bytes] template_values: Values to use for `TMPL_*` template variables, dictionary keys
+        should *NOT* include the TMPL_ prefix
+        :param algokit_utils.DeployCallArgs | None create_args: Arguments used when creating an application
+        :param algokit_utils.DeployCallArgs | None update_args: Arguments used when updating an application
+        :param algokit_utils.DeployCallArgs | None delete_args: Arguments used when deleting an application
+        :return DeployResponse: details action taken and relevant transactions
+        :raises DeploymentError: If the deployment failed"""
+
+        return self.app_client.deploy(
+            version,
+            signer=signer,
+            sender=sender,
+            allow_update=allow_update,
+            allow_delete=allow_delete,
+            on_update=on_update,
+            on_schema_break=on_schema_break,
+            template_values=template_values,
+            create_args=_convert_deploy_args(create_args),
+            update_args=_convert_deploy_args(update_args),
+            delete_args=_convert_deploy_args(delete_args),
+        )
+
+    def compose(self, atc: AtomicTransactionComposer | None = None) -> Composer:
+        return Composer(self.app_client, atc or AtomicTransactionComposer())
@@ -0,0 +1,890 @@
+# flake8: noqa
+# fmt: off
+# mypy: disable-error-code="no-any-return, no-untyped-call, misc, type-arg"
+# This file was automatically generated by algokit-client-generator.
+# DO NOT MODIFY IT BY HAND.
+# requires: algokit-utils@^1.2.0
+import base64
+import dataclasses
+import decimal
+import typing
+from abc import ABC, abstractmethod
+
+import algokit_utils
+import algosdk
+from algosdk.v2client import models
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    AtomicTransactionResponse,
+    SimulateAtomicTransactionResponse,
+    TransactionSigner,
+    TransactionWithSigner
+)
+
+_APP_SPEC_JSON = r"""{
+    "hints": {
+        "new_game(pay)uint64": {
+            "call_config": {
+                "no_op": "CALL",
+                "opt_in": "CALL"
+            }
+        },
+        "delete_game(uint64)void": {
+            "call_config": {
+                "no_op": "CALL"
+            }
+        },
+        "join(uint64)void": {
+            "call_config": {
+                "no_op": "CALL",
+                "opt_in": "CALL"
+            }
+        },
+        "move(uint64,uint64,uint64)void": {
+            "call_config": {
+                "no_op": "CALL"
+            }
+        }
+    },
+    "source": {
+        "approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzbWFydF9jb250cmFjdHMudGljdGFjdG9lX2JpdGJvYXJkLmNvbnRyYWN0LlRpY1RhY1RvZUJpdGJvYXJkLmFwcHJvdmFsX3Byb2dyYW06CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYm56IG1haW5fZW50cnlwb2ludEAyCiAgICBjYWxsc3ViIF9faW5pdF9fCgptYWluX2VudHJ5cG9pbnRAMjoKICAgIHR4biBOdW1BcHBBcmdzCiAgICBieiBtYWluX2JhcmVfcm91dGluZ0AxMAogICAgbWV0aG9kICJuZXdfZ2FtZShwYXkpdWludDY0IgogICAgbWV0aG9kICJkZWxldGVfZ2FtZSh1aW50NjQpdm9pZCIKICAgIG1ldGhvZCAiam9pbih1aW50NjQpdm9pZCIKICAgIG1ldGhvZCAibW92ZSh1aW50NjQsdWludDY0LHVpbnQ2NCl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggbWFpbl9uZXdfZ2FtZV9yb3V0ZUA0IG1haW5fZGVsZXRlX2dhbWVfcm91dGVANSBtYWluX2pvaW5fcm91dGVANiBtYWluX21vdmVfcm91dGVANwogICAgZXJyIC8vIHJlamVjdCB0cmFuc2FjdGlvbgoKbWFpbl9uZXdfZ2FtZV9yb3V0ZUA0OgogICAgaW50IDEKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIHNobAogICAgaW50IDMKICAgICYKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgb25lIG9mIE5vT3AsIE9wdEluCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludCAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnQgcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICBjYWxsc3ViIG5ld19nYW1lCiAgICBpdG9iCiAgICBieXRlIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX2RlbGV0ZV9nYW1lX3JvdXRlQDU6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICBjYWxsc3ViIGRlbGV0ZV9nYW1lCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX2pvaW5fcm91dGVANjoKICAgIGludCAxCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBzaGwKICAgIGludCAzCiAgICAmCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG9uZSBvZiBOb09wLCBPcHRJbgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIGNhbGxzdWIgam9pbgogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9tb3ZlX3JvdXRlQDc6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBidG9pCiAgICBjYWxsc3ViIG1vdmUKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fYmFyZV9yb3V0aW5nQDEwOgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgc3dpdGNoIG1haW5fY3JlYXRlQDExIG1haW5fcmVqZWN0X2JhcmVfb25fY29tcGxldGlvbkAxMyBtYWluX2Nsb3NlX291dEAxMgogICAgZXJyIC8vIHJlamVjdCB0cmFuc2FjdGlvbgoKbWFpbl9jcmVhdGVAMTE6CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgIQogICAgYXNzZXJ0IC8vIGlzIGNyZWF0aW5nCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX2Nsb3NlX291dEAxMjoKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX3JlamVjdF9iYXJlX29uX2NvbXBsZXRpb25AMTM6CiAgICBlcnIgLy8gcmVqZWN0IHRyYW5zYWN0aW9uCgoKLy8gc21hcnRfY29udHJhY3RzLnRpY3RhY3RvZV9iaXRib2FyZC5jb250cmFjdC5UaWNUYWNUb2VCaXRib2FyZC5uZXdfZ2FtZShtYnI6IHVpbnQ2NCkgLT4gdWludDY0OgpuZXdfZ2FtZToKICAgIHByb3RvIDEgMQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgaW50IE9wdEluCiAgICA9PQogICAgYnogbmV3X2dhbWVfYWZ0ZXJfaWZfZWxzZUAyCiAgICBjYWxsc3ViIG9wdF9pbgoKbmV3X2dhbWVfYWZ0ZXJfaWZfZWxzZUAyOgogICAgaW50IDAKICAgIGJ5dGUgImlkX2NvdW50ZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuaWRfY291bnRlciBleGlzdHMKICAgIGludCAxCiAgICArCiAgICBieXRlICJpZF9jb3VudGVyIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0CiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RNaW5CYWxhbmNlCiAgICBhc3NlcnQKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgYnl0ZSAweDAwMDAwMDAwMDAwMDAwMDAKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBpbnQgMAogICAgYnl0ZSAiaWRfY291bnRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5pZF9jb3VudGVyIGV4aXN0cwogICAgaXRvYgogICAgYnl0ZSAweDY3CiAgICBzd2FwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIGFzc2VydAogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBBbW91bnQKICAgIHN3YXAKICAgIHVuY292ZXIgMgogICAgLQogICAgPT0KICAgIGFzc2VydAogICAgaW50IDAKICAgIGJ5dGUgImlkX2NvdW50ZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuaWRfY291bnRlciBleGlzdHMKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50aWN0YWN0b2VfYml0Ym9hcmQuY29udHJhY3QuVGljVGFjVG9lQml0Ym9hcmQub3B0X2luKCkgLT4gdm9pZDoKb3B0X2luOgogICAgcHJvdG8gMCAwCiAgICB0eG4gU2VuZGVyCiAgICBieXRlICJnYW1lc19wbGF5ZWQiCiAgICBpbnQgMAogICAgYXBwX2xvY2FsX3B1dAogICAgdHhuIFNlbmRlcgogICAgYnl0ZSAiZ2FtZXNfd29uIgogICAgaW50IDAKICAgIGFwcF9sb2NhbF9wdXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50aWN0YWN0b2VfYml0Ym9hcmQuY29udHJhY3QuVGljVGFjVG9lQml0Ym9hcmQuZGVsZXRlX2dhbWUoZ2FtZV9pZDogdWludDY0KSAtPiB2b2lkOgpkZWxldGVfZ2FtZToKICAgIHByb3RvIDEgMAogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBieXRlIDB4NjcKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZ2FtZXMgZW50cnkgZXhpc3RzCiAgICBleHRyYWN0IDQwIDMyIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICA9PQogICAgYm56IGRlbGV0ZV9nYW1lX2Jvb2xfdHJ1ZUAyCiAgICBmcmFtZV9kaWcgMQogICAgZXh0cmFjdCAwIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICBpbnQgMjgxNDc0OTc2NzEwNjU2CiAgICAmCiAgICBieiBkZWxldGVfZ2FtZV9ib29sX2ZhbHNlQDMKCmRlbGV0ZV9nYW1lX2Jvb2xfdHJ1ZUAyOgogICAgaW50IDEKICAgIGIgZGVsZXRlX2dhbWVfYm9vbF9tZXJnZUA0CgpkZWxldGVfZ2FtZV9ib29sX2ZhbHNlQDM6CiAgICBpbnQgMAoKZGVsZXRlX2dhbWVfYm9vbF9tZXJnZUA0OgogICAgYXNzZXJ0CiAgICB0eG4gU2VuZGVyCiAgICBmcmFtZV9kaWcgMQogICAgZXh0cmFjdCA4IDMyIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZHVwCiAgICBjb3ZlciAyCiAgICA9PQogICAgYXNzZXJ0CiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RNaW5CYWxhbmNlCiAgICBhc3NlcnQKICAgIGZyYW1lX2RpZyAwCiAgICBib3hfZGVsCiAgICBwb3AKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIGFzc2VydAogICAgaXR4bl9iZWdpbgogICAgLQogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIGludCBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludCAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50aWN0YWN0b2VfYml0Ym9hcmQuY29udHJhY3QuVGljVGFjVG9lQml0Ym9hcmQuam9pbihnYW1lX2lkOiB1aW50NjQpIC0+IHZvaWQ6CmpvaW46CiAgICBwcm90byAxIDAKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIGludCBPcHRJbgogICAgPT0KICAgIGJ6IGpvaW5fYWZ0ZXJfaWZfZWxzZUAyCiAgICBjYWxsc3ViIG9wdF9pbgoKam9pbl9hZnRlcl9pZl9lbHNlQDI6CiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIGJ5dGUgMHg2NwogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmdhbWVzIGVudHJ5IGV4aXN0cwogICAgZXh0cmFjdCA4IDMyIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgdHhuIFNlbmRlcgogICAgIT0KICAgIGFzc2VydAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5nYW1lcyBlbnRyeSBleGlzdHMKICAgIGV4dHJhY3QgNDAgMzIgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgID09CiAgICBhc3NlcnQKICAgIGR1cAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZ2FtZXMgZW50cnkgZXhpc3RzCiAgICB0eG4gU2VuZGVyCiAgICByZXBsYWNlMiA0MAogICAgYm94X3B1dAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnRpY3RhY3RvZV9iaXRib2FyZC5jb250cmFjdC5UaWNUYWNUb2VCaXRib2FyZC5tb3ZlKGdhbWVfaWQ6IHVpbnQ2NCwgeDogdWludDY0LCB5OiB1aW50NjQpIC0+IHZvaWQ6Cm1vdmU6CiAgICBwcm90byAzIDAKICAgIGludCAwCiAgICBkdXAKICAgIGJ5dGUgIiIKICAgIGR1cG4gNAogICAgZnJhbWVfZGlnIC0zCiAgICBpdG9iCiAgICBieXRlIDB4NjcKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZ2FtZXMgZW50cnkgZXhpc3RzCiAgICBleHRyYWN0IDAgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ0b2kKICAgIGR1cAogICAgaW50IDI4MTQ3NDk3NjcxMDY1NgogICAgJgogICAgIQogICAgYXNzZXJ0CiAgICBmcmFtZV9kaWcgLTIKICAgIGludCAzCiAgICA8CiAgICBieiBtb3ZlX2Jvb2xfZmFsc2VAMwogICAgZnJhbWVfZGlnIC0xCiAgICBpbnQgMwogICAgPAogICAgYnogbW92ZV9ib29sX2ZhbHNlQDMKICAgIGludCAxCiAgICBiIG1vdmVfYm9vbF9tZXJnZUA0Cgptb3ZlX2Jvb2xfZmFsc2VAMzoKICAgIGludCAwCgptb3ZlX2Jvb2xfbWVyZ2VANDoKICAgIGFzc2VydAogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgY29vcmRfdG9fbWF0cml4X2luZGV4CiAgICBpbnQgMQogICAgc3dhcAogICAgc2hsCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMwogICAgZnJhbWVfZGlnIDkKICAgIGR1cAogICAgaW50IDE2CiAgICBzaHIKICAgIHwKICAgICYKICAgICEKICAgIGFzc2VydAogICAgdHhuIFNlbmRlcgogICAgZnJhbWVfZGlnIDgKICAgIGV4dHJhY3QgOCAzMiAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGR1cAogICAgZnJhbWVfYnVyeSAwCiAgICA9PQogICAgYm56IG1vdmVfYm9vbF90cnVlQDYKICAgIHR4biBTZW5kZXIKICAgIGZyYW1lX2RpZyA4CiAgICBleHRyYWN0IDQwIDMyIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgPT0KICAgIGJ6IG1vdmVfYm9vbF9mYWxzZUA3Cgptb3ZlX2Jvb2xfdHJ1ZUA2OgogICAgaW50IDEKICAgIGIgbW92ZV9ib29sX21lcmdlQDgKCm1vdmVfYm9vbF9mYWxzZUA3OgogICAgaW50IDAKCm1vdmVfYm9vbF9tZXJnZUA4OgogICAgYXNzZXJ0CiAgICB0eG4gU2VuZGVyCiAgICBmcmFtZV9kaWcgMAogICAgPT0KICAgIGR1cAogICAgZnJhbWVfYnVyeSA0CiAgICBmcmFtZV9kaWcgOQogICAgaW50IDMyCiAgICBzaHIKICAgIGludCAyNTUKICAgICYKICAgIGZyYW1lX2J1cnkgNgogICAgYnogbW92ZV9lbHNlX2JvZHlAMTAKICAgIGZyYW1lX2RpZyA2CiAgICBpbnQgMgogICAgJQogICAgIQogICAgYXNzZXJ0CiAgICBmcmFtZV9kaWcgOQogICAgZnJhbWVfZGlnIDMKICAgIHwKICAgIGR1cAogICAgZnJhbWVfYnVyeSA5CiAgICBpbnQgNTExCiAgICAmCiAgICBiIG1vdmVfYWZ0ZXJfaWZfZWxzZUAxMQoKbW92ZV9lbHNlX2JvZHlAMTA6CiAgICBmcmFtZV9kaWcgNgogICAgaW50IDIKICAgICUKICAgIGludCAxCiAgICA9PQogICAgYXNzZXJ0CiAgICBmcmFtZV9kaWcgMwogICAgaW50IDE2CiAgICBzaGwKICAgIGZyYW1lX2RpZyA5CiAgICB8CiAgICBkdXAKICAgIGZyYW1lX2J1cnkgOQogICAgaW50IDE2CiAgICBzaHIKICAgIGludCA1MTEKICAgICYKCm1vdmVfYWZ0ZXJfaWZfZWxzZUAxMToKICAgIGZyYW1lX2RpZyA5CiAgICBpbnQgNDI5NDk2NzI5NgogICAgKwogICAgZnJhbWVfYnVyeSA5CiAgICBjYWxsc3ViIGhhc19saW5lCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgNQogICAgYm56IG1vdmVfaWZfYm9keUAxMwogICAgZnJhbWVfZGlnIDYKICAgIGludCAxCiAgICArCiAgICBpbnQgOQogICAgPT0KICAgIGZyYW1lX2RpZyA5CiAgICBmcmFtZV9idXJ5IDIKICAgIGJ6IG1vdmVfYWZ0ZXJfaWZfZWxzZUAxOQoKbW92ZV9pZl9ib2R5QDEzOgogICAgZnJhbWVfZGlnIDkKICAgIGludCAyODE0NzQ5NzY3MTA2NTYKICAgIHwKICAgIGZyYW1lX2J1cnkgOQogICAgZnJhbWVfZGlnIDAKICAgIGR1cAogICAgaW50IDAKICAgIGJ5dGUgImdhbWVzX3BsYXllZCIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmdhbWVzX3BsYXllZCBleGlzdHMgZm9yIGFjY291bnQKICAgIGludCAxCiAgICArCiAgICBieXRlICJnYW1lc19wbGF5ZWQiCiAgICBzd2FwCiAgICBhcHBfbG9jYWxfcHV0CiAgICBmcmFtZV9kaWcgOAogICAgZXh0cmFjdCA0MCAzMiAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGR1cAogICAgZnJhbWVfYnVyeSAxCiAgICBkdXAKICAgIGludCAwCiAgICBieXRlICJnYW1lc19wbGF5ZWQiCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5nYW1lc19wbGF5ZWQgZXhpc3RzIGZvciBhY2NvdW50CiAgICBpbnQgMQogICAgKwogICAgYnl0ZSAiZ2FtZXNfcGxheWVkIgogICAgc3dhcAogICAgYXBwX2xvY2FsX3B1dAogICAgZnJhbWVfZGlnIDUKICAgIGJ6IG1vdmVfYWZ0ZXJfaWZfZWxzZUAxOAogICAgZnJhbWVfZGlnIDQKICAgIGJ6IG1vdmVfdGVybmFyeV9mYWxzZUAxNgogICAgZnJhbWVfZGlnIDAKICAgIGIgbW92ZV90ZXJuYXJ5X21lcmdlQDE3Cgptb3ZlX3Rlcm5hcnlfZmFsc2VAMTY6CiAgICBmcmFtZV9kaWcgMQoKbW92ZV90ZXJuYXJ5X21lcmdlQDE3OgogICAgZHVwCiAgICBpbnQgMAogICAgYnl0ZSAiZ2FtZXNfd29uIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZ2FtZXNfd29uIGV4aXN0cyBmb3IgYWNjb3VudAogICAgaW50IDEKICAgICsKICAgIGJ5dGUgImdhbWVzX3dvbiIKICAgIHN3YXAKICAgIGFwcF9sb2NhbF9wdXQKCm1vdmVfYWZ0ZXJfaWZfZWxzZUAxODoKICAgIGZyYW1lX2RpZyA5CiAgICBmcmFtZV9idXJ5IDIKCm1vdmVfYWZ0ZXJfaWZfZWxzZUAxOToKICAgIGZyYW1lX2RpZyAyCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgNwogICAgZHVwCiAgICBjb3ZlciAyCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5nYW1lcyBlbnRyeSBleGlzdHMKICAgIHN3YXAKICAgIHJlcGxhY2UyIDAKICAgIGJveF9wdXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50aWN0YWN0b2VfYml0Ym9hcmQuY29udHJhY3QuVGljVGFjVG9lQml0Ym9hcmQuY29vcmRfdG9fbWF0cml4X2luZGV4KHg6IHVpbnQ2NCwgeTogdWludDY0KSAtPiB1aW50NjQ6CmNvb3JkX3RvX21hdHJpeF9pbmRleDoKICAgIHByb3RvIDIgMQogICAgaW50IDMKICAgIGZyYW1lX2RpZyAtMQogICAgKgogICAgZnJhbWVfZGlnIC0yCiAgICArCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudGljdGFjdG9lX2JpdGJvYXJkLmNvbnRyYWN0LlRpY1RhY1RvZUJpdGJvYXJkLmhhc19saW5lKG1hcmtzOiB1aW50NjQpIC0+IHVpbnQ2NDoKaGFzX2xpbmU6CiAgICBwcm90byAxIDEKICAgIGZyYW1lX2RpZyAtMQogICAgaW50IDcKICAgICYKICAgIGludCA3CiAgICA9PQogICAgYm56IGhhc19saW5lX2Jvb2xfdHJ1ZUA4CiAgICBmcmFtZV9kaWcgLTEKICAgIGludCA1NgogICAgJgogICAgaW50IDU2CiAgICA9PQogICAgYm56IGhhc19saW5lX2Jvb2xfdHJ1ZUA4CiAgICBmcmFtZV9kaWcgLTEKICAgIGludCA0NDgKICAgICYKICAgIGludCA0NDgKICAgID09CiAgICBibnogaGFzX2xpbmVfYm9vbF90cnVlQDgKICAgIGZyYW1lX2RpZyAtMQogICAgaW50IDczCiAgICAmCiAgICBpbnQgNzMKICAgID09CiAgICBibnogaGFzX2xpbmVfYm9vbF90cnVlQDgKICAgIGZyYW1lX2RpZyAtMQogICAgaW50IDE0NgogICAgJgogICAgaW50IDE0NgogICAgPT0KICAgIGJueiBoYXNfbGluZV9ib29sX3RydWVAOAogICAgZnJhbWVfZGlnIC0xCiAgICBpbnQgMjkyCiAgICAmCiAgICBpbnQgMjkyCiAgICA9PQogICAgYm56IGhhc19saW5lX2Jvb2xfdHJ1ZUA4CiAgICBmcmFtZV9kaWcgLTEKICAgIGludCAyNzMKICAgICYKICAgIGludCAyNzMKICAgID09CiAgICBibnogaGFzX2xpbmVfYm9vbF90cnVlQDgKICAgIGZyYW1lX2RpZyAtMQogICAgaW50IDg0CiAgICAmCiAgICBpbnQgODQKICAgID09CiAgICBieiBoYXNfbGluZV9ib29sX2ZhbHNlQDkKCmhhc19saW5lX2Jvb2xfdHJ1ZUA4OgogICAgaW50IDEKICAgIGIgaGFzX2xpbmVfYm9vbF9tZXJnZUAxMAoKaGFzX2xpbmVfYm9vbF9mYWxzZUA5OgogICAgaW50IDAKCmhhc19saW5lX2Jvb2xfbWVyZ2VAMTA6CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudGljdGFjdG9lX2JpdGJvYXJkLmNvbnRyYWN0LlRpY1RhY1RvZUJpdGJvYXJkLl9faW5pdF9fKCkgLT4gdm9pZDoKX19pbml0X186CiAgICBwcm90byAwIDAKICAgIGJ5dGUgImlkX2NvdW50ZXIiCiAgICBpbnQgMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1Ygo=",
+        "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzbWFydF9jb250cmFjdHMudGljdGFjdG9lX2JpdGJvYXJkLmNvbnRyYWN0LlRpY1RhY1RvZUJpdGJvYXJkLmNsZWFyX3N0YXRlX3Byb2dyYW06CiAgICBpbnQgMQogICAgcmV0dXJuCg=="
+    },
+    "state": {
+        "global": {
+            "num_byte_slices": 0,
+            "num_uints": 1
+        },
+        "local": {
+            "num_byte_slices": 0,
+            "num_uints": 2
+        }
+    },
+    "schema": {
+        "global": {
+            "declared": {
+                "id_counter": {
+                    "type": "uint64",
+                    "key": "id_counter"
+                }
+            },
+            "reserved": {}
+        },
+        "local": {
+            "declared": {
+                "games_played": {
+                    "type": "uint64",
+                    "key": "games_played"
+                },
+                "games_won": {
+                    "type": "uint64",
+                    "key": "games_won"
+                }
+            },
+            "reserved": {}
+        }
+    },
+    "contract": {
+        "name": "TicTacToeBitboard",
+        "methods": [
+            {
+                "name": "new_game",
+                "args": [
+                    {
+                        "type": "pay",
+                        "name": "mbr"
+                    }
+                ],
+                "returns": {
+                    "type": "uint64"
+                }
+            },
+            {
+                "name": "delete_game",
+                "args": [
+                    {
+                        "type": "uint64",
+                        "name": "game_id"
+                    }
+                ],
+                "returns": {
+                    "type": "void"
+                }
+            },
+            {
+                "name": "join",
+                "args": [
+                    {
+                        "type": "uint64",
+                        "name": "game_id"
+                    }
+                ],
+                "returns": {
+                    "type": "void"
+                }
+            },
+            {
+                "name": "move",
+                "args": [
+                    {
+                        "type": "uint64",
+                        "name": "game_id"
+                    },
+                    {
+                        "type": "uint64",
+                        "name": "x"
+                    },
+                    {
+                        "type": "uint64",
+                        "name": "y"
+                    }
+                ],
+                "returns": {
+                    "type": "void"
+                }
+            }
+        ],
+        "networks": {}
+    },
+    "bare_call_config": {
+        "close_out": "CALL",
+        "no_op": "CREATE"
+    }
+}"""
+APP_SPEC = algokit_utils.ApplicationSpecification.from_json(_APP_SPEC_JSON)
+_TReturn = typing.TypeVar("_TReturn")
+
+
+class _ArgsBase(ABC, typing.Generic[_TReturn]):
+    @staticmethod
+    @abstractmethod
+    def method() -> str:
+        ...
+
+
+_TArgs = typing.TypeVar("_TArgs", bound=_ArgsBase[typing.Any])
+
+
+@dataclasses.dataclass(kw_only=True)
+class _TArgsHolder(typing.Generic[_TArgs]):
+    args: _TArgs
+
+
+def _filter_none(value: dict | typing.Any) -> dict | typing.Any:
+    if isinstance(value, dict):
+        return {k: _filter_none(v) for k, v in value.items() if v is not None}
+    return value
+
+
+def _as_dict(data: typing.Any, *, convert_all: bool = True) -> dict[str, typing.Any]:
+    if data is None:
+        return {}
+    if not dataclasses.is_dataclass(data):
+        raise TypeError(f"{data} must be a dataclass")
+    if convert_all:
+        result = dataclasses.asdict(data) # type: ignore[call-overload]
+    else:
+        result = {f.name: getattr(data, f.name) for f in dataclasses.fields(data)}
+    return _filter_none(result)
+
+
+def _convert_transaction_parameters(
+    transaction_parameters: algokit_utils.TransactionParameters | None,
+) -> algokit_utils.TransactionParametersDict:
+    return typing.cast(algokit_utils.TransactionParametersDict, _as_dict(transaction_parameters))
+
+
+def _convert_call_transaction_parameters(
+    transaction_parameters: algokit_utils.TransactionParameters | None,
+) -> algokit_utils.OnCompleteCallParametersDict:
+    return typing.cast(algokit_utils.OnCompleteCallParametersDict, _as_dict(transaction_parameters))
+
+
+def _convert_create_transaction_parameters(
+    transaction_parameters: algokit_utils.TransactionParameters | None,
+    on_complete: algokit_utils.OnCompleteActionName,
+) -> algokit_utils.CreateCallParametersDict:
+    result = typing.cast(algokit_utils.CreateCallParametersDict, _as_dict(transaction_parameters))
+    on_complete_enum = on_complete.replace("_", " ").title().replace(" ", "") + "OC"
+    result["on_complete"] = getattr(algosdk.transaction.OnComplete, on_complete_enum)
+    return result
+
+
+def _convert_deploy_args(
+    deploy_args: algokit_utils.DeployCallArgs | None,
+) -> algokit_utils.ABICreateCallArgsDict | None:
+    if deploy_args is None:
+        return None
+
+    deploy_args_dict = typing.cast(algokit_utils.ABICreateCallArgsDict, _as_dict(deploy_args))
+    if isinstance(deploy_args, _TArgsHolder):
+        deploy_args_dict["args"] = _as_dict(deploy_args.args)
+        deploy_args_dict["method"] = deploy_args.args.method()
+
+    return deploy_args_dict
+
+
+@dataclasses.dataclass(kw_only=True)
+class NewGameArgs(_ArgsBase[int]):
+    mbr: TransactionWithSigner
+
+    @staticmethod
+    def method() -> str:
+        return "new_game(pay)uint64"
+
+
+@dataclasses.dataclass(kw_only=True)
+class DeleteGameArgs(_ArgsBase[None]):
+    game_id: int
+
+    @staticmethod
+    def method() -> str:
+        return "delete_game(uint64)void"
+
+
+@dataclasses.dataclass(kw_only=True)
+class JoinArgs(_ArgsBase[None]):
+    game_id: int
+
+    @staticmethod
+    def method() -> str:
+        return "join(uint64)void"
+
+
+@dataclasses.dataclass(kw_only=True)
+class MoveArgs(_ArgsBase[None]):
+    game_id: int
+    x: int
+    y: int
+
+    @staticmethod
+    def method() -> str:
+        return "move(uint64,uint64,uint64)void"
+
+
+class GlobalState:
+    def __init__(self, data: dict[bytes, bytes | int]):
+        self.id_counter = typing.cast(int, data.get(b"id_counter"))
+
+
+class LocalState:
+    def __init__(self, data: dict[bytes, bytes | int]):
+        self.games_played = typing.cast(int, data.get(b"games_played"))
+        self.games_won = typing.cast(int, data.get(b"games_won"))
+
+
+@dataclasses.dataclass(kw_only=True)
+class SimulateOptions:
+    allow_more_logs: bool = dataclasses.field(default=False)
+    allow_empty_signatures: bool = dataclasses.field(default=False)
+    extra_opcode_budget: int = dataclasses.field(default=0)
+    exec_trace_config: models.SimulateTraceConfig | None         = dataclasses.field(default=None)
+
+
+class Composer:
+
+    def __init__(self, app_client: algokit_utils.ApplicationClient, atc: AtomicTransactionComposer):
+        self.app_client = app_client
+        self.atc = atc
+
+    def build(self) -> AtomicTransactionComposer:
+        return self.atc
+
+    def simulate(self, options: SimulateOptions | None = None) -> SimulateAtomicTransactionResponse:
+        request = models.SimulateRequest(
+            allow_more_logs=options.allow_more_logs,
+            allow_empty_signatures=options.allow_empty_signatures,
+            extra_opcode_budget=options.extra_opcode_budget,
+            exec_trace_config=options.exec_trace_config,
+            txn_groups=[]
+        ) if options else None
+        result = self.atc.simulate(self.app_client.algod_client, request)
+        return result
+
+    def execute(self) -> AtomicTransactionResponse:
+        return self.app_client.execute_atc(self.atc)
+
+    def new_game(
+        self,
+        *,
+        mbr: TransactionWithSigner,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `new_game(pay)uint64` ABI method
+        
+        :param TransactionWithSigner mbr: The `mbr` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = NewGameArgs(
+            mbr=mbr,
+        )
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def delete_game(
+        self,
+        *,
+        game_id: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `delete_game(uint64)void` ABI method
+        
+        :param int game_id: The `game_id` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = DeleteGameArgs(
+            game_id=game_id,
+        )
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def join(
+        self,
+        *,
+        game_id: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `join(uint64)void` ABI method
+        
+        :param int game_id: The `game_id` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = JoinArgs(
+            game_id=game_id,
+        )
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def move(
+        self,
+        *,
+        game_id: int,
+        x: int,
+        y: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `move(uint64,uint64,uint64)void` ABI method
+        
+        :param int game_id: The `game_id` ABI parameter
+        :param int x: The `x` ABI parameter
+        :param int y: The `y` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = MoveArgs(
+            game_id=game_id,
+            x=x,
+            y=y,
+        )
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def create_bare(
+        self,
+        *,
+        on_complete: typing.Literal["no_op"] = "no_op",
+        transaction_parameters: algokit_utils.CreateTransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to create an application using the no_op bare method
+        
+        :param typing.Literal[no_op] on_complete: On completion type to use
+        :param algokit_utils.CreateTransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        self.app_client.compose_create(
+            self.atc,
+            call_abi_method=False,
+            transaction_parameters=_convert_create_transaction_parameters(transaction_parameters, on_complete),
+        )
+        return self
+
+    def opt_in_new_game(
+        self,
+        *,
+        mbr: TransactionWithSigner,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `new_game(pay)uint64` ABI method
+        
+        :param TransactionWithSigner mbr: The `mbr` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = NewGameArgs(
+            mbr=mbr,
+        )
+        self.app_client.compose_opt_in(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def opt_in_join(
+        self,
+        *,
+        game_id: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `join(uint64)void` ABI method
+        
+        :param int game_id: The `game_id` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = JoinArgs(
+            game_id=game_id,
+        )
+        self.app_client.compose_opt_in(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def close_out_bare(
+        self,
+        *,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a calls to the close_out bare method
+        
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        self.app_client.compose_close_out(
+            self.atc,
+            call_abi_method=False,
+            transaction_parameters=_convert_transaction_parameters(transaction_parameters),
+        )
+        return self
+
+    def clear_state(
+        self,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+        app_args: list[bytes] | None = None,
+    ) -> "Composer":
+        """Adds a call to the application with on completion set to ClearState
+    
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :param list[bytes] | None app_args: (optional) Application args to pass"""
+    
+        self.app_client.compose_clear_state(self.atc, _convert_transaction_parameters(transaction_parameters), app_args)
+        return self
+
+
+class TicTacToeBitboardClient:
+    """A class for interacting with the TicTacToeBitboard app providing high productivity and
+    strongly typed methods to deploy and call the app"""
+
+    @typing.overload
+    def __init__(
+        self,
+        algod_client: algosdk.v2client.algod.AlgodClient,
+        *,
+        app_id: int = 0,
+        signer: TransactionSigner | algokit_utils.Account | None = None,
+        sender: str | None = None,
+        suggested_params: algosdk.transaction.SuggestedParams | None = None,
+        template_values: algokit_utils.TemplateValueMapping | None = None,
+        app_name: str | None = None,
+    ) -> None:
+        ...
+
+    @typing.overload
+    def __init__(
+        self,
+        algod_client: algosdk.v2client.algod.AlgodClient,
+        *,
+        creator: str | algokit_utils.Account,
+        indexer_client: algosdk.v2client.indexer.IndexerClient | None = None,
+        existing_deployments: algokit_utils.AppLookup | None = None,
+        signer: TransactionSigner | algokit_utils.Account | None = None,
+        sender: str | None = None,
+        suggested_params: algosdk.transaction.SuggestedParams | None = None,
+        template_values: algokit_utils.TemplateValueMapping | None = None,
+        app_name: str | None = None,
+    ) -> None:
+        ...
+
+    def __init__(
+        self,
+        algod_client: algosdk.v2client.algod.AlgodClient,
+        *,
+        creator: str | algokit_utils.Account | None = None,
+        indexer_client: algosdk.v2client.indexer.IndexerClient | None = None,
+        existing_deployments: algokit_utils.AppLookup | None = None,
+        app_id: int = 0,
+        signer: TransactionSigner | algokit_utils.Account | None = None,
+        sender: str | None = None,
+        suggested_params: algosdk.transaction.SuggestedParams | None = None,
+        template_values: algokit_utils.TemplateValueMapping | None = None,
+        app_name: str | None = None,
+    ) -> None:
+        """
+        TicTacToeBitboardClient can be created with an app_id to interact with an existing application, alternatively
+        it can be created with a creator and indexer_client specified to find existing applications by name and creator.
+        
+        :param AlgodClient algod_client: AlgoSDK algod client
+        :param int app_id: The app_id of an existing application, to instead find the application by creator and name
+        use the creator and indexer_client parameters
+        :param str | Account creator: The address or Account of the app creator to resolve the app_id
+        :param IndexerClient indexer_client: AlgoSDK indexer client, only required if deploying or finding app_id by
+        creator and app name
+        :param AppLookup existing_deployments:
+        :param TransactionSigner | Account signer: Account or signer to use to sign transactions, if not specified and
+        creator was passed as an Account will use that.
+        :param str sender: Address to use as the sender for all transactions, will use the address associated with the
+        signer if not specified.
+        :param TemplateValueMapping template_values: Values to use for TMPL_* template variables, dictionary keys should
+        *NOT* include the TMPL_ prefix
+        :param str | None app_name: Name of application to use when deploying, defaults to name defined on the
+        Application Specification
+            """
+
+        self.app_spec = APP_SPEC
+        
+        # calling full __init__ signature, so ignoring mypy warning about overloads
+        self.app_client = algokit_utils.ApplicationClient(  # type: ignore[call-overload, misc]
+            algod_client=algod_client,
+            app_spec=self.app_spec,
+            app_id=app_id,
+            creator=creator,
+            indexer_client=indexer_client,
+            existing_deployments=existing_deployments,
+            signer=signer,
+            sender=sender,
+            suggested_params=suggested_params,
+            template_values=template_values,
+            app_name=app_name,
+        )
+
+    @property
+    def algod_client(self) -> algosdk.v2client.algod.AlgodClient:
+        return self.app_client.algod_client
+
+    @property
+    def app_id(self) -> int:
+        return self.app_client.app_id
+
+    @app_id.setter
+    def app_id(self, value: int) -> None:
+        self.app_client.app_id = value
+
+    @property
+    def app_address(self) -> str:
+        return self.app_client.app_address
+
+    @property
+    def sender(self) -> str | None:
+        return self.app_client.sender
+
+    @sender.setter
+    def sender(self, value: str) -> None:
+        self.app_client.sender = value
+
+    @property
+    def signer(self) -> TransactionSigner | None:
+        return self.app_client.signer
+
+    @signer.setter
+    def signer(self, value: TransactionSigner) -> None:
+        self.app_client.signer = value
+
+    @property
+    def suggested_params(self) -> algosdk.transaction.SuggestedParams | None:
+        return self.app_client.suggested_params
+
+    @suggested_params.setter
+    def suggested_params(self, value: algosdk.transaction.SuggestedParams | None) -> None:
+        self.app_client.suggested_params = value
+
+    def get_global_state(self) -> GlobalState:
+        """Returns the application's global state wrapped in a strongly typed class with options to format the stored value"""
+
+        state = typing.cast(dict[bytes, bytes | int], self.app_client.get_global_state(raw=True))
+        return GlobalState(state)
+
+    def get_local_state(self, account: str | None = None) -> LocalState:
+        """Returns the application's local state wrapped in a strongly typed class with options to format the stored value"""
+
+        state = typing.cast(dict[bytes, bytes | int], self.app_client.get_local_state(account, raw=True))
+        return LocalState(state)
+
+    def new_game(
+        self,
+        *,
+        mbr: TransactionWithSigner,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[int]:
+        """Calls `new_game(pay)uint64` ABI method
+        
+        :param TransactionWithSigner mbr: The `mbr` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[int]: The result of the transaction"""
+
+        args = NewGameArgs(
+            mbr=mbr,
+        )
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
+    def delete_game(
+        self,
+        *,
+        game_id: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        """Calls `delete_game(uint64)void` ABI method
+        
+        :param int game_id: The `game_id` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[None]: The result of the transaction"""
+
+        args = DeleteGameArgs(
+            game_id=game_id,
+        )
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
+    def join(
+        self,
+        *,
+        game_id: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        """Calls `join(uint64)void` ABI method
+        
+        :param int game_id: The `game_id` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[None]: The result of the transaction"""
+
+        args = JoinArgs(
+            game_id=game_id,
+        )
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
+    def move(
+        self,
+        *,
+        game_id: int,
+        x: int,
+        y: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        """Calls `move(uint64,uint64,uint64)void` ABI method
+        
+        :param int game_id: The `game_id` ABI parameter
+        :param int x: The `x` ABI parameter
+        :param int y: The `y` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[None]: The result of the transaction"""
+
+        args = MoveArgs(
+            game_id=game_id,
+            x=x,
+            y=y,
+        )
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
+    def create_bare(
+        self,
+        *,
+        on_complete: typing.Literal["no_op"] = "no_op",
+        transaction_parameters: algokit_utils.CreateTransactionParameters | None = None,
+    ) -> algokit_utils.TransactionResponse:
+        """Creates an application using the no_op bare method
+        
+        :param typing.Literal[no_op] on_complete: On completion type to use
+        :param algokit_utils.CreateTransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.TransactionResponse: The result of the transaction"""
+
+        result = self.app_client.create(
+            call_abi_method=False,
+            transaction_parameters=_convert_create_transaction_parameters(transaction_parameters, on_complete),
+        )
+        return result
+
+    def opt_in_new_game(
+        self,
+        *,
+        mbr: TransactionWithSigner,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[int]:
+        """Calls `new_game(pay)uint64` ABI method
+        
+        :param TransactionWithSigner mbr: The `mbr` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[int]: The result of the transaction"""
+
+        args = NewGameArgs(
+            mbr=mbr,
+        )
+        result = self.app_client.opt_in(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
+    def opt_in_join(
+        self,
+        *,
+        game_id: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        """Calls `join(uint64)void` ABI method
+        
+        :param int game_id: The `game_id` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[None]: The result of the transaction"""
+
+        args = JoinArgs(
+            game_id=game_id,
+        )
+        result = self.app_client.opt_in(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
+    def close_out_bare(
+        self,
+        *,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.TransactionResponse:
+        """Calls the close_out bare method
+        
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.TransactionResponse: The result of the transaction"""
+
+        result = self.app_client.close_out(
+            call_abi_method=False,
+            transaction_parameters=_convert_transaction_parameters(transaction_parameters),
+        )
+        return result
+
+    def clear_state(
+        self,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+        app_args: list[bytes] | None = None,
+    ) -> algokit_utils.TransactionResponse:
+        """Calls the application with on completion set to ClearState
+    
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :param list[bytes] | None app_args: (optional) Application args to pass
+        :returns algokit_utils.TransactionResponse: The result of the transaction"""
+    
+        return self.app_client.clear_state(_convert_transaction_parameters(transaction_parameters), app_args)
+
+    def deploy(
+        self,
+        version: str | None = None,
+        *,
+        signer: TransactionSigner | None = None,
+        sender: str | None = None,
+        allow_update: bool | None = None,
+        allow_delete: bool | None = None,
+        on_update: algokit_utils.OnUpdate = algokit_utils.OnUpdate.Fail,
+        on_schema_break: algokit_utils.OnSchemaBreak = algokit_utils.OnSchemaBreak.Fail,
+        template_values: algokit_utils.TemplateValueMapping | None = None,
+        create_args: algokit_utils.DeployCallArgs | None = None,
+        update_args: algokit_utils.DeployCallArgs | None = None,
+        delete_args: algokit_utils.DeployCallArgs | None = None,
+    ) -> algokit_utils.DeployResponse:
+        """Deploy an application and update client to reference it.
+        
+        Idempotently deploy (create, update/delete if changed) an app against the given name via the given creator
+        account, including deploy-time template placeholder substitutions.
+        To understand the architecture decisions behind this functionality please see
+        <https://github.com/algorandfoundation/algokit-cli/blob/main/docs/architecture-decisions/2023-01-12_smart-contract-deployment.md>
+        
+        ```{note}
+        If there is a breaking state schema change to an existing app (and `on_schema_break` is set to
+        'ReplaceApp' the existing app will be deleted and re-created.
+        ```
+        
+        ```{note}
+        If there is an update (different TEAL code) to an existing app (and `on_update` is set to 'ReplaceApp')
+        the existing app will be deleted and re-created.
+        ```
+        
+        :param str version: version to use when creating or updating app, if None version will be auto incremented
+        :param algosdk.atomic_transaction_composer.TransactionSigner signer: signer to use when deploying app
+        , if None uses self.signer
+        :param str sender: sender address to use when deploying app, if None uses self.sender
+        :param bool allow_delete: Used to set the `TMPL_DELETABLE` template variable to conditionally control if an app
+        can be deleted
+        :param bool allow_update: Used to set the `TMPL_UPDATABLE` template variable to conditionally control if an app
+        can be updated
+        :param OnUpdate on_update: Determines what action to take if an application update is required
+        :param OnSchemaBreak on_schema_break: Determines what action to take if an application schema requirements
+        has increased beyond the current allocation
+        :param dict[str, int|str|bytes] template_values: Values to use for `TMPL_*` template variables, dictionary keys
+        should *NOT* include the TMPL_ prefix
+        :param algokit_utils.DeployCallArgs | None create_args: Arguments used when creating an application
+        :param algokit_utils.DeployCallArgs | None update_args: Arguments used when updating an application
+        :param algokit_utils.DeployCallArgs | None delete_args: Arguments used when deleting an application
+        :return DeployResponse: details action taken and relevant transactions
+        :raises DeploymentError: If the deployment failed"""
+
+        return self.app_client.deploy(
+            version,
+            signer=signer,
+            sender=sender,
+            allow_update=allow_update,
+            allow_delete=allow_delete,
+            on_update=on_update,
+            on_schema_break=on_schema_break,
+            template_values=template_values,
+            create_args=_convert_deploy_args(create_args),
+            update_args=_convert_deploy_args(update_args),
+            delete_args=_convert_deploy_args(delete_args),
+        )
+
+    def compose(self, atc: AtomicTransactionComposer | None = None) -> Composer:
+        return Composer(self.app_client, atc or AtomicTransactionComposer())
@@ -0,0 +1,850 @@
+# flake8: noqa
+# fmt: off
+# mypy: disable-error-code="no-any-return, no-untyped-call, misc, type-arg"
+# This file was automatically generated by algokit-client-generator.
+# DO NOT MODIFY IT BY HAND.
+# requires: algokit-utils@^1.2.0
+import base64
+import dataclasses
+import decimal
+import typing
+from abc import ABC, abstractmethod
+
+import algokit_utils
+import algosdk
+from algosdk.v2client import models
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    AtomicTransactionResponse,
+    SimulateAtomicTransactionResponse,
+    TransactionSigner,
+    TransactionWithSigner
+)
+
+_APP_SPEC_JSON = r"""{
+    "hints": {
+        "new_game(pay)uint64": {
+            "call_config": {
+                "no_op": "CALL"
+            }
+        },
+        "delete_game(uint64)void": {
+            "call_config": {
+                "no_op": "CALL"
+            }
+        },
+        "join(uint64,pay)void": {
+            "call_config": {
+                "no_op": "CALL"
+            }
+        },
+        "move(uint64,uint64,uint64)void": {
+            "call_config": {
+                "no_op": "CALL"
+            }
+        },
+        "get_stats(address)(uint64,uint64)": {
+            "read_only": true,
+            "structs": {
+                "output": {
+                    "name": "PlayerStats",
+                    "elements": [
+                        [
+                            "games_played",
+                            "uint64"
+                        ],
+                        [
+                            "games_won",
+                            "uint64"
+                        ]
+                    ]
+                }
+            },
+            "call_config": {
+                "no_op": "CALL"
+            }
+        }
+    },
+    "source": {
+        "approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzbWFydF9jb250cmFjdHMudGljdGFjdG9lX3N0YXRzLmNvbnRyYWN0LlRpY1RhY1RvZVN0YXRzLmFwcHJvdmFsX3Byb2dyYW06CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYm56IG1haW5fZW50cnlwb2ludEAyCiAgICBjYWxsc3ViIF9faW5pdF9fCgptYWluX2VudHJ5cG9pbnRAMjoKICAgIHR4biBOdW1BcHBBcmdzCiAgICBieiBtYWluX2JhcmVfcm91dGluZ0AxMQogICAgbWV0aG9kICJuZXdfZ2FtZShwYXkpdWludDY0IgogICAgbWV0aG9kICJkZWxldGVfZ2FtZSh1aW50NjQpdm9pZCIKICAgIG1ldGhvZCAiam9pbih1aW50NjQscGF5KXZvaWQiCiAgICBtZXRob2QgIm1vdmUodWludDY0LHVpbnQ2NCx1aW50NjQpdm9pZCIKICAgIG1ldGhvZCAiZ2V0X3N0YXRzKGFkZHJlc3MpKHVpbnQ2NCx1aW50NjQpIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggbWFpbl9uZXdfZ2FtZV9yb3V0ZUA0IG1haW5fZGVsZXRlX2dhbWVfcm91dGVANSBtYWluX2pvaW5fcm91dGVANiBtYWluX21vdmVfcm91dGVANyBtYWluX2dldF9zdGF0c19yb3V0ZUA4CiAgICBlcnIgLy8gcmVqZWN0IHRyYW5zYWN0aW9uCgptYWluX25ld19nYW1lX3JvdXRlQDQ6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50IDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludCBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIGNhbGxzdWIgbmV3X2dhbWUKICAgIGl0b2IKICAgIGJ5dGUgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fZGVsZXRlX2dhbWVfcm91dGVANToKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIGNhbGxzdWIgZGVsZXRlX2dhbWUKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fam9pbl9yb3V0ZUA2OgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludCAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnQgcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICBjYWxsc3ViIGpvaW4KICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fbW92ZV9yb3V0ZUA3OgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgYnRvaQogICAgY2FsbHN1YiBtb3ZlCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX2dldF9zdGF0c19yb3V0ZUA4OgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgY2FsbHN1YiBnZXRfc3RhdHMKICAgIGJ5dGUgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fYmFyZV9yb3V0aW5nQDExOgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIHJlamVjdCB0cmFuc2FjdGlvbgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgICEKICAgIGFzc2VydCAvLyBpcyBjcmVhdGluZwogICAgaW50IDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50aWN0YWN0b2Vfc3RhdHMuY29udHJhY3QuVGljVGFjVG9lU3RhdHMubmV3X2dhbWUobWJyOiB1aW50NjQpIC0+IHVpbnQ2NDoKbmV3X2dhbWU6CiAgICBwcm90byAxIDEKICAgIGludCAwCiAgICBieXRlICJpZF9jb3VudGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmlkX2NvdW50ZXIgZXhpc3RzCiAgICBpbnQgMQogICAgKwogICAgYnl0ZSAiaWRfY291bnRlciIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIGFzc2VydAogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0TWluQmFsYW5jZQogICAgYXNzZXJ0CiAgICBpbnQgOQogICAgYnplcm8KICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJ5dGUgMHgwMAogICAgY29uY2F0CiAgICBieXRlIDB4MDAKICAgIGNvbmNhdAogICAgaW50IDAKICAgIGJ5dGUgImlkX2NvdW50ZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuaWRfY291bnRlciBleGlzdHMKICAgIGl0b2IKICAgIGJ5dGUgImdhbWVzIgogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICBib3hfcHV0CiAgICB0eG4gU2VuZGVyCiAgICBjYWxsc3ViIGVuc3VyZV9zdGF0cwogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0TWluQmFsYW5jZQogICAgYXNzZXJ0CiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIEFtb3VudAogICAgc3dhcAogICAgdW5jb3ZlciAyCiAgICAtCiAgICA9PQogICAgYXNzZXJ0CiAgICBpbnQgMAogICAgYnl0ZSAiaWRfY291bnRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5pZF9jb3VudGVyIGV4aXN0cwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnRpY3RhY3RvZV9zdGF0cy5jb250cmFjdC5UaWNUYWNUb2VTdGF0cy5lbnN1cmVfc3RhdHMocGxheWVyOiBieXRlcykgLT4gdm9pZDoKZW5zdXJlX3N0YXRzOgogICAgcHJvdG8gMSAwCiAgICBieXRlIDB4NzMKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYm56IGVuc3VyZV9zdGF0c19hZnRlcl9pZl9lbHNlQDIKICAgIGZyYW1lX2RpZyAwCiAgICBieXRlIDB4MDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAKICAgIGJveF9wdXQKCmVuc3VyZV9zdGF0c19hZnRlcl9pZl9lbHNlQDI6CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudGljdGFjdG9lX3N0YXRzLmNvbnRyYWN0LlRpY1RhY1RvZVN0YXRzLmRlbGV0ZV9nYW1lKGdhbWVfaWQ6IHVpbnQ2NCkgLT4gdm9pZDoKZGVsZXRlX2dhbWU6CiAgICBwcm90byAxIDAKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgYnl0ZSAiZ2FtZXMiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2dldAogICAgc3dhcAogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmdhbWVzIGVudHJ5IGV4aXN0cwogICAgZXh0cmFjdCA0MSAzMiAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgPT0KICAgIGJueiBkZWxldGVfZ2FtZV9ib29sX3RydWVAMgogICAgZnJhbWVfZGlnIDEKICAgIGludCA1ODQKICAgIGdldGJpdAogICAgYnl0ZSAweDAwCiAgICBpbnQgMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIGludCAwCiAgICBnZXRiaXQKICAgIGJ6IGRlbGV0ZV9nYW1lX2Jvb2xfZmFsc2VAMwoKZGVsZXRlX2dhbWVfYm9vbF90cnVlQDI6CiAgICBpbnQgMQogICAgYiBkZWxldGVfZ2FtZV9ib29sX21lcmdlQDQKCmRlbGV0ZV9nYW1lX2Jvb2xfZmFsc2VAMzoKICAgIGludCAwCgpkZWxldGVfZ2FtZV9ib29sX21lcmdlQDQ6CiAgICBhc3NlcnQKICAgIHR4biBTZW5kZXIKICAgIGZyYW1lX2RpZyAwCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmdhbWVzIGVudHJ5IGV4aXN0cwogICAgZXh0cmFjdCA5IDMyIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgPT0KICAgIGFzc2VydAogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0TWluQmFsYW5jZQogICAgYXNzZXJ0CiAgICBzd2FwCiAgICBib3hfZGVsCiAgICBwb3AKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIGFzc2VydAogICAgaXR4bl9iZWdpbgogICAgZnJhbWVfZGlnIDEKICAgIGV4dHJhY3QgOSAzMiAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGNvdmVyIDIKICAgIC0KICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICBpbnQgcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnQgMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudGljdGFjdG9lX3N0YXRzLmNvbnRyYWN0LlRpY1RhY1RvZVN0YXRzLmpvaW4oZ2FtZV9pZDogdWludDY0LCBtYnI6IHVpbnQ2NCkgLT4gdm9pZDoKam9pbjoKICAgIHByb3RvIDIgMAogICAgZnJhbWVfZGlnIC0yCiAgICBpdG9iCiAgICBieXRlICJnYW1lcyIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5nYW1lcyBlbnRyeSBleGlzdHMKICAgIGV4dHJhY3QgOSAzMiAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIHR4biBTZW5kZXIKICAgICE9CiAgICBhc3NlcnQKICAgIGR1cAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZ2FtZXMgZW50cnkgZXhpc3RzCiAgICBleHRyYWN0IDQxIDMyIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0CiAgICBkdXAKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmdhbWVzIGVudHJ5IGV4aXN0cwogICAgdHhuIFNlbmRlcgogICAgcmVwbGFjZTIgNDEKICAgIGJveF9wdXQKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0CiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RNaW5CYWxhbmNlCiAgICBhc3NlcnQKICAgIHR4biBTZW5kZXIKICAgIGNhbGxzdWIgZW5zdXJlX3N0YXRzCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RNaW5CYWxhbmNlCiAgICBhc3NlcnQKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgQW1vdW50CiAgICBzd2FwCiAgICB1bmNvdmVyIDIKICAgIC0KICAgID09CiAgICBhc3NlcnQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50aWN0YWN0b2Vfc3RhdHMuY29udHJhY3QuVGljVGFjVG9lU3RhdHMubW92ZShnYW1lX2lkOiB1aW50NjQsIHg6IHVpbnQ2NCwgeTogdWludDY0KSAtPiB2b2lkOgptb3ZlOgogICAgcHJvdG8gMyAwCiAgICBpbnQgMAogICAgYnl0ZSAiIgogICAgZHVwCiAgICBmcmFtZV9kaWcgLTMKICAgIGl0b2IKICAgIGJ5dGUgImdhbWVzIgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5nYW1lcyBlbnRyeSBleGlzdHMKICAgIGR1cAogICAgaW50IDU4NAogICAgZ2V0Yml0CiAgICBieXRlIDB4MDAKICAgIGludCAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgaW50IDAKICAgIGdldGJpdAogICAgIQogICAgYXNzZXJ0CiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBjb29yZF90b19tYXRyaXhfaW5kZXgKICAgIGRpZyAxCiAgICBleHRyYWN0IDAgOSAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIHN3YXAKICAgIGludCAxCiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ5dGUgMHgwMAogICAgYj09CiAgICBhc3NlcnQKICAgIHR4biBTZW5kZXIKICAgIHN3YXAKICAgIGV4dHJhY3QgOSAzMiAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGR1cAogICAgY292ZXIgMgogICAgPT0KICAgIGJueiBtb3ZlX2Jvb2xfdHJ1ZUAyCiAgICB0eG4gU2VuZGVyCiAgICBmcmFtZV9kaWcgNAogICAgZXh0cmFjdCA0MSAzMiAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgID09CiAgICBieiBtb3ZlX2Jvb2xfZmFsc2VAMwoKbW92ZV9ib29sX3RydWVAMjoKICAgIGludCAxCiAgICBiIG1vdmVfYm9vbF9tZXJnZUA0Cgptb3ZlX2Jvb2xfZmFsc2VAMzoKICAgIGludCAwCgptb3ZlX2Jvb2xfbWVyZ2VANDoKICAgIGFzc2VydAogICAgdHhuIFNlbmRlcgogICAgZnJhbWVfZGlnIDUKICAgID09CiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMgogICAgYnogbW92ZV9lbHNlX2JvZHlANgogICAgZnJhbWVfZGlnIDQKICAgIGV4dHJhY3QgNzQgMSAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ0b2kKICAgIGludCAyCiAgICAlCiAgICAhCiAgICBhc3NlcnQKICAgIGZyYW1lX2RpZyAzCiAgICBkdXAKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmdhbWVzIGVudHJ5IGV4aXN0cwogICAgZXh0cmFjdCAwIDkgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBjb29yZF90b19tYXRyaXhfaW5kZXgKICAgIGR1cAogICAgaW50IDkKICAgIDwKICAgIGFzc2VydCAvLyBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnl0ZSAweDAxCiAgICByZXBsYWNlMwogICAgZGlnIDEKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmdhbWVzIGVudHJ5IGV4aXN0cwogICAgc3dhcAogICAgcmVwbGFjZTIgMAogICAgYm94X3B1dAogICAgYiBtb3ZlX2FmdGVyX2lmX2Vsc2VANwoKbW92ZV9lbHNlX2JvZHlANjoKICAgIGZyYW1lX2RpZyA0CiAgICBleHRyYWN0IDc0IDEgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICBpbnQgMgogICAgJQogICAgaW50IDEKICAgID09CiAgICBhc3NlcnQKICAgIGZyYW1lX2RpZyAzCiAgICBkdXAKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmdhbWVzIGVudHJ5IGV4aXN0cwogICAgZXh0cmFjdCAwIDkgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBjb29yZF90b19tYXRyaXhfaW5kZXgKICAgIGR1cAogICAgaW50IDkKICAgIDwKICAgIGFzc2VydCAvLyBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnl0ZSAweDAyCiAgICByZXBsYWNlMwogICAgZGlnIDEKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmdhbWVzIGVudHJ5IGV4aXN0cwogICAgc3dhcAogICAgcmVwbGFjZTIgMAogICAgYm94X3B1dAoKbW92ZV9hZnRlcl9pZl9lbHNlQDc6CiAgICBmcmFtZV9kaWcgMwogICAgZHVwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5nYW1lcyBlbnRyeSBleGlzdHMKICAgIGV4dHJhY3QgNzQgMSAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ0b2kKICAgIGludCAxCiAgICArCiAgICBpdG9iCiAgICBkaWcgMQogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZ2FtZXMgZW50cnkgZXhpc3RzCiAgICBzd2FwCiAgICBleHRyYWN0IDcgMQogICAgcmVwbGFjZTIgNzQKICAgIGRpZyAxCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5nYW1lcyBlbnRyeSBleGlzdHMKICAgIGV4dHJhY3QgMCA5IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgY2FsbHN1YiBpc19nYW1lX292ZXIKICAgIHBvcAogICAgZnJhbWVfYnVyeSAxCiAgICBieiBtb3ZlX2FmdGVyX2lmX2Vsc2VAMTQKICAgIGZyYW1lX2RpZyAzCiAgICBkdXAKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmdhbWVzIGVudHJ5IGV4aXN0cwogICAgaW50IDU4NAogICAgaW50IDEKICAgIHNldGJpdAogICAgYm94X3B1dAogICAgZnJhbWVfZGlnIDUKICAgIGNhbGxzdWIgYWRkX2dhbWVfcGxheWVkCiAgICBmcmFtZV9kaWcgNAogICAgZXh0cmFjdCA0MSAzMiAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGR1cAogICAgZnJhbWVfYnVyeSAwCiAgICBjYWxsc3ViIGFkZF9nYW1lX3BsYXllZAogICAgZnJhbWVfZGlnIDEKICAgIGJueiBtb3ZlX2FmdGVyX2lmX2Vsc2VAMTQKICAgIGZyYW1lX2RpZyAyCiAgICBieiBtb3ZlX3Rlcm5hcnlfZmFsc2VAMTEKICAgIGZyYW1lX2RpZyA1CiAgICBiIG1vdmVfdGVybmFyeV9tZXJnZUAxMgoKbW92ZV90ZXJuYXJ5X2ZhbHNlQDExOgogICAgZnJhbWVfZGlnIDAKCm1vdmVfdGVybmFyeV9tZXJnZUAxMjoKICAgIGJ5dGUgMHg3MwogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnN0YXRzIGVudHJ5IGV4aXN0cwogICAgZXh0cmFjdCA4IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICBpbnQgMQogICAgKwogICAgaXRvYgogICAgZGlnIDEKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnN0YXRzIGVudHJ5IGV4aXN0cwogICAgc3dhcAogICAgcmVwbGFjZTIgOAogICAgYm94X3B1dAoKbW92ZV9hZnRlcl9pZl9lbHNlQDE0OgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnRpY3RhY3RvZV9zdGF0cy5jb250cmFjdC5UaWNUYWNUb2VTdGF0cy5jb29yZF90b19tYXRyaXhfaW5kZXgoeDogdWludDY0LCB5OiB1aW50NjQpIC0+IHVpbnQ2NDoKY29vcmRfdG9fbWF0cml4X2luZGV4OgogICAgcHJvdG8gMiAxCiAgICBpbnQgMwogICAgZnJhbWVfZGlnIC0xCiAgICAqCiAgICBmcmFtZV9kaWcgLTIKICAgICsKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50aWN0YWN0b2Vfc3RhdHMuY29udHJhY3QuVGljVGFjVG9lU3RhdHMuaXNfZ2FtZV9vdmVyKGJvYXJkOiBieXRlcykgLT4gdWludDY0LCB1aW50NjQsIGJ5dGVzOgppc19nYW1lX292ZXI6CiAgICBwcm90byAxIDMKICAgIGludCAwCiAgICBkdXBuIDE0CiAgICBieXRlICIiCiAgICBpbnQgMAoKaXNfZ2FtZV9vdmVyX2Zvcl9oZWFkZXJAMToKICAgIGZyYW1lX2RpZyAxNgogICAgaW50IDMKICAgIDwKICAgIGJ6IGlzX2dhbWVfb3Zlcl9hZnRlcl9mb3JAMTIKICAgIGludCAzCiAgICBmcmFtZV9kaWcgMTYKICAgICoKICAgIGR1cAogICAgZnJhbWVfYnVyeSAxNQogICAgZnJhbWVfZGlnIC0xCiAgICBkaWcgMQogICAgaW50IDEKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgc3dhcAogICAgaW50IDEKICAgICsKICAgIGZyYW1lX2RpZyAtMQogICAgc3dhcAogICAgaW50IDEKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZHVwCiAgICBmcmFtZV9idXJ5IDAKICAgIGI9PQogICAgYnogaXNfZ2FtZV9vdmVyX2FmdGVyX2lmX2Vsc2VANgogICAgZnJhbWVfZGlnIDE1CiAgICBpbnQgMgogICAgKwogICAgZnJhbWVfZGlnIC0xCiAgICBzd2FwCiAgICBpbnQgMQogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMQogICAgZnJhbWVfZGlnIDAKICAgIGI9PQogICAgYnogaXNfZ2FtZV9vdmVyX2FmdGVyX2lmX2Vsc2VANgogICAgZnJhbWVfZGlnIDEKICAgIGJ5dGUgMHgwMAogICAgYiE9CiAgICBieiBpc19nYW1lX292ZXJfYWZ0ZXJfaWZfZWxzZUA2CiAgICBpbnQgMQogICAgaW50IDAKICAgIGZyYW1lX2RpZyAtMQogICAgZnJhbWVfYnVyeSAyCiAgICBmcmFtZV9idXJ5IDEKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgppc19nYW1lX292ZXJfYWZ0ZXJfaWZfZWxzZUA2OgogICAgZnJhbWVfZGlnIC0xCiAgICBmcmFtZV9kaWcgMTYKICAgIGR1cAogICAgY292ZXIgMgogICAgaW50IDEKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgc3dhcAogICAgaW50IDMKICAgICsKICAgIGZyYW1lX2RpZyAtMQogICAgc3dhcAogICAgaW50IDEKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZHVwCiAgICBmcmFtZV9idXJ5IDcKICAgIGI9PQogICAgYnogaXNfZ2FtZV9vdmVyX2FmdGVyX2lmX2Vsc2VAMTAKICAgIGZyYW1lX2RpZyAxNgogICAgaW50IDYKICAgICsKICAgIGZyYW1lX2RpZyAtMQogICAgc3dhcAogICAgaW50IDEKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZHVwCiAgICBmcmFtZV9idXJ5IDgKICAgIGZyYW1lX2RpZyA3CiAgICBiPT0KICAgIGJ6IGlzX2dhbWVfb3Zlcl9hZnRlcl9pZl9lbHNlQDEwCiAgICBmcmFtZV9kaWcgOAogICAgYnl0ZSAweDAwCiAgICBiIT0KICAgIGJ6IGlzX2dhbWVfb3Zlcl9hZnRlcl9pZl9lbHNlQDEwCiAgICBpbnQgMQogICAgaW50IDAKICAgIGZyYW1lX2RpZyAtMQogICAgZnJhbWVfYnVyeSAyCiAgICBmcmFtZV9idXJ5IDEKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgppc19nYW1lX292ZXJfYWZ0ZXJfaWZfZWxzZUAxMDoKICAgIGZyYW1lX2RpZyAxNgogICAgaW50IDEKICAgICsKICAgIGZyYW1lX2J1cnkgMTYKICAgIGIgaXNfZ2FtZV9vdmVyX2Zvcl9oZWFkZXJAMQoKaXNfZ2FtZV9vdmVyX2FmdGVyX2ZvckAxMjoKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAwIDEgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMTMKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCA0IDEgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgOQogICAgYj09CiAgICBieiBpc19nYW1lX292ZXJfYWZ0ZXJfaWZfZWxzZUAxNgogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDggMSAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGR1cAogICAgZnJhbWVfYnVyeSAxMAogICAgZnJhbWVfZGlnIDkKICAgIGI9PQogICAgYnogaXNfZ2FtZV9vdmVyX2FmdGVyX2lmX2Vsc2VAMTYKICAgIGZyYW1lX2RpZyAxMAogICAgYnl0ZSAweDAwCiAgICBiIT0KICAgIGJ6IGlzX2dhbWVfb3Zlcl9hZnRlcl9pZl9lbHNlQDE2CiAgICBpbnQgMQogICAgaW50IDAKICAgIGZyYW1lX2RpZyAtMQogICAgZnJhbWVfYnVyeSAyCiAgICBmcmFtZV9idXJ5IDEKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgppc19nYW1lX292ZXJfYWZ0ZXJfaWZfZWxzZUAxNjoKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAyIDEgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMTQKICAgIGZyYW1lX2RpZyA5CiAgICBiPT0KICAgIGJ6IGlzX2dhbWVfb3Zlcl9hZnRlcl9pZl9lbHNlQDIwCiAgICBmcmFtZV9kaWcgLTEKICAgIGV4dHJhY3QgNiAxIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZHVwCiAgICBmcmFtZV9idXJ5IDExCiAgICBmcmFtZV9kaWcgOQogICAgYj09CiAgICBieiBpc19nYW1lX292ZXJfYWZ0ZXJfaWZfZWxzZUAyMAogICAgZnJhbWVfZGlnIDExCiAgICBieXRlIDB4MDAKICAgIGIhPQogICAgYnogaXNfZ2FtZV9vdmVyX2FmdGVyX2lmX2Vsc2VAMjAKICAgIGludCAxCiAgICBpbnQgMAogICAgZnJhbWVfZGlnIC0xCiAgICBmcmFtZV9idXJ5IDIKICAgIGZyYW1lX2J1cnkgMQogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCmlzX2dhbWVfb3Zlcl9hZnRlcl9pZl9lbHNlQDIwOgogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDEgMSAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGR1cAogICAgZnJhbWVfYnVyeSAxMgogICAgZnJhbWVfZGlnIDEzCiAgICBiPT0KICAgIGJ6IGlzX2dhbWVfb3Zlcl9hZnRlcl9pZl9lbHNlQDMwCiAgICBmcmFtZV9kaWcgMTIKICAgIGZyYW1lX2RpZyAxNAogICAgYj09CiAgICBieiBpc19nYW1lX292ZXJfYWZ0ZXJfaWZfZWxzZUAzMAogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDMgMSAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGR1cAogICAgZnJhbWVfYnVyeSAyCiAgICBmcmFtZV9kaWcgMTQKICAgIGI9PQogICAgYnogaXNfZ2FtZV9vdmVyX2FmdGVyX2lmX2Vsc2VAMzAKICAgIGZyYW1lX2RpZyAyCiAgICBmcmFtZV9kaWcgOQogICAgYj09CiAgICBieiBpc19nYW1lX292ZXJfYWZ0ZXJfaWZfZWxzZUAzMAogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDUgMSAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGR1cAogICAgZnJhbWVfYnVyeSAzCiAgICBmcmFtZV9kaWcgOQogICAgYj09CiAgICBieiBpc19nYW1lX292ZXJfYWZ0ZXJfaWZfZWxzZUAzMAogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDYgMSAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGR1cAogICAgZnJhbWVfYnVyeSA0CiAgICBmcmFtZV9kaWcgMwogICAgYj09CiAgICBieiBpc19nYW1lX292ZXJfYWZ0ZXJfaWZfZWxzZUAzMAogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDcgMSAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGR1cAogICAgZnJhbWVfYnVyeSA1CiAgICBmcmFtZV9kaWcgNAogICAgYj09CiAgICBieiBpc19nYW1lX292ZXJfYWZ0ZXJfaWZfZWxzZUAzMAogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDggMSAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGR1cAogICAgZnJhbWVfYnVyeSA2CiAgICBmcmFtZV9kaWcgNQogICAgYj09CiAgICBieiBpc19nYW1lX292ZXJfYWZ0ZXJfaWZfZWxzZUAzMAogICAgZnJhbWVfZGlnIDYKICAgIGJ5dGUgMHgwMAogICAgYiE9CiAgICBieiBpc19nYW1lX292ZXJfYWZ0ZXJfaWZfZWxzZUAzMAogICAgaW50IDEKICAgIGR1cAogICAgZnJhbWVfZGlnIC0xCiAgICBmcmFtZV9idXJ5IDIKICAgIGZyYW1lX2J1cnkgMQogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCmlzX2dhbWVfb3Zlcl9hZnRlcl9pZl9lbHNlQDMwOgogICAgaW50IDAKICAgIGR1cAogICAgZnJhbWVfZGlnIC0xCiAgICBmcmFtZV9idXJ5IDIKICAgIGZyYW1lX2J1cnkgMQogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudGljdGFjdG9lX3N0YXRzLmNvbnRyYWN0LlRpY1RhY1RvZVN0YXRzLmFkZF9nYW1lX3BsYXllZChwbGF5ZXI6IGJ5dGVzKSAtPiB2b2lkOgphZGRfZ2FtZV9wbGF5ZWQ6CiAgICBwcm90byAxIDAKICAgIGJ5dGUgMHg3MwogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3RhdHMgZW50cnkgZXhpc3RzCiAgICBleHRyYWN0IDAgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ0b2kKICAgIGludCAxCiAgICArCiAgICBpdG9iCiAgICBkaWcgMQogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3RhdHMgZW50cnkgZXhpc3RzCiAgICBzd2FwCiAgICByZXBsYWNlMiAwCiAgICBib3hfcHV0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudGljdGFjdG9lX3N0YXRzLmNvbnRyYWN0LlRpY1RhY1RvZVN0YXRzLmdldF9zdGF0cyhwbGF5ZXI6IGJ5dGVzKSAtPiBieXRlczoKZ2V0X3N0YXRzOgogICAgcHJvdG8gMSAxCiAgICBieXRlIDB4NzMKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYnogZ2V0X3N0YXRzX2FmdGVyX2lmX2Vsc2VAMgogICAgZnJhbWVfZGlnIDAKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnN0YXRzIGVudHJ5IGV4aXN0cwogICAgc3dhcAogICAgcmV0c3ViCgpnZXRfc3RhdHNfYWZ0ZXJfaWZfZWxzZUAyOgogICAgYnl0ZSAweDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwCiAgICBzd2FwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudGljdGFjdG9lX3N0YXRzLmNvbnRyYWN0LlRpY1RhY1RvZVN0YXRzLl9faW5pdF9fKCkgLT4gdm9pZDoKX19pbml0X186CiAgICBwcm90byAwIDAKICAgIGJ5dGUgImlkX2NvdW50ZXIiCiAgICBpbnQgMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1Ygo=",
+        "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzbWFydF9jb250cmFjdHMudGljdGFjdG9lX3N0YXRzLmNvbnRyYWN0LlRpY1RhY1RvZVN0YXRzLmNsZWFyX3N0YXRlX3Byb2dyYW06CiAgICBpbnQgMQogICAgcmV0dXJuCg=="
+    },
+    "state": {
+        "global": {
+            "num_byte_slices": 0,
+            "num_uints": 1
+        },
+        "local": {
+            "num_byte_slices": 0,
+            "num_uints": 0
+        }
+    },
+    "schema": {
+        "global": {
+            "declared": {
+                "id_counter": {
+                    "type": "uint64",
+                    "key": "id_counter"
+                }
+            },
+            "reserved": {}
+        },
+        "local": {
+            "declared": {},
+            "reserved": {}
+        }
+    },
+    "contract": {
+        "name": "TicTacToeStats",
+        "methods": [
+            {
+                "name": "new_game",
+                "args": [
+                    {
+                        "type": "pay",
+                        "name": "mbr"
+                    }
+                ],
+                "returns": {
+                    "type": "uint64"
+                }
+            },
+            {
+                "name": "delete_game",
+                "args": [
+                    {
+                        "type": "uint64",
+                        "name": "game_id"
+                    }
+                ],
+                "returns": {
+                    "type": "void"
+                }
+            },
+            {
+                "name": "join",
+                "args": [
+                    {
+                        "type": "uint64",
+                        "name": "game_id"
+                    },
+                    {
+                        "type": "pay",
+                        "name": "mbr"
+                    }
+                ],
+                "returns": {
+                    "type": "void"
+                }
+            },
+            {
+                "name": "move",
+                "args": [
+                    {
+                        "type": "uint64",
+                        "name": "game_id"
+                    },
+                    {
+                        "type": "uint64",
+                        "name": "x"
+                    },
+                    {
+                        "type": "uint64",
+                        "name": "y"
+                    }
+                ],
+                "returns": {
+                    "type": "void"
+                }
+            },
+            {
+                "name": "get_stats",
+                "args": [
+                    {
+                        "type": "address",
+                        "name": "player"
+                    }
+                ],
+                "returns": {
+                    "type": "(uint64,uint64)"
+                }
+            }
+        ],
+        "networks": {}
+    },
+    "bare_call_config": {
+        "no_op": "CREATE"
+    }
+}"""
+APP_SPEC = algokit_utils.ApplicationSpecification.from_json(_APP_SPEC_JSON)
+_TReturn = typing.TypeVar("_TReturn")
+
+
+class _ArgsBase(ABC, typing.Generic[_TReturn]):
+    @staticmethod
+    @abstractmethod
+    def method() -> str:
+        ...
+
+
+_TArgs = typing.TypeVar("_TArgs", bound=_ArgsBase[typing.Any])
+
+
+@dataclasses.dataclass(kw_only=True)
+class _TArgsHolder(typing.Generic[_TArgs]):
+    args: _TArgs
+
+
+def _filter_none(value: dict | typing.Any) -> dict | typing.Any:
+    if isinstance(value, dict):
+        return {k: _filter_none(v) for k, v in value.items() if v is not None}
+    return value
+
+
+def _as_dict(data: typing.Any, *, convert_all: bool = True) -> dict[str, typing.Any]:
+    if data is None:
+        return {}
+    if not dataclasses.is_dataclass(data):
+        raise TypeError(f"{data} must be a dataclass")
+    if convert_all:
+        result = dataclasses.asdict(data) # type: ignore[call-overload]
+    else:
+        result = {f.name: getattr(data, f.name) for f in dataclasses.fields(data)}
+    return _filter_none(result)
+
+
+def _convert_transaction_parameters(
+    transaction_parameters: algokit_utils.TransactionParameters | None,
+) -> algokit_utils.TransactionParametersDict:
+    return typing.cast(algokit_utils.TransactionParametersDict, _as_dict(transaction_parameters))
+
+
+def _convert_call_transaction_parameters(
+    transaction_parameters: algokit_utils.TransactionParameters | None,
+) -> algokit_utils.OnCompleteCallParametersDict:
+    return typing.cast(algokit_utils.OnCompleteCallParametersDict, _as_dict(transaction_parameters))
+
+
+def _convert_create_transaction_parameters(
+    transaction_parameters: algokit_utils.TransactionParameters | None,
+    on_complete: algokit_utils.OnCompleteActionName,
+) -> algokit_utils.CreateCallParametersDict:
+    result = typing.cast(algokit_utils.CreateCallParametersDict, _as_dict(transaction_parameters))
+    on_complete_enum = on_complete.replace("_", " ").title().replace(" ", "") + "OC"
+    result["on_complete"] = getattr(algosdk.transaction.OnComplete, on_complete_enum)
+    return result
+
+
+def _convert_deploy_args(
+    deploy_args: algokit_utils.DeployCallArgs | None,
+) -> algokit_utils.ABICreateCallArgsDict | None:
+    if deploy_args is None:
+        return None
+
+    deploy_args_dict = typing.cast(algokit_utils.ABICreateCallArgsDict, _as_dict(deploy_args))
+    if isinstance(deploy_args, _TArgsHolder):
+        deploy_args_dict["args"] = _as_dict(deploy_args.args)
+        deploy_args_dict["method"] = deploy_args.args.method()
+
+    return deploy_args_dict
+
+
+@dataclasses.dataclass(kw_only=True)
+class NewGameArgs(_ArgsBase[int]):
+    mbr: TransactionWithSigner
+
+    @staticmethod
+    def method() -> str:
+        return "new_game(pay)uint64"
+
+
+@dataclasses.dataclass(kw_only=True)
+class DeleteGameArgs(_ArgsBase[None]):
+    game_id: int
+
+    @staticmethod
+    def method() -> str:
+        return "delete_game(uint64)void"
+
+
+@dataclasses.dataclass(kw_only=True)
+class JoinArgs(_ArgsBase[None]):
+    game_id: int
+    mbr: TransactionWithSigner
+
+    @staticmethod
+    def method() -> str:
+        return "join(uint64,pay)void"
+
+
+@dataclasses.dataclass(kw_only=True)
+class MoveArgs(_ArgsBase[None]):
+    game_id: int
+    x: int
+    y: int
+
+    @staticmethod
+    def method() -> str:
+        return "move(uint64,uint64,uint64)void"
+
+
+@dataclasses.dataclass(kw_only=True)
+class PlayerStats:
+    games_played: int
+    games_won: int
+
+
+@dataclasses.dataclass(kw_only=True)
+class GetStatsArgs(_ArgsBase[PlayerStats]):
+    player: str
+
+    @staticmethod
+    def method() -> str:
+        return "get_stats(address)(uint64,uint64)"
+
+
+class GlobalState:
+    def __init__(self, data: dict[bytes, bytes | int]):
+        self.id_counter = typing.cast(int, data.get(b"id_counter"))
+
+
+@dataclasses.dataclass(kw_only=True)
+class SimulateOptions:
+    allow_more_logs: bool = dataclasses.field(default=False)
+    allow_empty_signatures: bool = dataclasses.field(default=False)
+    extra_opcode_budget: int = dataclasses.field(default=0)
+    exec_trace_config: models.SimulateTraceConfig | None         = dataclasses.field(default=None)
+
+
+class Composer:
+
+    def __init__(self, app_client: algokit_utils.ApplicationClient, atc: AtomicTransactionComposer):
+        self.app_client = app_client
+        self.atc = atc
+
+    def build(self) -> AtomicTransactionComposer:
+        return self.atc
+
+    def simulate(self, options: SimulateOptions | None = None) -> SimulateAtomicTransactionResponse:
+        request = models.SimulateRequest(
+            allow_more_logs=options.allow_more_logs,
+            allow_empty_signatures=options.allow_empty_signatures,
+            extra_opcode_budget=options.extra_opcode_budget,
+            exec_trace_config=options.exec_trace_config,
+            txn_groups=[]
+        ) if options else None
+        result = self.atc.simulate(self.app_client.algod_client, request)
+        return result
+
+    def execute(self) -> AtomicTransactionResponse:
+        return self.app_client.execute_atc(self.atc)
+
+    def new_game(
+        self,
+        *,
+        mbr: TransactionWithSigner,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `new_game(pay)uint64` ABI method
+        
+        :param TransactionWithSigner mbr: The `mbr` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = NewGameArgs(
+            mbr=mbr,
+        )
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def delete_game(
+        self,
+        *,
+        game_id: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `delete_game(uint64)void` ABI method
+        
+        :param int game_id: The `game_id` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = DeleteGameArgs(
+            game_id=game_id,
+        )
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def join(
+        self,
+        *,
+        game_id: int,
+        mbr: TransactionWithSigner,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `join(uint64,pay)void` ABI method
+        
+        :param int game_id: The `game_id` ABI parameter
+        :param TransactionWithSigner mbr: The `mbr` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = JoinArgs(
+            game_id=game_id,
+            mbr=mbr,
+        )
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def move(
+        self,
+        *,
+        game_id: int,
+        x: int,
+        y: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `move(uint64,uint64,uint64)void` ABI method
+        
+        :param int game_id: The `game_id` ABI parameter
+        :param int x: The `x` ABI parameter
+        :param int y: The `y` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = MoveArgs(
+            game_id=game_id,
+            x=x,
+            y=y,
+        )
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def get_stats(
+        self,
+        *,
+        player: str,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `get_stats(address)(uint64,uint64)` ABI method
+        
+        :param str player: The `player` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = GetStatsArgs(
+            player=player,
+        )
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def create_bare(
+        self,
+        *,
+        on_complete: typing.Literal["no_op"] = "no_op",
+        transaction_parameters: algokit_utils.CreateTransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to create an application using the no_op bare method
+        
+        :param typing.Literal[no_op] on_complete: On completion type to use
+        :param algokit_utils.CreateTransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        self.app_client.compose_create(
+            self.atc,
+            call_abi_method=False,
+            transaction_parameters=_convert_create_transaction_parameters(transaction_parameters, on_complete),
+        )
+        return self
+
+    def clear_state(
+        self,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+        app_args: list[bytes] | None = None,
+    ) -> "Composer":
+        """Adds a call to the application with on completion set to ClearState
+    
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :param list[bytes] | None app_args: (optional) Application args to pass"""
+    
+        self.app_client.compose_clear_state(self.atc, _convert_transaction_parameters(transaction_parameters), app_args)
+        return self
+
+
+class TicTacToeStatsClient:
+    """A class for interacting with the TicTacToeStats app providing high productivity and
+    strongly typed methods to deploy and call the app"""
+
+    @typing.overload
+    def __init__(
+        self,
+        algod_client: algosdk.v2client.algod.AlgodClient,
+        *,
+        app_id: int = 0,
+        signer: TransactionSigner | algokit_utils.Account | None = None,
+        sender: str | None = None,
+        suggested_params: algosdk.transaction.SuggestedParams | None = None,
+        template_values: algokit_utils.TemplateValueMapping | None = None,
+        app_name: str | None = None,
+    ) -> None:
+        ...
+
+    @typing.overload
+    def __init__(
+        self,
+        algod_client: algosdk.v2client.algod.AlgodClient,
+        *,
+        creator: str | algokit_utils.Account,
+        indexer_client: algosdk.v2client.indexer.IndexerClient | None = None,
+        existing_deployments: algokit_utils.AppLookup | None = None,
+        signer: TransactionSigner | algokit_utils.Account | None = None,
+        sender: str | None = None,
+        suggested_params: algosdk.transaction.SuggestedParams | None = None,
+        template_values: algokit_utils.TemplateValueMapping | None = None,
+        app_name: str | None = None,
+    ) -> None:
+        ...
+
+    def __init__(
+        self,
+        algod_client: algosdk.v2client.algod.AlgodClient,
+        *,
+        creator: str | algokit_utils.Account | None = None,
+        indexer_client: algosdk.v2client.indexer.IndexerClient | None = None,
+        existing_deployments: algokit_utils.AppLookup | None = None,
+        app_id: int = 0,
+        signer: TransactionSigner | algokit_utils.Account | None = None,
+        sender: str | None = None,
+        suggested_params: algosdk.transaction.SuggestedParams | None = None,
+        template_values: algokit_utils.TemplateValueMapping | None = None,
+        app_name: str | None = None,
+    ) -> None:
+        """
+        TicTacToeStatsClient can be created with an app_id to interact with an existing application, alternatively
+        it can be created with a creator and indexer_client specified to find existing applications by name and creator.
+        
+        :param AlgodClient algod_client: AlgoSDK algod client
+        :param int app_id: The app_id of an existing application, to instead find the application by creator and name
+        use the creator and indexer_client parameters
+        :param str | Account creator: The address or Account of the app creator to resolve the app_id
+        :param IndexerClient indexer_client: AlgoSDK indexer client, only required if deploying or finding app_id by
+        creator and app name
+        :param AppLookup existing_deployments:
+        :param TransactionSigner | Account signer: Account or signer to use to sign transactions, if not specified and
+        creator was passed as an Account will use that.
+        :param str sender: Address to use as the sender for all transactions, will use the address associated with the
+        signer if not specified.
+        :param TemplateValueMapping template_values: Values to use for TMPL_* template variables, dictionary keys should
+        *NOT* include the TMPL_ prefix
+        :param str | None app_name: Name of application to use when deploying, defaults to name defined on the
+        Application Specification
+            """
+
+        self.app_spec = APP_SPEC
+        
+        # calling full __init__ signature, so ignoring mypy warning about overloads
+        self.app_client = algokit_utils.ApplicationClient(  # type: ignore[call-overload, misc]
+            algod_client=algod_client,
+            app_spec=self.app_spec,
+            app_id=app_id,
+            creator=creator,
+            indexer_client=indexer_client,
+            existing_deployments=existing_deployments,
+            signer=signer,
+            sender=sender,
+            suggested_params=suggested_params,
+            template_values=template_values,
+            app_name=app_name,
+        )
+
+    @property
+    def algod_client(self) -> algosdk.v2client.algod.AlgodClient:
+        return self.app_client.algod_client
+
+    @property
+    def app_id(self) -> int:
+        return self.app_client.app_id
+
+    @app_id.setter
+    def app_id(self, value: int) -> None:
+        self.app_client.app_id = value
+
+    @property
+    def app_address(self) -> str:
+        return self.app_client.app_address
+
+    @property
+    def sender(self) -> str | None:
+        return self.app_client.sender
+
+    @sender.setter
+    def sender(self, value: str) -> None:
+        self.app_client.sender = value
+
+    @property
+    def signer(self) -> TransactionSigner | None:
+        return self.app_client.signer
+
+    @signer.setter
+    def signer(self, value: TransactionSigner) -> None:
+        self.app_client.signer = value
+
+    @property
+    def suggested_params(self) -> algosdk.transaction.SuggestedParams | None:
+        return self.app_client.suggested_params
+
+    @suggested_params.setter
+    def suggested_params(self, value: algosdk.transaction.SuggestedParams | None) -> None:
+        self.app_client.suggested_params = value
+
+    def get_global_state(self) -> GlobalState:
+        """Returns the application's global state wrapped in a strongly typed class with options to format the stored value"""
+
+        state = typing.cast(dict[bytes, bytes | int], self.app_client.get_global_state(raw=True))
+        return GlobalState(state)
+
+    def new_game(
+        self,
+        *,
+        mbr: TransactionWithSigner,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[int]:
+        """Calls `new_game(pay)uint64` ABI method
+        
+        :param TransactionWithSigner mbr: The `mbr` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[int]: The result of the transaction"""
+
+        args = NewGameArgs(
+            mbr=mbr,
+        )
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
+    def delete_game(
+        self,
+        *,
+        game_id: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        """Calls `delete_game(uint64)void` ABI method
+        
+        :param int game_id: The `game_id` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[None]: The result of the transaction"""
+
+        args = DeleteGameArgs(
+            game_id=game_id,
+        )
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
+    def join(
+        self,
+        *,
+        game_id: int,
+        mbr: TransactionWithSigner,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        """Calls `join(uint64,pay)void` ABI method
+        
+        :param int game_id: The `game_id` ABI parameter
+        :param TransactionWithSigner mbr: The `mbr` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[None]: The result of the transaction"""
+
+        args = JoinArgs(
+            game_id=game_id,
+            mbr=mbr,
+        )
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
+    def move(
+        self,
+        *,
+        game_id: int,
+        x: int,
+        y: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        """Calls `move(uint64,uint64,uint64)void` ABI method
+        
+        :param int game_id: The `game_id` ABI parameter
+        :param int x: The `x` ABI parameter
+        :param int y: The `y` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[None]: The result of the transaction"""
+
+        args = MoveArgs(
+            game_id=game_id,
+            x=x,
+            y=y,
+        )
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
+    def get_stats(
+        self,
+        *,
+        player: str,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[PlayerStats]:
+        """Calls `get_stats(address)(uint64,uint64)` ABI method
+        
+        :param str player: The `player` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[PlayerStats]: The result of the transaction"""
+
+        args = GetStatsArgs(
+            player=player,
+        )
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        elements = self.app_spec.hints[args.method()].structs["output"]["elements"]
+        result_dict = {element[0]: value for element, value in zip(elements, result.return_value)}
+        result.return_value = PlayerStats(**result_dict)
+        return result
+
+    def create_bare(
+        self,
+        *,
+        on_complete: typing.Literal["no_op"] = "no_op",
+        transaction_parameters: algokit_utils.CreateTransactionParameters | None = None,
+    ) -> algokit_utils.TransactionResponse:
+        """Creates an application using the no_op bare method
+        
+        :param typing.Literal[no_op] on_complete: On completion type to use
+        :param algokit_utils.CreateTransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.TransactionResponse: The result of the transaction"""
+
+        result = self.app_client.create(
+            call_abi_method=False,
+            transaction_parameters=_convert_create_transaction_parameters(transaction_parameters, on_complete),
+        )
+        return result
+
+    def clear_state(
+        self,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+        app_args: list[bytes] | None = None,
+    ) -> algokit_utils.TransactionResponse:
+        """Calls the application with on completion set to ClearState
+    
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :param list[bytes] | None app_args: (optional) Application args to pass
+        :returns algokit_utils.TransactionResponse: The result of the transaction"""
+    
+        return self.app_client.clear_state(_convert_transaction_parameters(transaction_parameters), app_args)
+
+    def deploy(
+        self,
+        version: str | None = None,
+        *,
+        signer: TransactionSigner | None = None,
+        sender: str | None = None,
+        allow_update: bool | None = None,
+        allow_delete: bool | None = None,
+        on_update: algokit_utils.OnUpdate = algokit_utils.OnUpdate.Fail,
+        on_schema_break: algokit_utils.OnSchemaBreak = algokit_utils.OnSchemaBreak.Fail,
+        template_values: algokit_utils.TemplateValueMapping | None = None,
+        create_args: algokit_utils.DeployCallArgs | None = None,
+        update_args: algokit_utils.DeployCallArgs | None = None,
+        delete_args: algokit_utils.DeployCallArgs | None = None,
+    ) -> algokit_utils.DeployResponse:
+        """Deploy an application and update client to reference it.
+        
+        Idempotently deploy (create, update/delete if changed) an app against the given name via the given creator
+        account, including deploy-time template placeholder substitutions.
+        To understand the architecture decisions behind this functionality please see
+        <https://github.com/algorandfoundation/algokit-cli/blob/main/docs/architecture-decisions/2023-01-12_smart-contract-deployment.md>
+        
+        ```{note}
+        If there is a breaking state schema change to an existing app (and `on_schema_break` is set to
+        'ReplaceApp' the existing app will be deleted and re-created.
+        ```
+        
+        ```{note}
+        If there is an update (different TEAL code) to an existing app (and `on_update` is set to 'ReplaceApp')
+        the existing app will be deleted and re-created.
+        ```
+        
+        :param str version: version to use when creating or updating app, if None version will be auto incremented
+        :param algosdk.atomic_transaction_composer.TransactionSigner signer: signer to use when deploying app
+        , if None uses self.signer
+        :param str sender: sender address to use when deploying app, if None uses self.sender
+        :param bool allow_delete: Used to set the `TMPL_DELETABLE` template variable to conditionally control if an app
+        can be deleted
+        :param bool allow_update: Used to set the `TMPL_UPDATABLE` template variable to conditionally control if an app
+        can be updated
+        :param OnUpdate on_update: Determines what action to take if an application update is required
+        :param OnSchemaBreak on_schema_break: Determines what action to take if an application schema requirements
+        has increased beyond the current allocation
+        :param dict[str, int|str|bytes] template_values: Values to use for `TMPL_*` template variables, dictionary keys
+        should *NOT* include the TMPL_ prefix
+        :param algokit_utils.DeployCallArgs | None create_args: Arguments used when creating an application
+        :param algokit_utils.DeployCallArgs | None update_args: Arguments used when updating an application
+        :param algokit_utils.DeployCallArgs | None delete_args: Arguments used when deleting an application
+        :return DeployResponse: details action taken and relevant transactions
+        :raises DeploymentError: If the deployment failed"""
+
+        return self.app_client.deploy(
+            version,
+            signer=signer,
+            sender=sender,
+            allow_update=allow_update,
+            allow_delete=allow_delete,
+            on_update=on_update,
+            on_schema_break=on_schema_break,
+            template_values=template_values,
+            create_args=_convert_deploy_args(create_args),
+            update_args=_convert_deploy_args(update_args),
+            delete_args=_convert_deploy_args(delete_args),
+        )
+
+    def compose(self, atc: AtomicTransactionComposer | None = None) -> Composer:
+        return Composer(self.app_client, atc or AtomicTransactionComposer())
@@ -0,0 +1,32 @@
+# mypy: disable-error-code="no-untyped-call, misc"
+import typing
+
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts._helpers.application_client import ApplicationClient
+from smart_contracts._helpers.confirmations import ConfirmationWaiter
+from smart_contracts._helpers.fees import FeePooler
+from smart_contracts._helpers.views import AccountViews
+from smart_contracts.artifacts.auction import auction_client
+
+
+class AuctionClient(AccountViews, auction_client.AuctionClient):
+    """Extends the generated AuctionClient, taking the same arguments
+
+    Calls that send inner transactions (`opt_into_asset`, `claim_bids`, `claim_asset`
+    and `delete_application`) carry the fee for them unless the caller sets a flat
+    fee."""
+
+    # inner transaction counts are a property of the contract, so every client learns
+    # them once
+    fee_pooler = FeePooler()
+
+    def __init__(self, algod_client: AlgodClient, **kwargs: typing.Any) -> None:
+        super().__init__(algod_client, **kwargs)
+        self.app_client = ApplicationClient(
+            algod_client,
+            self.app_spec,
+            confirmation_waiter=ConfirmationWaiter.shared(algod_client),
+            fee_pooler=self.fee_pooler,
+            **kwargs,
+        )
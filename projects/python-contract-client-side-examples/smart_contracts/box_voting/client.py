@@ -0,0 +1,208 @@
+# mypy: disable-error-code="no-any-return, no-untyped-call, misc"
+import base64
+import dataclasses
+import math
+import os
+import typing
+from collections.abc import Iterable, Mapping
+
+from algosdk import transaction
+from algosdk.atomic_transaction_composer import (
+    TransactionSigner,
+    TransactionWithSigner,
+)
+from algosdk.encoding import decode_address
+from algosdk.error import AlgodHTTPError
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts._helpers.application_client import ApplicationClient
+from smart_contracts._helpers.bulk import BulkCall, BulkComposer, BulkResult
+from smart_contracts._helpers.confirmations import ConfirmationWaiter
+from smart_contracts._helpers.references import (
+    NextIdRule,
+    ReferenceResolver,
+    References,
+)
+from smart_contracts._helpers.views import AccountViews
+from smart_contracts.artifacts.box_voting import box_voting_client
+
+# key prefixes of the `topics` and `ballots` BoxMaps and of the tallies boxes in the
+# BoxVoting contract
+TOPICS_BOX_PREFIX = b"t"
+BALLOTS_BOX_PREFIX = b"b"
+TALLIES_BOX_PREFIX = b"v"
+
+# payment `vote` requires, for the MBR of the voter's ballot box
+BALLOT_MBR = 2_500 + 400 * (len(BALLOTS_BOX_PREFIX) + 8 + 32 + 1)
+# bytes of box I/O each box reference grants
+_BOX_QUOTA = 1_024
+
+
+def topic_mbr(topic: str, options: int) -> int:
+    """Returns the payment `add_topic` requires, for the MBR of the topic's boxes"""
+    topic_box = len(TOPICS_BOX_PREFIX) + 8 + 2 + len(topic.encode())
+    tallies_box = len(TALLIES_BOX_PREFIX) + 8 + 8 * options
+    return 2 * 2_500 + 400 * (topic_box + tallies_box)
+
+
+def topic_box_name(topic_id: int) -> bytes:
+    """Returns the name of the box holding the topic with the given id"""
+    return TOPICS_BOX_PREFIX + topic_id.to_bytes(8, "big")
+
+
+def tallies_box_name(topic_id: int) -> bytes:
+    """Returns the name of the box holding the votes for each option of a topic"""
+    return TALLIES_BOX_PREFIX + topic_id.to_bytes(8, "big")
+
+
+def ballot_box_name(topic_id: int, voter: str) -> bytes:
+    """Returns the name of the box holding the option `voter` picked in a topic"""
+    return BALLOTS_BOX_PREFIX + topic_id.to_bytes(8, "big") + decode_address(voter)
+
+
+@dataclasses.dataclass(frozen=True)
+class Vote:
+    """A vote for `vote_many` to cast
+
+    :param str sender: Voter, who also pays for their ballot box
+    :param TransactionSigner signer: Signer of the voter
+    :param int topic_id: Topic to vote in
+    :param int option: Index of the option to vote for"""
+
+    sender: str
+    signer: TransactionSigner
+    topic_id: int
+    option: int
+
+
+class BoxVotingClient(AccountViews, box_voting_client.BoxVotingClient):
+    """Extends the generated BoxVotingClient with typed access to the tallies and
+    ballot boxes, and with casting many votes in batched groups
+
+    Takes the same arguments as the generated client. Voters need no opt in, as
+    `vote` records their ballot in a box their payment funds, so each vote is a
+    single group. Calls reference the boxes they use unless the caller passes
+    references of their own."""
+
+    def __init__(self, algod_client: AlgodClient, **kwargs: typing.Any) -> None:
+        super().__init__(algod_client, **kwargs)
+        self.app_client = ApplicationClient(
+            algod_client,
+            self.app_spec,
+            confirmation_waiter=ConfirmationWaiter.shared(algod_client),
+            reference_resolver=ReferenceResolver(
+                {
+                    box_voting_client.AddTopicArgs.method(): NextIdRule(
+                        lambda: self.get_global_state().topic_counter or 0,
+                        _add_topic_references,
+                    ),
+                    box_voting_client.VoteArgs.method(): _vote_references,
+                    box_voting_client.GetVotesArgs.method(): _get_votes_references,
+                }
+            ),
+            **kwargs,
+        )
+
+    def get_tallies(self, topic_id: int) -> list[int]:
+        """Returns the votes for each option of a topic, read from its box"""
+        value = self._get_box(tallies_box_name(topic_id))
+        return [
+            int.from_bytes(value[start : start + 8], "big")
+            for start in range(0, len(value), 8)
+        ]
+
+    def get_ballot(self, topic_id: int, voter: str) -> int | None:
+        """Returns the option `voter` picked in a topic, or None if they haven't
+        voted in it"""
+        try:
+            value = self._get_box(ballot_box_name(topic_id, voter))
+        except AlgodHTTPError as ex:
+            if ex.code == 404:
+                return None
+            raise
+        return value[0]
+
+    def vote_many(self, votes: Iterable[Vote]) -> list[BulkResult]:
+        """Casts many votes, from any number of voters, with as many votes as fit in
+        each group
+
+        Each vote is sent and signed by its own voter, along with the payment for
+        their ballot box, so a voter's first vote needs no prior transaction. Votes
+        in topics the voter already has a ballot in, from before or earlier in
+        `votes`, pay nothing, as the contract refuses payments it has no box for.
+
+        :param Iterable[Vote] votes: Votes to cast
+        :returns list[BulkResult]: The result of each vote, True if it counted and
+        False if the voter had already voted in the topic, or the error of its group
+        """
+        sp = self.app_client.suggested_params or self.algod_client.suggested_params()
+        has_ballot: dict[tuple[int, str], bool] = {}
+        calls = []
+        for vote in votes:
+            ballot = (vote.topic_id, vote.sender)
+            if ballot not in has_ballot:
+                has_ballot[ballot] = self.get_ballot(*ballot) is not None
+            amount = 0 if has_ballot[ballot] else BALLOT_MBR
+            has_ballot[ballot] = True
+            # a voter repeating a vote would otherwise repeat the payment too, which
+            # can only be sent once
+            pay = transaction.PaymentTxn(
+                vote.sender, sp, self.app_address, amount, note=os.urandom(8)
+            )
+            calls.append(
+                BulkCall(
+                    box_voting_client.VoteArgs.method(),
+                    {
+                        "topic_id": vote.topic_id,
+                        "option": vote.option,
+                        "pay": TransactionWithSigner(pay, vote.signer),
+                    },
+                    {"sender": vote.sender, "signer": vote.signer},
+                )
+            )
+        return list(BulkComposer(self.app_client).execute(calls))
+
+    def _get_box(self, name: bytes) -> bytes:
+        box = typing.cast(
+            dict[str, str],
+            self.algod_client.application_box_by_name(self.app_id, name),
+        )
+        return base64.b64decode(box["value"])
+
+
+def _add_topic_references(topic_id: int, args: Mapping[str, object]) -> References:
+    # add_topic creates both boxes of the next topic
+    topic = typing.cast(str, args["topic"])
+    options = typing.cast(int, args["options"])
+    return References(
+        boxes=_with_quota(
+            (topic_box_name(topic_id), tallies_box_name(topic_id)),
+            2 + len(topic.encode()) + 8 * options,
+        )
+    )
+
+
+def _vote_references(args: Mapping[str, object]) -> References:
+    # the ballot box is named after the voter, who also sends the payment
+    topic_id = typing.cast(int, args["topic_id"])
+    pay = typing.cast(TransactionWithSigner, args["pay"])
+    voter = typing.cast(transaction.PaymentTxn, pay.txn).sender
+    # at most 255 options of 8 bytes, so two references cover every topic's tallies
+    return References(
+        boxes=(
+            (0, tallies_box_name(topic_id)),
+            (0, ballot_box_name(topic_id, voter)),
+        )
+    )
+
+
+def _get_votes_references(args: Mapping[str, object]) -> References:
+    topic_id = typing.cast(int, args["topic_id"])
+    return References(boxes=_with_quota((tallies_box_name(topic_id),), 8 * 255))
+
+
+def _with_quota(names: tuple[bytes, ...], size: int) -> tuple[tuple[int, bytes], ...]:
+    # every box reference grants 1KB of box I/O, so larger boxes take extra,
+    # unnamed, references
+    count = max(len(names), math.ceil(size / _BOX_QUOTA))
+    return tuple((0, name) for name in names) + ((0, b""),) * (count - len(names))
@@ -0,0 +1,93 @@
+import algopy
+from algopy import Bytes, Global, Txn, UInt64, arc4, op
+
+# Prefix of the box of each topic's tallies, one uint64 per option
+TALLIES_PREFIX = b"v"
+
+
+class BoxVoting(algopy.ARC4Contract):
+    def __init__(self) -> None:
+        self.topic_counter = UInt64(0)
+        self.topics = algopy.BoxMap(UInt64, arc4.String, key_prefix=b"t")
+        # the option each voter picked, keyed by topic id and voter
+        self.ballots = algopy.BoxMap(Bytes, arc4.UInt8, key_prefix=b"b")
+
+    @arc4.abimethod
+    def add_topic(
+        self, topic: arc4.String, options: UInt64, mbr: algopy.gtxn.PaymentTransaction
+    ) -> UInt64:
+        assert Txn.sender == Global.creator_address, "Only creator can add topics"
+        assert options > 0 and options <= 255, "Topics have 1 to 255 options"
+        assert (
+            mbr.receiver == Global.current_application_address
+        ), "mbr must pay this app"
+
+        self.topic_counter += 1
+
+        pre_new_topic_boxes, exists = op.AcctParamsGet.acct_min_balance(
+            Global.current_application_address
+        )
+        assert exists
+        self.topics[self.topic_counter] = topic
+        assert op.Box.create(self.tallies_key(self.topic_counter), options * 8)
+        post_new_topic_boxes, exists = op.AcctParamsGet.acct_min_balance(
+            Global.current_application_address
+        )
+        assert exists
+        assert mbr.amount == (
+            post_new_topic_boxes - pre_new_topic_boxes
+        ), "mbr must cover the topic boxes"
+
+        return self.topic_counter
+
+    @arc4.abimethod
+    def vote(
+        self, topic_id: UInt64, option: UInt64, pay: algopy.gtxn.PaymentTransaction
+    ) -> arc4.Bool:
+        assert pay.sender == Txn.sender, "Payment sender must match transaction sender"
+        assert (
+            pay.receiver == Global.current_application_address
+        ), "Payment must pay this app"
+        tallies_key = self.tallies_key(topic_id)
+        options, exists = op.Box.length(tallies_key)
+        assert exists, "Unknown topic"
+        assert option < options // 8, "Unknown option"
+
+        key = op.itob(topic_id) + Txn.sender.bytes
+        if key in self.ballots:
+            # there's no ballot box to fund, and a payment would be stuck in the app
+            assert pay.amount == 0, "Already voted, so pay nothing"
+            return arc4.Bool(False)  # noqa: FBT003  Already voted
+
+        # the payment funds the voter's ballot box
+        pre_new_ballot_box, exists = op.AcctParamsGet.acct_min_balance(
+            Global.current_application_address
+        )
+        assert exists
+        self.ballots[key] = arc4.UInt8(option)
+        post_new_ballot_box, exists = op.AcctParamsGet.acct_min_balance(
+            Global.current_application_address
+        )
+        assert exists
+        assert pay.amount == (
+            post_new_ballot_box - pre_new_ballot_box
+        ), "Incorrect payment amount"
+
+        votes = op.btoi(op.Box.extract(tallies_key, option * 8, 8))
+        op.Box.replace(tallies_key, option * 8, op.itob(votes + 1))
+        return arc4.Bool(True)  # noqa: FBT003
+
+    @arc4.abimethod(readonly=True)
+    def get_votes(self, topic_id: UInt64) -> arc4.DynamicArray[arc4.UInt64]:
+        tallies, exists = op.Box.get(self.tallies_key(topic_id))
+        assert exists, "Unknown topic"
+        # the tallies are the array's items, behind its uint16 length
+        length = op.extract(op.itob(tallies.length // 8), 6, 2)
+        return arc4.DynamicArray[arc4.UInt64].from_bytes(length + tallies)
+
+    @algopy.subroutine
+    def tallies_key(self, topic_id: UInt64) -> Bytes:
+        return TALLIES_PREFIX + op.itob(topic_id)
+
+    def clear_state_program(self) -> bool:
+        return True
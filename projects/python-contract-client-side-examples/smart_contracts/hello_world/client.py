@@ -0,0 +1,91 @@
+# mypy: disable-error-code="no-untyped-call, misc"
+import typing
+from collections.abc import Iterable, Iterator
+
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts._helpers.application_client import ApplicationClient
+from smart_contracts._helpers.bulk import BulkComposer, BulkGroupError
+from smart_contracts._helpers.confirmations import ConfirmationWaiter
+from smart_contracts._helpers.views import AccountViews
+from smart_contracts.artifacts.hello_world import hello_world_client
+
+# Bytes of app call arguments, method selector included, a transaction may carry
+MAX_ARGS_SIZE = 2_048
+# Bytes a transaction may log, where the return value goes behind its 4 byte prefix
+MAX_LOG_SIZE = 1_024
+# Opcode budget of a single app call
+OPCODE_BUDGET = 700
+# Opcodes a `hello_many` call runs, as compiled: routing and the loop's setup and exit,
+# then each name's pass through the loop
+HELLO_MANY_OPCODES = 40
+OPCODES_PER_NAME = 53
+# Names a `hello_many` call greets within its opcode budget
+MAX_NAMES_PER_CALL = (OPCODE_BUDGET - HELLO_MANY_OPCODES) // OPCODES_PER_NAME
+_GREETING = "Hello, "
+_EMPTY_CALL_SIZE = 4 + 2
+
+
+def pack_names(names: Iterable[str]) -> Iterator[list[str]]:
+    """Splits names into the `names` of `hello_many` calls, each holding as many
+    names as fit its arguments, the log of its greetings and its opcode budget
+
+    :param Iterable[str] names: Names to greet, in order
+    :returns Iterator[list[str]]: The names of each call, in order"""
+    chunk: list[str] = []
+    # the method selector and the array's length, then the return value's prefix
+    # and the array's length
+    args_size = log_size = _EMPTY_CALL_SIZE
+    for name in names:
+        # each item is a 2 byte offset and a 2 byte length, then the string itself
+        name_size = 4 + len(name.encode())
+        greeting_size = name_size + len(_GREETING)
+        if (
+            _EMPTY_CALL_SIZE + name_size > MAX_ARGS_SIZE
+            or _EMPTY_CALL_SIZE + greeting_size > MAX_LOG_SIZE
+        ):
+            raise ValueError(f"Name {name[:32]!r}... is too long to greet")
+        if (
+            len(chunk) == MAX_NAMES_PER_CALL
+            or args_size + name_size > MAX_ARGS_SIZE
+            or log_size + greeting_size > MAX_LOG_SIZE
+        ):
+            yield chunk
+            chunk, args_size, log_size = [], _EMPTY_CALL_SIZE, _EMPTY_CALL_SIZE
+        chunk.append(name)
+        args_size += name_size
+        log_size += greeting_size
+    if chunk:
+        yield chunk
+
+
+class HelloWorldClient(AccountViews, hello_world_client.HelloWorldClient):
+    """Extends the generated HelloWorldClient, taking the same arguments"""
+
+    def __init__(self, algod_client: AlgodClient, **kwargs: typing.Any) -> None:
+        super().__init__(algod_client, **kwargs)
+        self.app_client = ApplicationClient(
+            algod_client,
+            self.app_spec,
+            confirmation_waiter=ConfirmationWaiter.shared(algod_client),
+            **kwargs,
+        )
+
+    def hello_all(self, names: Iterable[str], *, max_in_flight: int = 8) -> list[str]:
+        """Greets any number of names with `hello_many` calls, packing as many names as
+        fit into each call and as many calls as fit into each group
+
+        :param Iterable[str] names: Names to greet
+        :param int max_in_flight: (optional) Number of groups sent at once
+        :returns list[str]: The greetings, in the order of `names`
+        :raises BulkGroupError: If a group failed, after the groups before it were
+        sent"""
+        greetings: list[str] = []
+        results = BulkComposer(self.app_client, max_in_flight=max_in_flight).execute(
+            hello_world_client.HelloManyArgs(names=chunk) for chunk in pack_names(names)
+        )
+        for result in results:
+            if isinstance(result, BulkGroupError):
+                raise result
+            greetings += result.return_value
+        return greetings
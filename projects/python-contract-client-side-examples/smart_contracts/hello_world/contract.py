@@ -1,4 +1,4 @@
-from algopy import ARC4Contract, String
+from algopy import ARC4Contract, Bytes, String, arc4, op, urange
 from algopy.arc4 import abimethod
 
 
@@ -6,3 +6,18 @@ class HelloWorld(ARC4Contract):
     @abimethod()
     def hello(self, name: String) -> String:
         return "Hello, " + name
+
+    @abimethod()
+    def hello_many(
+        self, names: arc4.DynamicArray[arc4.String]
+    ) -> arc4.DynamicArray[arc4.String]:
+        # encodes the greetings in one pass, as appending to an ARC-4 array of
+        # strings re-encodes the heads of every item before it
+        count = names.length
+        head = op.extract(op.itob(count), 6, 2)
+        tail = Bytes()
+        for i in urange(count):
+            greeting = b"Hello, " + names[i].native.bytes
+            head += op.extract(op.itob(count * 2 + tail.length), 6, 2)
+            tail += op.extract(op.itob(greeting.length), 6, 2) + greeting
+        return arc4.DynamicArray[arc4.String].from_bytes(head + tail)
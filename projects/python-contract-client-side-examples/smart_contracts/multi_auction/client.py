@@ -0,0 +1,399 @@
+# mypy: disable-error-code="no-any-return, no-untyped-call, misc"
+import base64
+import dataclasses
+import os
+import struct
+import typing
+from collections.abc import Iterable, Mapping
+
+import algokit_utils
+from algosdk import transaction
+from algosdk.atomic_transaction_composer import (
+    TransactionSigner,
+    TransactionWithSigner,
+)
+from algosdk.constants import ZERO_ADDRESS
+from algosdk.encoding import decode_address, encode_address
+from algosdk.error import AlgodHTTPError
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts._helpers.application_client import ApplicationClient
+from smart_contracts._helpers.bulk import BulkCall, BulkComposer, BulkResult
+from smart_contracts._helpers.confirmations import ConfirmationWaiter
+from smart_contracts._helpers.fees import FeePooler
+from smart_contracts._helpers.references import (
+    NextIdRule,
+    ReferenceResolver,
+    References,
+)
+from smart_contracts._helpers.views import AccountViews
+from smart_contracts.artifacts.multi_auction import multi_auction_client
+
+# key prefixes of the `auctions` and `claims` BoxMaps in the MultiAuction contract
+AUCTIONS_BOX_PREFIX = b"a"
+CLAIMS_BOX_PREFIX = b"c"
+
+# ARC-4 layout of `AuctionState`: seller: address, asa: uint64, asa_amount: uint64,
+# end: uint64, bid: uint64, bidder: address, settled: bool
+_AUCTION_STATE_LAYOUT = struct.Struct(">32sQQQQ32sB")
+AUCTION_STATE_SIZE = _AUCTION_STATE_LAYOUT.size
+_ARC4_TRUE = 0x80
+# payment `start_auction` requires, for the MBR of the auction's box
+AUCTION_BOX_MBR = 2_500 + 400 * (len(AUCTIONS_BOX_PREFIX) + 8 + AUCTION_STATE_SIZE)
+# part of a bidder's first payment into an auction that goes to the MBR of their
+# claim box, rather than to their bid
+CLAIM_BOX_MBR = 2_500 + 400 * (len(CLAIMS_BOX_PREFIX) + 8 + 32 + 8)
+# payment `opt_into_asset` requires
+ASSET_OPT_IN_MBR = 100_000
+
+
+def auction_box_name(auction_id: int) -> bytes:
+    """Returns the name of the box holding the auction with the given id"""
+    return AUCTIONS_BOX_PREFIX + auction_id.to_bytes(8, "big")
+
+
+def claim_box_name(auction_id: int, bidder: str) -> bytes:
+    """Returns the name of the box holding what `bidder` paid into an auction"""
+    return CLAIMS_BOX_PREFIX + auction_id.to_bytes(8, "big") + decode_address(bidder)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class AuctionState:
+    seller: str
+    asa: int
+    asa_amount: int
+    end: int
+    bid: int
+    bidder: str
+    settled: bool = False
+
+    @property
+    def has_bid(self) -> bool:
+        return self.bidder != ZERO_ADDRESS
+
+    @property
+    def winner(self) -> str:
+        """The account `claim_asset` sends the ASA to, the seller without bids"""
+        return self.bidder if self.has_bid else self.seller
+
+    @classmethod
+    def decode(cls, value: bytes | bytearray | memoryview) -> "AuctionState":
+        """Decodes the raw value of an `auctions` box"""
+        view = memoryview(value)
+        if view.nbytes != AUCTION_STATE_SIZE:
+            raise ValueError(
+                f"Expected a {AUCTION_STATE_SIZE} byte AuctionState, "
+                f"got {view.nbytes} bytes"
+            )
+        seller, asa, asa_amount, end, bid, bidder, settled = (
+            _AUCTION_STATE_LAYOUT.unpack_from(view)
+        )
+        return cls(
+            seller=encode_address(seller),
+            asa=asa,
+            asa_amount=asa_amount,
+            end=end,
+            bid=bid,
+            bidder=encode_address(bidder),
+            settled=(settled & _ARC4_TRUE) != 0,
+        )
+
+    def encode(self) -> bytes:
+        return _AUCTION_STATE_LAYOUT.pack(
+            decode_address(self.seller),
+            self.asa,
+            self.asa_amount,
+            self.end,
+            self.bid,
+            decode_address(self.bidder),
+            _ARC4_TRUE if self.settled else 0,
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class Listing:
+    """An auction for `start_auctions` to start
+
+    :param int asset_id: ASA to auction
+    :param int asset_amount: Amount of the ASA to auction
+    :param int starting_price: Bids must be higher than this
+    :param int length: Seconds the auction runs for"""
+
+    asset_id: int
+    asset_amount: int
+    starting_price: int
+    length: int
+
+
+def _pays_seller(
+    args: Mapping[str, object], parameters: algokit_utils.TransactionParametersDict
+) -> bool:
+    return bool(parameters.get("accounts"))
+
+
+class MultiAuctionClient(AccountViews, multi_auction_client.MultiAuctionClient):
+    """Extends the generated MultiAuctionClient with typed access to the `auctions`
+    and `claims` box maps, and with starting, bidding on and settling many auctions
+    in batched groups
+
+    Takes the same arguments as the generated client. `start_auction`, `settle` and
+    `claim_asset` reference the boxes and accounts they use unless the caller passes
+    references of their own, while `bid` and `claim_bids` touch a box named after
+    their sender, so their references are simulated. Calls that send inner
+    transactions carry the fee for them."""
+
+    # only settling an auction with bids pays the seller, and only that settlement
+    # references the seller, so the two cases are probed apart
+    fee_pooler = FeePooler({multi_auction_client.SettleArgs.method(): _pays_seller})
+
+    def __init__(self, algod_client: AlgodClient, **kwargs: typing.Any) -> None:
+        super().__init__(algod_client, **kwargs)
+        self.app_client = ApplicationClient(
+            algod_client,
+            self.app_spec,
+            confirmation_waiter=ConfirmationWaiter.shared(algod_client),
+            fee_pooler=self.fee_pooler,
+            reference_resolver=ReferenceResolver(
+                {
+                    multi_auction_client.StartAuctionArgs.method(): NextIdRule(
+                        lambda: self.get_global_state().id_counter or 0,
+                        _start_auction_references,
+                    ),
+                    multi_auction_client.SettleArgs.method(): self._settle_references,
+                    multi_auction_client.ClaimAssetArgs.method(): (
+                        self._claim_asset_references
+                    ),
+                }
+            ),
+            **kwargs,
+        )
+
+    def get_auction(self, auction_id: int) -> AuctionState:
+        """Returns the state of the auction with the given id"""
+        return AuctionState.decode(self._get_box(auction_box_name(auction_id)))
+
+    def get_claim(self, auction_id: int, bidder: str) -> int | None:
+        """Returns what `bidder` paid into an auction and hasn't claimed back yet, or
+        None if they have no claim box in it"""
+        try:
+            value = self._get_box(claim_box_name(auction_id, bidder))
+        except AlgodHTTPError as ex:
+            if ex.code == 404:
+                return None
+            raise
+        return int.from_bytes(value, "big")
+
+    def start_auctions(self, listings: Iterable[Listing]) -> list[BulkResult]:
+        """Starts an auction for each listing, selling from this client's sender,
+        with as many auctions as fit in each group
+
+        The app is opted into ASAs it doesn't hold yet in the same groups. Groups run
+        one after the other, as auction ids are handed out in order, so another
+        sender starting auctions at the same time fails the groups it overtakes.
+
+        :param Iterable[Listing] listings: Auctions to start
+        :returns list[BulkResult]: The result of each `start_auction` call, holding
+        the auction id, or the error of its group"""
+        sender, signer = self._account()
+        sp = self._suggested_params()
+        held_assets = {
+            asset["asset-id"]
+            for asset in typing.cast(
+                dict[str, list[dict[str, int]]],
+                self.algod_client.account_info(self.app_address),
+            ).get("assets", [])
+        }
+        next_auction_id = (self.get_global_state().id_counter or 0) + 1
+        calls = []
+        for listing in listings:
+            if listing.asset_id not in held_assets:
+                calls.append(
+                    BulkCall(
+                        multi_auction_client.OptIntoAssetArgs.method(),
+                        {
+                            "asset": listing.asset_id,
+                            "mbr": self._payment(sp, ASSET_OPT_IN_MBR),
+                        },
+                    )
+                )
+                held_assets.add(listing.asset_id)
+            axfer = transaction.AssetTransferTxn(
+                sender,
+                sp,
+                self.app_address,
+                listing.asset_amount,
+                listing.asset_id,
+            )
+            calls.append(
+                BulkCall(
+                    multi_auction_client.StartAuctionArgs.method(),
+                    {
+                        "starting_price": listing.starting_price,
+                        "length": listing.length,
+                        "axfer": TransactionWithSigner(axfer, signer),
+                        "mbr": self._payment(sp, AUCTION_BOX_MBR),
+                    },
+                    {"boxes": [(0, auction_box_name(next_auction_id))]},
+                )
+            )
+            next_auction_id += 1
+
+        results = BulkComposer(self.app_client, max_in_flight=1).execute(calls)
+        return [
+            result
+            for call, result in zip(calls, results, strict=True)
+            if call.method == multi_auction_client.StartAuctionArgs.method()
+        ]
+
+    def bid_many(self, bids: Iterable[tuple[int, int]]) -> list[BulkResult]:
+        """Bids on many auctions from this client's sender, with as many bids as fit
+        in each group
+
+        Bids on the same auction are sent in the order given, each group only once
+        the groups holding earlier bids on its auctions are done, so a higher bid
+        never overtakes a lower one. Groups with no auction in common are sent
+        concurrently. The payment of the first bid in an auction also covers the MBR
+        of the sender's claim box, so if its group fails, later bids on that auction
+        fail too.
+
+        :param Iterable[tuple[int, int]] bids: Auction id and amount of each bid
+        :returns list[BulkResult]: The result of each bid, holding the new highest
+        bid, or the error of its group"""
+        sender, _ = self._account()
+        sp = self._suggested_params()
+        has_claim: dict[int, bool] = {}
+        calls = []
+        for auction_id, amount in bids:
+            if auction_id not in has_claim:
+                has_claim[auction_id] = self.get_claim(auction_id, sender) is not None
+            payment = amount if has_claim[auction_id] else amount + CLAIM_BOX_MBR
+            has_claim[auction_id] = True
+            calls.append(
+                BulkCall(
+                    multi_auction_client.BidArgs.method(),
+                    {"auction_id": auction_id, "pay": self._payment(sp, payment)},
+                    {"boxes": _claim_boxes(auction_id, sender)},
+                    lane=auction_id,
+                )
+            )
+        return list(BulkComposer(self.app_client).execute(calls))
+
+    def claim_bids_many(self, auction_ids: Iterable[int]) -> list[BulkResult]:
+        """Claims back what this client's sender paid into many auctions, beyond
+        their highest bid in auctions they're winning
+
+        :param Iterable[int] auction_ids: Auctions to claim from
+        :returns list[BulkResult]: The result of each claim, holding the amount paid
+        back, or the error of its group"""
+        sender, _ = self._account()
+        return list(
+            BulkComposer(self.app_client).execute(
+                BulkCall(
+                    multi_auction_client.ClaimBidsArgs.method(),
+                    {"auction_id": auction_id},
+                    {"boxes": _claim_boxes(auction_id, sender)},
+                )
+                for auction_id in auction_ids
+            )
+        )
+
+    def settle_many(self, auction_ids: Iterable[int]) -> list[BulkResult]:
+        """Settles many ended auctions, paying each winning bid to its seller
+
+        Winners then claim their ASA with `claim_assets_many`, and what they paid
+        beyond their winning bid with `claim_bids_many`.
+
+        :param Iterable[int] auction_ids: Auctions to settle
+        :returns list[BulkResult]: The result of each settlement, or the error of its
+        group"""
+        return list(
+            BulkComposer(self.app_client).execute(
+                multi_auction_client.SettleArgs(auction_id=auction_id)
+                for auction_id in auction_ids
+            )
+        )
+
+    def claim_assets_many(self, auction_ids: Iterable[int]) -> list[BulkResult]:
+        """Claims the ASA of many settled auctions this client's sender won, or
+        that didn't get any bids when the sender is their seller
+
+        The sender must be opted into each ASA. Each auction's box is deleted, and its
+        MBR goes back to the seller.
+
+        :param Iterable[int] auction_ids: Auctions to claim the ASA of
+        :returns list[BulkResult]: The result of each claim, or the error of its
+        group"""
+        return list(
+            BulkComposer(self.app_client).execute(
+                multi_auction_client.ClaimAssetArgs(auction_id=auction_id)
+                for auction_id in auction_ids
+            )
+        )
+
+    def _get_box(self, name: bytes) -> bytes:
+        box = typing.cast(
+            dict[str, str],
+            self.algod_client.application_box_by_name(self.app_id, name),
+        )
+        return base64.b64decode(box["value"])
+
+    def _account(self) -> tuple[str, TransactionSigner]:
+        sender, signer = self.app_client.sender, self.app_client.signer
+        if sender is None or signer is None:
+            raise ValueError("Batched calls need a client with a sender and signer")
+        return sender, signer
+
+    def _suggested_params(self) -> transaction.SuggestedParams:
+        return self.app_client.suggested_params or self.algod_client.suggested_params()
+
+    def _payment(
+        self, sp: transaction.SuggestedParams, amount: int
+    ) -> TransactionWithSigner:
+        # payments of the same amount in one batch would otherwise be the same
+        # transaction, which can only be sent once
+        sender, signer = self._account()
+        txn = transaction.PaymentTxn(
+            sender, sp, self.app_address, amount, note=os.urandom(8)
+        )
+        return TransactionWithSigner(txn, signer)
+
+    def _settle_references(self, args: Mapping[str, object]) -> References | None:
+        # settling pays the winning bid, out of the winner's claim, to the seller
+        auction_id = typing.cast(int, args["auction_id"])
+        try:
+            auction = self.get_auction(auction_id)
+        except AlgodHTTPError:
+            return None
+        if not auction.has_bid:
+            return References(boxes=((0, auction_box_name(auction_id)),))
+        return References(
+            boxes=tuple(_claim_boxes(auction_id, auction.bidder)),
+            accounts=(auction.seller,),
+        )
+
+    def _claim_asset_references(self, args: Mapping[str, object]) -> References | None:
+        # claiming sends the ASA, and pays the auction box's MBR back to the seller
+        auction_id = typing.cast(int, args["auction_id"])
+        try:
+            auction = self.get_auction(auction_id)
+        except AlgodHTTPError:
+            return None
+        return References(
+            boxes=((0, auction_box_name(auction_id)),),
+            accounts=(auction.seller,),
+            foreign_assets=(auction.asa,),
+        )
+
+
+def _start_auction_references(
+    auction_id: int, args: Mapping[str, object]
+) -> References:
+    # start_auction stores the auction under the next id
+    return References(boxes=((0, auction_box_name(auction_id)),))
+
+
+def _claim_boxes(auction_id: int, bidder: str) -> list[tuple[int, bytes]]:
+    return [
+        (0, auction_box_name(auction_id)),
+        (0, claim_box_name(auction_id, bidder)),
+    ]
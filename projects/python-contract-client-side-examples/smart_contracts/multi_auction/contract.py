@@ -0,0 +1,236 @@
+from algopy import (
+    Account,
+    ARC4Contract,
+    Asset,
+    BoxMap,
+    Bytes,
+    Global,
+    Txn,
+    UInt64,
+    arc4,
+    gtxn,
+    itxn,
+    op,
+    subroutine,
+)
+
+
+class AuctionState(arc4.Struct, kw_only=True):
+    seller: arc4.Address
+    asa: arc4.UInt64
+    asa_amount: arc4.UInt64
+    end: arc4.UInt64
+    # the starting price until the first bid
+    bid: arc4.UInt64
+    # the zero address until the first bid
+    bidder: arc4.Address
+    # set once the seller is paid, from then on the winner can claim the ASA
+    settled: arc4.Bool
+
+
+class MultiAuction(ARC4Contract):
+    def __init__(self) -> None:
+        self.id_counter = UInt64(0)
+        self.auctions = BoxMap(UInt64, AuctionState, key_prefix=b"a")
+        # amount each bidder paid into an auction, keyed by auction id and bidder
+        self.claims = BoxMap(Bytes, UInt64, key_prefix=b"c")
+
+    @arc4.abimethod
+    def opt_into_asset(self, asset: Asset, mbr: gtxn.PaymentTransaction) -> None:
+        # Any seller can opt the app into the ASA they auction, paying for its MBR
+        assert not Global.current_application_address.is_opted_in(
+            asset
+        ), "ASA already opted in"
+        assert (
+            mbr.receiver == Global.current_application_address
+        ), "mbr must pay this app"
+        assert mbr.amount == Global.asset_opt_in_min_balance, "mbr must cover opt in"
+
+        # Submit opt-in transaction: 0 asset transfer to self
+        itxn.AssetTransfer(
+            asset_receiver=Global.current_application_address,
+            xfer_asset=asset,
+        ).submit()
+
+    @arc4.abimethod
+    def start_auction(
+        self,
+        starting_price: UInt64,
+        length: UInt64,
+        axfer: gtxn.AssetTransferTransaction,
+        mbr: gtxn.PaymentTransaction,
+    ) -> UInt64:
+        # Verify axfer
+        assert axfer.sender == Txn.sender, "axfer sender must match transaction sender"
+        assert (
+            axfer.asset_receiver == Global.current_application_address
+        ), "axfer must transfer to this app"
+        assert mbr.sender == Txn.sender, "mbr sender must match transaction sender"
+        assert (
+            mbr.receiver == Global.current_application_address
+        ), "mbr must pay this app"
+        # The winning bid is paid to the seller, so it must be able to fund an
+        # account the seller closed in the meantime
+        assert (
+            starting_price >= Global.min_balance
+        ), "starting price must cover the minimum balance"
+
+        self.id_counter += 1
+
+        pre_new_auction_box, exists = op.AcctParamsGet.acct_min_balance(
+            Global.current_application_address
+        )
+        assert exists
+        self.auctions[self.id_counter] = AuctionState(
+            seller=arc4.Address(Txn.sender),
+            asa=arc4.UInt64(axfer.xfer_asset.id),
+            asa_amount=arc4.UInt64(axfer.asset_amount),
+            end=arc4.UInt64(Global.latest_timestamp + length),
+            bid=arc4.UInt64(starting_price),
+            bidder=arc4.Address(),
+            settled=arc4.Bool(False),  # noqa: FBT003
+        )
+        post_new_auction_box, exists = op.AcctParamsGet.acct_min_balance(
+            Global.current_application_address
+        )
+        assert exists
+        assert mbr.amount == (
+            post_new_auction_box - pre_new_auction_box
+        ), "mbr must cover the auction box"
+
+        return self.id_counter
+
+    @arc4.abimethod
+    def bid(self, auction_id: UInt64, pay: gtxn.PaymentTransaction) -> UInt64:
+        auction = self.auctions[auction_id].copy()
+
+        # Ensure auction hasn't ended
+        assert Global.latest_timestamp < auction.end.native, "auction has ended"
+
+        # Verify payment transaction
+        assert pay.sender == Txn.sender, "payment sender must match transaction sender"
+        assert (
+            pay.receiver == Global.current_application_address
+        ), "payment must pay this app"
+
+        # The first bid of a bidder creates their claim box, paying its MBR out of
+        # the payment
+        amount = pay.amount
+        key = self.claim_key(auction_id, Txn.sender)
+        if key not in self.claims:
+            pre_new_claim_box, exists = op.AcctParamsGet.acct_min_balance(
+                Global.current_application_address
+            )
+            assert exists
+            self.claims[key] = UInt64(0)
+            post_new_claim_box, exists = op.AcctParamsGet.acct_min_balance(
+                Global.current_application_address
+            )
+            assert exists
+            amount -= post_new_claim_box - pre_new_claim_box
+        assert amount > auction.bid.native, "Bid must be higher than previous bid"
+
+        self.auctions[auction_id].bid = arc4.UInt64(amount)
+        self.auctions[auction_id].bidder = arc4.Address(Txn.sender)
+        self.claims[key] += amount
+
+        return amount  # Return the new highest bid amount
+
+    @arc4.abimethod
+    def claim_bids(self, auction_id: UInt64) -> UInt64:
+        key = self.claim_key(auction_id, Txn.sender)
+        amount = self.claims[key]
+
+        # the highest bid stays until the auction is settled
+        highest_bid = self.unsettled_bid(auction_id, Txn.sender)
+        amount -= highest_bid
+
+        if highest_bid:
+            self.claims[key] = highest_bid
+        else:
+            amount += self.delete_claim(key)
+
+        itxn.Payment(
+            amount=amount,
+            receiver=Txn.sender,
+        ).submit()
+
+        return amount
+
+    @arc4.abimethod
+    def settle(self, auction_id: UInt64) -> None:
+        auction = self.auctions[auction_id].copy()
+        assert Global.latest_timestamp > auction.end.native, "auction has not ended"
+        assert not auction.settled.native, "auction already settled"
+
+        # The winner claims the ASA with claim_asset, so a winner who can't hold it
+        # doesn't keep the seller from being paid
+        self.auctions[auction_id].settled = arc4.Bool(True)  # noqa: FBT003
+        if auction.bidder != arc4.Address():
+            # the rest of the winner's claim is theirs to claim_bids back
+            key = self.claim_key(auction_id, auction.bidder.native)
+            self.claims[key] -= auction.bid.native
+            itxn.Payment(
+                amount=auction.bid.native, receiver=auction.seller.native
+            ).submit()
+
+    @arc4.abimethod
+    def claim_asset(self, auction_id: UInt64) -> None:
+        auction = self.auctions[auction_id].copy()
+        assert auction.settled.native, "auction has not been settled"
+
+        # Without bids the ASA goes back to the seller
+        winner = auction.seller.native
+        if auction.bidder != arc4.Address():
+            winner = auction.bidder.native
+        assert Txn.sender == winner, "only the winner can claim the asset"
+
+        pre_del_box, exists = op.AcctParamsGet.acct_min_balance(
+            Global.current_application_address
+        )
+        assert exists
+        del self.auctions[auction_id]
+        post_del_box, exists = op.AcctParamsGet.acct_min_balance(
+            Global.current_application_address
+        )
+        assert exists
+
+        itxn.AssetTransfer(
+            xfer_asset=Asset(auction.asa.native),
+            asset_receiver=winner,
+            asset_amount=auction.asa_amount.native,
+        ).submit()
+        # The seller paid for the auction's box, unless they closed their account
+        # since, when its MBR couldn't fund it and goes to the winner instead
+        mbr_receiver = auction.seller.native
+        seller_balance, seller_funded = op.AcctParamsGet.acct_balance(mbr_receiver)
+        if not seller_funded:
+            mbr_receiver = winner
+        itxn.Payment(amount=pre_del_box - post_del_box, receiver=mbr_receiver).submit()
+
+    @subroutine
+    def claim_key(self, auction_id: UInt64, bidder: Account) -> Bytes:
+        return op.itob(auction_id) + bidder.bytes
+
+    @subroutine
+    def unsettled_bid(self, auction_id: UInt64, bidder: Account) -> UInt64:
+        # returns the bid of `bidder` if it's the highest and not yet paid out
+        if auction_id in self.auctions:
+            auction = self.auctions[auction_id].copy()
+            if not auction.settled.native and bidder == auction.bidder.native:
+                return auction.bid.native
+        return UInt64(0)
+
+    @subroutine
+    def delete_claim(self, key: Bytes) -> UInt64:
+        # returns the MBR the claim box freed
+        pre_del_box, exists = op.AcctParamsGet.acct_min_balance(
+            Global.current_application_address
+        )
+        assert exists
+        del self.claims[key]
+        post_del_box, exists = op.AcctParamsGet.acct_min_balance(
+            Global.current_application_address
+        )
+        assert exists
+        return pre_del_box - post_del_box
@@ -0,0 +1,62 @@
+# mypy: disable-error-code="no-untyped-call, misc"
+import typing
+from collections.abc import Mapping
+
+import algokit_utils
+from algosdk.constants import ZERO_ADDRESS
+from algosdk.encoding import encode_address
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts._helpers.application_client import ApplicationClient
+from smart_contracts._helpers.confirmations import ConfirmationWaiter
+from smart_contracts._helpers.fees import FeePooler
+from smart_contracts._helpers.references import ReferenceResolver, References
+from smart_contracts._helpers.views import AccountViews
+from smart_contracts.artifacts.refund_auction import refund_auction_client
+
+
+def _outbids(
+    args: Mapping[str, object], parameters: algokit_utils.TransactionParametersDict
+) -> bool:
+    return bool(parameters.get("accounts"))
+
+
+class RefundAuctionClient(AccountViews, refund_auction_client.RefundAuctionClient):
+    """Extends the generated RefundAuctionClient, taking the same arguments
+
+    Bidders need no opt in, as `bid` pays the bidder it outbids back straight away.
+    `bid` references that bidder unless the caller passes references of their own,
+    and calls that send inner transactions (`opt_into_asset`, `bid`, `claim_asset`
+    and `delete_application`) carry the fee for them unless the caller sets a flat
+    fee."""
+
+    # inner transaction counts are a property of the contract, so every client learns
+    # them once. Only a bid outbidding someone pays them back, and only such a bid
+    # references the bidder, so the two cases are probed apart
+    fee_pooler = FeePooler({refund_auction_client.BidArgs.method(): _outbids})
+
+    def __init__(self, algod_client: AlgodClient, **kwargs: typing.Any) -> None:
+        super().__init__(algod_client, **kwargs)
+        self.app_client = ApplicationClient(
+            algod_client,
+            self.app_spec,
+            confirmation_waiter=ConfirmationWaiter.shared(algod_client),
+            fee_pooler=self.fee_pooler,
+            reference_resolver=ReferenceResolver(
+                {refund_auction_client.BidArgs.method(): self._bid_references}
+            ),
+            **kwargs,
+        )
+
+    def get_previous_bidder(self) -> str | None:
+        """Returns the highest bidder so far, or None before the first bid"""
+        previous_bidder = self.get_global_state().previous_bidder.as_bytes
+        if not previous_bidder:
+            return None
+        address = encode_address(previous_bidder)
+        return None if address == ZERO_ADDRESS else address
+
+    def _bid_references(self, args: Mapping[str, object]) -> References:
+        # the bid pays back the bidder it outbids
+        previous_bidder = self.get_previous_bidder()
+        return References(accounts=(previous_bidder,) if previous_bidder else ())
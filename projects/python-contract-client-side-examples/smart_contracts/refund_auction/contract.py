@@ -0,0 +1,117 @@
+from algopy import (
+    Account,
+    ARC4Contract,
+    Asset,
+    Global,
+    Txn,
+    UInt64,
+    arc4,
+    gtxn,
+    itxn,
+)
+
+
+class RefundAuction(ARC4Contract):
+    def __init__(self) -> None:
+        self.auction_end = UInt64(0)
+        self.previous_bid = UInt64(0)
+        self.asa_amount = UInt64(0)
+        self.asa = Asset()
+        self.previous_bidder = Account()
+
+    @arc4.abimethod
+    def opt_into_asset(self, asset: Asset) -> None:
+        # Only allow app creator to opt the app account into a ASA
+        assert Txn.sender == Global.creator_address, "Only creator can opt in to ASA"
+        # Verify a ASA hasn't already been opted into
+        assert self.asa.id == 0, "ASA already opted in"
+        # Save ASA ID in global state
+        self.asa = asset
+
+        # Submit opt-in transaction: 0 asset transfer to self
+        itxn.AssetTransfer(
+            asset_receiver=Global.current_application_address,
+            xfer_asset=asset,
+        ).submit()
+
+    @arc4.abimethod
+    def start_auction(
+        self,
+        starting_price: UInt64,
+        length: UInt64,
+        axfer: gtxn.AssetTransferTransaction,
+    ) -> UInt64:
+        assert (
+            Txn.sender == Global.creator_address
+        ), "auction must be started by creator"
+
+        # Ensure the auction hasn't already been started
+        assert self.auction_end == 0, "auction already started"
+
+        # Verify axfer
+        assert (
+            axfer.asset_receiver == Global.current_application_address
+        ), "axfer must transfer to this app"
+
+        # Every bid is paid back once outbid, so it must be able to fund an account
+        # its bidder closed in the meantime, or that refund would block later bids
+        assert (
+            starting_price >= Global.min_balance
+        ), "starting price must cover the minimum balance"
+
+        # Set global state
+        self.asa_amount = axfer.asset_amount
+        self.auction_end = Global.latest_timestamp + length
+        self.previous_bid = starting_price
+
+        return Global.latest_timestamp
+
+    @arc4.abimethod
+    def bid(self, pay: gtxn.PaymentTransaction) -> UInt64:
+        # Ensure auction hasn't ended
+        assert Global.latest_timestamp < self.auction_end, "auction has ended"
+
+        # Verify payment transaction
+        assert pay.sender == Txn.sender, "payment sender must match transaction sender"
+        assert (
+            pay.receiver == Global.current_application_address
+        ), "payment must pay this app"
+        assert pay.amount > self.previous_bid, "Bid must be higher than previous bid"
+
+        # Pay the previous bidder back, so nobody has funds left to claim. The first
+        # bid has nobody to pay back
+        if self.previous_bidder != Account():
+            itxn.Payment(
+                amount=self.previous_bid, receiver=self.previous_bidder
+            ).submit()
+
+        # set global state
+        self.previous_bid = pay.amount
+        self.previous_bidder = pay.sender
+
+        return self.previous_bid  # Return the new highest bid amount
+
+    @arc4.abimethod
+    def claim_asset(self, asset: Asset) -> None:
+        assert Global.latest_timestamp > self.auction_end, "auction has not ended"
+        assert (
+            Txn.sender == self.previous_bidder
+        ), "only previous bidder can claim asset"
+
+        # Send ASA to previous bidder
+        itxn.AssetTransfer(
+            xfer_asset=asset,
+            asset_close_to=self.previous_bidder,
+            asset_receiver=self.previous_bidder,
+            asset_amount=self.asa_amount,
+        ).submit()
+
+    @arc4.abimethod(allow_actions=["DeleteApplication"])
+    def delete_application(self) -> None:
+        assert Txn.sender == Global.creator_address, "Only creator can delete app"
+
+        # The winning bid is all that's left, along with the app's own balance
+        itxn.Payment(
+            receiver=Global.creator_address,
+            close_remainder_to=Global.creator_address,
+        ).submit()
@@ -0,0 +1,91 @@
+# mypy: disable-error-code="misc"
+import dataclasses
+from collections.abc import Iterable
+
+import numpy as np
+import numpy.typing as npt
+
+from smart_contracts.tictactoe.client import GameState
+
+# cells of every line, in the order `TicTacToe.is_game_over` checks them: each row
+# then the column of the same index, then both diagonals
+LINES = np.array(
+    [
+        [0, 1, 2],
+        [0, 3, 6],
+        [3, 4, 5],
+        [1, 4, 7],
+        [6, 7, 8],
+        [2, 5, 8],
+        [0, 4, 8],
+        [2, 4, 6],
+    ]
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class BoardAnalysis:
+    """What `analyze` found out about each of N boards
+
+    :param NDArray[bool] is_over: (N,) Whether `is_game_over` ends the game
+    :param NDArray[bool] is_draw: (N,) Whether `is_game_over` calls it a draw. Nine
+    equal marks, its draw check, also complete every line, so like the contract's
+    this never holds
+    :param NDArray[uint8] winner: (N,) Mark of the first line `is_game_over` finds
+    complete, 0 without one
+    :param NDArray[bool] is_full: (N,) Whether every cell is marked. The contract only
+    ends games on a line, so full boards without one stay open with no legal move
+    :param NDArray[bool] legal_moves: (N, 9) Cells `move` may mark, those still
+    empty in games that aren't over"""
+
+    is_over: npt.NDArray[np.bool_]
+    is_draw: npt.NDArray[np.bool_]
+    winner: npt.NDArray[np.uint8]
+    is_full: npt.NDArray[np.bool_]
+    legal_moves: npt.NDArray[np.bool_]
+
+
+def analyze(boards: npt.NDArray[np.uint8]) -> BoardAnalysis:
+    """Evaluates many boards at once, as `TicTacToe.is_game_over` and `move` would
+
+    :param NDArray[uint8] boards: (N, 9) boards, a row per board of its cells from the
+    top left, as in `GameState.board`
+    :returns BoardAnalysis: The outcome of each board"""
+    if boards.ndim != 2 or boards.shape[1] != 9:
+        raise ValueError(f"Expected boards of shape (N, 9), got {boards.shape}")
+    if boards.dtype != np.uint8:
+        raise ValueError(f"Expected boards of dtype uint8, got {boards.dtype}")
+
+    # (N, 8, 3): the marks on each line of each board
+    lines = np.take(boards, LINES, axis=1)
+    complete = (
+        (lines[:, :, 0] == lines[:, :, 1])
+        & (lines[:, :, 1] == lines[:, :, 2])
+        & (lines[:, :, 0] != 0)
+    )
+    has_line = complete.any(axis=1)
+    first_line = complete.argmax(axis=1)[:, np.newaxis]
+    first_mark = np.take_along_axis(lines[:, :, 0], first_line, axis=1)[:, 0]
+    winner = np.where(has_line, first_mark, 0).astype(np.uint8)
+
+    all_equal = (boards == boards[:, :1]).all(axis=1) & (boards[:, 0] != 0)
+    is_draw = all_equal & ~has_line
+    is_over = has_line | is_draw
+    empty = boards == 0
+    return BoardAnalysis(
+        is_over=is_over,
+        is_draw=is_draw,
+        winner=winner,
+        is_full=~empty.any(axis=1),
+        legal_moves=empty & ~is_over[:, np.newaxis],
+    )
+
+
+def boards_of(games: Iterable[GameState]) -> npt.NDArray[np.uint8]:
+    """Stacks the boards of games, e.g. from `TicTacToeClient.iter_games`, for
+    `analyze`
+
+    :param Iterable[GameState] games: Games to take the boards of
+    :returns NDArray[uint8]: (N, 9) boards, in the order of `games`"""
+    cells = b"".join(game.board for game in games)
+    return np.frombuffer(cells, dtype=np.uint8).reshape(-1, 9)
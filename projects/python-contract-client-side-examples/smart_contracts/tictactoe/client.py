@@ -0,0 +1,190 @@
+# mypy: disable-error-code="no-any-return, no-untyped-call, misc"
+import dataclasses
+import struct
+import typing
+from collections.abc import Callable, Iterable, Iterator
+
+from algosdk.constants import ZERO_ADDRESS
+from algosdk.encoding import decode_address
+from algosdk.v2client.algod import AlgodClient
+from algosdk.v2client.indexer import IndexerClient
+
+from smart_contracts._helpers.application_client import ApplicationClient
+from smart_contracts._helpers.box_maps import BoxMap
+from smart_contracts._helpers.confirmations import ConfirmationWaiter
+from smart_contracts._helpers.fees import FeePooler
+from smart_contracts._helpers.players import PlayersRule, encode_address
+from smart_contracts._helpers.references import (
+    NextIdRule,
+    ReferenceResolver,
+    References,
+)
+from smart_contracts._helpers.views import AccountViews
+from smart_contracts.artifacts.tictactoe import tic_tac_toe_client
+
+# key prefix of the `games` BoxMap in the TicTacToe contract
+GAMES_BOX_PREFIX = b"games"
+
+# ARC-4 layout of `GameState`: board: byte[9], host: address, guest: address,
+# is_over: bool, turns: uint8. Every field is static, so each one lives at a fixed
+# offset and the whole struct is always 75 bytes.
+_GAME_STATE_LAYOUT = struct.Struct(">9s32s32sBB")
+GAME_STATE_SIZE = _GAME_STATE_LAYOUT.size
+# payment `new_game` requires, for the MBR of the game's box
+NEW_GAME_MBR = 2_500 + 400 * (len(GAMES_BOX_PREFIX) + 8 + GAME_STATE_SIZE)
+_ARC4_TRUE = 0x80
+
+
+def encode_game_id(game_id: int) -> bytes:
+    """Encodes a game id as the `games` box maps of the TicTacToe contracts key it"""
+    return game_id.to_bytes(8, "big")
+
+
+def decode_game_id(key: bytes) -> int:
+    """Decodes a game id encoded by `encode_game_id`"""
+    return int.from_bytes(key, "big")
+
+
+def game_box_name(game_id: int) -> bytes:
+    """Returns the name of the box holding the game with the given id"""
+    return GAMES.box_name(game_id)
+
+
+def game_id_from_box_name(box_name: bytes) -> int | None:
+    """Returns the game id stored in a box name, or None if it isn't a `games` box"""
+    return GAMES.key_from_box_name(box_name)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class GameState:
+    board: bytes
+    host: str
+    guest: str
+    is_over: bool
+    turns: int
+
+    @property
+    def has_guest(self) -> bool:
+        return self.guest != ZERO_ADDRESS
+
+    @classmethod
+    def decode(cls, value: bytes | bytearray | memoryview) -> "GameState":
+        """Decodes the raw value of a `games` box"""
+        view = memoryview(value)
+        if view.nbytes != GAME_STATE_SIZE:
+            raise ValueError(
+                f"Expected a {GAME_STATE_SIZE} byte GameState, got {view.nbytes} bytes"
+            )
+        board, host, guest, is_over, turns = _GAME_STATE_LAYOUT.unpack_from(view)
+        return cls(
+            board=board,
+            host=encode_address(host),
+            guest=encode_address(guest),
+            is_over=(is_over & _ARC4_TRUE) != 0,
+            turns=turns,
+        )
+
+    @classmethod
+    def decode_many(
+        cls, values: Iterable[bytes | bytearray | memoryview]
+    ) -> list["GameState"]:
+        """Decodes the raw values of many `games` boxes, preserving their order"""
+        return [cls.decode(value) for value in values]
+
+    def encode(self) -> bytes:
+        return _GAME_STATE_LAYOUT.pack(
+            self.board,
+            decode_address(self.host),
+            decode_address(self.guest),
+            _ARC4_TRUE if self.is_over else 0,
+            self.turns,
+        )
+
+
+GAMES = BoxMap(GAMES_BOX_PREFIX, 8, encode_game_id, decode_game_id, GameState.decode)
+
+
+class TicTacToeClient(AccountViews, tic_tac_toe_client.TicTacToeClient):
+    """Extends the generated TicTacToeClient with typed access to the `games` box map
+
+    Takes the same arguments as the generated client. Box and account references of
+    ABI method calls are filled in from the `games` key prefix unless the caller
+    passes references of their own, and `delete_game` carries the fee for its refund
+    payment."""
+
+    fee_pooler = FeePooler()
+
+    def __init__(self, algod_client: AlgodClient, **kwargs: typing.Any) -> None:
+        super().__init__(algod_client, **kwargs)
+        self.app_client = ApplicationClient(
+            algod_client,
+            self.app_spec,
+            confirmation_waiter=ConfirmationWaiter.shared(algod_client),
+            fee_pooler=self.fee_pooler,
+            reference_resolver=ReferenceResolver(
+                {
+                    tic_tac_toe_client.NewGameArgs.method(): NextIdRule(
+                        lambda: self.get_global_state().id_counter or 0,
+                        lambda game_id, args: GAMES.references(game_id),
+                    ),
+                    tic_tac_toe_client.DeleteGameArgs.method(): GAMES.references_to(
+                        "game_id"
+                    ),
+                    tic_tac_toe_client.JoinArgs.method(): GAMES.references_to(
+                        "game_id"
+                    ),
+                    tic_tac_toe_client.MoveArgs.method(): PlayersRule(
+                        self.get_game, _move_references
+                    ),
+                }
+            ),
+            **kwargs,
+        )
+
+    def get_game(self, game_id: int) -> GameState:
+        """Returns the state of the game with the given id"""
+        return GAMES.get(self.algod_client, self.app_id, game_id)
+
+    def iter_games(
+        self,
+        predicate: Callable[[GameState], bool] | None = None,
+        *,
+        indexer_client: IndexerClient | None = None,
+        page_size: int = 1000,
+        max_in_flight: int = 16,
+    ) -> Iterator[tuple[int, GameState]]:
+        """Streams `(game_id, game)` for every game box, in the order values arrive
+
+        :param predicate: (optional) Only yield games for which this returns True, e.g.
+        `is_open` or `involves(address)`
+        :param IndexerClient indexer_client: (optional) Page box names through the indexer
+        rather than listing them all from algod in one response
+        :param int page_size: Number of box names requested per indexer page
+        :param int max_in_flight: Maximum number of box values fetched concurrently"""
+        game_ids = GAMES.iter_keys(
+            self.algod_client, self.app_id, indexer_client, page_size
+        )
+        for game_id, game in GAMES.iter_items(
+            self.algod_client, self.app_id, game_ids, max_in_flight
+        ):
+            if predicate is None or predicate(game):
+                yield game_id, game
+
+
+def _move_references(game_id: int, players: tuple[str, ...]) -> References:
+    # the move that ends a game updates the local state of both players
+    return dataclasses.replace(GAMES.references(game_id), accounts=players)
+
+
+def is_open(game: GameState) -> bool:
+    """Matches games still waiting for a guest"""
+    return not game.has_guest and not game.is_over
+
+
+def involves(address: str) -> Callable[[GameState], bool]:
+    """Returns a predicate matching games where `address` is the host or guest"""
+
+    def predicate(game: GameState) -> bool:
+        return address in (game.host, game.guest)
+
+    return predicate
@@ -0,0 +1,152 @@
+# mypy: disable-error-code="no-any-return, no-untyped-call, misc"
+import dataclasses
+import struct
+import typing
+
+from algosdk.constants import ZERO_ADDRESS
+from algosdk.encoding import decode_address
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts._helpers.application_client import ApplicationClient
+from smart_contracts._helpers.box_maps import BoxMap
+from smart_contracts._helpers.confirmations import ConfirmationWaiter
+from smart_contracts._helpers.fees import FeePooler
+from smart_contracts._helpers.players import PlayersRule, encode_address
+from smart_contracts._helpers.references import (
+    NextIdRule,
+    ReferenceResolver,
+    References,
+)
+from smart_contracts._helpers.views import AccountViews
+from smart_contracts.artifacts.tictactoe_bitboard import tic_tac_toe_bitboard_client
+from smart_contracts.tictactoe.client import decode_game_id, encode_game_id
+
+# key prefix of the `games` BoxMap in the TicTacToeBitboard contract
+GAMES_BOX_PREFIX = b"g"
+
+# ARC-4 layout of `GameState`: board: uint64, host: address, guest: address, where
+# the board packs the host's marks from bit 0, the guest's from bit 16, the turns
+# played from bit 32 and whether the game is over at bit 48
+_GAME_STATE_LAYOUT = struct.Struct(">Q32s32s")
+GAME_STATE_SIZE = _GAME_STATE_LAYOUT.size
+# payment `new_game` requires, for the MBR of the game's box
+NEW_GAME_MBR = 2_500 + 400 * (len(GAMES_BOX_PREFIX) + 8 + GAME_STATE_SIZE)
+_GUEST_SHIFT = 16
+_TURNS_SHIFT = 32
+_IS_OVER = 1 << 48
+_CELLS = 0x1FF
+# marks TicTacToe stores in the cells of its board
+HOST_MARK = 1
+GUEST_MARK = 2
+
+
+def game_box_name(game_id: int) -> bytes:
+    """Returns the name of the box holding the game with the given id"""
+    return GAMES.box_name(game_id)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class GameState:
+    host_marks: int
+    guest_marks: int
+    host: str
+    guest: str
+    is_over: bool
+    turns: int
+
+    @property
+    def has_guest(self) -> bool:
+        return self.guest != ZERO_ADDRESS
+
+    @property
+    def board(self) -> bytes:
+        """The board cell by cell, as TicTacToe stores it, with `HOST_MARK` or
+        `GUEST_MARK` in the cells that are taken and 0 in the others"""
+        return bytes(
+            (
+                HOST_MARK
+                if self.host_marks >> cell & 1
+                else GUEST_MARK if self.guest_marks >> cell & 1 else 0
+            )
+            for cell in range(9)
+        )
+
+    @classmethod
+    def decode(cls, value: bytes | bytearray | memoryview) -> "GameState":
+        """Decodes the raw value of a `games` box"""
+        view = memoryview(value)
+        if view.nbytes != GAME_STATE_SIZE:
+            raise ValueError(
+                f"Expected a {GAME_STATE_SIZE} byte GameState, got {view.nbytes} bytes"
+            )
+        board, host, guest = _GAME_STATE_LAYOUT.unpack_from(view)
+        return cls(
+            host_marks=board & _CELLS,
+            guest_marks=board >> _GUEST_SHIFT & _CELLS,
+            host=encode_address(host),
+            guest=encode_address(guest),
+            is_over=(board & _IS_OVER) != 0,
+            turns=board >> _TURNS_SHIFT & 0xFF,
+        )
+
+    def encode(self) -> bytes:
+        board = (
+            self.host_marks
+            | self.guest_marks << _GUEST_SHIFT
+            | self.turns << _TURNS_SHIFT
+            | (_IS_OVER if self.is_over else 0)
+        )
+        return _GAME_STATE_LAYOUT.pack(
+            board, decode_address(self.host), decode_address(self.guest)
+        )
+
+
+GAMES = BoxMap(GAMES_BOX_PREFIX, 8, encode_game_id, decode_game_id, GameState.decode)
+
+
+class TicTacToeBitboardClient(
+    AccountViews, tic_tac_toe_bitboard_client.TicTacToeBitboardClient
+):
+    """Extends the generated TicTacToeBitboardClient with typed access to the `games`
+    box map
+
+    Takes the same arguments as the generated client, and fills in references and
+    fees of ABI method calls as TicTacToeClient does."""
+
+    fee_pooler = FeePooler()
+
+    def __init__(self, algod_client: AlgodClient, **kwargs: typing.Any) -> None:
+        super().__init__(algod_client, **kwargs)
+        self.app_client = ApplicationClient(
+            algod_client,
+            self.app_spec,
+            confirmation_waiter=ConfirmationWaiter.shared(algod_client),
+            fee_pooler=self.fee_pooler,
+            reference_resolver=ReferenceResolver(
+                {
+                    tic_tac_toe_bitboard_client.NewGameArgs.method(): NextIdRule(
+                        lambda: self.get_global_state().id_counter or 0,
+                        lambda game_id, args: GAMES.references(game_id),
+                    ),
+                    tic_tac_toe_bitboard_client.DeleteGameArgs.method(): (
+                        GAMES.references_to("game_id")
+                    ),
+                    tic_tac_toe_bitboard_client.JoinArgs.method(): (
+                        GAMES.references_to("game_id")
+                    ),
+                    tic_tac_toe_bitboard_client.MoveArgs.method(): PlayersRule(
+                        self.get_game, _move_references
+                    ),
+                }
+            ),
+            **kwargs,
+        )
+
+    def get_game(self, game_id: int) -> GameState:
+        """Returns the state of the game with the given id"""
+        return GAMES.get(self.algod_client, self.app_id, game_id)
+
+
+def _move_references(game_id: int, players: tuple[str, ...]) -> References:
+    # the move that ends a game updates the local state of both players
+    return dataclasses.replace(GAMES.references(game_id), accounts=players)
@@ -0,0 +1,162 @@
+# pyright: reportMissingModuleSource=false
+from algopy import (
+    ARC4Contract,
+    BoxMap,
+    Global,
+    LocalState,
+    OnCompleteAction,
+    Txn,
+    UInt64,
+    arc4,
+    gtxn,
+    itxn,
+    op,
+    subroutine,
+)
+
+# Bits of the bitboard: the host's marks, one per cell, from bit 0, the guest's from
+# bit 16, the number of turns played from bit 32 and whether the game is over at
+# bit 48, i.e. 0x000O_00TT_0GGG_0HHH
+GUEST_SHIFT = 16
+TURNS_SHIFT = 32
+IS_OVER = 1 << 48
+CELLS = 0x1FF
+TURN = 1 << TURNS_SHIFT
+
+
+class GameState(arc4.Struct, kw_only=True):
+    board: arc4.UInt64
+    host: arc4.Address
+    guest: arc4.Address
+
+
+class TicTacToeBitboard(ARC4Contract):
+    def __init__(self) -> None:
+        self.id_counter = UInt64(0)
+
+        self.games_played = LocalState(UInt64)
+        self.games_won = LocalState(UInt64)
+
+        # the key counts towards the box's MBR, so keep its prefix short
+        self.games = BoxMap(UInt64, GameState, key_prefix=b"g")
+
+    @subroutine
+    def opt_in(self) -> None:
+        self.games_played[Txn.sender] = UInt64(0)
+        self.games_won[Txn.sender] = UInt64(0)
+
+    @arc4.abimethod(allow_actions=[OnCompleteAction.NoOp, OnCompleteAction.OptIn])
+    def new_game(self, mbr: gtxn.PaymentTransaction) -> UInt64:
+        if Txn.on_completion == OnCompleteAction.OptIn:
+            self.opt_in()
+
+        self.id_counter += 1
+
+        assert mbr.receiver == Global.current_application_address
+        pre_new_game_box, exists = op.AcctParamsGet.acct_min_balance(
+            Global.current_application_address
+        )
+        assert exists
+        self.games[self.id_counter] = GameState(
+            board=arc4.UInt64(),
+            host=arc4.Address(Txn.sender),
+            guest=arc4.Address(),
+        )
+        post_new_game_box, exists = op.AcctParamsGet.acct_min_balance(
+            Global.current_application_address
+        )
+        assert exists
+        assert mbr.amount == (post_new_game_box - pre_new_game_box)
+
+        return self.id_counter
+
+    @arc4.abimethod
+    def delete_game(self, game_id: UInt64) -> None:
+        game = self.games[game_id].copy()
+
+        assert game.guest == arc4.Address() or game.board.native & IS_OVER
+        assert Txn.sender == game.host.native
+
+        pre_del_box, exists = op.AcctParamsGet.acct_min_balance(
+            Global.current_application_address
+        )
+        assert exists
+        del self.games[game_id]
+        post_del_box, exists = op.AcctParamsGet.acct_min_balance(
+            Global.current_application_address
+        )
+        assert exists
+
+        itxn.Payment(
+            receiver=game.host.native, amount=pre_del_box - post_del_box
+        ).submit()
+
+    @arc4.abimethod(allow_actions=[OnCompleteAction.NoOp, OnCompleteAction.OptIn])
+    def join(self, game_id: UInt64) -> None:
+        if Txn.on_completion == OnCompleteAction.OptIn:
+            self.opt_in()
+
+        assert self.games[game_id].host.native != Txn.sender
+        assert self.games[game_id].guest == arc4.Address()
+
+        self.games[game_id].guest = arc4.Address(Txn.sender)
+
+    @arc4.abimethod
+    def move(self, game_id: UInt64, x: UInt64, y: UInt64) -> None:
+        game = self.games[game_id].copy()
+        board = game.board.native
+
+        assert not board & IS_OVER
+
+        assert x < 3 and y < 3
+        cell = UInt64(1) << self.coord_to_matrix_index(x, y)
+        assert not (board | board >> GUEST_SHIFT) & cell
+
+        assert Txn.sender == game.host.native or Txn.sender == game.guest.native
+        is_host = Txn.sender == game.host.native
+
+        turns = (board >> TURNS_SHIFT) & 0xFF
+        if is_host:
+            assert turns % 2 == 0
+            board |= cell
+            marks = board & CELLS
+        else:
+            assert turns % 2 == 1
+            board |= cell << GUEST_SHIFT
+            marks = (board >> GUEST_SHIFT) & CELLS
+        board += TURN
+
+        # only the player who just moved can have completed a line
+        is_won = self.has_line(marks)
+        if is_won or turns + 1 == 9:
+            board |= IS_OVER
+            self.games_played[game.host.native] += UInt64(1)
+            self.games_played[game.guest.native] += UInt64(1)
+
+            if is_won:
+                winner = game.host if is_host else game.guest
+                self.games_won[winner.native] += UInt64(1)
+
+        self.games[game_id].board = arc4.UInt64(board)
+
+    @arc4.baremethod(allow_actions=[OnCompleteAction.CloseOut])
+    def close_out(self) -> None:
+        pass
+
+    @subroutine
+    def coord_to_matrix_index(self, x: UInt64, y: UInt64) -> UInt64:
+        return 3 * y + x
+
+    @subroutine
+    def has_line(self, marks: UInt64) -> bool:
+        # rows, columns then diagonals, as masks of the cells they cover
+        return (
+            marks & 0b000_000_111 == 0b000_000_111
+            or marks & 0b000_111_000 == 0b000_111_000
+            or marks & 0b111_000_000 == 0b111_000_000
+            or marks & 0b001_001_001 == 0b001_001_001
+            or marks & 0b010_010_010 == 0b010_010_010
+            or marks & 0b100_100_100 == 0b100_100_100
+            or marks & 0b100_010_001 == 0b100_010_001
+            or marks & 0b001_010_100 == 0b001_010_100
+        )
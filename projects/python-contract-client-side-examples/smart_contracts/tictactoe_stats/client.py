@@ -0,0 +1,232 @@
+# mypy: disable-error-code="no-any-return, no-untyped-call, misc"
+import dataclasses
+import heapq
+import struct
+import typing
+from collections.abc import Callable, Iterable, Iterator, Mapping
+
+from algosdk import transaction
+from algosdk.atomic_transaction_composer import TransactionWithSigner
+from algosdk.encoding import decode_address
+from algosdk.v2client.algod import AlgodClient
+from algosdk.v2client.indexer import IndexerClient
+
+from smart_contracts._helpers.application_client import ApplicationClient
+from smart_contracts._helpers.box_maps import BoxMap, fetch_concurrently
+from smart_contracts._helpers.confirmations import ConfirmationWaiter
+from smart_contracts._helpers.fees import FeePooler
+from smart_contracts._helpers.players import PlayersRule, encode_address
+from smart_contracts._helpers.references import (
+    NextIdRule,
+    ReferenceResolver,
+    References,
+)
+from smart_contracts._helpers.views import AccountViews
+from smart_contracts.artifacts.tictactoe_stats import tic_tac_toe_stats_client
+from smart_contracts.tictactoe.client import (
+    GAMES,
+    NEW_GAME_MBR,
+    GameState,
+    game_box_name,
+)
+
+# key prefix of the `stats` BoxMap in the TicTacToeStats contract, whose `games`
+# BoxMap shares the layout and key prefix of TicTacToe's
+STATS_BOX_PREFIX = b"s"
+
+# ARC-4 layout of `PlayerStats`: games_played: uint64, games_won: uint64
+_PLAYER_STATS_LAYOUT = struct.Struct(">QQ")
+PLAYER_STATS_SIZE = _PLAYER_STATS_LAYOUT.size
+# part of the payment of a player's first `new_game` or `join` that goes to the MBR
+# of their stats box
+STATS_BOX_MBR = 2_500 + 400 * (len(STATS_BOX_PREFIX) + 32 + PLAYER_STATS_SIZE)
+
+
+def stats_box_name(player: str) -> bytes:
+    """Returns the name of the box holding the stats of `player`"""
+    return STATS.box_name(player)
+
+
+def player_from_box_name(box_name: bytes) -> str | None:
+    """Returns the player a box name holds the stats of, or None if it isn't a
+    `stats` box"""
+    return STATS.key_from_box_name(box_name)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class PlayerStats:
+    games_played: int
+    games_won: int
+
+    @classmethod
+    def decode(cls, value: bytes | bytearray | memoryview) -> "PlayerStats":
+        """Decodes the raw value of a `stats` box"""
+        view = memoryview(value)
+        if view.nbytes != PLAYER_STATS_SIZE:
+            raise ValueError(
+                f"Expected a {PLAYER_STATS_SIZE} byte PlayerStats, "
+                f"got {view.nbytes} bytes"
+            )
+        games_played, games_won = _PLAYER_STATS_LAYOUT.unpack_from(view)
+        return cls(games_played=games_played, games_won=games_won)
+
+    def encode(self) -> bytes:
+        return _PLAYER_STATS_LAYOUT.pack(self.games_played, self.games_won)
+
+
+STATS = BoxMap(STATS_BOX_PREFIX, 32, decode_address, encode_address, PlayerStats.decode)
+
+
+def by_wins(entry: tuple[str, PlayerStats]) -> tuple[int, int]:
+    """Ranks players by games won, then by fewest games played"""
+    _, stats = entry
+    return stats.games_won, -stats.games_played
+
+
+class TicTacToeStatsClient(AccountViews, tic_tac_toe_stats_client.TicTacToeStatsClient):
+    """Extends the generated TicTacToeStatsClient with typed access to the `games` and
+    `stats` box maps, and with reading many players' stats at once
+
+    Takes the same arguments as the generated client. Players never opt in, as their
+    stats live in a box their first `new_game` or `join` pays for. Calls reference
+    the game and stats boxes they use unless the caller passes references of their
+    own, so the move ending a game needs no account references, and `delete_game`
+    carries the fee for its refund payment."""
+
+    fee_pooler = FeePooler()
+
+    def __init__(self, algod_client: AlgodClient, **kwargs: typing.Any) -> None:
+        super().__init__(algod_client, **kwargs)
+        self.app_client = ApplicationClient(
+            algod_client,
+            self.app_spec,
+            confirmation_waiter=ConfirmationWaiter.shared(algod_client),
+            fee_pooler=self.fee_pooler,
+            reference_resolver=ReferenceResolver(
+                {
+                    tic_tac_toe_stats_client.NewGameArgs.method(): NextIdRule(
+                        lambda: self.get_global_state().id_counter or 0,
+                        _new_game_references,
+                    ),
+                    tic_tac_toe_stats_client.DeleteGameArgs.method(): (
+                        GAMES.references_to("game_id")
+                    ),
+                    tic_tac_toe_stats_client.JoinArgs.method(): _join_references,
+                    tic_tac_toe_stats_client.MoveArgs.method(): PlayersRule(
+                        self.get_game, _move_references
+                    ),
+                    tic_tac_toe_stats_client.GetStatsArgs.method(): (
+                        STATS.references_to("player")
+                    ),
+                }
+            ),
+            **kwargs,
+        )
+
+    def new_game_mbr(self, host: str) -> int:
+        """Returns the payment `new_game` requires from `host`"""
+        return NEW_GAME_MBR + self.join_mbr(host)
+
+    def join_mbr(self, guest: str) -> int:
+        """Returns the payment `join` requires from `guest`, which is nothing once
+        they have a stats box"""
+        return 0 if self.get_player_stats(guest) is not None else STATS_BOX_MBR
+
+    def get_game(self, game_id: int) -> GameState:
+        """Returns the state of the game with the given id"""
+        return GAMES.get(self.algod_client, self.app_id, game_id)
+
+    def get_player_stats(self, player: str) -> PlayerStats | None:
+        """Returns the stats of `player`, or None if they haven't played yet"""
+        return STATS.get_or_none(self.algod_client, self.app_id, player)
+
+    def get_player_stats_many(
+        self, players: Iterable[str], *, max_in_flight: int = 16
+    ) -> dict[str, PlayerStats | None]:
+        """Returns the stats of many players, fetching their boxes concurrently
+
+        :param Iterable[str] players: Players to read the stats of
+        :param int max_in_flight: Maximum number of box values fetched concurrently
+        :returns dict[str, PlayerStats | None]: The stats of each player, in the order
+        of `players`, None for players who haven't played yet"""
+        players = list(players)
+        fetched = dict(
+            fetch_concurrently(
+                players,
+                lambda player: (player, self.get_player_stats(player)),
+                max_in_flight,
+            )
+        )
+        return {player: fetched[player] for player in players}
+
+    def iter_player_stats(
+        self,
+        *,
+        indexer_client: IndexerClient | None = None,
+        page_size: int = 1000,
+        max_in_flight: int = 16,
+    ) -> Iterator[tuple[str, PlayerStats]]:
+        """Streams `(player, stats)` for every stats box, in the order values arrive
+
+        :param IndexerClient indexer_client: (optional) Page box names through the indexer
+        rather than listing them all from algod in one response
+        :param int page_size: Number of box names requested per indexer page
+        :param int max_in_flight: Maximum number of box values fetched concurrently"""
+        players = STATS.iter_keys(
+            self.algod_client, self.app_id, indexer_client, page_size
+        )
+        yield from STATS.iter_items(
+            self.algod_client, self.app_id, players, max_in_flight
+        )
+
+    def leaderboard(
+        self,
+        limit: int = 10,
+        *,
+        key: Callable[[tuple[str, PlayerStats]], typing.Any] = by_wins,
+        indexer_client: IndexerClient | None = None,
+        max_in_flight: int = 16,
+    ) -> list[tuple[str, PlayerStats]]:
+        """Returns the top players, streaming every stats box but only holding on to
+        the best `limit` of them
+
+        :param int limit: Number of players to return
+        :param key: (optional) Ranks `(player, stats)` entries, highest first,
+        defaults to `by_wins`
+        :param IndexerClient indexer_client: (optional) Page box names through the indexer
+        :param int max_in_flight: Maximum number of box values fetched concurrently
+        :returns list[tuple[str, PlayerStats]]: The top players, best first"""
+        return heapq.nlargest(
+            limit,
+            self.iter_player_stats(
+                indexer_client=indexer_client, max_in_flight=max_in_flight
+            ),
+            key=key,
+        )
+
+
+def _move_references(game_id: int, players: tuple[str, ...]) -> References:
+    # the move that ends a game updates the stats of both players
+    return References(
+        boxes=GAMES.references(game_id).boxes + STATS.references(*players).boxes
+    )
+
+
+def _payer(args: Mapping[str, object]) -> str:
+    # the player paying for a call's boxes is the one making it
+    mbr = typing.cast(TransactionWithSigner, args["mbr"])
+    return typing.cast(transaction.PaymentTxn, mbr.txn).sender
+
+
+def _new_game_references(game_id: int, args: Mapping[str, object]) -> References:
+    # new_game stores the game under the next id, and creates the host's stats
+    return References(
+        boxes=((0, game_box_name(game_id)), (0, stats_box_name(_payer(args))))
+    )
+
+
+def _join_references(args: Mapping[str, object]) -> References:
+    game_id = typing.cast(int, args["game_id"])
+    return References(
+        boxes=((0, game_box_name(game_id)), (0, stats_box_name(_payer(args))))
+    )
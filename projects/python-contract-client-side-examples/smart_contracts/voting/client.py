@@ -0,0 +1,85 @@
+# mypy: disable-error-code="no-untyped-call, misc"
+import typing
+from collections.abc import Sequence
+
+import algokit_utils
+from algosdk import transaction
+from algosdk.atomic_transaction_composer import EmptySigner, TransactionWithSigner
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts._helpers.application_client import (
+    ApplicationClient,
+    as_parameters_dict,
+)
+from smart_contracts._helpers.confirmations import ConfirmationWaiter
+from smart_contracts._helpers.readonly import ReadonlyCall, ReadonlyCaller
+from smart_contracts._helpers.templates import TEMPLATE_SENDER, GroupTemplate
+from smart_contracts._helpers.views import AccountViews
+from smart_contracts.artifacts.voting import voting_client
+
+# Payment `vote` expects alongside the call, in µAlgo
+VOTE_PAYMENT = 10_000
+
+
+class VotingClient(AccountViews, voting_client.VotingClient):
+    """Extends the generated VotingClient, taking the same arguments
+
+    `get_votes` is answered by simulate alone, so it needs no signer, and repeated
+    reads within a round don't reach algod again."""
+
+    # results are cached per app, so every client can share them
+    readonly_caller = ReadonlyCaller()
+
+    def __init__(self, algod_client: AlgodClient, **kwargs: typing.Any) -> None:
+        super().__init__(algod_client, **kwargs)
+        self.app_client = ApplicationClient(
+            algod_client,
+            self.app_spec,
+            confirmation_waiter=ConfirmationWaiter.shared(algod_client),
+            readonly_caller=self.readonly_caller,
+            **kwargs,
+        )
+
+    @classmethod
+    def get_votes_many(
+        cls, clients: Sequence["VotingClient"]
+    ) -> list[algokit_utils.ABITransactionResponse[int]]:
+        """Calls `get_votes()uint64` of every client's app, 16 apps per simulate
+
+        :param Sequence[VotingClient] clients: Clients of the apps to read, all using
+        the same algod
+        :returns list[algokit_utils.ABITransactionResponse[int]]: The results, in the
+        order of `clients`"""
+        method = voting_client.APP_SPEC.contract.get_method_by_name("get_votes")
+        return cls.readonly_caller.call_many(
+            [ReadonlyCall(client.app_client, method) for client in clients]
+        )
+
+    def vote_template(
+        self,
+        *,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> GroupTemplate:
+        """Composes the `vote(pay)bool` group once, payment included, to stamp out for
+        each voter
+
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional)
+        Additional transaction parameters of the app call
+        :returns GroupTemplate: The template, whose instances are ready to sign"""
+        suggested_params = (
+            (transaction_parameters and transaction_parameters.suggested_params)
+            or self.app_client.suggested_params
+            or self.algod_client.suggested_params()
+        )
+        payment = transaction.PaymentTxn(
+            TEMPLATE_SENDER, suggested_params, self.app_address, VOTE_PAYMENT
+        )
+        return GroupTemplate.compose(
+            self.app_client,
+            self.app_spec.contract.get_method_by_name("vote"),
+            {"pay": TransactionWithSigner(payment, EmptySigner())},
+            {
+                **as_parameters_dict(transaction_parameters),
+                "suggested_params": suggested_params,
+            },
+        )
@@ -0,0 +1,36 @@
+from algokit_utils import get_localnet_default_account
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts._helpers.account_pool import AccountPool
+
+
+def _last_round(algod_client: AlgodClient) -> int:
+    return algod_client.status()["last-round"]  # type: ignore[call-overload, no-any-return]
+
+
+def test_accounts_are_funded_in_full_groups(algod_client: AlgodClient) -> None:
+    pool = AccountPool(
+        algod_client,
+        get_localnet_default_account(algod_client),
+        size=20,
+        funding=1_000_000,
+    )
+    before = _last_round(algod_client)
+    acct = pool.take()
+
+    # the stand-in confirms each group in a block of its own
+    assert _last_round(algod_client) - before == 2
+    assert len(pool) == 19
+    assert algod_client.account_info(acct.address)["amount"] == 1_000_000  # type: ignore[call-overload]
+
+
+def test_accounts_given_back_are_taken_first(algod_client: AlgodClient) -> None:
+    pool = AccountPool(algod_client, get_localnet_default_account(algod_client), size=2)
+    first, second = pool.take(), pool.take()
+    pool.give_back(first, second)
+
+    assert [pool.take(), pool.take()] == [first, second]
+    before = _last_round(algod_client)
+    pool.fill(3)
+    assert len(pool) == 3
+    assert _last_round(algod_client) - before == 1
@@ -1,5 +1,6 @@
+from collections.abc import Callable, Iterator
+
 import pytest
-from algokit_utils import TransactionParameters
 from algokit_utils.beta.account_manager import AddressAndSigner
 from algokit_utils.beta.algorand_client import (
     AlgorandClient,
@@ -12,65 +13,39 @@ from algokit_utils.config import config
 from algosdk.atomic_transaction_composer import TransactionWithSigner
 from algosdk.v2client.algod import AlgodClient
 
-from smart_contracts.artifacts.auction.auction_client import AuctionClient
-
-
-@pytest.fixture(scope="session")
-def algorand() -> AlgorandClient:
-    """Get an AlgorandClient to use throughout the tests"""
-    algorand = AlgorandClient.default_local_net()
-    algorand.set_default_validity_window(1000)
+from benchmarks.clock import LocalnetClock
+from smart_contracts.auction.client import AuctionClient
 
-    return algorand
+# Every test runs its own auction from the start, so tests can run in any order or
+# in parallel, and the steps below are shared by the tests that need them
 
 
-@pytest.fixture(scope="session")
-def dispenser(algorand: AlgorandClient) -> AddressAndSigner:
-    """Get the dispenser to fund test addresses"""
-    return algorand.account.dispenser()
-
-
-@pytest.fixture(scope="session")
-def creator(algorand: AlgorandClient, dispenser: AddressAndSigner) -> AddressAndSigner:
+@pytest.fixture
+def creator(take_account: Callable[[], AddressAndSigner]) -> AddressAndSigner:
     """Get an account to use as the creator of the auction"""
-    acct = algorand.account.random()
-
-    # Make sure the account has some ALGO
-    algorand.send.payment(
-        PayParams(sender=dispenser.address, receiver=acct.address, amount=10_000_000)
-    )
-
-    return acct
+    return take_account()
 
 
-@pytest.fixture(scope="session")
-def alice(algorand: AlgorandClient, dispenser: AddressAndSigner) -> AddressAndSigner:
+@pytest.fixture
+def alice(take_account: Callable[[], AddressAndSigner]) -> AddressAndSigner:
     """Get an account to use as Alice who will participate in the auction"""
-    acct = algorand.account.random()
+    return take_account()
 
-    # Make sure the account has some ALGO
-    algorand.send.payment(
-        PayParams(sender=dispenser.address, receiver=acct.address, amount=10_000_000)
-    )
 
-    return acct
-
-
-@pytest.fixture(scope="session")
-def bob(algorand: AlgorandClient, dispenser: AddressAndSigner) -> AddressAndSigner:
+@pytest.fixture
+def bob(take_account: Callable[[], AddressAndSigner]) -> AddressAndSigner:
     """Get an account to use as Bob who will participate in the auction"""
+    return take_account()
 
-    acct = algorand.account.random()
-
-    # Make sure the account has some ALGO
-    algorand.send.payment(
-        PayParams(sender=dispenser.address, receiver=acct.address, amount=10_000_000)
-    )
 
-    return acct
+@pytest.fixture
+def clock(localnet_clock: LocalnetClock) -> Iterator[LocalnetClock]:
+    """Hold the clock of LocalNet, as the auction ends at a set time"""
+    with localnet_clock.hold():
+        yield localnet_clock
 
 
-@pytest.fixture(scope="session")
+@pytest.fixture
 def auction_asset_id(creator: AddressAndSigner, algorand: AlgorandClient) -> int:
     """Create an asset to be auctioned"""
     # Create an asset
@@ -89,7 +64,7 @@ def auction_asset_id(creator: AddressAndSigner, algorand: AlgorandClient) -> int
     return sent_txn["confirmation"]["asset-index"]
 
 
-@pytest.fixture(scope="session")
+@pytest.fixture
 def creator_auction_client(
     algod_client: AlgodClient, creator: AddressAndSigner, algorand: AlgorandClient
 ) -> AuctionClient:
@@ -116,87 +91,122 @@ def creator_auction_client(
         )
     )
 
-    print(f"creator app client details {auction_client.app_id}")
     return auction_client
 
 
-@pytest.fixture(scope="session")
+@pytest.fixture
 def alice_auction_client(
-    algod_client: AlgodClient,
     creator_auction_client: AuctionClient,
     alice: AddressAndSigner,
 ) -> AuctionClient:
     """Create an Auction App Client for Alice"""
-
-    config.configure(
-        debug=True,
-        # trace_all=True,
-    )
-
-    auction_client = AuctionClient(
-        algod_client,
-        sender=alice.address,
-        signer=alice.signer,
-        app_id=creator_auction_client.app_id,
-    )
-    print(f"Alice app client details {auction_client.app_id}")
-
-    return auction_client
+    return creator_auction_client.as_account(alice.address, alice.signer)
 
 
-@pytest.fixture(scope="session")
+@pytest.fixture
 def bob_auction_client(
-    algod_client: AlgodClient,
     creator_auction_client: AuctionClient,
     bob: AddressAndSigner,
 ) -> AuctionClient:
     """Create an Auction App Client for Bob"""
+    return creator_auction_client.as_account(bob.address, bob.signer)
 
-    config.configure(
-        debug=True,
-        # trace_all=True,
+
+def _opt_into_asset(
+    creator_auction_client: AuctionClient, auction_asset_id: int
+) -> None:
+    creator_auction_client.opt_into_asset(asset=auction_asset_id)
+
+
+def _start_auction(
+    creator_auction_client: AuctionClient,
+    creator: AddressAndSigner,
+    auction_asset_id: int,
+    algorand: AlgorandClient,
+) -> int:
+    _opt_into_asset(creator_auction_client, auction_asset_id)
+    asa_transfer_txn = algorand.transactions.asset_transfer(
+        AssetTransferParams(
+            sender=creator.address,
+            receiver=creator_auction_client.app_address,
+            asset_id=auction_asset_id,
+            amount=1,
+        )
     )
 
-    auction_client = AuctionClient(
-        algod_client,
-        sender=bob.address,
-        signer=bob.signer,
-        app_id=creator_auction_client.app_id,
+    signed_asa_transfer_txn = TransactionWithSigner(asa_transfer_txn, creator.signer)
+
+    start_timestamp = creator_auction_client.start_auction(
+        starting_price=1000000, length=1000, axfer=signed_asa_transfer_txn
     )
-    print(f"Bob app client details {auction_client.app_id}")
+    return start_timestamp.return_value
 
-    return auction_client
 
+def _bid(
+    auction_client: AuctionClient,
+    bidder: AddressAndSigner,
+    auction_asset_id: int,
+    algorand: AlgorandClient,
+    amount: int,
+) -> int:
+    # The bidder opts into the auction asset (ASA) and the app
+    algorand.send.asset_opt_in(
+        AssetOptInParams(
+            sender=bidder.address,
+            asset_id=auction_asset_id,
+        )
+    )
 
-def test_opt_into_asset(
-    algod_client: AlgodClient,
+    auction_client.opt_in_opt_in()
+
+    bid_payment_txn = algorand.transactions.payment(
+        PayParams(
+            sender=bidder.address,
+            receiver=auction_client.app_address,
+            amount=amount,
+        )
+    )
+
+    highest_bid = auction_client.bid(
+        pay=TransactionWithSigner(bid_payment_txn, bidder.signer)
+    )
+    return highest_bid.return_value
+
+
+def _run_bidding(
     creator_auction_client: AuctionClient,
+    alice_auction_client: AuctionClient,
+    bob_auction_client: AuctionClient,
     creator: AddressAndSigner,
+    alice: AddressAndSigner,
+    bob: AddressAndSigner,
     auction_asset_id: int,
     algorand: AlgorandClient,
 ) -> None:
-    """Test that the auction app opts into the auction asset"""
+    # Alice bids first, then Bob outbids her
+    _start_auction(creator_auction_client, creator, auction_asset_id, algorand)
+    _bid(alice_auction_client, alice, auction_asset_id, algorand, 1100000)
+    _bid(bob_auction_client, bob, auction_asset_id, algorand, 2000000)
 
-    # Reset timestamp offset to ensure it's current time in localnet
-    algod_client.set_timestamp_offset(0)
 
-    # dummy transaction to update the timestamp offset
-    algorand.send.payment(
-        PayParams(
-            sender=creator.address,
-            receiver=creator.address,
-            amount=0,
-        )
-    )
+def _claim_prize(
+    clock: LocalnetClock,
+    bob_auction_client: AuctionClient,
+    auction_asset_id: int,
+) -> None:
+    # Move past the end of the auction
+    clock.advance(1001)
 
-    sp = algod_client.suggested_params()
-    sp.flat_fee = True
-    sp.fee = 2000
+    bob_auction_client.claim_asset(asset=auction_asset_id)
 
-    creator_auction_client.opt_into_asset(
-        asset=auction_asset_id,
-        transaction_parameters=TransactionParameters(suggested_params=sp),
-    )
+
+def test_opt_into_asset(
+    creator_auction_client: AuctionClient,
+    auction_asset_id: int,
+    algorand: AlgorandClient,
+) -> None:
+    """Test that the auction app opts into the auction asset"""
+    _opt_into_asset(creator_auction_client, auction_asset_id)
 
     asset_info = algorand.account.get_asset_information(
         creator_auction_client.app_address, auction_asset_id
@@ -207,150 +217,112 @@ def test_opt_into_asset(
 
 
 def test_start_auction(
+    clock: LocalnetClock,
     creator_auction_client: AuctionClient,
     creator: AddressAndSigner,
     auction_asset_id: int,
     algorand: AlgorandClient,
 ) -> None:
     """Test that the auction is started"""
-    asa_transfer_txn = algorand.transactions.asset_transfer(
-        AssetTransferParams(
-            sender=creator.address,
-            receiver=creator_auction_client.app_address,
-            asset_id=auction_asset_id,
-            amount=1,
-        )
-    )
-
-    signed_asa_transfer_txn = TransactionWithSigner(asa_transfer_txn, creator.signer)
-
-    start_timestamp = creator_auction_client.start_auction(
-        starting_price=1000000, length=1000, axfer=signed_asa_transfer_txn
+    start_timestamp = _start_auction(
+        creator_auction_client, creator, auction_asset_id, algorand
     )
-    print(f"Auction started at Unix time: {start_timestamp.return_value}\n")
 
-    assert start_timestamp.return_value
+    assert start_timestamp
 
 
 def test_alice_bid(
+    clock: LocalnetClock,
+    creator_auction_client: AuctionClient,
     alice_auction_client: AuctionClient,
+    creator: AddressAndSigner,
     alice: AddressAndSigner,
     auction_asset_id: int,
     algorand: AlgorandClient,
 ) -> None:
     """Test that Alice bids in the auction"""
+    _start_auction(creator_auction_client, creator, auction_asset_id, algorand)
 
-    # Alice opts into the auction asset (ASA)
-    algorand.send.asset_opt_in(
-        AssetOptInParams(
-            sender=alice.address,
-            asset_id=auction_asset_id,
-        )
-    )
-
-    alice_auction_client.opt_in_opt_in()
-
-    alice_bid_payment_txn = algorand.transactions.payment(
-        PayParams(
-            sender=alice.address,
-            receiver=alice_auction_client.app_address,
-            amount=1100000,
-        )
-    )
-
-    alice_bid_payment_tws = TransactionWithSigner(alice_bid_payment_txn, alice.signer)
-
-    highest_bid = alice_auction_client.bid(pay=alice_bid_payment_tws)
-    print(
-        f"Alice is the highest bidder with bid: {highest_bid.return_value} microAlgos\n"
-    )
+    highest_bid = _bid(alice_auction_client, alice, auction_asset_id, algorand, 1100000)
 
+    assert highest_bid == 1100000
     alice_local_state = alice_auction_client.get_local_state(alice.address)
-
     assert alice_local_state.claimable_amount == 1100000
 
 
 def test_bob_bid(
+    clock: LocalnetClock,
+    creator_auction_client: AuctionClient,
+    alice_auction_client: AuctionClient,
     bob_auction_client: AuctionClient,
+    creator: AddressAndSigner,
+    alice: AddressAndSigner,
     bob: AddressAndSigner,
     auction_asset_id: int,
     algorand: AlgorandClient,
 ) -> None:
     """Test that Bob outbids Alice in the auction"""
+    _start_auction(creator_auction_client, creator, auction_asset_id, algorand)
+    _bid(alice_auction_client, alice, auction_asset_id, algorand, 1100000)
 
-    # Alice opts into the auction asset (ASA)
-    algorand.send.asset_opt_in(
-        AssetOptInParams(
-            sender=bob.address,
-            asset_id=auction_asset_id,
-        )
-    )
-
-    bob_auction_client.opt_in_opt_in()
-
-    bob_bid_payment_txn = algorand.transactions.payment(
-        PayParams(
-            sender=bob.address,
-            receiver=bob_auction_client.app_address,
-            amount=2000000,
-        )
-    )
-
-    bob_bid_payment_tws = TransactionWithSigner(bob_bid_payment_txn, bob.signer)
-
-    highest_bid = bob_auction_client.bid(pay=bob_bid_payment_tws)
-    print(
-        f"Bob is the highest bidder with bid: {highest_bid.return_value} microAlgos\n"
-    )
+    highest_bid = _bid(bob_auction_client, bob, auction_asset_id, algorand, 2000000)
 
+    assert highest_bid == 2000000
     bob_local_state = bob_auction_client.get_local_state(bob.address)
-
     assert bob_local_state.claimable_amount == 2000000
 
 
 def test_alice_claim_bid(
-    algod_client: AlgodClient,
+    clock: LocalnetClock,
+    creator_auction_client: AuctionClient,
     alice_auction_client: AuctionClient,
+    bob_auction_client: AuctionClient,
+    creator: AddressAndSigner,
+    alice: AddressAndSigner,
+    bob: AddressAndSigner,
+    auction_asset_id: int,
+    algorand: AlgorandClient,
 ) -> None:
     """Test that Alice claims her bid"""
-
-    sp = algod_client.suggested_params()
-    sp.flat_fee = True
-    sp.fee = 2000
-
-    claimed_amount = alice_auction_client.claim_bids(
-        transaction_parameters=TransactionParameters(suggested_params=sp)
+    _run_bidding(
+        creator_auction_client,
+        alice_auction_client,
+        bob_auction_client,
+        creator,
+        alice,
+        bob,
+        auction_asset_id,
+        algorand,
     )
+
+    claimed_amount = alice_auction_client.claim_bids()
     assert claimed_amount.return_value == 1100000
 
 
 def test_bob_claim_prize(
-    algod_client: AlgodClient,
+    clock: LocalnetClock,
+    creator_auction_client: AuctionClient,
+    alice_auction_client: AuctionClient,
     bob_auction_client: AuctionClient,
+    creator: AddressAndSigner,
+    alice: AddressAndSigner,
     bob: AddressAndSigner,
     auction_asset_id: int,
     algorand: AlgorandClient,
 ) -> None:
     """Test that Bob claims the prize"""
-
-    algod_client.set_timestamp_offset(1001)
-
-    algorand.send.payment(
-        PayParams(
-            sender=bob.address,
-            receiver=bob.address,
-            amount=0,
-        )
+    _run_bidding(
+        creator_auction_client,
+        alice_auction_client,
+        bob_auction_client,
+        creator,
+        alice,
+        bob,
+        auction_asset_id,
+        algorand,
     )
 
-    sp = algod_client.suggested_params()
-    sp.flat_fee = True
-    sp.fee = 2000  # double fee to cover inner txn fee
-
-    bob_auction_client.claim_asset(
-        asset=auction_asset_id,
-        transaction_parameters=TransactionParameters(suggested_params=sp),
-    )
+    _claim_prize(clock, bob_auction_client, auction_asset_id)
 
     bob_asset_info = algorand.account.get_asset_information(
         bob.address, auction_asset_id
@@ -360,20 +332,30 @@ def test_bob_claim_prize(
 
 
 def test_delete_app(
-    algod_client: AlgodClient,
+    clock: LocalnetClock,
     creator_auction_client: AuctionClient,
+    alice_auction_client: AuctionClient,
+    bob_auction_client: AuctionClient,
     creator: AddressAndSigner,
+    alice: AddressAndSigner,
+    bob: AddressAndSigner,
+    auction_asset_id: int,
     algorand: AlgorandClient,
 ) -> None:
     """Test that the creator claims the prize fund and deletes the auction app"""
-
-    sp = algod_client.suggested_params()
-    sp.flat_fee = True
-    sp.fee = 2000  # double fee to cover inner txn fee
-
-    creator_auction_client.delete_delete_application(
-        transaction_parameters=TransactionParameters(suggested_params=sp)
+    _run_bidding(
+        creator_auction_client,
+        alice_auction_client,
+        bob_auction_client,
+        creator,
+        alice,
+        bob,
+        auction_asset_id,
+        algorand,
     )
+    _claim_prize(clock, bob_auction_client, auction_asset_id)
+
+    creator_auction_client.delete_delete_application()
     creator_info = algorand.account.get_information(creator.address)
 
     assert creator_info["total-created-apps"] == 0
@@ -0,0 +1,96 @@
+import json
+from pathlib import Path
+
+from _algopy_testing import arc4 as testing_arc4
+
+from benchmarks.__main__ import main
+from benchmarks.runner import Result, compare
+from benchmarks.stand_in.contracts import _kw_only_structs
+
+
+def _result(calls_per_second: float, p90: float) -> dict[str, object]:
+    return {"calls_per_second": calls_per_second, "latency_ms": {"p90": p90}}
+
+
+def test_percentiles_are_of_latencies() -> None:
+    result = Result(calls=100, seconds=2.0, latencies=[i / 1000 for i in range(101)])
+
+    assert result.as_dict()["calls_per_second"] == 50.0
+    assert result.as_dict()["latency_ms"] == {"p50": 50.0, "p90": 90.0, "p99": 99.0}
+
+
+def test_regressions_beyond_tolerance_are_reported() -> None:
+    baseline = {"a/sync": _result(100, 10), "b/sync": _result(100, 10)}
+    results = {
+        "a/sync": _result(80, 12),
+        "b/sync": _result(70, 13),
+        "c/sync": _result(1, 1000),
+    }
+
+    assert compare(results, baseline, tolerance=0.25) == [
+        "b/sync: 70 calls/s, down from 100 calls/s",
+        "b/sync: p90 latency 13 ms, up from 10 ms",
+    ]
+
+
+def test_benchmarks_run_against_the_stand_in(tmp_path: Path) -> None:
+    output, baseline = tmp_path / "results.json", tmp_path / "baseline.json"
+    args = ["--scenario", "hello", "--scenario", "vote", "--calls", "4"]
+
+    assert main([*args, "--baseline", str(baseline), "--update-baseline"]) == 0
+    # a baseline nothing can fall short of
+    report = json.loads(baseline.read_text())
+    for result in report["results"].values():
+        result["calls_per_second"] = 0
+        result["latency_ms"]["p90"] = float("inf")
+    baseline.write_text(json.dumps(report))
+    assert main([*args, "--baseline", str(baseline), "--output", str(output)]) == 0
+
+    results = json.loads(output.read_text())["results"]
+    assert set(results) == {"hello/sync", "hello/composed", "hello/concurrent"} | {
+        "vote/sync",
+        "vote/concurrent",
+    }
+    assert results["vote/concurrent"]["calls"] == 4
+
+
+def test_baselines_measured_differently_are_not_compared(tmp_path: Path) -> None:
+    output, baseline = tmp_path / "results.json", tmp_path / "baseline.json"
+    args = ["--scenario", "hello", "--calls", "4", "--baseline", str(baseline)]
+    assert main([*args, "--update-baseline"]) == 0
+    # a baseline nothing can fall short of, so only the differences fail
+    report = json.loads(baseline.read_text())
+    for result in report["results"].values():
+        result["calls_per_second"] = 0
+        result["latency_ms"]["p90"] = float("inf")
+    baseline.write_text(json.dumps(report))
+    assert main([*args, "--output", str(output)]) == 0
+
+    assert main([*args, "--workers", "2", "--output", str(output)]) == 1
+    report["meta"]["machine"] = "elsewhere"
+    baseline.write_text(json.dumps(report))
+    assert main([*args, "--output", str(output)]) == 1
+
+
+def test_batched_calls_count_a_call_per_name(tmp_path: Path) -> None:
+    output = tmp_path / "results.json"
+    args = ["--scenario", "hello_many", "--calls", "30", "--workers", "2"]
+
+    assert main([*args, "--output", str(output), "--baseline", str(output)]) == 0
+
+    results = json.loads(output.read_text())["results"]
+    # 30 names take 3 calls, or 2 calls per worker
+    assert results["hello_many/sync"]["calls"] == 30
+    assert results["hello_many/sync"]["operations"] == 3
+    assert results["hello_many/composed"]["operations"] == 1
+    assert results["hello_many/concurrent"]["calls"] == 30
+    assert results["hello_many/concurrent"]["operations"] == 4
+
+
+def test_stand_in_only_patches_structs_while_running_contracts() -> None:
+    from_bytes = testing_arc4.Struct.__dict__["from_bytes"]
+
+    with _kw_only_structs():
+        assert testing_arc4.Struct.__dict__["from_bytes"] is not from_bytes
+
+    assert testing_arc4.Struct.__dict__["from_bytes"] is from_bytes
@@ -0,0 +1,71 @@
+import base64
+import threading
+
+from smart_contracts._helpers.box_maps import BoxMap, fetch_concurrently
+
+NUMBERS = BoxMap(
+    b"n",
+    8,
+    lambda key: key.to_bytes(8, "big"),
+    lambda key: int.from_bytes(key, "big"),
+    lambda value: value.decode(),
+)
+
+
+class _PagingIndexer:
+    """Serves box names through the indexer's box endpoint, a page at a time"""
+
+    def __init__(self, names: list[bytes]):
+        self.names = names
+
+    def application_boxes(
+        self, application_id: int, limit: int, next_page: str | None
+    ) -> dict[str, object]:
+        start = int(next_page or 0)
+        page = self.names[start : start + limit]
+        response: dict[str, object] = {
+            "boxes": [{"name": base64.b64encode(name).decode()} for name in page]
+        }
+        if start + limit < len(self.names):
+            response["next-token"] = str(start + limit)
+        return response
+
+
+def test_keys_round_trip_through_box_names() -> None:
+    assert NUMBERS.key_from_box_name(NUMBERS.box_name(7)) == 7
+    assert NUMBERS.key_from_box_name(b"x" + bytes(8)) is None
+    assert NUMBERS.key_from_box_name(b"n" + bytes(9)) is None
+    assert NUMBERS.references_to("number")({"number": 7}).boxes == (
+        (0, NUMBERS.box_name(7)),
+    )
+
+
+def test_keys_are_paged_through_the_indexer() -> None:
+    indexer = _PagingIndexer(
+        [NUMBERS.box_name(1), b"other", NUMBERS.box_name(2), NUMBERS.box_name(3)]
+    )
+
+    keys = NUMBERS.iter_keys(
+        None, 1, indexer_client=indexer, page_size=2  # type: ignore[arg-type]
+    )
+
+    assert list(keys) == [1, 2, 3]
+
+
+def test_fetches_are_bounded() -> None:
+    lock = threading.Lock()
+    running = peak = 0
+
+    def fetch(key: int) -> int:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        with lock:
+            running -= 1
+        return key * 2
+
+    assert sorted(fetch_concurrently(range(20), fetch, max_in_flight=3)) == [
+        key * 2 for key in range(20)
+    ]
+    assert peak <= 3
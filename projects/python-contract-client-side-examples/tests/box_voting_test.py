@@ -0,0 +1,162 @@
+from collections.abc import Callable
+
+import pytest
+from algokit_utils import LogicError, TransactionParameters
+from algokit_utils.beta.account_manager import AddressAndSigner
+from algokit_utils.beta.algorand_client import AlgorandClient, PayParams
+from algosdk.account import generate_account
+from algosdk.atomic_transaction_composer import TransactionWithSigner
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts._helpers.bulk import BulkGroupError
+from smart_contracts.box_voting.client import (
+    BALLOT_MBR,
+    BoxVotingClient,
+    Vote,
+    ballot_box_name,
+    topic_mbr,
+)
+
+
+def test_box_names_and_mbr() -> None:
+    _, voter = generate_account()
+
+    assert ballot_box_name(2, voter)[:9] == b"b" + (2).to_bytes(8, "big")
+    assert BALLOT_MBR == 2_500 + 400 * (1 + 8 + 32 + 1)
+    assert topic_mbr("Lunch", 3) == 2 * 2_500 + 400 * ((1 + 8 + 2 + 5) + (1 + 8 + 24))
+
+
+@pytest.fixture(scope="module")
+def accounts(take_account: Callable[[], AddressAndSigner]) -> list[AddressAndSigner]:
+    # the creator comes first, then the voters
+    return [take_account() for _ in range(4)]
+
+
+def _create_client(
+    algod_client: AlgodClient, algorand: AlgorandClient, creator: AddressAndSigner
+) -> BoxVotingClient:
+    client = BoxVotingClient(
+        algod_client, sender=creator.address, signer=creator.signer
+    )
+    client.create_bare()
+    # the app account's own minimum balance, boxes are paid for as they're created
+    algorand.send.payment(
+        PayParams(sender=creator.address, receiver=client.app_address, amount=100_000)
+    )
+
+    return client
+
+
+def _add_topic(
+    client: BoxVotingClient, algorand: AlgorandClient, topic: str, options: int
+) -> int:
+    creator = client.app_client.sender
+    assert creator is not None
+    mbr = algorand.transactions.payment(
+        PayParams(
+            sender=creator,
+            receiver=client.app_address,
+            amount=topic_mbr(topic, options),
+        )
+    )
+
+    return client.add_topic(
+        topic=topic,
+        options=options,
+        mbr=TransactionWithSigner(mbr, client.app_client.signer),
+    ).return_value
+
+
+def test_batched_votes_need_no_opt_in(
+    algod_client: AlgodClient,
+    algorand: AlgorandClient,
+    accounts: list[AddressAndSigner],
+) -> None:
+    client = _create_client(algod_client, algorand, accounts[0])
+    lunch = _add_topic(client, algorand, "Lunch", 3)
+    # over 1KB of tallies, which takes an extra box reference
+    colour = _add_topic(client, algorand, "Colour", 200)
+    assert (lunch, colour) == (1, 2)
+
+    alice, bob, carol = accounts[1:]
+    votes = [
+        Vote(alice.address, alice.signer, lunch, 0),
+        Vote(bob.address, bob.signer, lunch, 2),
+        Vote(carol.address, carol.signer, lunch, 2),
+        Vote(alice.address, alice.signer, colour, 199),
+        # Bob already voted in this topic, so his second vote doesn't count
+        Vote(bob.address, bob.signer, lunch, 1),
+    ]
+    results = client.vote_many(votes)
+
+    assert [result.return_value for result in results] == [  # type: ignore[union-attr]
+        True,
+        True,
+        True,
+        True,
+        False,
+    ]
+    assert client.get_tallies(lunch) == [1, 0, 2]
+    assert client.get_votes(topic_id=lunch).return_value == [1, 0, 2]
+    assert client.get_tallies(colour)[199] == 1
+    assert client.get_ballot(lunch, bob.address) == 2
+    assert client.get_ballot(colour, bob.address) is None
+
+
+def test_unknown_options_fail_their_group(
+    algod_client: AlgodClient,
+    algorand: AlgorandClient,
+    accounts: list[AddressAndSigner],
+) -> None:
+    client = _create_client(algod_client, algorand, accounts[0])
+    topic_id = _add_topic(client, algorand, "Yes or no", 2)
+
+    voter = accounts[1]
+    [result] = client.vote_many([Vote(voter.address, voter.signer, topic_id, 2)])
+
+    assert isinstance(result, BulkGroupError)
+    assert "Unknown option" in str(result.cause)
+    assert client.get_ballot(topic_id, voter.address) is None
+
+
+def test_repeated_votes_pay_nothing(
+    algod_client: AlgodClient,
+    algorand: AlgorandClient,
+    accounts: list[AddressAndSigner],
+) -> None:
+    client = _create_client(algod_client, algorand, accounts[0])
+    topic_id = _add_topic(client, algorand, "Tea or coffee", 2)
+    voter = accounts[1]
+    balance = algod_client.account_info(client.app_address)["amount"]  # type: ignore[call-overload]
+
+    first = client.vote_many(
+        [
+            Vote(voter.address, voter.signer, topic_id, 0),
+            Vote(voter.address, voter.signer, topic_id, 1),
+        ]
+    )
+    second = client.vote_many([Vote(voter.address, voter.signer, topic_id, 1)])
+
+    assert [result.return_value for result in [*first, *second]] == [  # type: ignore[union-attr]
+        True,
+        False,
+        False,
+    ]
+    # only the ballot box was paid for
+    assert (
+        algod_client.account_info(client.app_address)["amount"]  # type: ignore[call-overload]
+        == balance + BALLOT_MBR
+    )
+
+    pay = algorand.transactions.payment(
+        PayParams(sender=voter.address, receiver=client.app_address, amount=BALLOT_MBR)
+    )
+    with pytest.raises(LogicError, match="Already voted, so pay nothing"):
+        client.vote(
+            topic_id=topic_id,
+            option=1,
+            pay=TransactionWithSigner(pay, voter.signer),
+            transaction_parameters=TransactionParameters(
+                sender=voter.address, signer=voter.signer
+            ),
+        )
@@ -0,0 +1,111 @@
+import base64
+import time
+
+from algosdk import abi
+from algosdk.account import generate_account
+from algosdk.atomic_transaction_composer import AccountTransactionSigner
+from algosdk.error import AlgodHTTPError
+from algosdk.transaction import SignedTransaction, SuggestedParams
+
+from smart_contracts._helpers.application_client import ApplicationClient
+from smart_contracts._helpers.bulk import BulkCall, BulkComposer, BulkGroupError
+from smart_contracts.artifacts.hello_world.hello_world_client import APP_SPEC, HelloArgs
+
+_RETURN_PREFIX = bytes.fromhex("151f7c75")
+_STRING = abi.StringType()
+
+
+class _ConfirmingAlgod:
+    """Confirms every group sent, unless it greets "fail", answering `hello` calls
+    the way the contract does. Groups greeting "slow" take a while to send"""
+
+    def __init__(self) -> None:
+        self.suggested_params_requests = 0
+        self.groups: list[list[SignedTransaction]] = []
+        self.confirmed: dict[str, SignedTransaction] = {}
+
+    def suggested_params(self) -> SuggestedParams:
+        self.suggested_params_requests += 1
+        return SuggestedParams(fee=0, first=1, last=1001, gh=b"\x00" * 32)
+
+    def send_transactions(self, stxns: list[SignedTransaction]) -> str:
+        names = [_STRING.decode(stxn.transaction.app_args[1]) for stxn in stxns]
+        if "fail" in names:
+            raise AlgodHTTPError("logic eval error: err opcode executed")
+        if "slow" in names:
+            time.sleep(0.2)
+        self.groups.append(stxns)
+        self.confirmed.update((stxn.get_txid(), stxn) for stxn in stxns)
+        return str(stxns[0].get_txid())
+
+    def status(self) -> dict[str, object]:
+        return {"last-round": 1}
+
+    def pending_transaction_info(self, tx_id: str) -> dict[str, object]:
+        name = _STRING.decode(self.confirmed[tx_id].transaction.app_args[1])
+        greeting = _RETURN_PREFIX + _STRING.encode(f"Hello, {name}")
+        return {"confirmed-round": 1, "logs": [base64.b64encode(greeting).decode()]}
+
+
+def _composer(algod: _ConfirmingAlgod, max_in_flight: int = 2) -> BulkComposer:
+    private_key, address = generate_account()
+    app_client = ApplicationClient(
+        algod,  # type: ignore[arg-type]
+        APP_SPEC,
+        app_id=1,
+        sender=address,
+        signer=AccountTransactionSigner(private_key),
+    )
+    return BulkComposer(app_client, max_in_flight=max_in_flight)
+
+
+def test_results_follow_input_order_across_groups() -> None:
+    algod = _ConfirmingAlgod()
+    names = [f"name {i}" for i in range(40)]
+
+    results = list(_composer(algod).execute(HelloArgs(name=name) for name in names))
+
+    assert [result.return_value for result in results] == [
+        f"Hello, {name}" for name in names
+    ]
+    assert sorted(len(group) for group in algod.groups) == [8, 16, 16]
+    assert algod.suggested_params_requests == 1
+
+
+def test_repeated_calls_are_distinct_transactions() -> None:
+    algod = _ConfirmingAlgod()
+
+    results = list(_composer(algod).execute([HelloArgs(name="World")] * 20))
+
+    assert len({result.tx_id for result in results}) == 20
+
+
+def test_failing_group_only_fails_its_own_calls() -> None:
+    algod = _ConfirmingAlgod()
+    calls = [BulkCall("hello(string)string", {"name": "fail"})] + [
+        HelloArgs(name=f"name {i}") for i in range(20)
+    ]
+
+    results = list(_composer(algod).execute(calls))
+
+    assert all(isinstance(result, BulkGroupError) for result in results[:16])
+    assert [result.return_value for result in results[16:]] == [
+        f"Hello, name {i}" for i in range(15, 20)
+    ]
+
+
+def test_lanes_are_sent_in_order() -> None:
+    algod = _ConfirmingAlgod()
+    calls = [
+        BulkCall("hello(string)string", {"name": name}, lane=lane)
+        for name, lane in [("slow", "a"), ("next", "a"), ("other", "b")]
+        for _ in range(16)
+    ]
+
+    results = list(_composer(algod, max_in_flight=3).execute(calls))
+
+    assert not any(isinstance(result, BulkGroupError) for result in results)
+    # lane "b" overtakes the slow group, while lane "a" waits for it
+    assert [
+        _STRING.decode(group[0].transaction.app_args[1]) for group in algod.groups
+    ] == ["other", "slow", "next"]
@@ -0,0 +1,87 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from smart_contracts._helpers.confirmations import ConfirmationWaiter
+
+
+class _BlockAlgod:
+    """Produces a block every few milliseconds holding whatever was queued for it"""
+
+    def __init__(self) -> None:
+        self.round = 1
+        self.queued: list[str] = []
+        self.blocks: dict[int, list[str]] = {}
+        self.lookups: list[str] = []
+        self._lock = threading.Lock()
+
+    def status(self) -> dict[str, object]:
+        return {"last-round": self.round}
+
+    def status_after_block(self, round_num: int) -> dict[str, object]:
+        time.sleep(0.005)
+        with self._lock:
+            self.round += 1
+            self.blocks[self.round], self.queued = self.queued, []
+            return {"last-round": self.round}
+
+    def get_block_txids(self, round_num: int) -> dict[str, object]:
+        return {"blockTxids": self.blocks[round_num]}
+
+    def pending_transaction_info(self, tx_id: str) -> dict[str, object]:
+        self.lookups.append(tx_id)
+        for round_num, tx_ids in self.blocks.items():
+            if tx_id in tx_ids:
+                return {"confirmed-round": round_num}
+        return {}
+
+    def send(self, tx_id: str) -> None:
+        with self._lock:
+            self.queued.append(tx_id)
+
+
+def test_many_transactions_are_confirmed_from_blocks() -> None:
+    algod = _BlockAlgod()
+    waiter = ConfirmationWaiter(algod)  # type: ignore[arg-type]
+
+    def send_and_wait(tx_id: str) -> int:
+        sent_after_round = waiter.last_round
+        algod.send(tx_id)
+        return waiter.watch(
+            tx_id, sent_after_round=sent_after_round, wait_rounds=100
+        ).result(timeout=5)
+
+    with ThreadPoolExecutor(20) as executor:
+        confirmed_rounds = list(executor.map(send_and_wait, map(str, range(200))))
+    waiter.close()
+
+    assert all(confirmed_round > 1 for confirmed_round in confirmed_rounds)
+    # only transactions watched after a block they may be in are looked up
+    assert len(algod.lookups) < 200
+
+
+def test_transaction_confirmed_before_being_watched_is_looked_up() -> None:
+    algod = _BlockAlgod()
+    waiter = ConfirmationWaiter(algod)  # type: ignore[arg-type]
+    sent_after_round = waiter.last_round
+    algod.send("early")
+    waiter.wait_for_round(sent_after_round + 2)
+
+    future = waiter.watch("early", sent_after_round=sent_after_round, wait_rounds=10)
+
+    assert future.result(timeout=5) == sent_after_round + 1
+    assert algod.lookups == ["early"]
+    waiter.close()
+
+
+def test_transaction_never_confirmed_fails_after_its_rounds() -> None:
+    algod = _BlockAlgod()
+    waiter = ConfirmationWaiter(algod)  # type: ignore[arg-type]
+
+    future = waiter.watch("lost", sent_after_round=waiter.last_round, wait_rounds=2)
+
+    with pytest.raises(Exception, match="not confirmed in time"):
+        future.result(timeout=5)
+    waiter.close()
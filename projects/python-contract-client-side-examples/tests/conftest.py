@@ -1,12 +1,24 @@
+import os
+from collections.abc import Callable, Iterator
+
 import pytest
 from algokit_utils import (
+    AlgoClientConfig,
     get_algod_client,
     get_default_localnet_config,
     get_indexer_client,
+    get_localnet_default_account,
 )
+from algokit_utils.beta.account_manager import AddressAndSigner
+from algokit_utils.beta.algorand_client import AlgorandClient
+from algokit_utils.beta.client_manager import AlgoSdkClients
 from algosdk.v2client.algod import AlgodClient
 from algosdk.v2client.indexer import IndexerClient
 
+from benchmarks.clock import LocalnetClock
+from benchmarks.stand_in import LocalnetStandIn
+from smart_contracts._helpers.account_pool import AccountPool
+
 # Uncomment if you want to load network specific or generic .env file
 # @pytest.fixture(autouse=True, scope="session")
 # def environment_fixture() -> None:
@@ -14,13 +26,103 @@ from algosdk.v2client.indexer import IndexerClient
 #     load_dotenv(env_path)
 
 
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--localnet",
+        action="store_true",
+        help="run against a running AlgoKit LocalNet instead of the in-process stand-in",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers", "localnet: needs a real LocalNet, skipped against the stand-in"
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    if config.getoption("--localnet"):
+        return
+    skip = pytest.mark.skip(reason="needs a real LocalNet, run with --localnet")
+    for item in items:
+        if "localnet" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture(autouse=True, scope="session")
+def localnet(request: pytest.FixtureRequest) -> Iterator[dict[str, AlgoClientConfig]]:
+    """Serves LocalNet's APIs from an in-process stand-in, unless `--localnet` is given,
+    and returns the configs to connect to algod and indexer with"""
+    if request.config.getoption("--localnet"):
+        yield {name: get_default_localnet_config(name) for name in ("algod", "indexer")}
+        return
+    # any free ports, so each pytest-xdist worker gets a ledger of its own
+    with (
+        LocalnetStandIn(algod_port=0, kmd_port=0, indexer_port=0) as stand_in,
+        pytest.MonkeyPatch.context() as monkeypatch,
+    ):
+        # algokit finds kmd on algod's host, at this port
+        monkeypatch.setenv("KMD_PORT", str(stand_in.port("kmd")))
+        yield {name: stand_in.config(name) for name in ("algod", "indexer")}
+
+
 @pytest.fixture(scope="session")
-def algod_client() -> AlgodClient:
+def algod_client(localnet: dict[str, AlgoClientConfig]) -> AlgodClient:
     # by default we are using localnet algod
-    client = get_algod_client(get_default_localnet_config("algod"))
+    client = get_algod_client(localnet["algod"])
     return client
 
 
 @pytest.fixture(scope="session")
-def indexer_client() -> IndexerClient:
-    return get_indexer_client(get_default_localnet_config("indexer"))
+def indexer_client(localnet: dict[str, AlgoClientConfig]) -> IndexerClient:
+    return get_indexer_client(localnet["indexer"])
+
+
+@pytest.fixture(scope="session")
+def account_pool(algod_client: AlgodClient) -> AccountPool:
+    """Funded accounts for any test module, created in bulk by the LocalNet dispenser"""
+    return AccountPool(algod_client, get_localnet_default_account(algod_client))
+
+
+@pytest.fixture(scope="session")
+def algorand(
+    algod_client: AlgodClient, indexer_client: IndexerClient
+) -> AlgorandClient:
+    """Get an AlgorandClient to use throughout the tests"""
+    algorand = AlgorandClient.from_clients(AlgoSdkClients(algod_client, indexer_client))
+    algorand.set_default_validity_window(1000)
+
+    return algorand
+
+
+@pytest.fixture(scope="session")
+def take_account(
+    algorand: AlgorandClient, account_pool: AccountPool
+) -> Callable[[], AddressAndSigner]:
+    """Takes accounts from the pool that `algorand` signs for. They aren't given back,
+    as tests leave them holding assets, app state or less than they were funded with"""
+
+    def take() -> AddressAndSigner:
+        acct = account_pool.take()
+        algorand.account.set_signer(acct.address, acct.signer)
+
+        return acct
+
+    return take
+
+
+@pytest.fixture(scope="session")
+def localnet_clock(
+    request: pytest.FixtureRequest,
+    tmp_path_factory: pytest.TempPathFactory,
+    algod_client: AlgodClient,
+    account_pool: AccountPool,
+) -> LocalnetClock:
+    """The clock of LocalNet's blocks, for flows that depend on time"""
+    lock_path = None
+    if request.config.getoption("--localnet") and "PYTEST_XDIST_WORKER" in os.environ:
+        # pytest-xdist workers share the real LocalNet, and this directory
+        lock_path = tmp_path_factory.getbasetemp().parent / "localnet-clock.lock"
+    return LocalnetClock(algod_client, account_pool.take(), lock_path)
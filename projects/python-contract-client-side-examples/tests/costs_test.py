@@ -0,0 +1,111 @@
+import base64
+import json
+from pathlib import Path
+
+import pytest
+
+from benchmarks.costs import Costs, compare, main
+
+
+def _b64(value: bytes) -> str:
+    return base64.b64encode(value).decode()
+
+
+def test_costs_are_read_from_simulate() -> None:
+    box_change = {"app-state-type": "b", "operation": "w", "key": _b64(b"game")}
+    txn_result = {
+        "app-budget-consumed": 321,
+        "txn-result": {
+            "global-state-delta": [
+                {"key": _b64(b"topic"), "value": {"action": 1, "bytes": _b64(b"hi")}},
+                {"key": _b64(b"gone"), "value": {"action": 3}},
+            ],
+            "local-state-delta": [
+                {
+                    "address": "A",
+                    "delta": [{"key": _b64(b"voted"), "value": {"action": 2}}],
+                }
+            ],
+            "inner-txns": [{"inner-txns": [{}]}],
+        },
+        "exec-trace": {
+            "approval-program-trace": [
+                {"pc": 1, "state-changes": [{**box_change, "new-value": {}}]},
+                {
+                    "pc": 2,
+                    "state-changes": [
+                        {**box_change, "new-value": {"bytes": _b64(bytes(10))}}
+                    ],
+                },
+            ]
+        },
+    }
+
+    assert Costs.of(txn_result, min_fee=1_000) == Costs(
+        app_budget=321,
+        inner_txns=2,
+        state_bytes=(5 + 2) + (5 + 8),
+        box_bytes=4 + 10,
+        min_fee=3_000,
+    )
+
+
+def test_costs_beyond_threshold_are_regressions() -> None:
+    baseline = {"A.a": {"app_budget": 100, "inner_txns": 0, "box_bytes": None}}
+    costs = {
+        "A.a": {"app_budget": 111, "inner_txns": 1, "box_bytes": 10},
+        "B.b": {"app_budget": 1_000},
+    }
+
+    assert compare(costs, baseline, threshold=0.1) == [
+        "A.a: app_budget 111, up from 100",
+        "A.a: inner_txns 1, up from 0",
+        "A.a: box_bytes 10, missing from baseline",
+        "B.b: app_budget 1000, missing from baseline",
+    ]
+    # costs the run can't measure, such as opcode budgets on the stand-in, pass
+    assert compare({"A.a": {"app_budget": None}}, baseline, threshold=0.1) == []
+
+
+def test_every_method_is_tracked_on_the_stand_in(tmp_path: Path) -> None:
+    output = tmp_path / "costs.json"
+
+    assert main(["--output", str(output), "--baseline", str(output)]) == 0
+
+    costs = json.loads(output.read_text())["costs"]
+    assert len(costs) == 44
+    assert costs["Auction.claim_bids"]["inner_txns"] == 1
+    assert costs["Auction.claim_bids"]["min_fee"] == 2_000
+    assert costs["RefundAuction.bid"]["inner_txns"] == 1
+    assert (
+        costs["RefundAuction.bid"]["state_bytes"] < costs["Auction.bid"]["state_bytes"]
+    )
+    # ballots live in boxes rather than local state
+    assert costs["BoxVoting.vote"]["state_bytes"] < costs["Voting.vote"]["state_bytes"]
+    # stats live in boxes rather than in local state
+    assert costs["TicTacToeStats.move"]["state_bytes"] == 0
+    assert costs["TicTacToe.move"]["state_bytes"] > 0
+    # the stand-in doesn't run the AVM
+    assert costs["TicTacToe.move"]["app_budget"] is None
+
+
+def test_committed_baseline_covers_every_method(tmp_path: Path) -> None:
+    output = tmp_path / "costs.json"
+
+    assert main(["--output", str(output)]) == 0
+
+    baseline = json.loads(
+        (Path(__file__).parent.parent / "benchmarks" / "costs.json").read_text()
+    )
+    assert baseline["costs"].keys() == json.loads(output.read_text())["costs"].keys()
+
+
+def test_missing_baseline_fails_in_ci(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("CI", "true")
+    output = tmp_path / "costs.json"
+
+    assert (
+        main(["--output", str(output), "--baseline", str(tmp_path / "none.json")]) == 1
+    )
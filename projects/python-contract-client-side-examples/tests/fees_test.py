@@ -0,0 +1,111 @@
+from collections.abc import Mapping
+
+from algokit_utils import TransactionParametersDict
+from algosdk.account import generate_account
+from algosdk.atomic_transaction_composer import (
+    AccountTransactionSigner,
+    AtomicTransactionComposer,
+)
+from algosdk.transaction import SuggestedParams
+from algosdk.v2client import models
+
+from smart_contracts._helpers.application_client import ApplicationClient
+from smart_contracts._helpers.fees import FeePooler
+from smart_contracts.artifacts.auction.auction_client import APP_SPEC
+
+
+class _SimulatingAlgod:
+    """Simulates every group as an app call sending one payment, which itself sends
+    another inner transaction, or as sending nothing once `inner` is cleared"""
+
+    def __init__(self) -> None:
+        self.requests: list[models.SimulateRequest] = []
+        self.inner = True
+
+    def simulate_transactions(
+        self, request: models.SimulateRequest
+    ) -> dict[str, object]:
+        self.requests.append(request)
+        inner_txns = [{"txn": {}, "inner-txns": [{"txn": {}}]}] if self.inner else []
+        return {
+            "version": 2,
+            "txn-groups": [
+                {"txn-results": [{"txn-result": {"txn": {}, "inner-txns": inner_txns}}]}
+            ],
+        }
+
+
+def _client(
+    algod: _SimulatingAlgod,
+    *,
+    flat_fee: bool = False,
+    fee_pooler: FeePooler | None = None,
+) -> ApplicationClient:
+    private_key, address = generate_account()
+    return ApplicationClient(
+        algod,
+        APP_SPEC,
+        app_id=1,
+        sender=address,
+        signer=AccountTransactionSigner(private_key),
+        suggested_params=SuggestedParams(
+            fee=0 if not flat_fee else 5000,
+            first=1,
+            last=1001,
+            gh=b"\x00" * 32,
+            min_fee=1000,
+            flat_fee=flat_fee,
+        ),
+        fee_pooler=fee_pooler or FeePooler(),
+    )
+
+
+def _claim_bids(
+    client: ApplicationClient,
+    transaction_parameters: TransactionParametersDict | None = None,
+) -> int:
+    atc = AtomicTransactionComposer()
+    client.compose_call(
+        atc,
+        call_abi_method="claim_bids()uint64",
+        transaction_parameters=transaction_parameters,
+    )
+    [call] = atc.build_group()
+    return call.txn.fee
+
+
+def test_fee_covers_nested_inner_transactions() -> None:
+    algod = _SimulatingAlgod()
+    client = _client(algod)
+
+    assert _claim_bids(client) == 3000
+    assert _claim_bids(client) == 3000
+    assert len(algod.requests) == 1
+
+
+def test_flat_fee_is_left_alone() -> None:
+    algod = _SimulatingAlgod()
+
+    assert _claim_bids(_client(algod, flat_fee=True)) == 5000
+    assert algod.requests == []
+
+
+def _references_accounts(
+    args: Mapping[str, object], parameters: TransactionParametersDict
+) -> bool:
+    return bool(parameters.get("accounts"))
+
+
+def test_variants_are_probed_apart() -> None:
+    algod = _SimulatingAlgod()
+    client = _client(
+        algod,
+        fee_pooler=FeePooler({"claim_bids()uint64": _references_accounts}),
+    )
+
+    algod.inner = False
+    assert _claim_bids(client) == 1000
+    algod.inner = True
+    assert _claim_bids(client, {"accounts": [generate_account()[1]]}) == 3000
+    assert _claim_bids(client) == 1000
+    assert len(algod.requests) == 2
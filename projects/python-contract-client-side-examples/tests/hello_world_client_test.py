@@ -5,7 +5,16 @@ from algokit_utils.config import config
 from algosdk.v2client.algod import AlgodClient
 from algosdk.v2client.indexer import IndexerClient
 
-from smart_contracts.artifacts.hello_world.hello_world_client import HelloWorldClient
+from smart_contracts.artifacts.hello_world.hello_world_client import SimulateOptions
+from smart_contracts.hello_world.client import (
+    HELLO_MANY_OPCODES,
+    MAX_LOG_SIZE,
+    MAX_NAMES_PER_CALL,
+    OPCODE_BUDGET,
+    OPCODES_PER_NAME,
+    HelloWorldClient,
+    pack_names,
+)
 
 
 @pytest.fixture(scope="session")
@@ -36,6 +45,8 @@ def test_says_hello(hello_world_client: HelloWorldClient) -> None:
     assert result.return_value == "Hello, World"
 
 
+# the stand-in doesn't model opcode budgets
+@pytest.mark.localnet
 def test_simulate_says_hello_with_correct_budget_consumed(
     hello_world_client: HelloWorldClient, algod_client: AlgodClient
 ) -> None:
@@ -46,3 +57,56 @@ def test_simulate_says_hello_with_correct_budget_consumed(
     assert result.abi_results[0].return_value == "Hello, World"
     assert result.abi_results[1].return_value == "Hello, Jane"
     assert result.simulate_response["txn-groups"][0]["app-budget-consumed"] < 100
+
+
+def test_names_are_packed_within_call_limits() -> None:
+    short_names = [f"Name {i}" for i in range(30)]
+    long_names = ["x" * 300] * 4
+
+    assert [len(chunk) for chunk in pack_names(short_names)] == [12, 12, 6]
+    # three greetings of 311 bytes fill the log
+    assert [len(chunk) for chunk in pack_names(long_names)] == [3, 1]
+    with pytest.raises(ValueError, match="too long"):
+        list(pack_names(["x" * MAX_LOG_SIZE]))
+
+
+def test_says_hello_to_many_names(hello_world_client: HelloWorldClient) -> None:
+    # more calls than fit in one group
+    names = [f"Name {i}" for i in range(MAX_NAMES_PER_CALL * 20)]
+
+    greetings = hello_world_client.hello_all(names)
+
+    assert greetings == [f"Hello, {name}" for name in names]
+
+
+# the stand-in doesn't model opcode budgets
+@pytest.mark.localnet
+def test_full_hello_many_call_fits_its_budget(
+    hello_world_client: HelloWorldClient,
+) -> None:
+    names = [f"Name {i}" for i in range(MAX_NAMES_PER_CALL)]
+
+    result = hello_world_client.compose().hello_many(names=names).simulate()
+
+    assert result.abi_results[0].return_value == [f"Hello, {name}" for name in names]
+    assert result.simulate_response["txn-groups"][0]["app-budget-consumed"] <= 700
+
+
+# the stand-in doesn't model opcode budgets
+@pytest.mark.localnet
+@pytest.mark.parametrize("count", [1, MAX_NAMES_PER_CALL, MAX_NAMES_PER_CALL + 1])
+def test_hello_many_opcodes_match_the_budget_maths(
+    hello_world_client: HelloWorldClient, count: int
+) -> None:
+    names = [f"Name {i}" for i in range(count)]
+
+    # budget to spare, so a call over its own budget reports what it would consume
+    result = (
+        hello_world_client.compose()
+        .hello_many(names=names)
+        .simulate(SimulateOptions(extra_opcode_budget=OPCODE_BUDGET))
+    )
+
+    consumed = result.simulate_response["txn-groups"][0]["app-budget-consumed"]
+    assert consumed == HELLO_MANY_OPCODES + OPCODES_PER_NAME * count
+    assert (consumed <= OPCODE_BUDGET) == (count <= MAX_NAMES_PER_CALL)
@@ -1,6 +1,7 @@
 from collections.abc import Iterator
 
 import pytest
+from algopy import arc4
 from algopy_testing import AlgopyTestContext, algopy_testing_context
 
 from smart_contracts.hello_world.contract import HelloWorld
@@ -22,3 +23,21 @@ def test_hello(context: AlgopyTestContext) -> None:
 
     # Assert
     assert output == f"Hello, {dummy_input}"
+
+
+def test_hello_many(context: AlgopyTestContext) -> None:
+    # Arrange
+    names = ["World", "Jane", ""]
+    contract = HelloWorld()
+
+    # Act
+    output = contract.hello_many(
+        arc4.DynamicArray[arc4.String](*(arc4.String(name) for name in names))
+    )
+
+    # Assert
+    assert [greeting.native for greeting in output] == [
+        "Hello, World",
+        "Hello, Jane",
+        "Hello, ",
+    ]
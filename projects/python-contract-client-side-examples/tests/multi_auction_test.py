@@ -0,0 +1,243 @@
+import dataclasses
+from collections.abc import Callable, Iterator
+
+import pytest
+from algokit_utils import LogicError
+from algokit_utils.beta.account_manager import AddressAndSigner
+from algokit_utils.beta.algorand_client import (
+    AlgorandClient,
+    AssetCreateParams,
+    AssetOptInParams,
+    AssetTransferParams,
+    PayParams,
+)
+from algosdk.account import generate_account
+from algosdk.atomic_transaction_composer import TransactionWithSigner
+from algosdk.v2client.algod import AlgodClient
+
+from benchmarks.clock import LocalnetClock
+from smart_contracts._helpers.bulk import BulkGroupError
+from smart_contracts.multi_auction.client import (
+    AUCTION_BOX_MBR,
+    AUCTION_STATE_SIZE,
+    CLAIM_BOX_MBR,
+    AuctionState,
+    Listing,
+    MultiAuctionClient,
+    claim_box_name,
+)
+
+
+def test_decode_round_trips() -> None:
+    _, seller = generate_account()
+    auction = AuctionState(
+        seller=seller, asa=7, asa_amount=1, end=1_000, bid=5, bidder=seller
+    )
+    settled = dataclasses.replace(auction, settled=True)
+
+    assert len(auction.encode()) == AUCTION_STATE_SIZE == 97
+    assert AuctionState.decode(auction.encode()) == auction
+    assert AuctionState.decode(settled.encode()) == settled
+    # ARC-4 encodes true as the top bit of its byte
+    assert settled.encode()[-1] == 0x80
+    assert auction.has_bid
+
+
+def test_claim_box_name() -> None:
+    _, bidder = generate_account()
+
+    assert claim_box_name(3, bidder)[:9] == b"c" + (3).to_bytes(8, "big")
+    assert len(claim_box_name(3, bidder)) == 1 + 8 + 32
+
+
+@pytest.fixture
+def clock(localnet_clock: LocalnetClock) -> Iterator[LocalnetClock]:
+    """Hold the clock of LocalNet, as auctions end at a set time"""
+    with localnet_clock.hold():
+        yield localnet_clock
+
+
+def _create_client(
+    algod_client: AlgodClient, algorand: AlgorandClient, seller: AddressAndSigner
+) -> MultiAuctionClient:
+    client = MultiAuctionClient(
+        algod_client, sender=seller.address, signer=seller.signer
+    )
+    client.create_bare()
+    # the app account's own minimum balance, boxes are paid for as they're created
+    algorand.send.payment(
+        PayParams(sender=seller.address, receiver=client.app_address, amount=100_000)
+    )
+
+    return client
+
+
+def _create_asset(algorand: AlgorandClient, seller: AddressAndSigner) -> int:
+    return algorand.send.asset_create(
+        AssetCreateParams(sender=seller.address, total=1)
+    )["confirmation"]["asset-index"]
+
+
+def test_many_auctions_in_one_app(
+    clock: LocalnetClock,
+    algod_client: AlgodClient,
+    algorand: AlgorandClient,
+    take_account: Callable[[], AddressAndSigner],
+) -> None:
+    seller, alice, bob = (take_account() for _ in range(3))
+    seller_client = _create_client(algod_client, algorand, seller)
+    asset_ids = [
+        algorand.send.asset_create(
+            AssetCreateParams(sender=seller.address, total=1, asset_name=f"Lot {lot}")
+        )["confirmation"]["asset-index"]
+        for lot in range(3)
+    ]
+    for bidder in (alice, bob):
+        for asset_id in asset_ids:
+            algorand.send.asset_opt_in(
+                AssetOptInParams(sender=bidder.address, asset_id=asset_id)
+            )
+
+    started = seller_client.start_auctions(
+        Listing(asset_id, asset_amount=1, starting_price=1_000_000, length=1_000)
+        for asset_id in asset_ids
+    )
+    auction_ids = [result.return_value for result in started]  # type: ignore[union-attr]
+    assert auction_ids == [1, 2, 3]
+
+    alice_client = seller_client.as_account(alice.address, alice.signer)
+    bob_client = seller_client.as_account(bob.address, bob.signer)
+    # Alice bids on the first two auctions, raising her first bid, Bob outbids her
+    # on the second one
+    alice_bids = alice_client.bid_many(
+        [(auction_ids[0], 1_100_000), (auction_ids[1], 1_100_000)]
+    )
+    alice_bids += alice_client.bid_many([(auction_ids[0], 1_200_000)])
+    [bob_bid] = bob_client.bid_many([(auction_ids[1], 2_000_000)])
+    assert [bid.return_value for bid in alice_bids] == [  # type: ignore[union-attr]
+        1_100_000,
+        1_100_000,
+        1_200_000,
+    ]
+    assert bob_bid.return_value == 2_000_000  # type: ignore[union-attr]
+    assert alice_client.get_claim(auction_ids[0], alice.address) == 2_300_000
+    assert alice_client.get_auction(auction_ids[1]).bidder == bob.address
+
+    # bids only count before the auction ends, and settlements only after
+    [early] = seller_client.settle_many(auction_ids[:1])
+    assert isinstance(early, BulkGroupError)
+
+    clock.advance(1_001)
+    [late_bid] = bob_client.bid_many([(auction_ids[2], 3_000_000)])
+    assert isinstance(late_bid, BulkGroupError)
+    settled = seller_client.settle_many(auction_ids)
+    assert not any(isinstance(result, BulkGroupError) for result in settled)
+    # the third auction got no bids, so its ASA goes back to the seller
+    winners = [alice_client, bob_client, seller_client]
+    for auction_id, winner in zip(auction_ids, winners, strict=True):
+        [claimed_asset] = winner.claim_assets_many([auction_id])
+        assert not isinstance(claimed_asset, BulkGroupError)
+
+    holders = [alice, bob, seller]
+    for asset_id, holder in zip(asset_ids, holders, strict=True):
+        holding = algorand.account.get_asset_information(holder.address, asset_id)
+        assert holding["asset-holding"]["amount"] == 1
+    # Alice claims back her earlier bid on the first auction, which she won, and
+    # her outbid one on the second, each with its claim box's MBR
+    claimed = alice_client.claim_bids_many(auction_ids[:2])
+    assert [result.return_value for result in claimed] == [  # type: ignore[union-attr]
+        1_100_000 + CLAIM_BOX_MBR,
+        1_100_000 + CLAIM_BOX_MBR,
+    ]
+    assert alice_client.get_claim(auction_ids[0], alice.address) is None
+    assert alice_client.get_claim(auction_ids[1], alice.address) is None
+
+
+def test_winners_who_cannot_hold_the_asset_do_not_block_the_seller(
+    clock: LocalnetClock,
+    algod_client: AlgodClient,
+    algorand: AlgorandClient,
+    take_account: Callable[[], AddressAndSigner],
+) -> None:
+    seller, bob = take_account(), take_account()
+    seller_client = _create_client(algod_client, algorand, seller)
+    asset_id = _create_asset(algorand, seller)
+    [started] = seller_client.start_auctions(
+        [Listing(asset_id, asset_amount=1, starting_price=1_000_000, length=1_000)]
+    )
+    auction_id = started.return_value  # type: ignore[union-attr]
+    bob_client = seller_client.as_account(bob.address, bob.signer)
+    bob_client.bid_many([(auction_id, 2_000_000)])
+
+    # Bob never opted into the ASA, yet settling pays the seller
+    clock.advance(1_001)
+    seller_balance = algorand.account.get_information(seller.address)["amount"]
+    [settled] = seller_client.settle_many([auction_id])
+    assert not isinstance(settled, BulkGroupError)
+    assert (
+        algorand.account.get_information(seller.address)["amount"]
+        == seller_balance + 2_000_000 - 2_000
+    )
+    assert seller_client.get_auction(auction_id).settled
+
+    # only the winner claims the ASA, once they can hold it
+    [by_seller] = seller_client.claim_assets_many([auction_id])
+    assert isinstance(by_seller, BulkGroupError)
+    [not_opted_in] = bob_client.claim_assets_many([auction_id])
+    assert isinstance(not_opted_in, BulkGroupError)
+    algorand.send.asset_opt_in(AssetOptInParams(sender=bob.address, asset_id=asset_id))
+    seller_balance = algorand.account.get_information(seller.address)["amount"]
+    [claimed] = bob_client.claim_assets_many([auction_id])
+    assert not isinstance(claimed, BulkGroupError)
+    holding = algorand.account.get_asset_information(bob.address, asset_id)
+    assert holding["asset-holding"]["amount"] == 1
+    # the seller gets back the MBR of the auction's box
+    assert (
+        algorand.account.get_information(seller.address)["amount"]
+        == seller_balance + AUCTION_BOX_MBR
+    )
+
+
+def test_auctions_are_started_with_the_sellers_own_transactions(
+    algod_client: AlgodClient,
+    algorand: AlgorandClient,
+    take_account: Callable[[], AddressAndSigner],
+) -> None:
+    seller, other = take_account(), take_account()
+    seller_client = _create_client(algod_client, algorand, seller)
+    asset_id = algorand.send.asset_create(
+        AssetCreateParams(sender=seller.address, total=2)
+    )["confirmation"]["asset-index"]
+    # the first auction opts the app into the ASA
+    seller_client.start_auctions(
+        [Listing(asset_id, asset_amount=1, starting_price=1_000_000, length=1_000)]
+    )
+
+    def start_auction(caller: AddressAndSigner, mbr_sender: AddressAndSigner) -> None:
+        axfer = algorand.transactions.asset_transfer(
+            AssetTransferParams(
+                sender=seller.address,
+                receiver=seller_client.app_address,
+                asset_id=asset_id,
+                amount=1,
+            )
+        )
+        mbr = algorand.transactions.payment(
+            PayParams(
+                sender=mbr_sender.address,
+                receiver=seller_client.app_address,
+                amount=AUCTION_BOX_MBR,
+            )
+        )
+        seller_client.as_account(caller.address, caller.signer).start_auction(
+            starting_price=1_000_000,
+            length=1_000,
+            axfer=TransactionWithSigner(axfer, seller.signer),
+            mbr=TransactionWithSigner(mbr, mbr_sender.signer),
+        )
+
+    # nobody can start an auction out of someone else's transactions
+    with pytest.raises(LogicError, match="axfer sender must match"):
+        start_auction(other, other)
+    with pytest.raises(LogicError, match="mbr sender must match"):
+        start_auction(seller, other)
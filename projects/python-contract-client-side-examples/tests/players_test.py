@@ -0,0 +1,55 @@
+from algosdk.account import generate_account
+from algosdk.constants import ZERO_ADDRESS
+from algosdk.encoding import decode_address
+from algosdk.error import AlgodHTTPError
+
+from smart_contracts._helpers.players import PlayersRule, encode_address
+from smart_contracts._helpers.references import References
+from smart_contracts.tictactoe.client import GameState
+
+
+def _address() -> str:
+    _, address = generate_account()
+    return str(address)
+
+
+class _Games:
+    """Serves games by id, counting how often each is read"""
+
+    def __init__(self, games: dict[int, GameState]):
+        self.games = games
+        self.reads: list[int] = []
+
+    def get(self, game_id: int) -> GameState:
+        self.reads.append(game_id)
+        if game_id not in self.games:
+            raise AlgodHTTPError("box not found", code=404)
+        return self.games[game_id]
+
+
+def _references(game_id: int, players: tuple[str, ...]) -> References:
+    return References(foreign_apps=(game_id,), accounts=players)
+
+
+def test_encode_address_round_trips() -> None:
+    address = _address()
+
+    assert encode_address(decode_address(address)) == address
+
+
+def test_players_are_read_once_the_guest_has_joined() -> None:
+    host, guest = _address(), _address()
+    games = _Games({1: GameState(bytes(9), host, ZERO_ADDRESS, is_over=False, turns=0)})
+    rule = PlayersRule(games.get, _references)
+
+    assert rule({"game_id": 1}) == References(foreign_apps=(1,), accounts=(host,))
+    games.games[1] = GameState(bytes(9), host, guest, is_over=False, turns=0)
+    assert rule({"game_id": 1}) == _references(1, (host, guest))
+    assert rule({"game_id": 1}) == _references(1, (host, guest))
+    assert games.reads == [1, 1]
+
+
+def test_unreadable_games_are_left_to_simulate() -> None:
+    rule = PlayersRule(_Games({}).get, _references)
+
+    assert rule({"game_id": 7}) is None
@@ -0,0 +1,52 @@
+from pathlib import Path
+
+from benchmarks.profiler import Line, Profile, Program, SourceMap
+
+CONTRACT = Path("smart_contracts/tictactoe/contract.py")
+# lines of the contract's class and of `is_game_over`
+CLASS_LINE, IS_GAME_OVER_LINE = 33, 150
+
+TEAL = """#pragma version 10
+smart_contracts.tictactoe.contract.TicTacToe.approval_program:
+    callsub is_game_over
+    return
+is_game_over:
+    int 1 // true
+    retsub
+"""
+# pcs of each opcode, by the line of TEAL it's on
+TEAL_MAP = SourceMap(["approval.teal"], {1: (0, 2), 4: (0, 3), 5: (0, 5), 7: (0, 6)})
+PCS = [1, 5, 7, 4]
+
+
+def test_source_maps_are_decoded_by_pc() -> None:
+    source_map = SourceMap.from_json(
+        {"sources": ["contract.py"], "mappings": "AAEA;AAFA;;AAgBC,CAAC"}
+    )
+
+    assert source_map.lines == {0: (0, 2), 1: (0, 0), 3: (0, 16)}
+
+
+def test_opcodes_are_located_at_their_subroutines_without_source_map() -> None:
+    profile = Profile.of(Program(TEAL, TEAL_MAP, CONTRACT), PCS)
+
+    program_line = Line(str(CONTRACT), CLASS_LINE)
+    is_game_over_line = Line(str(CONTRACT), IS_GAME_OVER_LINE)
+    assert profile.own == {program_line: 2, is_game_over_line: 2}
+    assert profile.cumulative == {program_line: 4, is_game_over_line: 2}
+    assert profile.folded() == (
+        f"approval_program ({program_line}) 2\n"
+        f"approval_program ({program_line});is_game_over ({is_game_over_line}) 2\n"
+    )
+
+
+def test_opcodes_are_located_at_lines_of_source_map() -> None:
+    # `int 1` comes from the row check of `is_game_over`
+    source_map = SourceMap([str(CONTRACT)], {5: (0, 152)})
+    program = Program(TEAL, TEAL_MAP, CONTRACT, source_map)
+    profile = Profile.of(program, PCS)
+
+    row_check = Line(str(CONTRACT), 153)
+    assert profile.own[row_check] == 1
+    assert program.source(row_check).startswith("if board[3 * i] ==")
+    assert f"1   25%        1  {row_check}  if board" in profile.report(program)
@@ -0,0 +1,137 @@
+import base64
+
+from algosdk.account import generate_account
+from algosdk.atomic_transaction_composer import (
+    AccountTransactionSigner,
+    AtomicTransactionComposer,
+)
+from algosdk.transaction import SuggestedParams
+from algosdk.v2client import models
+
+from smart_contracts._helpers.application_client import ApplicationClient
+from smart_contracts._helpers.references import (
+    NextIdRule,
+    ReferenceResolver,
+    References,
+)
+from smart_contracts.artifacts.tictactoe.tic_tac_toe_client import APP_SPEC
+
+APP_ID = 1
+
+
+class _SimulatingAlgod:
+    """Reports a fixed set of unnamed resources for every simulated group"""
+
+    def __init__(self, unnamed_resources: dict[str, object]):
+        self.unnamed_resources = unnamed_resources
+        self.requests: list[models.SimulateRequest] = []
+
+    def simulate_transactions(
+        self, request: models.SimulateRequest
+    ) -> dict[str, object]:
+        self.requests.append(request)
+        return {
+            "version": 2,
+            "txn-groups": [
+                {
+                    "txn-results": [
+                        {
+                            "txn-result": {"txn": {}},
+                            "unnamed-resources-accessed": self.unnamed_resources,
+                        }
+                    ]
+                }
+            ],
+        }
+
+
+def _client(algod: _SimulatingAlgod, resolver: ReferenceResolver) -> ApplicationClient:
+    private_key, address = generate_account()
+    return ApplicationClient(
+        algod,
+        APP_SPEC,
+        app_id=APP_ID,
+        sender=address,
+        signer=AccountTransactionSigner(private_key),
+        suggested_params=SuggestedParams(fee=1000, first=1, last=1001, gh=b"\x00" * 32),
+        reference_resolver=resolver,
+    )
+
+
+def _delete_game(client: ApplicationClient, game_id: int) -> AtomicTransactionComposer:
+    atc = AtomicTransactionComposer()
+    client.compose_call(atc, call_abi_method="delete_game(uint64)void", game_id=game_id)
+    return atc
+
+
+def test_rules_take_precedence_over_simulate() -> None:
+    algod = _SimulatingAlgod({})
+    resolver = ReferenceResolver(
+        {"delete_game(uint64)void": lambda args: References(foreign_apps=(9,))}
+    )
+
+    [call] = _delete_game(_client(algod, resolver), 1).build_group()
+
+    assert call.txn.foreign_apps == [9]
+    assert algod.requests == []
+
+
+def test_falls_back_to_simulate_once_per_argument_shape() -> None:
+    _, other = generate_account()
+    algod = _SimulatingAlgod(
+        {
+            "boxes": [{"app": APP_ID, "name": base64.b64encode(b"box").decode()}],
+            "app-locals": [{"account": other, "app": APP_ID}],
+            "assets": [5],
+        }
+    )
+    client = _client(algod, ReferenceResolver())
+
+    [call] = _delete_game(client, 1).build_group()
+    _delete_game(client, 1)
+    _delete_game(client, 2)
+
+    assert [(box.app_index, box.name) for box in call.txn.boxes] == [(0, b"box")]
+    assert call.txn.accounts == [other]
+    assert call.txn.foreign_assets == [5]
+    assert len(algod.requests) == 2
+    assert algod.requests[0].allow_unnamed_resources
+
+
+def test_simulated_references_are_bounded() -> None:
+    algod = _SimulatingAlgod({"assets": [5]})
+    client = _client(algod, ReferenceResolver(max_entries=1))
+
+    for game_id in (1, 2, 1):
+        _delete_game(client, game_id)
+
+    assert len(algod.requests) == 3
+
+
+def test_next_ids_are_counted_per_group() -> None:
+    counter_reads = []
+
+    def read_counter() -> int:
+        counter_reads.append(4)
+        return 4
+
+    resolver = ReferenceResolver(
+        {
+            "delete_game(uint64)void": NextIdRule(
+                read_counter,
+                lambda next_id, args: References(foreign_apps=(next_id,)),
+            )
+        }
+    )
+    client = _client(_SimulatingAlgod({}), resolver)
+    atc = AtomicTransactionComposer()
+    for game_id in (1, 2, 3):
+        client.compose_call(
+            atc, call_abi_method="delete_game(uint64)void", game_id=game_id
+        )
+
+    [other] = _delete_game(client, 4).build_group()
+
+    assert [call.txn.foreign_apps for call in atc.build_group()] == [[5], [6], [7]]
+    assert other.txn.foreign_apps == [5]
+    assert len(counter_reads) == 2
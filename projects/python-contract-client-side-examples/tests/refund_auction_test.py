@@ -0,0 +1,146 @@
+from collections.abc import Callable, Iterator
+
+import pytest
+from algokit_utils import LogicError
+from algokit_utils.beta.account_manager import AddressAndSigner
+from algokit_utils.beta.algorand_client import (
+    AlgorandClient,
+    AssetCreateParams,
+    AssetOptInParams,
+    AssetTransferParams,
+    PayParams,
+)
+from algosdk.atomic_transaction_composer import TransactionWithSigner
+from algosdk.v2client.algod import AlgodClient
+
+from benchmarks.clock import LocalnetClock
+from smart_contracts.refund_auction.client import RefundAuctionClient
+
+
+@pytest.fixture
+def clock(localnet_clock: LocalnetClock) -> Iterator[LocalnetClock]:
+    """Hold the clock of LocalNet, as the auction ends at a set time"""
+    with localnet_clock.hold():
+        yield localnet_clock
+
+
+def _bid(
+    client: RefundAuctionClient,
+    bidder: AddressAndSigner,
+    algorand: AlgorandClient,
+    amount: int,
+) -> int:
+    # a single group, with no opt in to the app beforehand
+    pay = algorand.transactions.payment(
+        PayParams(sender=bidder.address, receiver=client.app_address, amount=amount)
+    )
+    bidder_client = client.as_account(bidder.address, bidder.signer)
+
+    return bidder_client.bid(pay=TransactionWithSigner(pay, bidder.signer)).return_value
+
+
+def _start_auction(
+    algod_client: AlgodClient,
+    algorand: AlgorandClient,
+    creator: AddressAndSigner,
+    starting_price: int,
+) -> tuple[RefundAuctionClient, int]:
+    client = RefundAuctionClient(
+        algod_client, sender=creator.address, signer=creator.signer
+    )
+    client.create_bare()
+    algorand.send.payment(
+        PayParams(sender=creator.address, receiver=client.app_address, amount=1_000_000)
+    )
+    asset_id = algorand.send.asset_create(
+        AssetCreateParams(sender=creator.address, total=1, decimals=0)
+    )["confirmation"]["asset-index"]
+    client.opt_into_asset(asset=asset_id)
+    axfer = algorand.transactions.asset_transfer(
+        AssetTransferParams(
+            sender=creator.address,
+            receiver=client.app_address,
+            asset_id=asset_id,
+            amount=1,
+        )
+    )
+    client.start_auction(
+        starting_price=starting_price,
+        length=1_000,
+        axfer=TransactionWithSigner(axfer, creator.signer),
+    )
+
+    return client, asset_id
+
+
+def test_outbid_bidders_are_paid_back(
+    clock: LocalnetClock,
+    algod_client: AlgodClient,
+    algorand: AlgorandClient,
+    take_account: Callable[[], AddressAndSigner],
+) -> None:
+    creator, alice, bob = (take_account() for _ in range(3))
+    client, asset_id = _start_auction(algod_client, algorand, creator, 1_000_000)
+
+    alice_balance = algorand.account.get_information(alice.address)["amount"]
+    bob_balance = algorand.account.get_information(bob.address)["amount"]
+    assert _bid(client, alice, algorand, 1_100_000) == 1_100_000
+    # the first bid pays nobody back, so it only pays its own fees
+    alice_balance -= 1_100_000 + 1_000 + 1_000
+    assert algorand.account.get_information(alice.address)["amount"] == alice_balance
+    assert _bid(client, bob, algorand, 2_000_000) == 2_000_000
+    # a bid outbidding someone also covers the fee of paying them back
+    bob_balance -= 2_000_000 + 1_000 + 2_000
+    assert algorand.account.get_information(bob.address)["amount"] == bob_balance
+
+    # Alice got her bid back with Bob's, without claiming it
+    assert (
+        algorand.account.get_information(alice.address)["amount"]
+        == alice_balance + 1_100_000
+    )
+    assert client.get_previous_bidder() == bob.address
+
+    clock.advance(1_001)
+    algorand.send.asset_opt_in(AssetOptInParams(sender=bob.address, asset_id=asset_id))
+    bob_client = client.as_account(bob.address, bob.signer)
+    bob_client.claim_asset(asset=asset_id)
+    holding = algorand.account.get_asset_information(bob.address, asset_id)
+    assert holding["asset-holding"]["amount"] == 1
+
+    client.delete_delete_application()
+    creator_info = algorand.account.get_information(creator.address)
+    assert creator_info["total-created-apps"] == 0
+
+
+def test_starting_price_covers_the_minimum_balance(
+    clock: LocalnetClock,
+    algod_client: AlgodClient,
+    algorand: AlgorandClient,
+    take_account: Callable[[], AddressAndSigner],
+) -> None:
+    with pytest.raises(LogicError, match="starting price must cover"):
+        _start_auction(algod_client, algorand, take_account(), 99_999)
+
+
+def test_closed_bidders_are_still_paid_back(
+    clock: LocalnetClock,
+    algod_client: AlgodClient,
+    algorand: AlgorandClient,
+    take_account: Callable[[], AddressAndSigner],
+) -> None:
+    creator, alice, bob = (take_account() for _ in range(3))
+    client, _ = _start_auction(algod_client, algorand, creator, 100_000)
+    _bid(client, alice, algorand, 100_001)
+    # Alice closes her account, so paying her back has to fund it again
+    algorand.send.payment(
+        PayParams(
+            sender=alice.address,
+            receiver=creator.address,
+            amount=0,
+            close_remainder_to=creator.address,
+        )
+    )
+
+    assert _bid(client, bob, algorand, 200_000) == 200_000
+    assert algorand.account.get_information(alice.address)["amount"] == 100_001
+    assert client.get_previous_bidder() == bob.address
@@ -0,0 +1,58 @@
+import base64
+
+from algosdk import encoding, transaction
+from algosdk.account import generate_account
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    TransactionWithSigner,
+)
+
+from smart_contracts._helpers.signing import BatchSigner
+
+_GENESIS_HASH = "SGO1GKSzyE7IEPItTxCByw9x8FmnrCDexi9/cOUJOiI="
+
+
+def _payments(sender: str, count: int) -> list[transaction.Transaction]:
+    sp = transaction.SuggestedParams(fee=1000, first=1, last=1001, gh=_GENESIS_HASH)
+    return [
+        transaction.PaymentTxn(sender, sp, sender, amount) for amount in range(count)
+    ]
+
+
+def test_sign_groups_signs_with_each_sender_key() -> None:
+    accounts = [generate_account() for _ in range(2)]
+    groups = [
+        transaction.assign_group_id(
+            _payments(accounts[0][1], 3) + _payments(accounts[1][1], 2)
+        )
+        for _ in range(4)
+    ]
+
+    with BatchSigner(
+        {address: private_key for private_key, address in accounts}, max_workers=2
+    ) as signer:
+        signed_groups = signer.sign_groups(groups)
+
+    keys = {address: private_key for private_key, address in accounts}
+    assert signed_groups == [
+        [
+            base64.b64decode(encoding.msgpack_encode(txn.sign(keys[txn.sender])))
+            for txn in group
+        ]
+        for group in groups
+    ]
+
+
+def test_signer_plugs_into_composers() -> None:
+    private_key, address = generate_account()
+    atc = AtomicTransactionComposer()
+
+    with BatchSigner({address: private_key}, max_workers=1) as batch_signer:
+        for txn in _payments(address, 2):
+            atc.add_transaction(
+                TransactionWithSigner(txn, batch_signer.signer(address))
+            )
+        signed_txns = atc.gather_signatures()
+
+    assert [stxn.transaction.amt for stxn in signed_txns] == [0, 1]
+    assert all(stxn.signature for stxn in signed_txns)
@@ -0,0 +1,93 @@
+import threading
+
+from algosdk.account import generate_account
+from algosdk.atomic_transaction_composer import AccountTransactionSigner
+from algosdk.transaction import SuggestedParams
+from algosdk.v2client import models
+
+from smart_contracts._helpers.confirmations import ConfirmationWaiter
+from smart_contracts._helpers.simulate_cache import SimulateCache
+from smart_contracts.artifacts.hello_world.hello_world_client import SimulateOptions
+from smart_contracts.hello_world.client import HelloWorldClient
+
+
+class _SimulatingAlgod:
+    """Simulates every group as succeeding, at a round tests move on by hand"""
+
+    def __init__(self) -> None:
+        self.round = 1
+        self.requests: list[models.SimulateRequest] = []
+        self._next_round = threading.Event()
+
+    def status(self) -> dict[str, object]:
+        return {"last-round": self.round}
+
+    def status_after_block(self, round_num: int) -> dict[str, object]:
+        self._next_round.wait()
+        self._next_round.clear()
+        return {"last-round": self.round}
+
+    def simulate_transactions(
+        self, request: models.SimulateRequest
+    ) -> dict[str, object]:
+        self.requests.append(request)
+        txn_results = [{"txn-result": {"txn": {}}} for _ in request.txn_groups[0].txns]
+        return {"version": 2, "txn-groups": [{"txn-results": txn_results}]}
+
+    def advance(self) -> None:
+        self.round += 1
+        self._next_round.set()
+
+
+def _client(algod: _SimulatingAlgod) -> HelloWorldClient:
+    private_key, address = generate_account()
+    return HelloWorldClient(
+        algod,  # type: ignore[arg-type]
+        app_id=1,
+        sender=address,
+        signer=AccountTransactionSigner(private_key),
+        suggested_params=SuggestedParams(
+            fee=1000, first=1, last=1001, gh=b"\x00" * 32, flat_fee=True
+        ),
+    )
+
+
+def test_identical_groups_are_simulated_once() -> None:
+    algod = _SimulatingAlgod()
+    client = _client(algod)
+    cache = SimulateCache()
+
+    first = cache.simulate(client.compose().hello(name="World"))
+    second = cache.simulate(client.compose().hello(name="World"))
+    cache.simulate(client.compose().hello(name="Algorand"))
+    cache.simulate(
+        client.compose().hello(name="World"), SimulateOptions(allow_more_logs=True)
+    )
+
+    assert second is first
+    assert len(algod.requests) == 3
+
+
+def test_least_recently_used_results_are_dropped() -> None:
+    algod = _SimulatingAlgod()
+    client = _client(algod)
+    cache = SimulateCache(max_entries=2)
+
+    for name in ["a", "b", "a", "c", "a", "b"]:
+        cache.simulate(client.compose().hello(name=name))
+
+    # "b" was dropped for "c", while "a" stayed in use
+    assert len(algod.requests) == 4
+
+
+def test_results_are_not_reused_in_a_later_round() -> None:
+    algod = _SimulatingAlgod()
+    client = _client(algod)
+    cache = SimulateCache()
+
+    cache.simulate(client.compose().hello(name="World"))
+    algod.advance()
+    ConfirmationWaiter.shared(algod).wait_for_round(2)  # type: ignore[arg-type]
+    cache.simulate(client.compose().hello(name="World"))
+
+    assert len(algod.requests) == 2
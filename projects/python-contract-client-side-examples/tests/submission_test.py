@@ -0,0 +1,69 @@
+import threading
+import time
+
+from algosdk.error import AlgodHTTPError
+
+from smart_contracts._helpers.confirmations import ConfirmationWaiter
+from smart_contracts._helpers.submission import SubmissionPipeline
+
+
+class _ConfirmingAlgod:
+    """Confirms every group sent in the next block, rejecting the first send as if
+    the transaction pool were full"""
+
+    def __init__(self) -> None:
+        self.round = 1
+        self.bodies: list[bytes] = []
+        self.blocks: dict[int, list[str]] = {}
+        self._queued: list[str] = []
+        self._pool_full = True
+        self._lock = threading.Lock()
+
+    def status(self) -> dict[str, object]:
+        return {"last-round": self.round}
+
+    def status_after_block(self, round_num: int) -> dict[str, object]:
+        time.sleep(0.005)
+        with self._lock:
+            self.round += 1
+            self.blocks[self.round], self._queued = self._queued, []
+            return {"last-round": self.round}
+
+    def get_block_txids(self, round_num: int) -> dict[str, object]:
+        return {"blockTxids": self.blocks[round_num]}
+
+    def pending_transaction_info(self, tx_id: str) -> dict[str, object]:
+        for round_num, tx_ids in self.blocks.items():
+            if tx_id in tx_ids:
+                return {"confirmed-round": round_num}
+        return {}
+
+    def algod_request(
+        self, method: str, path: str, data: bytes, headers: dict[str, str]
+    ) -> dict[str, object]:
+        with self._lock:
+            if self._pool_full:
+                self._pool_full = False
+                raise AlgodHTTPError("txpool is full")
+            self.bodies.append(data)
+            tx_id = f"tx{len(self.bodies)}"
+            self._queued.append(tx_id)
+            return {"txId": tx_id}
+
+
+def test_groups_are_sent_raw_and_confirmed() -> None:
+    algod = _ConfirmingAlgod()
+    waiter = ConfirmationWaiter(algod)  # type: ignore[arg-type]
+    pipeline = SubmissionPipeline(
+        algod,  # type: ignore[arg-type]
+        max_pending=2,
+        confirmation_waiter=waiter,
+    )
+
+    futures = [pipeline.submit([b"a%d" % i, b"b%d" % i]) for i in range(5)]
+    confirmed_rounds = [future.result(timeout=5) for future in futures]
+    waiter.close()
+
+    assert algod.bodies == [b"a%db%d" % (i, i) for i in range(5)]
+    assert confirmed_rounds == sorted(confirmed_rounds)
+    assert confirmed_rounds[0] > 2  # sent after the pool made room
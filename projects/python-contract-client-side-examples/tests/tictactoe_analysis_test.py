@@ -0,0 +1,92 @@
+import numpy as np
+import numpy.typing as npt
+import pytest
+from algopy import arc4
+from algopy_testing import algopy_testing_context
+from algosdk.account import generate_account
+from hypothesis import given, settings
+from hypothesis import strategies as st
+from hypothesis.extra.numpy import arrays
+
+from smart_contracts.tictactoe.analysis import analyze, boards_of
+from smart_contracts.tictactoe.client import GameState
+from smart_contracts.tictactoe.contract import Board, TicTacToe
+
+# any (N, 9) boards, with marks beyond the two players' to check lines of any equal
+# marks count, as they do on chain
+boards_strategy = arrays(
+    np.uint8,
+    st.tuples(st.integers(0, 16), st.just(9)),
+    elements=st.integers(0, 3),
+)
+
+
+@given(boards_strategy)
+@settings(deadline=None)
+def test_matches_is_game_over(boards: npt.NDArray[np.uint8]) -> None:
+    analysis = analyze(boards)
+
+    with algopy_testing_context():
+        contract = TicTacToe()
+        expected = [
+            contract.is_game_over(Board(*(arc4.Byte(int(cell)) for cell in board)))
+            for board in boards
+        ]
+    assert [
+        (bool(is_over), bool(is_draw))
+        for is_over, is_draw in zip(analysis.is_over, analysis.is_draw, strict=True)
+    ] == expected
+
+
+@given(boards_strategy)
+def test_legal_moves_are_empty_cells_of_open_games(
+    boards: npt.NDArray[np.uint8],
+) -> None:
+    analysis = analyze(boards)
+
+    for board, is_over, legal_moves in zip(
+        boards, analysis.is_over, analysis.legal_moves, strict=True
+    ):
+        assert list(legal_moves) == [not is_over and cell == 0 for cell in board]
+
+
+def test_winner_and_full_boards() -> None:
+    boards = np.array(
+        [
+            [1, 1, 1, 2, 2, 0, 0, 0, 0],  # host wins on the top row
+            [1, 2, 1, 1, 2, 0, 0, 2, 1],  # guest wins on the middle column
+            [1, 2, 1, 1, 2, 2, 2, 1, 1],  # full, without a line
+            [0, 0, 0, 0, 1, 0, 0, 0, 0],
+        ],
+        dtype=np.uint8,
+    )
+
+    analysis = analyze(boards)
+
+    assert list(analysis.winner) == [1, 2, 0, 0]
+    assert list(analysis.is_over) == [True, True, False, False]
+    # the contract leaves full boards without a line open
+    assert list(analysis.is_full & ~analysis.is_over) == [False, False, True, False]
+    assert analysis.legal_moves[3].sum() == 8
+
+
+def test_boards_of_games() -> None:
+    _, host = generate_account()
+    games = [
+        GameState(
+            board=bytes([turn % 3] * 9), host=host, guest=host, is_over=False, turns=0
+        )
+        for turn in range(3)
+    ]
+
+    boards = boards_of(games)
+
+    assert boards.shape == (3, 9)
+    assert list(analyze(boards).is_over) == [False, True, True]
+
+
+def test_rejects_other_shapes_and_dtypes() -> None:
+    with pytest.raises(ValueError, match="shape"):
+        analyze(np.zeros((2, 3, 3), dtype=np.uint8))
+    with pytest.raises(ValueError, match="dtype"):
+        analyze(np.zeros((2, 9), dtype=np.int64))
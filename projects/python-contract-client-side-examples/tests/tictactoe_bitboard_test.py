@@ -0,0 +1,221 @@
+import algosdk.abi
+import pytest
+from algokit_utils import (
+    EnsureBalanceParameters,
+    TransactionParameters,
+    ensure_funded,
+    get_localnet_default_account,
+)
+from algokit_utils.beta.account_manager import AddressAndSigner
+from algokit_utils.beta.algorand_client import AlgorandClient
+from algokit_utils.beta.client_manager import AlgoSdkClients
+from algokit_utils.beta.composer import PayParams
+from algosdk.account import generate_account
+from algosdk.atomic_transaction_composer import TransactionWithSigner
+from algosdk.v2client.algod import AlgodClient
+from algosdk.v2client.indexer import IndexerClient
+
+from benchmarks.costs import track
+from benchmarks.network import Network
+from smart_contracts._helpers.account_pool import AccountPool
+from smart_contracts.tictactoe import client as tictactoe
+from smart_contracts.tictactoe_bitboard.client import (
+    GAME_STATE_SIZE,
+    NEW_GAME_MBR,
+    GameState,
+    TicTacToeBitboardClient,
+    game_box_name,
+)
+
+GAME_STATE_ABI_TYPE = algosdk.abi.TupleType(
+    [algosdk.abi.UintType(64), algosdk.abi.AddressType(), algosdk.abi.AddressType()]
+)
+
+
+def _random_address() -> str:
+    _, address = generate_account()
+    return address
+
+
+def test_decode_matches_abi_decoder() -> None:
+    host, guest = _random_address(), _random_address()
+    # host in the top row and centre, guest in the left column, over after 5 turns
+    board = 0b000_010_111 | 0b001_001_000 << 16 | 5 << 32 | 1 << 48
+    encoded = GAME_STATE_ABI_TYPE.encode([board, host, guest])
+
+    game = GameState.decode(encoded)
+
+    assert GAME_STATE_SIZE == len(encoded) == 72
+    assert game == GameState(
+        host_marks=0b000_010_111,
+        guest_marks=0b001_001_000,
+        host=host,
+        guest=guest,
+        is_over=True,
+        turns=5,
+    )
+    assert game.board == bytes([1, 1, 1, 2, 1, 0, 2, 0, 0])
+    assert game.encode() == encoded
+
+
+def test_new_game_needs_less_mbr_than_tictactoe() -> None:
+    assert game_box_name(1) == b"g" + (1).to_bytes(8, "big")
+    assert NEW_GAME_MBR == 2_500 + 400 * (1 + 8 + 72)
+    assert NEW_GAME_MBR < 2_500 + 400 * (
+        len(tictactoe.game_box_name(1)) + tictactoe.GAME_STATE_SIZE
+    )
+
+
+@pytest.fixture(scope="session")
+def algorand_client(
+    algod_client: AlgodClient, indexer_client: IndexerClient
+) -> AlgorandClient:
+    """Get an AlgorandClient to use throughout the tests"""
+    algorand = AlgorandClient.from_clients(AlgoSdkClients(algod_client, indexer_client))
+    algorand.set_suggested_params_timeout(0)
+
+    return algorand
+
+
+@pytest.fixture(scope="session")
+def bitboard_client(algorand_client: AlgorandClient) -> TicTacToeBitboardClient:
+    """Get a TicTacToeBitboardClient to use throughout the tests"""
+    client = TicTacToeBitboardClient(
+        algod_client=algorand_client.client.algod,
+        creator=get_localnet_default_account(algorand_client.client.algod),
+        indexer_client=algorand_client.client.indexer,
+    )
+
+    client.create_bare()
+    ensure_funded(
+        algorand_client.client.algod,
+        EnsureBalanceParameters(
+            account_to_fund=client.app_address, min_spending_balance_micro_algos=0
+        ),
+    )
+
+    return client
+
+
+@pytest.fixture
+def players(
+    algorand_client: AlgorandClient, account_pool: AccountPool
+) -> tuple[AddressAndSigner, AddressAndSigner]:
+    """Get a host and a guest for a single test, as they opt in to the shared app"""
+    accts = account_pool.take(), account_pool.take()
+    for acct in accts:
+        algorand_client.account.set_signer(acct.address, acct.signer)
+
+    return accts
+
+
+def _params(acct: AddressAndSigner) -> TransactionParameters:
+    return TransactionParameters(signer=acct.signer, sender=acct.address)
+
+
+def _play(
+    client: TicTacToeBitboardClient,
+    algorand_client: AlgorandClient,
+    players: tuple[AddressAndSigner, AddressAndSigner],
+    moves: list[tuple[int, int]],
+) -> int:
+    host, guest = players
+    game_id = client.opt_in_new_game(
+        mbr=TransactionWithSigner(
+            txn=algorand_client.transactions.payment(
+                PayParams(
+                    sender=host.address,
+                    receiver=client.app_address,
+                    amount=NEW_GAME_MBR,
+                )
+            ),
+            signer=host.signer,
+        ),
+        transaction_parameters=_params(host),
+    ).return_value
+    client.opt_in_join(game_id=game_id, transaction_parameters=_params(guest))
+    for turn, (x, y) in enumerate(moves):
+        client.move(
+            game_id=game_id, x=x, y=y, transaction_parameters=_params(players[turn % 2])
+        )
+
+    return game_id
+
+
+def test_win(
+    bitboard_client: TicTacToeBitboardClient,
+    algorand_client: AlgorandClient,
+    players: tuple[AddressAndSigner, AddressAndSigner],
+) -> None:
+    host, guest = players
+    moves = [(0, 0), (2, 2), (1, 1), (2, 1), (0, 2), (2, 0)]
+
+    game_id = _play(bitboard_client, algorand_client, players, moves)
+
+    game = bitboard_client.get_game(game_id)
+    assert game.is_over
+    assert game.turns == 6
+    assert game.board == bytes([1, 0, 2, 0, 1, 2, 1, 0, 2])
+    assert (game.host, game.guest) == (host.address, guest.address)
+
+    assert bitboard_client.get_local_state(host.address).games_played == 1
+    assert bitboard_client.get_local_state(guest.address).games_played == 1
+
+    assert bitboard_client.get_local_state(host.address).games_won == 0
+    assert bitboard_client.get_local_state(guest.address).games_won == 1
+
+
+def test_draw(
+    bitboard_client: TicTacToeBitboardClient,
+    algorand_client: AlgorandClient,
+    players: tuple[AddressAndSigner, AddressAndSigner],
+) -> None:
+    host, guest = players
+    moves = [(0, 0), (1, 0), (2, 0), (1, 1), (0, 1), (2, 1), (1, 2), (0, 2), (2, 2)]
+
+    game_id = _play(bitboard_client, algorand_client, players, moves)
+
+    game = bitboard_client.get_game(game_id)
+    assert game.is_over
+    assert game.turns == 9
+    assert game.host_marks | game.guest_marks == 0x1FF
+
+    assert bitboard_client.get_local_state(host.address).games_played == 1
+    assert bitboard_client.get_local_state(host.address).games_won == 0
+    assert bitboard_client.get_local_state(guest.address).games_won == 0
+
+
+def test_taken_cells_are_rejected(
+    bitboard_client: TicTacToeBitboardClient,
+    algorand_client: AlgorandClient,
+    players: tuple[AddressAndSigner, AddressAndSigner],
+) -> None:
+    game_id = _play(bitboard_client, algorand_client, players, [(1, 1)])
+
+    with pytest.raises(Exception, match="assert failed"):
+        bitboard_client.move(
+            game_id=game_id, x=1, y=1, transaction_parameters=_params(players[1])
+        )
+    assert bitboard_client.get_game(game_id).guest_marks == 0
+
+
+# the stand-in doesn't model opcode budgets or box writes
+@pytest.mark.localnet
+def test_costs_less_than_tictactoe(
+    algorand_client: AlgorandClient, account_pool: AccountPool
+) -> None:
+    costs = track(
+        Network(algorand_client, account_pool),
+        contracts=["TicTacToe", "TicTacToeBitboard"],
+    ).costs
+
+    bitboard, board = costs["TicTacToeBitboard.move"], costs["TicTacToe.move"]
+    assert bitboard.app_budget is not None and board.app_budget is not None
+    assert bitboard.app_budget < board.app_budget
+    for method in ("new_game", "join", "move"):
+        bitboard, board = (
+            costs[f"TicTacToeBitboard.{method}"],
+            costs[f"TicTacToe.{method}"],
+        )
+        assert bitboard.box_bytes is not None and board.box_bytes is not None
+        assert bitboard.box_bytes < board.box_bytes, method
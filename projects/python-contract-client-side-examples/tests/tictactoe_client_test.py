@@ -0,0 +1,196 @@
+import base64
+
+import algosdk.abi
+import pytest
+from algokit_utils import TransactionParameters
+from algosdk.account import generate_account
+from algosdk.atomic_transaction_composer import AccountTransactionSigner
+from algosdk.constants import ZERO_ADDRESS
+from algosdk.error import AlgodHTTPError
+from algosdk.transaction import SuggestedParams
+
+from smart_contracts.tictactoe.client import (
+    GAME_STATE_SIZE,
+    GameState,
+    TicTacToeClient,
+    game_box_name,
+    involves,
+    is_open,
+)
+
+GAME_STATE_ABI_TYPE = algosdk.abi.TupleType(
+    [
+        algosdk.abi.ArrayStaticType(algosdk.abi.ByteType(), 9),
+        algosdk.abi.AddressType(),
+        algosdk.abi.AddressType(),
+        algosdk.abi.BoolType(),
+        algosdk.abi.UintType(8),
+    ]
+)
+
+
+def _random_address() -> str:
+    _, address = generate_account()
+    return address
+
+
+class _BoxesAlgod:
+    """Serves a fixed set of boxes through the algod box endpoints"""
+
+    def __init__(self, boxes: dict[bytes, bytes], deleted: list[bytes] | None = None):
+        self.boxes = boxes
+        # names still listed but whose box is gone by the time it is fetched
+        self.deleted = deleted or []
+
+    def application_boxes(self, application_id: int) -> dict[str, list[dict[str, str]]]:
+        names = [*self.boxes, *self.deleted]
+        return {"boxes": [{"name": base64.b64encode(name).decode()} for name in names]}
+
+    def application_box_by_name(
+        self, application_id: int, box_name: bytes
+    ) -> dict[str, str]:
+        if box_name not in self.boxes:
+            raise AlgodHTTPError("box not found", code=404)
+        return {"value": base64.b64encode(self.boxes[box_name]).decode()}
+
+
+def _offline_client(algod: _BoxesAlgod) -> TicTacToeClient:
+    private_key, address = generate_account()
+    return TicTacToeClient(
+        algod,  # type: ignore[arg-type]
+        app_id=1,
+        sender=address,
+        signer=AccountTransactionSigner(private_key),
+        suggested_params=SuggestedParams(
+            fee=1000, first=1, last=1001, gh=b"\x00" * 32, flat_fee=True
+        ),
+    )
+
+
+def test_game_box_name() -> None:
+    assert game_box_name(1) == b"games" + (1).to_bytes(8, "big")
+
+
+def test_decode_matches_abi_decoder() -> None:
+    host, guest = _random_address(), _random_address()
+    board = [1, 0, 2, 0, 1, 2, 0, 0, 1]
+    encoded = GAME_STATE_ABI_TYPE.encode([board, host, guest, True, 5])
+
+    game = GameState.decode(encoded)
+
+    assert GAME_STATE_SIZE == len(encoded) == 75
+    assert game == GameState(
+        board=bytes(board), host=host, guest=guest, is_over=True, turns=5
+    )
+    assert game.has_guest
+    assert game.encode() == encoded
+
+
+def test_decode_open_game() -> None:
+    host = _random_address()
+    encoded = GAME_STATE_ABI_TYPE.encode([[0] * 9, host, ZERO_ADDRESS, False, 0])
+
+    game = GameState.decode(memoryview(encoded))
+
+    assert game.guest == ZERO_ADDRESS
+    assert not game.has_guest
+    assert not game.is_over
+
+
+def test_decode_many_preserves_order() -> None:
+    host, guest = _random_address(), _random_address()
+    encoded = [
+        GAME_STATE_ABI_TYPE.encode([[0] * 9, host, guest, False, turns])
+        for turns in range(5)
+    ]
+
+    games = GameState.decode_many(encoded)
+
+    assert [game.turns for game in games] == list(range(5))
+
+
+def test_decode_rejects_wrong_size() -> None:
+    with pytest.raises(ValueError, match="75 byte"):
+        GameState.decode(b"\x00" * 74)
+
+
+def test_iter_games_filters_and_skips_unrelated_boxes() -> None:
+    host, guest = _random_address(), _random_address()
+    boxes = {
+        game_box_name(1): GAME_STATE_ABI_TYPE.encode(
+            [[0] * 9, host, ZERO_ADDRESS, False, 0]
+        ),
+        game_box_name(2): GAME_STATE_ABI_TYPE.encode([[0] * 9, host, guest, False, 1]),
+        game_box_name(3): GAME_STATE_ABI_TYPE.encode(
+            [[0] * 9, _random_address(), ZERO_ADDRESS, False, 0]
+        ),
+        b"not-a-game": b"",
+    }
+    client = TicTacToeClient(_BoxesAlgod(boxes), app_id=1)  # type: ignore[arg-type]
+
+    assert {game_id for game_id, _ in client.iter_games()} == {1, 2, 3}
+    assert {game_id for game_id, _ in client.iter_games(is_open)} == {1, 3}
+    assert {
+        game_id for game_id, _ in client.iter_games(involves(host), max_in_flight=1)
+    } == {1, 2}
+
+
+def test_iter_games_skips_games_deleted_while_scanning() -> None:
+    host = _random_address()
+    algod = _BoxesAlgod(
+        {game_box_name(1): GAME_STATE_ABI_TYPE.encode([[0] * 9, host, host, True, 9])},
+        deleted=[game_box_name(2)],
+    )
+    client = TicTacToeClient(algod, app_id=1)  # type: ignore[arg-type]
+
+    assert [game_id for game_id, _ in client.iter_games()] == [1]
+
+
+def test_calls_reference_the_game_box() -> None:
+    client = _offline_client(_BoxesAlgod({}))
+
+    [join] = client.compose().join(game_id=7).build().build_group()
+
+    assert [(box.app_index, box.name) for box in join.txn.boxes] == [
+        (0, game_box_name(7))
+    ]
+
+
+def test_move_references_both_players() -> None:
+    host, guest = _random_address(), _random_address()
+    client = _offline_client(
+        _BoxesAlgod(
+            {
+                game_box_name(7): GAME_STATE_ABI_TYPE.encode(
+                    [[0] * 9, host, guest, False, 0]
+                )
+            }
+        )
+    )
+
+    [move] = client.compose().move(game_id=7, x=0, y=0).build().build_group()
+
+    assert move.txn.accounts == [host, guest]
+    assert [box.name for box in move.txn.boxes] == [game_box_name(7)]
+
+
+def test_explicit_references_are_kept() -> None:
+    other = _random_address()
+    client = _offline_client(_BoxesAlgod({}))
+
+    [move] = (
+        client.compose()
+        .move(
+            game_id=7,
+            x=0,
+            y=0,
+            transaction_parameters=TransactionParameters(
+                boxes=[(0, b"other")], accounts=[other]
+            ),
+        )
+        .build()
+        .build_group()
+    )
+
+    assert move.txn.accounts == [other]
+    assert [box.name for box in move.txn.boxes] == [b"other"]
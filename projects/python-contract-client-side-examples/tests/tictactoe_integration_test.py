@@ -1,6 +1,3 @@
-import base64
-
-import algosdk.abi
 import pytest
 from algokit_utils import (
     EnsureBalanceParameters,
@@ -13,11 +10,11 @@ from algokit_utils.beta.algorand_client import AlgorandClient
 from algokit_utils.beta.client_manager import AlgoSdkClients
 from algokit_utils.beta.composer import PayParams
 from algosdk.atomic_transaction_composer import TransactionWithSigner
-from algosdk.util import algos_to_microalgos
 from algosdk.v2client.algod import AlgodClient
 from algosdk.v2client.indexer import IndexerClient
 
-from smart_contracts.artifacts.tictactoe.tic_tac_toe_client import TicTacToeClient
+from smart_contracts._helpers.account_pool import AccountPool
+from smart_contracts.tictactoe.client import TicTacToeClient, involves
 
 
 @pytest.fixture(scope="session")
@@ -51,44 +48,34 @@ def tictactoe_client(algorand_client: AlgorandClient) -> TicTacToeClient:
     return client
 
 
-@pytest.fixture(scope="session")
-def host(algorand_client: AlgorandClient) -> AddressAndSigner:
-    """Get a host account to use throughout the tests"""
-    acct = algorand_client.account.random()
-    ensure_funded(
-        algorand_client.client.algod,
-        EnsureBalanceParameters(
-            account_to_fund=acct.address,
-            min_spending_balance_micro_algos=algos_to_microalgos(10),
-        ),
-    )
+@pytest.fixture
+def host(
+    algorand_client: AlgorandClient, account_pool: AccountPool
+) -> AddressAndSigner:
+    """Get a host account for a single test, as it opts in to the shared app"""
+    acct = account_pool.take()
+    algorand_client.account.set_signer(acct.address, acct.signer)
 
     return acct
 
 
-@pytest.fixture(scope="session")
-def guest(algorand_client: AlgorandClient) -> AddressAndSigner:
-    """Get a host account to use throughout the tests"""
-    acct = algorand_client.account.random()
-    ensure_funded(
-        algorand_client.client.algod,
-        EnsureBalanceParameters(
-            account_to_fund=acct.address,
-            min_spending_balance_micro_algos=algos_to_microalgos(10),
-        ),
-    )
+@pytest.fixture
+def guest(
+    algorand_client: AlgorandClient, account_pool: AccountPool
+) -> AddressAndSigner:
+    """Get a guest account for a single test, as it opts in to the shared app"""
+    acct = account_pool.take()
+    algorand_client.account.set_signer(acct.address, acct.signer)
 
     return acct
 
 
-@pytest.fixture(scope="session")
+@pytest.fixture
 def game_id(
     tictactoe_client: TicTacToeClient,
     algorand_client: AlgorandClient,
     host: AddressAndSigner,
 ) -> int:
-    last_game_id = tictactoe_client.get_global_state().id_counter
-
     result = tictactoe_client.opt_in_new_game(
         mbr=TransactionWithSigner(
             txn=algorand_client.transactions.payment(
@@ -103,35 +90,41 @@ def game_id(
         transaction_parameters=TransactionParameters(
             signer=host.signer,
             sender=host.address,
-            boxes=[(0, b"games" + (last_game_id + 1).to_bytes(8, "big"))],
         ),
     )
 
     return result.return_value
 
 
-def test_join(
-    tictactoe_client: TicTacToeClient,
-    guest: AddressAndSigner,
-    game_id: int,
-):
+def _join(
+    tictactoe_client: TicTacToeClient, guest: AddressAndSigner, game_id: int
+) -> None:
     tictactoe_client.opt_in_join(
         game_id=game_id,
         transaction_parameters=TransactionParameters(
             signer=guest.signer,
             sender=guest.address,
-            boxes=[(0, b"games" + game_id.to_bytes(8, "big"))],
         ),
     )
 
 
+def test_join(
+    tictactoe_client: TicTacToeClient,
+    guest: AddressAndSigner,
+    game_id: int,
+):
+    _join(tictactoe_client, guest, game_id)
+
+    assert tictactoe_client.get_game(game_id).guest == guest.address
+
+
 def test_moves(
     tictactoe_client: TicTacToeClient,
-    algorand_client: AlgorandClient,
     host: AddressAndSigner,
     guest: AddressAndSigner,
     game_id: int,
 ):
+    _join(tictactoe_client, guest, game_id)
     moves = [
         ((0, 0), (2, 2)),
         ((1, 1), (2, 1)),
@@ -145,8 +138,6 @@ def test_moves(
             transaction_parameters=TransactionParameters(
                 signer=host.signer,
                 sender=host.address,
-                boxes=[(0, b"games" + game_id.to_bytes(8, "big"))],
-                accounts=[guest.address],
             ),
         )
 
@@ -157,27 +148,15 @@ def test_moves(
             transaction_parameters=TransactionParameters(
                 signer=guest.signer,
                 sender=guest.address,
-                boxes=[(0, b"games" + game_id.to_bytes(8, "big"))],
-                accounts=[host.address],
             ),
         )
 
-    game_state = algosdk.abi.TupleType(
-        [
-            algosdk.abi.ArrayStaticType(algosdk.abi.ByteType(), 9),
-            algosdk.abi.AddressType(),
-            algosdk.abi.AddressType(),
-            algosdk.abi.BoolType(),
-            algosdk.abi.UintType(8),
-        ]
-    ).decode(
-        base64.b64decode(
-            algorand_client.client.algod.application_box_by_name(
-                tictactoe_client.app_id, box_name=b"games" + game_id.to_bytes(8, "big")
-            )["value"]
-        )
-    )
-    assert game_state[3]
+    game_state = tictactoe_client.get_game(game_id)
+    assert game_state.is_over
+    assert game_state.turns == 6
+    assert game_state.host == host.address
+    assert game_state.guest == guest.address
+    assert (game_id, game_state) in tictactoe_client.iter_games(involves(guest.address))
 
     assert tictactoe_client.get_local_state(host.address).games_played == 1
     assert tictactoe_client.get_local_state(guest.address).games_played == 1
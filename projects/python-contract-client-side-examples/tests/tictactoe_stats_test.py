@@ -0,0 +1,180 @@
+import pytest
+from algokit_utils import (
+    EnsureBalanceParameters,
+    TransactionParameters,
+    ensure_funded,
+    get_localnet_default_account,
+)
+from algokit_utils.beta.account_manager import AddressAndSigner
+from algokit_utils.beta.algorand_client import AlgorandClient
+from algokit_utils.beta.client_manager import AlgoSdkClients
+from algokit_utils.beta.composer import PayParams
+from algosdk.account import generate_account
+from algosdk.atomic_transaction_composer import TransactionWithSigner
+from algosdk.v2client.algod import AlgodClient
+from algosdk.v2client.indexer import IndexerClient
+
+from smart_contracts._helpers.account_pool import AccountPool
+from smart_contracts.tictactoe_stats.client import (
+    NEW_GAME_MBR,
+    STATS_BOX_MBR,
+    PlayerStats,
+    TicTacToeStatsClient,
+    player_from_box_name,
+    stats_box_name,
+)
+
+
+def test_stats_box_round_trips() -> None:
+    _, player = generate_account()
+    stats = PlayerStats(games_played=3, games_won=2)
+
+    assert PlayerStats.decode(stats.encode()) == stats
+    assert player_from_box_name(stats_box_name(player)) == player
+    assert player_from_box_name(b"games" + bytes(8)) is None
+    assert STATS_BOX_MBR == 2_500 + 400 * (1 + 32 + 16)
+    assert NEW_GAME_MBR == 2_500 + 400 * (5 + 8 + 75)
+
+
+@pytest.fixture(scope="session")
+def algorand_client(
+    algod_client: AlgodClient, indexer_client: IndexerClient
+) -> AlgorandClient:
+    """Get an AlgorandClient to use throughout the tests"""
+    algorand = AlgorandClient.from_clients(AlgoSdkClients(algod_client, indexer_client))
+    algorand.set_suggested_params_timeout(0)
+
+    return algorand
+
+
+@pytest.fixture
+def stats_client(algorand_client: AlgorandClient) -> TicTacToeStatsClient:
+    """Get a TicTacToeStatsClient of an app of its own, so its leaderboard only holds
+    the players of a single test"""
+    client = TicTacToeStatsClient(
+        algod_client=algorand_client.client.algod,
+        creator=get_localnet_default_account(algorand_client.client.algod),
+        indexer_client=algorand_client.client.indexer,
+    )
+
+    client.create_bare()
+    ensure_funded(
+        algorand_client.client.algod,
+        EnsureBalanceParameters(
+            account_to_fund=client.app_address, min_spending_balance_micro_algos=0
+        ),
+    )
+
+    return client
+
+
+@pytest.fixture
+def players(
+    algorand_client: AlgorandClient, account_pool: AccountPool
+) -> list[AddressAndSigner]:
+    accts = [account_pool.take() for _ in range(3)]
+    for acct in accts:
+        algorand_client.account.set_signer(acct.address, acct.signer)
+
+    return accts
+
+
+def _params(acct: AddressAndSigner) -> TransactionParameters:
+    return TransactionParameters(signer=acct.signer, sender=acct.address)
+
+
+def _mbr(
+    client: TicTacToeStatsClient,
+    algorand_client: AlgorandClient,
+    player: AddressAndSigner,
+    amount: int,
+) -> TransactionWithSigner:
+    return TransactionWithSigner(
+        txn=algorand_client.transactions.payment(
+            PayParams(sender=player.address, receiver=client.app_address, amount=amount)
+        ),
+        signer=player.signer,
+    )
+
+
+def _play(
+    client: TicTacToeStatsClient,
+    algorand_client: AlgorandClient,
+    host: AddressAndSigner,
+    guest: AddressAndSigner,
+    moves: list[tuple[int, int]],
+) -> int:
+    # no opt in, the first game of each player pays for their stats box
+    game_id = client.new_game(
+        mbr=_mbr(client, algorand_client, host, client.new_game_mbr(host.address)),
+        transaction_parameters=_params(host),
+    ).return_value
+    client.join(
+        game_id=game_id,
+        mbr=_mbr(client, algorand_client, guest, client.join_mbr(guest.address)),
+        transaction_parameters=_params(guest),
+    )
+    for turn, (x, y) in enumerate(moves):
+        client.move(
+            game_id=game_id,
+            x=x,
+            y=y,
+            transaction_parameters=_params((host, guest)[turn % 2]),
+        )
+
+    return game_id
+
+
+def test_stats_need_no_opt_in(
+    stats_client: TicTacToeStatsClient,
+    algorand_client: AlgorandClient,
+    players: list[AddressAndSigner],
+) -> None:
+    host, guest, _ = players
+    assert stats_client.new_game_mbr(host.address) == NEW_GAME_MBR + STATS_BOX_MBR
+
+    game_id = _play(
+        stats_client,
+        algorand_client,
+        host,
+        guest,
+        [(0, 0), (2, 2), (1, 1), (2, 1), (0, 2), (2, 0)],
+    )
+
+    assert stats_client.get_game(game_id).is_over
+    assert stats_client.get_player_stats(host.address) == PlayerStats(
+        games_played=1, games_won=0
+    )
+    assert stats_client.get_player_stats(guest.address) == PlayerStats(
+        games_played=1, games_won=1
+    )
+    # both players have a stats box now, so later games only pay for the game
+    assert stats_client.new_game_mbr(guest.address) == NEW_GAME_MBR
+    assert stats_client.join_mbr(host.address) == 0
+
+
+def test_bulk_stats_and_leaderboard(
+    stats_client: TicTacToeStatsClient,
+    algorand_client: AlgorandClient,
+    players: list[AddressAndSigner],
+) -> None:
+    alice, bob, carol = players
+    host_wins = [(0, 0), (0, 1), (1, 0), (1, 1), (2, 0)]
+    _play(stats_client, algorand_client, alice, bob, host_wins)
+    _play(stats_client, algorand_client, alice, carol, host_wins)
+    _play(stats_client, algorand_client, carol, bob, host_wins)
+
+    _, newcomer = generate_account()
+    stats = stats_client.get_player_stats_many([carol.address, newcomer, alice.address])
+    assert list(stats) == [carol.address, newcomer, alice.address]
+    assert stats[carol.address] == PlayerStats(games_played=2, games_won=1)
+    assert stats[newcomer] is None
+
+    assert dict(stats_client.iter_player_stats(max_in_flight=2)) == {
+        alice.address: PlayerStats(games_played=2, games_won=2),
+        bob.address: PlayerStats(games_played=2, games_won=0),
+        carol.address: PlayerStats(games_played=2, games_won=1),
+    }
+    leaders = stats_client.leaderboard(limit=2)
+    assert [player for player, _ in leaders] == [alice.address, carol.address]
+    assert stats_client.get_stats(player=bob.address).return_value.games_played == 2
@@ -0,0 +1,163 @@
+import base64
+import threading
+
+import pytest
+from algosdk import encoding, transaction
+from algosdk.account import generate_account
+from algosdk.atomic_transaction_composer import (
+    AccountTransactionSigner,
+    EmptySigner,
+    TransactionWithSigner,
+)
+from algosdk.transaction import SuggestedParams
+from algosdk.v2client import models
+
+from smart_contracts._helpers.confirmations import ConfirmationWaiter
+from smart_contracts._helpers.readonly import ReadonlyCaller
+from smart_contracts.voting.client import VOTE_PAYMENT, VotingClient
+
+_RETURN_PREFIX = bytes.fromhex("151f7c75")
+
+
+class _SimulatingAlgod:
+    """Simulates every `get_votes` call as returning its app id, at a round tests
+    move on by hand"""
+
+    def __init__(self) -> None:
+        self.round = 1
+        self.requests: list[models.SimulateRequest] = []
+        self.suggested_params_calls = 0
+        self._next_round = threading.Event()
+
+    def status(self) -> dict[str, object]:
+        return {"last-round": self.round}
+
+    def status_after_block(self, round_num: int) -> dict[str, object]:
+        self._next_round.wait()
+        self._next_round.clear()
+        return {"last-round": self.round}
+
+    def advance(self) -> None:
+        self.round += 1
+        self._next_round.set()
+        ConfirmationWaiter.shared(self).wait_for_round(self.round)  # type: ignore[arg-type]
+
+    def suggested_params(self) -> SuggestedParams:
+        self.suggested_params_calls += 1
+        return SuggestedParams(
+            fee=0, first=self.round, last=self.round + 1000, gh=b"\x00" * 32
+        )
+
+    def simulate_transactions(
+        self, request: models.SimulateRequest
+    ) -> dict[str, object]:
+        self.requests.append(request)
+        [group] = request.txn_groups
+        txn_results = [
+            {
+                "txn-result": {
+                    "txn": {},
+                    "logs": [
+                        base64.b64encode(
+                            _RETURN_PREFIX + stxn.transaction.index.to_bytes(8, "big")
+                        ).decode()
+                    ],
+                }
+            }
+            for stxn in group.txns
+        ]
+        return {"version": 2, "txn-groups": [{"txn-results": txn_results}]}
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(VotingClient, "readonly_caller", ReadonlyCaller())
+
+
+def _clients(algod: _SimulatingAlgod, count: int) -> list[VotingClient]:
+    return [VotingClient(algod, app_id=app_id) for app_id in range(1, count + 1)]  # type: ignore[arg-type]
+
+
+def test_get_votes_needs_no_signer() -> None:
+    algod = _SimulatingAlgod()
+    [client] = _clients(algod, 1)
+
+    assert client.get_votes().return_value == 1
+    [request] = algod.requests
+    assert request.allow_empty_signatures
+
+
+def test_get_votes_is_cached_per_round() -> None:
+    algod = _SimulatingAlgod()
+    [client] = _clients(algod, 1)
+
+    client.get_votes()
+    client.get_votes()
+    assert len(algod.requests) == 1
+
+    algod.advance()
+    client.get_votes()
+    assert len(algod.requests) == 2
+    # suggested params are fetched once per round, and not at all for cached calls
+    assert algod.suggested_params_calls == 2
+
+
+def test_get_votes_many_batches_16_apps_per_simulate() -> None:
+    algod = _SimulatingAlgod()
+    clients = _clients(algod, 20)
+
+    results = VotingClient.get_votes_many(clients + clients[:2])
+
+    assert [result.return_value for result in results] == [*range(1, 21), 1, 2]
+    assert [len(request.txn_groups[0].txns) for request in algod.requests] == [16, 4]
+
+
+def test_vote_template_matches_composed_vote() -> None:
+    suggested_params = SuggestedParams(
+        fee=0,
+        first=1,
+        last=1001,
+        gh="SGO1GKSzyE7IEPItTxCByw9x8FmnrCDexi9/cOUJOiI=",
+        min_fee=1000,
+    )
+    [template_client] = _clients(_SimulatingAlgod(), 1)
+    template_client.app_client.suggested_params = suggested_params
+    template = template_client.vote_template()
+
+    _, voter = generate_account()
+    voter_params = transaction.SuggestedParams(**{**vars(suggested_params)})
+    voter_params.first, voter_params.last = 50, 1050
+    voter_client = VotingClient(
+        _SimulatingAlgod(),  # type: ignore[arg-type]
+        app_id=1,
+        sender=voter,
+        signer=EmptySigner(),
+        suggested_params=voter_params,
+    )
+    payment = transaction.PaymentTxn(
+        voter, voter_params, voter_client.app_address, VOTE_PAYMENT
+    )
+    composed = (
+        voter_client.compose()
+        .vote(pay=TransactionWithSigner(payment, EmptySigner()))
+        .atc.build_group()
+    )
+
+    assert [
+        encoding.msgpack_encode(txn) for txn in template.instantiate(voter, 50)
+    ] == [encoding.msgpack_encode(txn_with_signer.txn) for txn_with_signer in composed]
+
+
+def test_account_views_share_the_client() -> None:
+    algod = _SimulatingAlgod()
+    [client] = _clients(algod, 1)
+    private_key, voter = generate_account()
+
+    view = client.as_account(voter, AccountTransactionSigner(private_key))
+
+    assert isinstance(view, VotingClient)
+    assert view.app_client.sender == voter
+    assert client.app_client.sender is None
+    assert view.app_spec is client.app_spec
+    assert view.app_client.algod_client is client.app_client.algod_client
+    assert view.app_id == client.app_id
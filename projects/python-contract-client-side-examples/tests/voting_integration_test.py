@@ -1,4 +1,4 @@
-from typing import Callable
+from collections.abc import Callable, Iterator
 
 import pytest
 from algokit_utils import (
@@ -12,11 +12,11 @@ from algokit_utils.beta.algorand_client import AlgorandClient
 from algokit_utils.beta.client_manager import AlgoSdkClients
 from algokit_utils.beta.composer import PayParams
 from algosdk.atomic_transaction_composer import TransactionWithSigner
-from algosdk.util import algos_to_microalgos
 from algosdk.v2client.algod import AlgodClient
 from algosdk.v2client.indexer import IndexerClient
 
-from smart_contracts.artifacts.voting.voting_client import VotingClient
+from smart_contracts._helpers.account_pool import AccountPool
+from smart_contracts.voting.client import VotingClient
 
 
 @pytest.fixture(scope="session")
@@ -48,20 +48,36 @@ def voting_client(algorand_client: AlgorandClient) -> VotingClient:
     return client
 
 
-@pytest.fixture(scope="session")
-def voter_factory(algorand_client: AlgorandClient) -> Callable[[], AddressAndSigner]:
+@pytest.fixture(scope="module")
+def voter_factory(
+    algorand_client: AlgorandClient,
+    voting_client: VotingClient,
+    account_pool: AccountPool,
+) -> Iterator[Callable[[], AddressAndSigner]]:
+    voters: list[AddressAndSigner] = []
+
     def create_voter() -> AddressAndSigner:
-        acct = algorand_client.account.random()
-        ensure_funded(
-            algorand_client.client.algod,
-            EnsureBalanceParameters(
-                account_to_fund=acct.address,
-                min_spending_balance_micro_algos=algos_to_microalgos(10),
-            ),
-        )
+        acct = account_pool.take()
+        algorand_client.account.set_signer(acct.address, acct.signer)
+        voters.append(acct)
         return acct
 
-    return create_voter
+    yield create_voter
+    # voters leave the app and are topped back up to what the pool funded them with,
+    # leaving them as good as new for other modules
+    dispenser = get_localnet_default_account(algorand_client.client.algod)
+    for voter in voters:
+        voting_client.as_account(voter.address, voter.signer).clear_state()
+        info = algorand_client.account.get_information(voter.address)
+        algorand_client.send.payment(
+            PayParams(
+                sender=dispenser.address,
+                signer=dispenser.signer,
+                receiver=voter.address,
+                amount=account_pool.funding - info["amount"],
+            )
+        )
+    account_pool.give_back(*voters)
 
 
 def test_set_topic(voting_client: VotingClient) -> None:
@@ -78,12 +94,7 @@ def test_voting(
 ) -> None:
     for _ in range(3):
         voter = voter_factory()
-        voter_client = VotingClient(
-            algorand_client.client.algod,
-            sender=voter.address,
-            signer=voter.signer,
-            app_id=voting_client.app_id,
-        )
+        voter_client = voting_client.as_account(voter.address, voter.signer)
         voter_client.opt_in_opt_in()
         voted = voter_client.vote(
             pay=TransactionWithSigner(